@@ -1,12 +1,14 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict
+from typing import Callable, Optional, List, Dict, Literal
 from datetime import datetime, timedelta
 from astro_charts.chart_creator import ChartCreator
+import asyncio
 import json
 import logging
 from dotenv import load_dotenv
-from astro_charts.services.pocketbase_service import PocketbaseService
+from astro_charts.services.pocketbase_service import PocketbaseWriteQueue, get_pocketbase_service
 import os
 import shutil
 from astro_charts.services.transit_visualization_service import TransitVisualizationService
@@ -14,11 +16,19 @@ from astro_charts.services.synastry_visualization_service import SynastryVisuali
 from astro_charts.services.alt_marriage_date_finder import AltMarriageDateFinder
 from astro_charts.services.natal_visualization_service import NatalVisualizationService
 from astro_charts.services.single_transit_visualization_service import SingleTransitVisualizationService
-import time
-from pathlib import Path
 from astro_charts.services.transit_loop_midpoint_visualization_service import TransitLoopMidpointVisualizationService
 from astro_charts.services.vedic_lucky_times_service import VedicLuckyTimesService
 from astro_charts.services.sports_prediction_service import SportsPredictionService
+from astro_charts.services.geo_service import GeoService
+from astro_charts.utils.artifact_utils import (
+    CHART_CLEANUP_INTERVAL_SECONDS, CHART_MAX_AGE_DAYS, artifact_path, cleanup_old_files
+)
+from astro_charts.utils.async_utils import run_blocking, shutdown_chart_executor
+from astro_charts.utils.http_utils import close_http_sessions
+from astro_charts.services.job_queue import JobQueue
+from astro_charts.services.ephemeris_store import get_ephemeris_store
+from astro_charts.services.natal_cache import get_natal_cache
+from astro_charts.services.batch_synastry_service import BatchSynastryService, BATCH_SYNASTRY_CHUNK_SIZE
 # Load environment variables at startup
 load_dotenv()
 
@@ -74,6 +84,12 @@ class TransitLoopRequest(BaseModel):
     filter_planets: Optional[List[str]] = None
     zodiac_type: Optional[str] = None
     sidereal_mode: Optional[str] = None
+    # Visualization backend: "altair" or "fast" (defaults to VISUALIZATION_RENDER_MODE)
+    render_mode: Optional[Literal["altair", "fast"]] = None
+
+class TransitLoopStreamRequest(TransitLoopRequest):
+    # "ndjson" (one JSON object per line) or "sse" (server-sent events)
+    stream_format: Literal["ndjson", "sse"] = "ndjson"
 
 class SynastryPerson(BaseModel):
     name: str
@@ -118,6 +134,43 @@ class SynastryRequest(BaseModel):
     transit_minute: Optional[int] = 0
     zodiac_type: Optional[str] = None
     sidereal_mode: Optional[str] = None
+    # Visualization backend: "altair" or "fast" (defaults to VISUALIZATION_RENDER_MODE)
+    render_mode: Optional[Literal["altair", "fast"]] = None
+
+class BatchSynastryCandidate(BaseModel):
+    name: str
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int
+    city: Optional[str] = None
+    nation: Optional[str] = None
+    # Coordinates skip geocoding when given
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    tz_str: Optional[str] = None
+    # Caller's identifier, passed through to the results
+    id: Optional[str] = None
+
+class BatchSynastryRequest(BaseModel):
+    # Reference person's data
+    name: str
+    year: int
+    month: int
+    day: int
+    hour: int
+    minute: int
+    city: str
+    nation: str
+
+    candidates: List[BatchSynastryCandidate]
+
+    chunk_size: int = BATCH_SYNASTRY_CHUNK_SIZE
+    top_n: Optional[int] = None
+    include_linkages: bool = False
+    zodiac_type: Optional[str] = None
+    sidereal_mode: Optional[str] = None
 
 class TransitChartRequest(BaseModel):
     birth_data: BaseBirthData
@@ -150,6 +203,8 @@ class MidpointTransitLoopRequest(BaseModel):
     filter_planets: Optional[List[str]] = None
     zodiac_type: Optional[str] = None
     sidereal_mode: Optional[str] = None
+    # Visualization backend: "altair" or "fast" (defaults to VISUALIZATION_RENDER_MODE)
+    render_mode: Optional[Literal["altair", "fast"]] = None
 
 class LuckyTimesRequest(BaseModel):
     # Birth data
@@ -243,31 +298,106 @@ ZODIAC_SIGNS = {
     "Pis": "Pisces"
 }
 
-def cleanup_old_charts(days=7):
-    """Remove chart files older than specified days"""
-    try:
-        charts_dir = Path('charts')
-        if not charts_dir.exists():
-            return
-        
-        current_time = time.time()
-        max_age = days * 24 * 60 * 60  # Convert days to seconds
-        
-        for chart_file in charts_dir.glob('*'):
-            if chart_file.is_file():
-                file_age = current_time - chart_file.stat().st_mtime
-                if file_age > max_age:
-                    chart_file.unlink()
-                    logger.info(f"Removed old chart file: {chart_file}")
-    except Exception as e:
-        logger.error(f"Error during chart cleanup: {str(e)}")
+async def cleanup_old_charts_periodically():
+    """Remove old files from charts/ every CHART_CLEANUP_INTERVAL_SECONDS"""
+    while True:
+        try:
+            await run_blocking(cleanup_old_files, 'charts', CHART_MAX_AGE_DAYS)
+        except Exception as e:
+            logger.error(f"Error during chart cleanup: {str(e)}")
+        await asyncio.sleep(CHART_CLEANUP_INTERVAL_SECONDS)
+
+async def create_chart_creator(**kwargs) -> ChartCreator:
+    """Build a ChartCreator without blocking the event loop.
+
+    Coordinates are resolved asynchronously first so the geocoding cache is warm,
+    then the natal calculation runs on the chart executor.
+    """
+    geo_service = GeoService(os.getenv('GEONAMES_USERNAME'))
+    await geo_service.get_coordinates_async(kwargs["city"], kwargs["nation"])
+    return await run_blocking(ChartCreator, **kwargs)
+
+natal_cache = get_natal_cache()
+
+async def natal_cache_key(**kwargs) -> Optional[str]:
+    """Natal cache key for ChartCreator arguments, or None if the place cannot be geocoded"""
+    geo_service = GeoService(os.getenv('GEONAMES_USERNAME'))
+    coordinates = await geo_service.get_coordinates_async(kwargs["city"], kwargs["nation"])
+    if not coordinates:
+        return None
+    return natal_cache.key(
+        kwargs["year"], kwargs["month"], kwargs["day"], kwargs["hour"], kwargs["minute"],
+        coordinates[0], coordinates[1], kwargs.get("zodiac_type"), kwargs.get("sidereal_mode")
+    )
+
+async def get_chart_creator(**kwargs) -> ChartCreator:
+    """create_chart_creator, reusing the ChartCreator of a recent request for the same person"""
+    key = await natal_cache_key(**kwargs)
+    chart_creator = natal_cache.get_creator(key, kwargs["name"]) if key else None
+    if chart_creator is None:
+        chart_creator = await create_chart_creator(**kwargs)
+        if key:
+            natal_cache.set_creator(key, kwargs["name"], chart_creator)
+    return chart_creator
+
+async def get_natal_chart_data(chart_creator: Optional[ChartCreator] = None, **kwargs) -> Dict:
+    """
+    Natal chart data (get_chart_data_as_json) for ChartCreator arguments, from the natal cache when possible
+
+    Args:
+        chart_creator: ChartCreator for these arguments, used on a cache miss (built when not given)
+        **kwargs: ChartCreator arguments
+
+    Returns:
+        Dict: Natal chart data, safe for the caller to modify
+    """
+    key = await natal_cache_key(**kwargs)
+    if key:
+        chart_data = natal_cache.get(key, kwargs["name"], f"{kwargs['city']}, {kwargs['nation']}")
+        if chart_data is not None:
+            return chart_data
+
+    if chart_creator is None:
+        chart_creator = await get_chart_creator(**kwargs)
+    payload = await run_blocking(chart_creator.get_chart_data_as_json)
+    if key:
+        natal_cache.set(key, json.loads(payload))
+    return json.loads(payload)
+
+# Background jobs for long-running requests (transit loops, marriage dates)
+job_queue = JobQueue()
+
+# Shared PocketBase client, and write-behind queue for records the response does not include
+pocketbase = get_pocketbase_service()
+pocketbase_writes = PocketbaseWriteQueue(pocketbase)
+
+# Periodic removal of old files from charts/ (started with the app)
+chart_cleanup_task: Optional[asyncio.Task] = None
+
+@app.on_event("startup")
+async def startup_event():
+    """Start the background job workers, PocketBase writer and chart cleanup, and memory-map the precomputed ephemeris"""
+    global chart_cleanup_task
+    await job_queue.start()
+    await pocketbase_writes.start()
+    chart_cleanup_task = asyncio.create_task(cleanup_old_charts_periodically())
+    await run_blocking(get_ephemeris_store)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop job workers and chart cleanup, flush pending PocketBase writes and release pooled connections and the chart executor"""
+    if chart_cleanup_task is not None:
+        chart_cleanup_task.cancel()
+    await job_queue.stop()
+    await pocketbase_writes.stop()
+    await close_http_sessions()
+    shutdown_chart_executor()
 
 @app.post("/charts/natal")
 async def create_natal_chart(data: BaseBirthData):
-    cleanup_old_charts()
     try:
-        # Create chart
-        chart_creator = ChartCreator(
+        # Birth details for the chart
+        birth_details = dict(
             name=data.name,
             year=data.year,
             month=data.month,
@@ -279,12 +409,13 @@ async def create_natal_chart(data: BaseBirthData):
             zodiac_type=data.zodiac_type,
             sidereal_mode=data.sidereal_mode
         )
+        chart_creator = await get_chart_creator(**birth_details)
         
         # Get chart data
-        chart_data = json.loads(chart_creator.get_chart_data_as_json())
+        chart_data = await get_natal_chart_data(chart_creator, **birth_details)
         
         # Generate SVG chart
-        _, _ = chart_creator.create_natal_chart()
+        _, _ = await run_blocking(chart_creator.create_natal_chart, chart_data)
         
          # Construct the actual file path where the chart was moved
         name_safe = data.name.replace(" ", "_")
@@ -298,23 +429,22 @@ async def create_natal_chart(data: BaseBirthData):
         viz_service = NatalVisualizationService()
         
         try:
-            viz_chart_path, viz_html_path = viz_service.create_visualization(
+            viz_chart, viz_html = await run_blocking(viz_service.create_visualization,
                 chart_data, 
                 viz_path,
                 viz_html_path
             )
         except Exception as viz_error:
             logger.error(f"Visualization error: {str(viz_error)}")
-            viz_chart_path = None
-            viz_html_path = None
+            viz_chart = None
+            viz_html = None
         
         # Save to PocketBase
-        pb_service = PocketbaseService()
-        record = pb_service.create_natal_chart(
+        record = await pocketbase.create_async(pocketbase.natal_chart_record,
             natal_data=chart_data,
             chart_path=final_chart_path,
-            easy_chart=viz_chart_path,
-            easy_chart_html=viz_html_path,
+            easy_chart=viz_chart,
+            easy_chart_html=viz_html,
             user_id=data.user_id,
             job_id=data.job_id
         )
@@ -322,8 +452,8 @@ async def create_natal_chart(data: BaseBirthData):
         # Return the data including the PocketBase record
         return {
             "chart_data": chart_data,
-            "visualization_path": viz_chart_path if viz_chart_path else None,
-            "visualization_html_path": viz_html_path if viz_html_path else None,
+            "visualization_path": artifact_path(viz_chart),
+            "visualization_html_path": artifact_path(viz_html),
             "record": record
         }
         
@@ -333,9 +463,8 @@ async def create_natal_chart(data: BaseBirthData):
 
 @app.post("/charts/transit")
 async def create_transit_chart(request: TransitChartRequest):
-    cleanup_old_charts()
     try:
-        chart_creator = ChartCreator(
+        chart_creator = await create_chart_creator(
             name=request.birth_data.name,
             year=request.birth_data.year,
             month=request.birth_data.month,
@@ -378,25 +507,24 @@ async def create_transit_chart(request: TransitChartRequest):
         # Create visualization
         viz_service = SingleTransitVisualizationService()
         try:
-            viz_chart_path, viz_html_path = viz_service.create_visualization(
+            viz_chart, viz_html = await run_blocking(viz_service.create_visualization,
                 chart_data, 
                 viz_path,
                 viz_html_path
             )
-            if viz_chart_path:
-                logger.info(f"Created easy visualization at {viz_chart_path}")
+            if viz_chart:
+                logger.info(f"Created easy visualization {viz_chart.filename}")
         except Exception as viz_error:
             logger.error(f"Visualization error: {str(viz_error)}")
-            viz_chart_path = None
-            viz_html_path = None
+            viz_chart = None
+            viz_html = None
         
         # Save to PocketBase
-        pb_service = PocketbaseService()
-        record = pb_service.create_single_transit_chart(
+        record = await pocketbase.create_async(pocketbase.single_transit_chart_record,
             transit_data=chart_data,
             chart_path=final_chart_path,
-            easy_chart=viz_chart_path,
-            easy_chart_html=viz_html_path,
+            easy_chart=viz_chart,
+            easy_chart_html=viz_html,
             user_id=request.birth_data.user_id,
             job_id=request.birth_data.job_id
         )
@@ -404,8 +532,8 @@ async def create_transit_chart(request: TransitChartRequest):
         # Return both chart data and PocketBase record
         return {
             "chart_data": chart_data,
-            "visualization_path": viz_chart_path if viz_chart_path else None,
-            "visualization_html_path": viz_html_path if viz_html_path else None,
+            "visualization_path": artifact_path(viz_chart),
+            "visualization_html_path": artifact_path(viz_html),
             "record": record
         }
         
@@ -415,9 +543,12 @@ async def create_transit_chart(request: TransitChartRequest):
 
 @app.post("/charts/transit-loop")
 async def create_transit_loop(request: TransitLoopRequest):
-    cleanup_old_charts()
+    return await run_transit_loop(request)
+
+async def run_transit_loop(request: TransitLoopRequest, day_progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """Transit loop endpoint logic; day_progress is called with (days done, total days)"""
     try:
-        chart_creator = ChartCreator(
+        chart_creator = await create_chart_creator(
             name=request.name,
             year=request.year,
             month=request.month,
@@ -438,10 +569,11 @@ async def create_transit_loop(request: TransitLoopRequest):
             aspects_only=request.aspects_only,
             filter_orb=request.filter_orb,
             filter_aspects=request.filter_aspects,
-            filter_planets=request.filter_planets
+            filter_planets=request.filter_planets,
+            progress=day_progress
         )
         
-        logger.info(f"Transit Loop Results: {results}")
+        logger.info(f"Transit loop computed {len(results.get('daily_aspects', {}))} days for {request.name}")
 
         # Create visualization
         name_safe = request.name.replace(" ", "_")
@@ -450,25 +582,25 @@ async def create_transit_loop(request: TransitLoopRequest):
 
         viz_service = TransitVisualizationService()
         try:
-            viz_chart_path, viz_html_path = viz_service.create_visualization(
+            viz_chart, viz_html = await run_blocking(viz_service.create_visualization,
                 results, 
                 viz_path,
-                viz_html_path
+                viz_html_path,
+                request.render_mode
             )
         except Exception as viz_error:
             logger.error(f"Visualization error: {str(viz_error)}")
-            viz_chart_path = None
-            viz_html_path = None
+            viz_chart = None
+            viz_html = None
 
-        # Save to PocketBase
+        # Save to PocketBase in the background (the record is not returned)
         try:
-            pb_service = PocketbaseService()
-            record = pb_service.create_transit_loop_charts(
+            pocketbase_writes.enqueue(await run_blocking(pocketbase.transit_loop_record,
                 transit_loop_data={
                     "natal": results.get("natal", {}),
                     "transit_data": results,
-                    "visualization_path": viz_chart_path,
-                    "visualization_html_path": viz_html_path,
+                    "visualization_path": viz_chart,
+                    "visualization_html_path": viz_html,
                     "date_range": {
                         "from_date": request.from_date,
                         "to_date": request.to_date
@@ -476,7 +608,7 @@ async def create_transit_loop(request: TransitLoopRequest):
                 },
                 user_id=request.user_id,
                 job_id=request.job_id
-            )
+            ))
         except Exception as pb_error:
             logger.error(f"PocketBase error: {str(pb_error)}")
             raise
@@ -484,8 +616,8 @@ async def create_transit_loop(request: TransitLoopRequest):
         # Return results
         return {
             "chart_data": results,
-            "visualization_path": viz_chart_path if viz_chart_path else None,
-            "visualization_html_path": viz_html_path if viz_html_path else None,
+            "visualization_path": artifact_path(viz_chart),
+            "visualization_html_path": artifact_path(viz_html),
             "daily_aspects": results.get("daily_aspects", {}),
             "turbulent_transits": results.get("turbulent_transits", {})
         }
@@ -495,6 +627,56 @@ async def create_transit_loop(request: TransitLoopRequest):
         logger.exception("Full traceback:")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/charts/transit-loop/stream")
+async def stream_transit_loop(request: TransitLoopStreamRequest):
+    """
+    Stream a transit loop one day at a time
+
+    Each day's record (date, daily_aspects, turbulent_transits, cinderella_transits
+    and golden_transits) is sent as soon as it is computed, followed by an "end"
+    message with the number of days. No visualization or PocketBase record is made.
+
+    Like /charts/transit-loop, every day is calculated at noon and transit_hour and
+    transit_minute are ignored, so streamed days match the non-streaming loop and
+    share its cached days.
+    """
+    try:
+        chart_creator = await create_chart_creator(
+            name=request.name,
+            year=request.year,
+            month=request.month,
+            day=request.day,
+            hour=request.hour,
+            minute=request.minute,
+            city=request.city,
+            nation=request.nation,
+            zodiac_type=request.zodiac_type,
+            sidereal_mode=request.sidereal_mode
+        )
+    except Exception as e:
+        logger.error(f"Error creating transit loop stream: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    def encode(event: str, payload: Dict) -> str:
+        if request.stream_format == "sse":
+            return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        return json.dumps({"type": event, **payload}) + "\n"
+
+    async def stream():
+        days = 0
+        try:
+            async for record in chart_creator.stream_transit_loop(request.from_date, request.to_date):
+                days += 1
+                yield encode("day", record)
+        except Exception as e:
+            logger.error(f"Error streaming transit loop: {str(e)}")
+            yield encode("error", {"detail": str(e)})
+        logger.info(f"Streamed {days} transit loop days for {request.name}")
+        yield encode("end", {"days": days})
+
+    media_type = "text/event-stream" if request.stream_format == "sse" else "application/x-ndjson"
+    return StreamingResponse(stream(), media_type=media_type)
+
 # Add this function before initializing MarriageDateFinder
 async def transit_loop_wrapper(
     name: str, 
@@ -552,9 +734,12 @@ alt_marriage_finder = AltMarriageDateFinder(transit_loop_wrapper)
 
 @app.post("/charts/synastry")
 async def create_synastry_chart(request: SynastryRequest):
-    cleanup_old_charts()
+    return await run_synastry_chart(request)
+
+async def run_synastry_chart(request: SynastryRequest, day_progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """Synastry endpoint logic; day_progress is called with (days scanned, total days) by the marriage date search"""
     try:
-        chart_creator = ChartCreator(
+        chart_creator = await create_chart_creator(
             name=request.name,
             year=request.year,
             month=request.month,
@@ -568,7 +753,7 @@ async def create_synastry_chart(request: SynastryRequest):
         )
         
         # Get chart data and generate chart
-        chart_data = chart_creator.create_synastry_chart(
+        chart_data = await run_blocking(chart_creator.create_synastry_chart,
             name2=request.name2,
             year2=request.year2,
             month2=request.month2,
@@ -596,7 +781,8 @@ async def create_synastry_chart(request: SynastryRequest):
                 request.transit_hour or 12,
                 request.transit_minute or 0,
                 request.user_id,
-                request.job_id
+                request.job_id,
+                progress=day_progress
             )
             logger.info(f"Marriage dates found: {marriage_dates}")
             is_marriage_request = True
@@ -618,28 +804,27 @@ async def create_synastry_chart(request: SynastryRequest):
         
         # Create easy visualization
         viz_service = SynastryVisualizationService()
-        viz_chart_path, easy_chart_html_path = viz_service.create_visualization(chart_data, easy_chart_path, easy_chart_html_path)
+        viz_chart, easy_chart_html = await run_blocking(viz_service.create_visualization, chart_data, easy_chart_path, easy_chart_html_path, request.render_mode)
 
-        if viz_chart_path:
-            logger.info(f"Created easy visualization at {viz_chart_path}")
+        if viz_chart:
+            logger.info(f"Created easy visualization {viz_chart.filename}")
         
-        # Save to PocketBase with both charts
-        pb_service = PocketbaseService()
-        record = pb_service.create_synastry_chart(
+        # Save to PocketBase with both charts (in the background; the record is not returned)
+        pocketbase_writes.enqueue(await run_blocking(pocketbase.synastry_chart_record,
             synastry_data=chart_data,
             chart_path=final_chart_path,
-            easy_chart_path=viz_chart_path,
-            easy_chart_html_path=easy_chart_html_path,
+            easy_chart_path=viz_chart,
+            easy_chart_html_path=easy_chart_html,
             user_id=request.user_id,
             job_id=request.job_id,
             is_marriage_request=is_marriage_request
-        )
+        ))
         
-        # Return both chart data, visualization path and PocketBase record
+        # Return both chart data and visualization path
         return {
             "chart_data": chart_data,
-            "visualization_path": viz_chart_path if viz_chart_path else None,
-            "easy_chart_html_path": easy_chart_html_path if easy_chart_html_path else None,
+            "visualization_path": artifact_path(viz_chart),
+            "easy_chart_html_path": artifact_path(easy_chart_html),
             # "record": record
         }
         
@@ -647,11 +832,63 @@ async def create_synastry_chart(request: SynastryRequest):
         logger.error(f"Error creating synastry chart: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/charts/synastry/batch")
+async def create_batch_synastry_scores(request: BatchSynastryRequest):
+    """
+    Score one reference person against many candidates without rendering charts
+
+    Streams newline-delimited JSON: a {"type": "chunk"} line with the scores of each
+    chunk of candidates as soon as it is computed, then a final {"type": "ranking"}
+    line with the candidates ordered by overall score.
+    """
+    service = BatchSynastryService(request.zodiac_type, request.sidereal_mode)
+    reference_record = request.dict(include={"name", "year", "month", "day", "hour", "minute", "city", "nation"})
+    try:
+        lat, lng, _ = await run_blocking(service.locate, reference_record)
+        site = (lat, lng)
+        reference = await run_blocking(service.build_chart, reference_record, site)
+    except Exception as e:
+        logger.error(f"Error creating batch synastry reference chart: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+    candidates = [candidate.dict() for candidate in request.candidates]
+    chunks = service.score_candidates(
+        reference, candidates, request.chunk_size, site, request.include_linkages
+    )
+
+    async def stream():
+        # Only what the final ranking needs is kept; full results go out with their chunk
+        results = []
+        try:
+            while True:
+                chunk = await run_blocking(next, chunks, None)
+                if chunk is None:
+                    break
+                results.extend(BatchSynastryService.ranking_entry(result) for result in chunk)
+                yield json.dumps({"type": "chunk", "results": chunk}) + "\n"
+        except Exception as e:
+            logger.error(f"Error scoring batch synastry candidates: {str(e)}")
+            yield json.dumps({"type": "error", "detail": str(e)}) + "\n"
+
+        scored = sum(1 for result in results if "scores" in result)
+        yield json.dumps({
+            "type": "ranking",
+            "ranking": BatchSynastryService.rank(results, request.top_n),
+            "scored": scored,
+            "failed": len(results) - scored
+        }) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 @app.post("/charts/midpoint-transit-loop")
 async def create_midpoint_transit_loop(request: MidpointTransitLoopRequest):
-    cleanup_old_charts()
+    return await run_midpoint_transit_loop(request)
+
+async def run_midpoint_transit_loop(request: MidpointTransitLoopRequest,
+                                    day_progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """Midpoint transit loop endpoint logic; day_progress is called with (days done, total days)"""
     try:
-        chart_creator = ChartCreator(
+        chart_creator = await create_chart_creator(
             name=request.name,
             year=request.year,
             month=request.month,
@@ -665,7 +902,7 @@ async def create_midpoint_transit_loop(request: MidpointTransitLoopRequest):
         )
         
         # Create natal chart and get data
-        natal_data, source_path = chart_creator.create_natal_chart()
+        natal_data, source_path = await run_blocking(chart_creator.create_natal_chart)
         
         # Calculate midpoints
         midpoints = chart_creator.calculate_natal_midpoints(natal_data)
@@ -677,7 +914,8 @@ async def create_midpoint_transit_loop(request: MidpointTransitLoopRequest):
             midpoints=midpoints,  # Pass midpoints here
             filter_orb=request.filter_orb,
             filter_aspects=request.filter_aspects,
-            filter_planets=request.filter_planets
+            filter_planets=request.filter_planets,
+            progress=day_progress
         )
         
         # logger.info(f"Transit data: {transit_data}")
@@ -691,18 +929,18 @@ async def create_midpoint_transit_loop(request: MidpointTransitLoopRequest):
         
         # Create visualization
         viz_service = TransitLoopMidpointVisualizationService()
-        viz_chart_path, viz_html_path = viz_service.create_visualization(
+        viz_chart, viz_html = await run_blocking(viz_service.create_visualization,
             transit_data, 
             viz_path,
-            viz_html_path
+            viz_html_path,
+            request.render_mode
         )
         
         # Save to PocketBase
-        pb_service = PocketbaseService()
-        record = pb_service.create_cosmo_chart(
+        record = await pocketbase.create_async(pocketbase.cosmo_chart_record,
             transit_data=transit_data,
-            chart_path=viz_chart_path,
-            chart_html_path=viz_html_path,
+            chart_path=viz_chart,
+            chart_html_path=viz_html,
             user_id=request.user_id,
             job_id=request.job_id
         )
@@ -723,8 +961,8 @@ async def create_midpoint_transit_loop(request: MidpointTransitLoopRequest):
 @app.post("/charts/planets")
 async def get_planets(data: BaseBirthData):
     try:
-        # Create chart
-        chart_creator = ChartCreator(
+        # Birth details for the chart
+        birth_details = dict(
             name=data.name,
             year=data.year,
             month=data.month,
@@ -738,7 +976,7 @@ async def get_planets(data: BaseBirthData):
         )
         
         # Get chart data
-        chart_data = json.loads(chart_creator.get_chart_data_as_json())
+        chart_data = await get_natal_chart_data(**birth_details)
         
         # Extract just the planets data
         planets_data = chart_data["subject"]["planets"]
@@ -749,8 +987,7 @@ async def get_planets(data: BaseBirthData):
                 planet["sign"] = ZODIAC_SIGNS.get(planet["sign"], planet["sign"])
         
         # Save to PocketBase
-        pb_service = PocketbaseService()
-        record = pb_service.create_planets_record(
+        record = await run_blocking(pocketbase.create_planets_record,
             planets_data=planets_data,
             user_id=data.user_id,
             job_id=data.job_id
@@ -768,8 +1005,8 @@ async def get_planets(data: BaseBirthData):
 @app.post("/charts/lucky-times")
 async def get_lucky_times(data: LuckyTimesRequest):
     try:
-        # Create chart
-        chart_creator = ChartCreator(
+        # Birth details for the chart
+        birth_details = dict(
             name=data.name,
             year=data.year,
             month=data.month,
@@ -781,9 +1018,10 @@ async def get_lucky_times(data: LuckyTimesRequest):
             zodiac_type=data.zodiac_type,
             sidereal_mode=data.sidereal_mode
         )
+        chart_creator = await get_chart_creator(**birth_details)
         
         # Get chart data
-        chart_data = json.loads(chart_creator.get_chart_data_as_json())
+        chart_data = await get_natal_chart_data(chart_creator, **birth_details)
         
         # Extract required positions
         ascendant_pos = chart_data["subject"]["houses"]["ascendant"]["abs_pos"]
@@ -875,7 +1113,8 @@ async def get_lucky_times(data: LuckyTimesRequest):
             transit_hour=data.transit_hour,
             transit_minute=data.transit_minute,
             zodiac_type=data.zodiac_type,
-            sidereal_mode=data.sidereal_mode
+            sidereal_mode=data.sidereal_mode,
+            render_chart=False
         )
         current_transit = json.loads(current_transit)
         current_jupiter_pos = current_transit["transit"]["subject"]["planets"]["jupiter"]["abs_pos"]
@@ -934,7 +1173,8 @@ async def get_lucky_times(data: LuckyTimesRequest):
                 transit_hour=data.transit_hour,
                 transit_minute=data.transit_minute,
                 zodiac_type=data.zodiac_type,
-                sidereal_mode=data.sidereal_mode
+                sidereal_mode=data.sidereal_mode,
+                render_chart=False
             )
             current_transit = json.loads(current_transit)
             
@@ -1017,7 +1257,8 @@ async def get_lucky_times(data: LuckyTimesRequest):
                     transit_hour=data.transit_hour,
                     transit_minute=data.transit_minute,
                     zodiac_type=data.zodiac_type,
-                    sidereal_mode=data.sidereal_mode
+                    sidereal_mode=data.sidereal_mode,
+                    render_chart=False
                 )
                 current_transit = json.loads(current_transit)
                 jupiter_pos = current_transit["transit"]["subject"]["planets"]["jupiter"]["abs_pos"]
@@ -1058,7 +1299,8 @@ async def get_lucky_times(data: LuckyTimesRequest):
                             transit_hour=data.transit_hour,
                             transit_minute=data.transit_minute,
                             zodiac_type=data.zodiac_type,
-                            sidereal_mode=data.sidereal_mode
+                            sidereal_mode=data.sidereal_mode,
+                            render_chart=False
                         )
                         current_transit = json.loads(current_transit)
                         fine_jupiter_pos = current_transit["transit"]["subject"]["planets"]["jupiter"]["abs_pos"]
@@ -1120,7 +1362,8 @@ async def get_lucky_times(data: LuckyTimesRequest):
                         transit_hour=data.transit_hour,
                         transit_minute=data.transit_minute,
                         zodiac_type=data.zodiac_type,
-                        sidereal_mode=data.sidereal_mode
+                        sidereal_mode=data.sidereal_mode,
+                        render_chart=False
                     )
                     current_transit = json.loads(current_transit)
                     jupiter_pos = current_transit["transit"]["subject"]["planets"]["jupiter"]["abs_pos"]
@@ -1269,7 +1512,8 @@ async def get_lucky_times(data: LuckyTimesRequest):
                             transit_hour=data.transit_hour,
                             transit_minute=data.transit_minute,
                             zodiac_type=data.zodiac_type,
-                            sidereal_mode=data.sidereal_mode
+                            sidereal_mode=data.sidereal_mode,
+                            render_chart=False
                         )
                         current_transit = json.loads(current_transit)
                         moon_pos = current_transit["transit"]["subject"]["planets"]["moon"]["abs_pos"]
@@ -1315,8 +1559,7 @@ async def get_lucky_times(data: LuckyTimesRequest):
                 # Don't add a "next_conjunction" field if we don't have a real conjunction
         
         # Save to PocketBase
-        pb_service = PocketbaseService()
-        record = pb_service.create_lucky_times_record(
+        record = await run_blocking(pocketbase.create_lucky_times_record,
             planets_data=planets_data,
             pof_data=pof_data,
             lucky_times_data=response,
@@ -1339,8 +1582,8 @@ async def get_vedic_lucky_times(data: VedicLuckyTimesRequest):
         print("get_vedic_lucky_times")
         print("Data Received:")
         print(data)
-        # Create chart creator
-        chart_creator = ChartCreator(
+        # Birth details for the chart
+        birth_details = dict(
             name=data.name,
             year=data.year,
             month=data.month,
@@ -1352,9 +1595,10 @@ async def get_vedic_lucky_times(data: VedicLuckyTimesRequest):
             zodiac_type=data.zodiac_type,
             sidereal_mode=data.sidereal_mode
         )
+        chart_creator = await get_chart_creator(**birth_details)
         
         # Get natal chart data
-        natal_data = json.loads(chart_creator.get_chart_data_as_json())
+        natal_data = await get_natal_chart_data(chart_creator, **birth_details)
         
         # Get current positions
         today = datetime.now()
@@ -1366,7 +1610,8 @@ async def get_vedic_lucky_times(data: VedicLuckyTimesRequest):
                 transit_hour=data.transit_hour,
                 transit_minute=data.transit_minute,
                 zodiac_type=data.zodiac_type,
-                sidereal_mode=data.sidereal_mode
+                sidereal_mode=data.sidereal_mode,
+                render_chart=False
             )
             current_transit = json.loads(current_transit)
         except Exception as transit_error:
@@ -1387,13 +1632,14 @@ async def get_vedic_lucky_times(data: VedicLuckyTimesRequest):
             service = VedicLuckyTimesService()
             
             # Check if location-specific calculations are requested
+            location_transit = None
             if data.current_city and data.current_nation:
                 # Check if current location is different from birth location
                 location_changed = (data.current_city != data.city) or (data.current_nation != data.nation)
                 
                 if location_changed:
                     # Create a separate chart creator for the current location
-                    location_chart_creator = ChartCreator(
+                    location_chart_creator = await create_chart_creator(
                         name=data.name,
                         year=data.year,
                         month=data.month,
@@ -1415,7 +1661,8 @@ async def get_vedic_lucky_times(data: VedicLuckyTimesRequest):
                         transit_hour=data.transit_hour,
                         transit_minute=data.transit_minute,
                         zodiac_type=data.zodiac_type,
-                        sidereal_mode=data.sidereal_mode
+                        sidereal_mode=data.sidereal_mode,
+                        render_chart=False
                     )
                     location_transit = json.loads(location_transit)
                     
@@ -1425,36 +1672,20 @@ async def get_vedic_lucky_times(data: VedicLuckyTimesRequest):
                     # If locations are the same, reuse the existing transit chart
                     location_transit = current_transit
                     logger.info("Current location is same as birth location, reusing transit chart")
-                
-                # Get location-specific Yogi point alignments with the location-specific transit
-                location_specific_alignments = service.calculate_location_specific_yogi_alignments(
-                    natal_data=natal_data,
-                    current_city=data.current_city,
-                    current_nation=data.current_nation,
-                    orb=data.orb,
-                    transit_data=location_transit  # Pass the location-specific transit data
-                )
-                
-                # Process standard Vedic lucky times, passing in the location_specific_alignments
-                response = service.process_vedic_lucky_times(
-                    natal_data=natal_data,
-                    transit_data=current_transit,  # Still use original transit for standard calculations
-                    birth_date=birth_date,
-                    from_date=data.from_date,
-                    name=data.name,
-                    orb=data.orb,
-                    location_specific_alignments=location_specific_alignments
-                )
-            else:
-                # Just process standard Vedic lucky times without location-specific alignments
-                response = service.process_vedic_lucky_times(
-                    natal_data=natal_data,
-                    transit_data=current_transit,
-                    birth_date=birth_date,
-                    from_date=data.from_date,
-                    name=data.name,
-                    orb=data.orb  # Pass the orb parameter
-                )
+            
+            # Process Vedic lucky times; the location-specific alignments (if requested) are
+            # calculated alongside the other analyses, using the location-specific transit
+            response = await run_blocking(service.process_vedic_lucky_times,
+                natal_data=natal_data,
+                transit_data=current_transit,  # Still use original transit for standard calculations
+                birth_date=birth_date,
+                from_date=data.from_date,
+                name=data.name,
+                orb=data.orb,  # Pass the orb parameter
+                current_city=data.current_city,
+                current_nation=data.current_nation,
+                location_transit_data=location_transit
+            )
                 
         except Exception as service_error:
             logger.error(f"Error in VedicLuckyTimesService: {str(service_error)}")
@@ -1469,8 +1700,6 @@ async def get_vedic_lucky_times(data: VedicLuckyTimesRequest):
         
         # Save to PocketBase
         try:
-            pb_service = PocketbaseService()
-            
             # Convert any datetime objects to strings before saving to PocketBase
             def convert_datetime_to_str(obj):
                 if isinstance(obj, dict):
@@ -1488,7 +1717,7 @@ async def get_vedic_lucky_times(data: VedicLuckyTimesRequest):
             # Create a copy of the response to avoid modifying the original
             pb_response = convert_datetime_to_str(dict(response))
             
-            record = pb_service.create_vedic_lucky_times_record(
+            record = await pocketbase.create_async(pocketbase.vedic_lucky_times_record,
                 natal_data=natal_data,
                 yogi_point_data=pb_response,
                 user_id=data.user_id,
@@ -1522,7 +1751,7 @@ async def get_sports_prediction(data: SportsPredictionRequest):
         event_minute = data.transit_minute if data.transit_minute is not None else int(event_time_parts[1])
         
         # Create chart for the event time and location
-        chart_creator = ChartCreator(
+        birth_details = dict(
             name=data.event_name,
             year=event_year,
             month=event_month,
@@ -1536,7 +1765,7 @@ async def get_sports_prediction(data: SportsPredictionRequest):
         )
         
         # Get chart data
-        chart_data = json.loads(chart_creator.get_chart_data_as_json())
+        chart_data = await get_natal_chart_data(**birth_details)
         
         # Create service to process sports prediction
         # This will be implemented in a separate file
@@ -1549,7 +1778,7 @@ async def get_sports_prediction(data: SportsPredictionRequest):
             if not data.include_sun_as_malefic and "sun" in service.malefic_planets:
                 service.malefic_planets.remove("sun")
             
-            prediction_results = service.analyze_chart(
+            prediction_results = await run_blocking(service.analyze_chart,
                 chart_data=chart_data,
                 favorite_name=data.favorite_name,
                 underdog_name=data.underdog_name,
@@ -1592,8 +1821,7 @@ async def get_sports_prediction(data: SportsPredictionRequest):
         
         # Save to PocketBase
         try:
-            pb_service = PocketbaseService()
-            record = pb_service.create_sports_prediction_record(
+            record = await pocketbase.create_async(pocketbase.sports_prediction_record,
                 chart_data=chart_data,
                 prediction_results=prediction_results,
                 event_name=data.event_name,
@@ -1617,8 +1845,8 @@ async def get_sports_prediction(data: SportsPredictionRequest):
 @app.post("/charts/next-venus-aspects")
 async def get_next_venus_aspects(data: VedicLuckyTimesRequest):
     try:
-        # Create chart creator
-        chart_creator = ChartCreator(
+        # Birth details for the chart
+        birth_details = dict(
             name=data.name,
             year=data.year,
             month=data.month,
@@ -1630,9 +1858,10 @@ async def get_next_venus_aspects(data: VedicLuckyTimesRequest):
             zodiac_type=data.zodiac_type,
             sidereal_mode=data.sidereal_mode
         )
+        chart_creator = await get_chart_creator(**birth_details)
         
         # Get natal chart data
-        natal_data = json.loads(chart_creator.get_chart_data_as_json())
+        natal_data = await get_natal_chart_data(chart_creator, **birth_details)
         
         # Get current positions
         today = datetime.now()
@@ -1641,13 +1870,14 @@ async def get_next_venus_aspects(data: VedicLuckyTimesRequest):
             transit_month=today.month,
             transit_day=today.day,
             transit_hour=data.transit_hour,
-            transit_minute=data.transit_minute
+            transit_minute=data.transit_minute,
+            render_chart=False
         )
         current_transit = json.loads(current_transit)
         
         # Use the Vedic Lucky Times Service to process Venus aspects
         service = VedicLuckyTimesService()
-        response = service.get_next_venus_aspects(
+        response = await run_blocking(service.get_next_venus_aspects,
             natal_data=natal_data,
             transit_data=current_transit,
             orb=data.orb
@@ -1659,6 +1889,80 @@ async def get_next_venus_aspects(data: VedicLuckyTimesRequest):
         logger.error(f"Error calculating Venus aspects to Yogi Point: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def job_day_progress(progress, message: str) -> Callable[[int, int], None]:
+    """Report (days done, total days) of a job's date range as progress from 0.1 to 0.9"""
+    def report(done: int, total: int) -> None:
+        progress(0.1 + 0.8 * done / max(total, 1), f"{message}: {done} of {total} days")
+    return report
+
+async def run_transit_loop_job(payload: Dict, progress) -> Dict:
+    """Job handler: transit loop, saved to PocketBase by the endpoint logic"""
+    progress(0.05, "Calculating transit loop")
+    return await run_transit_loop(TransitLoopRequest(**payload), job_day_progress(progress, "Calculating transit loop"))
+
+async def run_midpoint_transit_loop_job(payload: Dict, progress) -> Dict:
+    """Job handler: midpoint transit loop, saved to PocketBase by the endpoint logic"""
+    progress(0.05, "Calculating midpoint transit loop")
+    return await run_midpoint_transit_loop(MidpointTransitLoopRequest(**payload),
+                                           job_day_progress(progress, "Calculating midpoint transit loop"))
+
+async def run_marriage_dates_job(payload: Dict, progress) -> Dict:
+    """Job handler: synastry with marriage date search, saved to PocketBase by the endpoint logic"""
+    progress(0.05, "Searching marriage dates")
+    request = SynastryRequest(**payload)
+    request.find_marriage_date = True
+    return await run_synastry_chart(request, job_day_progress(progress, "Searching marriage dates"))
+
+job_queue.register("transit_loop", run_transit_loop_job)
+job_queue.register("midpoint_transit_loop", run_midpoint_transit_loop_job)
+job_queue.register("marriage_dates", run_marriage_dates_job)
+
+def submit_user_job(kind: str, request: BaseModel) -> Dict:
+    """Queue a job for request.user_id; a job_id already used by another user is refused"""
+    existing = job_queue.get(request.job_id) if request.job_id else None
+    if existing and existing["user_id"] != request.user_id:
+        raise HTTPException(status_code=409, detail=f"Job {request.job_id} already exists")
+    return job_queue.submit(kind, request.dict(), job_id=request.job_id, user_id=request.user_id)
+
+@app.post("/jobs/transit-loop", status_code=202)
+async def submit_transit_loop_job(request: TransitLoopRequest):
+    """Queue a transit loop; poll /jobs/{job_id}?user_id=... for progress"""
+    return submit_user_job("transit_loop", request)
+
+@app.post("/jobs/midpoint-transit-loop", status_code=202)
+async def submit_midpoint_transit_loop_job(request: MidpointTransitLoopRequest):
+    """Queue a midpoint transit loop; poll /jobs/{job_id}?user_id=... for progress"""
+    return submit_user_job("midpoint_transit_loop", request)
+
+@app.post("/jobs/marriage-dates", status_code=202)
+async def submit_marriage_dates_job(request: SynastryRequest):
+    """Queue a synastry chart with marriage date search; poll /jobs/{job_id}?user_id=... for progress"""
+    if not request.from_date or not request.to_date:
+        raise HTTPException(status_code=422, detail="from_date and to_date are required to find marriage dates")
+    return submit_user_job("marriage_dates", request)
+
+def get_user_job(job_id: str, user_id: str, include_result: bool = False) -> Dict:
+    """Job submitted by user_id; other users' jobs are reported as not found"""
+    job = job_queue.get(job_id, include_result=include_result)
+    if not job or job["user_id"] != user_id:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+@app.get("/jobs/{job_id}")
+async def get_job_status(job_id: str, user_id: str):
+    """Status and progress of a background job submitted by user_id"""
+    return get_user_job(job_id, user_id)
+
+@app.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str, user_id: str):
+    """Result of a completed background job submitted by user_id"""
+    job = get_user_job(job_id, user_id, include_result=True)
+    if job["status"] == JobQueue.STATUS_FAILED:
+        raise HTTPException(status_code=500, detail=job["error"])
+    if job["status"] != JobQueue.STATUS_COMPLETED:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job['status']}")
+    return job["result"]
+
 def normalize_degrees(deg):
     """Normalize degrees to 0-360 range"""
     return deg % 360
@@ -6,23 +6,31 @@ import json
 from datetime import datetime, timedelta
 import pytz
 import math
-from datetime import date
 import requests
 from .magi_aspects import MagiAspectCalculator, SuperAspectCalculator
 from .services.geo_service import GeoService
-from timezonefinder import TimezoneFinder
+from .utils.timezone_utils import get_timezone
+from .utils.ascendant_utils import (
+    SWISSEPH_LOCK, closest_ascendant_sample, find_ascendant_crossings, julian_day_to_datetime,
+    normalize_angle, set_sidereal_mode
+)
+from .utils.async_utils import CHART_PROCESS_WORKERS, get_process_pool, reset_process_pool, run_blocking
+from .utils.cache_utils import LRUCache
+from concurrent.futures.process import BrokenProcessPool
 from .magi_synastry import MagiSynastryCalculator
 from .magi_linkages import MagiLinkageCalculator
 from .services.cinderella_analyzer import CinderellaAnalyzer
 from .sexual_linkages import SexualLinkageCalculator
-from .services.nasa_horizons_service import NASAHorizonsService
+from .services.declination_service import DeclinationService
+from .services.ephemeris_engine import EphemerisEngine, SIGNS
 from .services.turbulent_transit_service import TurbulentTransitService
-from .romance_linkages import RomanceLinkageCalculator
-from .marital_linkages import MaritalLinkageCalculator
 from .transit_calculator import calculate_transit_data
 from .services.synastry_score_calculator import SynastryScoreCalculator
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
 from .cosmobiology_calculator import CosmobiologyCalculator
+from .models.chart_state import ChartState
+from .services.natal_cache import NatalCache
+from .services.transit_day_cache import TransitDayCache, get_transit_day_cache
 
 
 
@@ -102,6 +110,25 @@ class ChartCreator:
         'KE': 'Africa/Nairobi'
     }
 
+    # Planets included in transit chart data
+    TRANSIT_PLANETS = [
+        "sun", "moon", "mercury", "venus", "mars", "jupiter",
+        "saturn", "uranus", "neptune", "pluto", "chiron"
+    ]
+
+    # Kerykeion subject attributes for houses 1-12
+    HOUSE_ATTRIBUTES = [
+        "first_house", "second_house", "third_house", "fourth_house",
+        "fifth_house", "sixth_house", "seventh_house", "eighth_house",
+        "ninth_house", "tenth_house", "eleventh_house", "twelfth_house"
+    ]
+
+    # Days handled by one worker task when a transit range is split across processes
+    TRANSIT_CHUNK_DAYS = int(os.getenv('TRANSIT_LOOP_CHUNK_DAYS', '30'))
+
+    # Days computed per step when a transit loop is streamed
+    TRANSIT_STREAM_CHUNK_DAYS = int(os.getenv('TRANSIT_STREAM_CHUNK_DAYS', '7'))
+
     def __init__(self, name, year, month, day, hour, minute, city, nation, zodiac_type=None, sidereal_mode=None):
         # Initialize GeoService and get coordinates
         geonames_username = os.getenv('GEONAMES_USERNAME')
@@ -116,8 +143,7 @@ class ChartCreator:
         logger.info(f"Retrieved coordinates: lat={self.latitude}, lng={self.longitude}")
 
         # Get timezone from coordinates
-        tf = TimezoneFinder()
-        self.timezone_str = tf.timezone_at(lat=self.latitude, lng=self.longitude)
+        self.timezone_str = get_timezone(self.latitude, self.longitude)
         if not self.timezone_str:
             raise ValueError(f"Could not determine timezone for coordinates: {self.latitude}, {self.longitude}")
         
@@ -174,8 +200,15 @@ class ChartCreator:
 
         self.cinderella_analyzer = CinderellaAnalyzer()
         self.sexual_linkage_calculator = SexualLinkageCalculator()
-        self.nasa_service = NASAHorizonsService()
+        self.declination_service = DeclinationService()
         self.turbulent_transit_service = TurbulentTransitService()
+        
+        # Batched ephemeris for date-range transits, using the natal zodiac settings
+        self.ephemeris_engine = EphemerisEngine(
+            zodiac_type=getattr(self.subject, 'zodiac_type', None),
+            sidereal_mode=getattr(self.subject, 'sidereal_mode', None),
+            bodies=self.TRANSIT_PLANETS
+        )
 
         self.name = name
         self.year = year
@@ -185,6 +218,8 @@ class ChartCreator:
         self.minute = minute
         self.city = city
         self.nation = nation
+        self.zodiac_type = zodiac_type
+        self.sidereal_mode = sidereal_mode
         self.natal_subject = None
         self.transit_subject = None
 
@@ -212,8 +247,12 @@ class ChartCreator:
             return self._turbulent_transits
         return []
 
-    def create_natal_chart(self):
-        """Create and save a natal chart"""
+    def create_natal_chart(self, chart_data=None):
+        """Create and save a natal chart
+
+        Args:
+            chart_data: Natal chart data from get_chart_data_as_json, if already known
+        """
         try:
             # Generate custom filename from name
             name_safe = self.subject.name.replace(" ", "_")
@@ -238,7 +277,8 @@ class ChartCreator:
                 logger.info(f"Natal chart moved from {source_path} to {os.path.abspath(chart_path)}")
             
             # Get chart data using existing method but only include natal data
-            chart_data = json.loads(self.get_chart_data_as_json())
+            if chart_data is None:
+                chart_data = json.loads(self.get_chart_data_as_json())
             
             # Create simplified natal-only data structure
             final_data = {
@@ -255,8 +295,23 @@ class ChartCreator:
 
     async def create_transit_chart(self, transit_year=None, transit_month=None, 
                              transit_day=None, transit_hour=None, transit_minute=None,
-                             zodiac_type=None, sidereal_mode=None):
-        """Create a transit chart for a specific date (or current date if not specified)"""
+                             zodiac_type=None, sidereal_mode=None, render_chart=True):
+        """Create a transit chart for a specific date (or current date if not specified).
+        
+        With render_chart=False only the transit data is computed: no SVG is rendered,
+        nothing is written to disk and chart_path is None in the returned data.
+        
+        The calculation runs on the chart executor so the event loop stays responsive.
+        """
+        return await run_blocking(
+            self._build_transit_chart,
+            transit_year, transit_month, transit_day, transit_hour, transit_minute,
+            zodiac_type, sidereal_mode, render_chart
+        )
+
+    def _build_transit_chart(self, transit_year, transit_month, transit_day, transit_hour,
+                             transit_minute, zodiac_type, sidereal_mode, render_chart):
+        """Blocking implementation of create_transit_chart"""
         try:
             # Use provided transit date or current date
             if all([transit_year, transit_month, transit_day]):
@@ -307,6 +362,12 @@ class ChartCreator:
                     transit_params["sidereal_mode"] = self.subject.sidereal_mode
                     logger.info(f"Using sidereal_mode from natal chart for transit: {self.subject.sidereal_mode}")
             
+            if not render_chart:
+                # Data only: read positions from the ephemeris (store) instead of building a subject
+                return self._get_ephemeris_transit_chart(
+                    transit_time, transit_params.get("zodiac_type"), transit_params.get("sidereal_mode")
+                )
+
             self.transit_subject = AstrologicalSubject(**transit_params)
             logger.info("`Transit subject` created successfully")
 
@@ -337,292 +398,388 @@ class ChartCreator:
             logger.error(f"Error creating transit chart: {str(e)}")
             raise
 
+    def _get_ephemeris_transit_chart(self, transit_time, zodiac_type=None, sidereal_mode=None):
+        """Transit chart data as JSON (with no chart_path) for one local time from the ephemeris engine"""
+        engine = self.ephemeris_engine
+        if (zodiac_type, sidereal_mode) != (engine.zodiac_type, engine.sidereal_mode):
+            engine = EphemerisEngine(zodiac_type=zodiac_type, sidereal_mode=sidereal_mode, bodies=self.TRANSIT_PLANETS)
+
+        table = engine.compute([transit_time], self.timezone_str, lat=self.latitude, lng=self.longitude)
+        date_str = transit_time.strftime("%Y-%m-%d")
+
+        natal_data = self._get_transit_natal_data(date_str)
+        transit_data = self._get_ephemeris_transit_data(engine.positions_at(table, 0), transit_time, table.house_cusps[0])
+        chart_data = self._assemble_transit_chart_data(natal_data, transit_data, None)
+        return json.dumps(chart_data, indent=2)
+
+    def _get_transit_planet_details(self, planet_obj, date_str):
+        """Get planet details for transit chart data, with declination for the given date.
+
+        Accepts a kerykeion planet or a dict with the same keys (e.g. from the ephemeris engine).
+        """
+        # Get planet name and position
+        planet_name = planet_obj["name"].lower()
+        abs_pos = planet_obj["abs_pos"]
+        
+        # Calculate declination
+        declination = self.get_declination(
+            planet_name=planet_name,
+            date_str=date_str,
+            abs_pos=abs_pos,
+            longitude=self.longitude,
+            latitude=self.latitude
+        )
+        logger.debug(f"Got declination for {planet_name}: {declination}")
+
+        return {
+            "name": planet_obj["name"],
+            "sign": planet_obj["sign"],
+            "position": round(planet_obj["position"], 4),
+            "abs_pos": round(abs_pos, 4),
+            "house": planet_obj["house"],
+            "retrograde": planet_obj["retrograde"],
+            "declination": round(declination, 4) if declination is not None else None
+        }
+
     def _get_transit_data_as_json(self, chart_path):
         """Get transit chart data as JSON"""
         try:
-            def get_planet_details(planet_obj):
-                print(f"Processing planet Object: {planet_obj}")
-                # Get planet name and position
-                planet_name = planet_obj.name.lower()
-                abs_pos = planet_obj.abs_pos
-                
-                # Calculate declination
-                declination = self.get_declination(
-                    planet_name=planet_name,
-                    date_str=f"{self.transit_subject.year}-{self.transit_subject.month:02d}-{self.transit_subject.day:02d}",
-                    abs_pos=abs_pos,
-                    longitude=self.longitude,
-                    latitude=self.latitude
-                )
-                logger.info(f"Got declination for {planet_name}: {declination}")
-
-                return {
-                    "name": planet_obj.name,
-                    "sign": planet_obj.sign,
-                    "position": round(planet_obj.position, 4),
-                    "abs_pos": round(abs_pos, 4),
-                    "house": planet_obj.house,
-                    "retrograde": planet_obj.retrograde,
-                    "declination": round(declination, 4) if declination is not None else None
-                }
+            transit_date = f"{self.transit_subject.year}-{self.transit_subject.month:02d}-{self.transit_subject.day:02d}"
 
             # Create natal data first
-            natal_data = {
-                "subject": {
-                    "name": self.subject.name,
-                    "birth_data": {
-                        "date": f"{self.subject.year}-{self.subject.month}-{self.subject.day}",
-                        "time": f"{self.subject.hour}:{self.subject.minute}",
-                        "location": f"{self.subject.city}, {self.subject.nation}",
-                        "longitude": round(self.longitude, 4),
-                        "latitude": round(self.latitude, 4)
-                    },
-                    "planets": {
-                        planet: get_planet_details(getattr(self.subject, planet))
-                        for planet in ["sun", "moon", "mercury", "venus", "mars", 
-                                    "jupiter", "saturn", "uranus", "neptune", 
-                                    "pluto", "chiron"]
-                    },
-                    "houses": {
-                        "ascendant": {
-                            "sign": self.subject.first_house["sign"],
-                            "position": self.subject.first_house["position"],
-                            "abs_pos": self.subject.first_house["abs_pos"],
-                            "house_num": 1
-                        },
-                        "house_1": {
-                            "sign": self.subject.first_house["sign"],
-                            "position": self.subject.first_house["position"],
-                            "abs_pos": self.subject.first_house["abs_pos"],
-                            "house_num": 1
-                        },
-                        "house_2": {
-                            "sign": self.subject.second_house["sign"] if hasattr(self.subject, "second_house") else "",
-                            "position": self.subject.second_house["position"] if hasattr(self.subject, "second_house") else 0,
-                            "abs_pos": self.subject.second_house["abs_pos"] if hasattr(self.subject, "second_house") else 0,
-                            "house_num": 2
-                        },
-                        "house_3": {
-                            "sign": self.subject.third_house["sign"] if hasattr(self.subject, "third_house") else "",
-                            "position": self.subject.third_house["position"] if hasattr(self.subject, "third_house") else 0,
-                            "abs_pos": self.subject.third_house["abs_pos"] if hasattr(self.subject, "third_house") else 0,
-                            "house_num": 3
-                        },
-                        "house_4": {
-                            "sign": self.subject.fourth_house["sign"] if hasattr(self.subject, "fourth_house") else "",
-                            "position": self.subject.fourth_house["position"] if hasattr(self.subject, "fourth_house") else 0,
-                            "abs_pos": self.subject.fourth_house["abs_pos"] if hasattr(self.subject, "fourth_house") else 0,
-                            "house_num": 4
-                        },
-                        "house_5": {
-                            "sign": self.subject.fifth_house["sign"] if hasattr(self.subject, "fifth_house") else "",
-                            "position": self.subject.fifth_house["position"] if hasattr(self.subject, "fifth_house") else 0,
-                            "abs_pos": self.subject.fifth_house["abs_pos"] if hasattr(self.subject, "fifth_house") else 0,
-                            "house_num": 5
-                        },
-                        "house_6": {
-                            "sign": self.subject.sixth_house["sign"] if hasattr(self.subject, "sixth_house") else "",
-                            "position": self.subject.sixth_house["position"] if hasattr(self.subject, "sixth_house") else 0,
-                            "abs_pos": self.subject.sixth_house["abs_pos"] if hasattr(self.subject, "sixth_house") else 0,
-                            "house_num": 6
-                        },
-                        "house_7": {
-                            "sign": self.subject.seventh_house["sign"] if hasattr(self.subject, "seventh_house") else "",
-                            "position": self.subject.seventh_house["position"] if hasattr(self.subject, "seventh_house") else 0,
-                            "abs_pos": self.subject.seventh_house["abs_pos"] if hasattr(self.subject, "seventh_house") else 0,
-                            "house_num": 7
-                        },
-                        "house_8": {
-                            "sign": self.subject.eighth_house["sign"] if hasattr(self.subject, "eighth_house") else "",
-                            "position": self.subject.eighth_house["position"] if hasattr(self.subject, "eighth_house") else 0,
-                            "abs_pos": self.subject.eighth_house["abs_pos"] if hasattr(self.subject, "eighth_house") else 0,
-                            "house_num": 8
-                        },
-                        "house_9": {
-                            "sign": self.subject.ninth_house["sign"] if hasattr(self.subject, "ninth_house") else "",
-                            "position": self.subject.ninth_house["position"] if hasattr(self.subject, "ninth_house") else 0,
-                            "abs_pos": self.subject.ninth_house["abs_pos"] if hasattr(self.subject, "ninth_house") else 0,
-                            "house_num": 9
-                        },
-                        "house_10": {
-                            "sign": self.subject.tenth_house["sign"],
-                            "position": self.subject.tenth_house["position"],
-                            "abs_pos": self.subject.tenth_house["abs_pos"],
-                            "house_num": 10
-                        },
-                        "midheaven": {
-                            "sign": self.subject.tenth_house["sign"],
-                            "position": self.subject.tenth_house["position"],
-                            "abs_pos": self.subject.tenth_house["abs_pos"],
-                            "house_num": 10
-                        },
-                        "house_11": {
-                            "sign": self.subject.eleventh_house["sign"] if hasattr(self.subject, "eleventh_house") else "",
-                            "position": self.subject.eleventh_house["position"] if hasattr(self.subject, "eleventh_house") else 0,
-                            "abs_pos": self.subject.eleventh_house["abs_pos"] if hasattr(self.subject, "eleventh_house") else 0,
-                            "house_num": 11
-                        },
-                        "house_12": {
-                            "sign": self.subject.twelfth_house["sign"] if hasattr(self.subject, "twelfth_house") else "",
-                            "position": self.subject.twelfth_house["position"] if hasattr(self.subject, "twelfth_house") else 0,
-                            "abs_pos": self.subject.twelfth_house["abs_pos"] if hasattr(self.subject, "twelfth_house") else 0,
-                            "house_num": 12
-                        }
-                    }
-                }
-            }
+            natal_data = self._get_transit_natal_data(transit_date)
 
             # Create transit data with same structure
             transit_data = {
                 "subject": {
                     "name": "Transit",
                     "birth_data": {
-                        "date": f"{self.transit_subject.year}-{self.transit_subject.month:02d}-{self.transit_subject.day:02d}",
+                        "date": transit_date,
                         "time": f"{self.transit_subject.hour}:{self.transit_subject.minute:02d}",
                         "location": f"{self.transit_subject.city}, {self.transit_subject.nation}",
                         "longitude": round(self.longitude, 4),
                         "latitude": round(self.latitude, 4)
                     },
                     "planets": {
-                        planet: get_planet_details(getattr(self.transit_subject, planet))
-                        for planet in ["sun", "moon", "mercury", "venus", "mars", 
-                                    "jupiter", "saturn", "uranus", "neptune", 
-                                    "pluto", "chiron"]
+                        planet: self._get_transit_planet_details(getattr(self.transit_subject, planet), transit_date)
+                        for planet in self.TRANSIT_PLANETS
                     },
-                    "houses": {
-                        "ascendant": {
-                            "sign": self.transit_subject.first_house["sign"],
-                            "position": self.transit_subject.first_house["position"],
-                            "abs_pos": self.transit_subject.first_house["abs_pos"],
-                            "house_num": 1
-                        },
-                        "house_1": {
-                            "sign": self.transit_subject.first_house["sign"],
-                            "position": self.transit_subject.first_house["position"],
-                            "abs_pos": self.transit_subject.first_house["abs_pos"],
-                            "house_num": 1
-                        },
-                        "house_2": {
-                            "sign": self.transit_subject.second_house["sign"] if hasattr(self.transit_subject, "second_house") else "",
-                            "position": self.transit_subject.second_house["position"] if hasattr(self.transit_subject, "second_house") else 0,
-                            "abs_pos": self.transit_subject.second_house["abs_pos"] if hasattr(self.transit_subject, "second_house") else 0,
-                            "house_num": 2
-                        },
-                        "house_3": {
-                            "sign": self.transit_subject.third_house["sign"] if hasattr(self.transit_subject, "third_house") else "",
-                            "position": self.transit_subject.third_house["position"] if hasattr(self.transit_subject, "third_house") else 0,
-                            "abs_pos": self.transit_subject.third_house["abs_pos"] if hasattr(self.transit_subject, "third_house") else 0,
-                            "house_num": 3
-                        },
-                        "house_4": {
-                            "sign": self.transit_subject.fourth_house["sign"] if hasattr(self.transit_subject, "fourth_house") else "",
-                            "position": self.transit_subject.fourth_house["position"] if hasattr(self.transit_subject, "fourth_house") else 0,
-                            "abs_pos": self.transit_subject.fourth_house["abs_pos"] if hasattr(self.transit_subject, "fourth_house") else 0,
-                            "house_num": 4
-                        },
-                        "house_5": {
-                            "sign": self.transit_subject.fifth_house["sign"] if hasattr(self.transit_subject, "fifth_house") else "",
-                            "position": self.transit_subject.fifth_house["position"] if hasattr(self.transit_subject, "fifth_house") else 0,
-                            "abs_pos": self.transit_subject.fifth_house["abs_pos"] if hasattr(self.transit_subject, "fifth_house") else 0,
-                            "house_num": 5
-                        },
-                        "house_6": {
-                            "sign": self.transit_subject.sixth_house["sign"] if hasattr(self.transit_subject, "sixth_house") else "",
-                            "position": self.transit_subject.sixth_house["position"] if hasattr(self.transit_subject, "sixth_house") else 0,
-                            "abs_pos": self.transit_subject.sixth_house["abs_pos"] if hasattr(self.transit_subject, "sixth_house") else 0,
-                            "house_num": 6
-                        },
-                        "house_7": {
-                            "sign": self.transit_subject.seventh_house["sign"] if hasattr(self.transit_subject, "seventh_house") else "",
-                            "position": self.transit_subject.seventh_house["position"] if hasattr(self.transit_subject, "seventh_house") else 0,
-                            "abs_pos": self.transit_subject.seventh_house["abs_pos"] if hasattr(self.transit_subject, "seventh_house") else 0,
-                            "house_num": 7
-                        },
-                        "house_8": {
-                            "sign": self.transit_subject.eighth_house["sign"] if hasattr(self.transit_subject, "eighth_house") else "",
-                            "position": self.transit_subject.eighth_house["position"] if hasattr(self.transit_subject, "eighth_house") else 0,
-                            "abs_pos": self.transit_subject.eighth_house["abs_pos"] if hasattr(self.transit_subject, "eighth_house") else 0,
-                            "house_num": 8
-                        },
-                        "house_9": {
-                            "sign": self.transit_subject.ninth_house["sign"] if hasattr(self.transit_subject, "ninth_house") else "",
-                            "position": self.transit_subject.ninth_house["position"] if hasattr(self.transit_subject, "ninth_house") else 0,
-                            "abs_pos": self.transit_subject.ninth_house["abs_pos"] if hasattr(self.transit_subject, "ninth_house") else 0,
-                            "house_num": 9
-                        },
-                        "house_10": {
-                            "sign": self.transit_subject.tenth_house["sign"],
-                            "position": self.transit_subject.tenth_house["position"],
-                            "abs_pos": self.transit_subject.tenth_house["abs_pos"],
-                            "house_num": 10
-                        },
-                        "midheaven": {
-                            "sign": self.transit_subject.tenth_house["sign"],
-                            "position": self.transit_subject.tenth_house["position"],
-                            "abs_pos": self.transit_subject.tenth_house["abs_pos"],
-                            "house_num": 10
-                        },
-                        "house_11": {
-                            "sign": self.transit_subject.eleventh_house["sign"] if hasattr(self.transit_subject, "eleventh_house") else "",
-                            "position": self.transit_subject.eleventh_house["position"] if hasattr(self.transit_subject, "eleventh_house") else 0,
-                            "abs_pos": self.transit_subject.eleventh_house["abs_pos"] if hasattr(self.transit_subject, "eleventh_house") else 0,
-                            "house_num": 11
-                        },
-                        "house_12": {
-                            "sign": self.transit_subject.twelfth_house["sign"] if hasattr(self.transit_subject, "twelfth_house") else "",
-                            "position": self.transit_subject.twelfth_house["position"] if hasattr(self.transit_subject, "twelfth_house") else 0,
-                            "abs_pos": self.transit_subject.twelfth_house["abs_pos"] if hasattr(self.transit_subject, "twelfth_house") else 0,
-                            "house_num": 12
-                        }
-                    }
+                    "houses": self._get_houses_data(self.transit_subject)
                 }
             }
 
-            # Calculate aspects after both natal and transit data are created
-            super_calc = SuperAspectCalculator()
-            super_aspects = super_calc.find_super_aspects(natal_data)
-            transit_super_aspects = super_calc.find_super_aspects(transit_data)
+            chart_data = self._assemble_transit_chart_data(natal_data, transit_data, chart_path)
+            return json.dumps(chart_data, indent=2)
 
-            # Calculate Cinderella aspects
-            linkage_calc = MagiLinkageCalculator()
-            cinderella_aspects = linkage_calc.find_cinderella_linkages(natal_data, transit_data)
-            
-            # Calculate Golden Transits
-            golden_transits = linkage_calc.find_golden_transits(natal_data, transit_data)
-
-            # Add aspects to transit data
-            transit_data["transit_super_aspects"] = transit_super_aspects
-            transit_data["cinderella_aspects"] = cinderella_aspects
-            transit_data["cinderella_transits"] = cinderella_aspects
-            transit_data["aspects"] = []  # Keep empty array for consistency
-            transit_data["turbulent_transits"] = []  # Will be filled later
-            transit_data["golden_transits"] = golden_transits  # Add golden transits
-
-            # Add turbulent transit analysis
-            turbulent_transits = self.turbulent_transit_service.analyze_turbulent_transits(
-                natal_data=natal_data,
-                transit_data=transit_data["subject"]
-            )
+        except Exception as e:
+            logger.error(f"Error converting transit data to JSON: {str(e)}")
+            raise
 
-            # Create final chart data
-            chart_data = {
-                "natal": natal_data["subject"],
-                "transit": transit_data,
-                "natal_super_aspects": super_aspects,
-                "chart_path": chart_path,
-                "turbulent_transits": turbulent_transits,
-                "golden_transits": golden_transits,  # Add golden transits here too
-                "cinderella_transits": cinderella_aspects
+    def _get_ephemeris_transit_data(self, positions, transit_time, house_cusps):
+        """Build the transit side of transit chart data from one ephemeris engine sample"""
+        date_str = transit_time.strftime("%Y-%m-%d")
+        return {
+            "subject": {
+                "name": "Transit",
+                "birth_data": {
+                    "date": date_str,
+                    "time": f"{transit_time.hour}:{transit_time.minute:02d}",
+                    "location": f"{self.subject.city}, {self.subject.nation}",
+                    "longitude": round(self.longitude, 4),
+                    "latitude": round(self.latitude, 4)
+                },
+                "planets": {
+                    planet: self._get_transit_planet_details(positions[planet], date_str)
+                    for planet in self.TRANSIT_PLANETS
+                },
+                "houses": self._format_houses([
+                    {"sign": SIGNS[int(cusp // 30)], "position": float(cusp % 30), "abs_pos": float(cusp)}
+                    for cusp in house_cusps
+                ])
             }
+        }
 
-            logger.info(f"Found {len(turbulent_transits)} turbulent transits")
-            logger.info(f"Found {len(golden_transits)} golden transits")
-            logger.info(f"Found {len(cinderella_aspects)} cinderella transits")
-            return json.dumps(chart_data, indent=2)
+    def get_transit_range_data(self, from_date: str, to_date: str,
+                               transit_hour: int = 12, transit_minute: int = 0) -> Dict[str, Dict]:
+        """
+        Get transit chart data for every day in a date range from a single ephemeris pass.
+        
+        Produces the same structure as create_transit_chart for each day (with no chart_path),
+        without building a kerykeion subject or rendering an SVG per day.
+        
+        Args:
+            from_date (str): Start date in YYYY-MM-DD format
+            to_date (str): End date in YYYY-MM-DD format (inclusive)
+            transit_hour (int): Local hour of each daily transit
+            transit_minute (int): Local minute of each daily transit
+            
+        Returns:
+            Dict: Date string -> transit chart data, in date order
+        """
+        table = self.ephemeris_engine.compute_range(
+            from_date, to_date, self.timezone_str,
+            hour=transit_hour, minute=transit_minute,
+            lat=self.latitude, lng=self.longitude
+        )
+        
+        # When validating against Horizons, fetch the whole range per body up front
+        self.declination_service.prefetch_range(from_date, to_date, self.longitude, self.latitude)
+        
+        results = {}
+        for index, transit_time in enumerate(table.times):
+            date_str = transit_time.strftime("%Y-%m-%d")
+            positions = self.ephemeris_engine.positions_at(table, index)
+            
+            natal_data = self._get_transit_natal_data(date_str)
+            transit_data = self._get_ephemeris_transit_data(positions, transit_time, table.house_cusps[index])
+            results[date_str] = self._assemble_transit_chart_data(natal_data, transit_data, None)
+        
+        return results
+
+    @property
+    def init_params(self) -> Dict:
+        """Constructor arguments, used to rebuild this chart in worker processes"""
+        return {
+            "name": self.name,
+            "year": self.year,
+            "month": self.month,
+            "day": self.day,
+            "hour": self.hour,
+            "minute": self.minute,
+            "city": self.city,
+            "nation": self.nation,
+            "zodiac_type": self.zodiac_type,
+            "sidereal_mode": self.sidereal_mode
+        }
 
+    @staticmethod
+    def _split_date_range(from_date: str, to_date: str, chunk_days: int) -> List[tuple]:
+        """Split an inclusive YYYY-MM-DD range into consecutive (start, end) chunks"""
+        start = datetime.strptime(from_date, "%Y-%m-%d")
+        end = datetime.strptime(to_date, "%Y-%m-%d")
+        chunks = []
+        while start <= end:
+            chunk_end = min(start + timedelta(days=chunk_days - 1), end)
+            chunks.append((start.strftime("%Y-%m-%d"), chunk_end.strftime("%Y-%m-%d")))
+            start = chunk_end + timedelta(days=1)
+        return chunks
+
+    def get_transit_range_data_parallel(self, from_date: str, to_date: str,
+                                        transit_hour: int = 12, transit_minute: int = 0,
+                                        chunk_days: Optional[int] = None,
+                                        progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Dict]:
+        """
+        Same as get_transit_range_data, but splits the range across the chart process pool.
+        
+        Each worker builds the natal chart once and reuses it for every chunk it gets.
+        Short ranges (a single chunk) and CHART_PROCESS_WORKERS <= 1 run in this process.
+        
+        Args:
+            from_date (str): Start date in YYYY-MM-DD format
+            to_date (str): End date in YYYY-MM-DD format (inclusive)
+            transit_hour (int): Local hour of each daily transit
+            transit_minute (int): Local minute of each daily transit
+            chunk_days (int): Days per worker task (defaults to TRANSIT_CHUNK_DAYS)
+            progress (Callable): Called with (days done, total days) as each chunk finishes
+            
+        Returns:
+            Dict: Date string -> transit chart data, in date order
+        """
+        chunks = self._split_date_range(from_date, to_date, chunk_days or self.TRANSIT_CHUNK_DAYS)
+        total_days = (datetime.strptime(to_date, "%Y-%m-%d") - datetime.strptime(from_date, "%Y-%m-%d")).days + 1
+        
+        def in_process() -> Dict[str, Dict]:
+            if not progress:
+                return self.get_transit_range_data(from_date, to_date, transit_hour, transit_minute)
+            # Go chunk by chunk so progress is reported as often as with the pool
+            results = {}
+            for start, end in chunks:
+                results.update(self.get_transit_range_data(start, end, transit_hour, transit_minute))
+                progress(len(results), total_days)
+            return results
+        
+        if CHART_PROCESS_WORKERS <= 1 or len(chunks) <= 1:
+            return in_process()
+        
+        try:
+            pool = get_process_pool()
+            futures = [
+                pool.submit(_transit_range_chunk, self.init_params, start, end, transit_hour, transit_minute)
+                for start, end in chunks
+            ]
+            logger.info(f"Split transit range {from_date} to {to_date} into {len(chunks)} chunks")
+            
+            # Chunks are consecutive, so merging in submission order keeps dates sorted
+            results = {}
+            for future in futures:
+                results.update(future.result())
+                if progress:
+                    progress(len(results), total_days)
+            return results
+            
+        except BrokenProcessPool as e:
+            logger.error(f"Chart process pool broke, computing transit range in process: {str(e)}")
+            reset_process_pool()
+            return in_process()
         except Exception as e:
-            logger.error(f"Error converting transit data to JSON: {str(e)}")
-            raise
+            logger.error(f"Parallel transit range failed, computing in process: {str(e)}")
+            return in_process()
+
+    @property
+    def transit_fingerprint(self) -> str:
+        """Fingerprint of this natal chart for the transit day cache"""
+        natal_key = NatalCache.key(
+            self.year, self.month, self.day, self.hour, self.minute,
+            self.latitude, self.longitude, self.zodiac_type, self.sidereal_mode
+        )
+        return TransitDayCache.fingerprint(natal_key, self.subject.name, f"{self.subject.city}, {self.subject.nation}")
+
+    @staticmethod
+    def _consecutive_ranges(dates: List[str]) -> List[tuple]:
+        """Group sorted YYYY-MM-DD dates into (start, end) ranges of consecutive days"""
+        ranges = []
+        for date_str in dates:
+            current = datetime.strptime(date_str, "%Y-%m-%d")
+            if ranges and current - datetime.strptime(ranges[-1][1], "%Y-%m-%d") == timedelta(days=1):
+                ranges[-1] = (ranges[-1][0], date_str)
+            else:
+                ranges.append((date_str, date_str))
+        return ranges
+
+    def get_transit_range_data_incremental(self, from_date: str, to_date: str,
+                                           transit_hour: int = 12, transit_minute: int = 0,
+                                           progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Dict]:
+        """
+        Same as get_transit_range_data_parallel, but reuses days computed by earlier loops.
+        
+        Days already in the transit day cache for this natal chart, time and zodiac
+        are read back; only the missing days are computed (one ephemeris pass per run
+        of consecutive missing days) and then stored for the next loop.
+        
+        Args:
+            from_date (str): Start date in YYYY-MM-DD format
+            to_date (str): End date in YYYY-MM-DD format (inclusive)
+            transit_hour (int): Local hour of each daily transit
+            transit_minute (int): Local minute of each daily transit
+            progress (Callable): Called with (days done, total days) once the cached days are
+                read and as each computed chunk finishes
+            
+        Returns:
+            Dict: Date string -> transit chart data, in date order
+        """
+        day_cache = get_transit_day_cache()
+        if day_cache is None:
+            return self.get_transit_range_data_parallel(from_date, to_date, transit_hour, transit_minute,
+                                                        progress=progress)
+        
+        dates = [t.strftime("%Y-%m-%d") for t in EphemerisEngine.daily_times(from_date, to_date)]
+        fingerprint = self.transit_fingerprint
+        days = day_cache.get_days(fingerprint, dates, transit_hour, transit_minute)
+        missing = [date_str for date_str in dates if date_str not in days]
+        logger.info(f"Transit range {from_date} to {to_date}: {len(days)} days cached, {len(missing)} to compute")
+        if progress:
+            progress(len(days), len(dates))
+        
+        for start, end in self._consecutive_ranges(missing):
+            run_progress = None
+            if progress:
+                run_progress = lambda done, _, before=len(days): progress(before + done, len(dates))
+            computed = self.get_transit_range_data_parallel(start, end, transit_hour, transit_minute,
+                                                            progress=run_progress)
+            day_cache.set_days(fingerprint, computed, transit_hour, transit_minute)
+            days.update(computed)
+        
+        return {date_str: days[date_str] for date_str in dates if date_str in days}
+
+    def _format_houses(self, house_points):
+        """Build the houses block of chart data from 12 house cusp points (None when missing)"""
+        houses = {}
+        for house_num, point in enumerate(house_points, start=1):
+            details = {
+                "sign": point["sign"] if point is not None else "",
+                "position": point["position"] if point is not None else 0,
+                "abs_pos": point["abs_pos"] if point is not None else 0,
+                "house_num": house_num
+            }
+            if house_num == 1:
+                houses["ascendant"] = dict(details)
+            houses[f"house_{house_num}"] = details
+            if house_num == 10:
+                houses["midheaven"] = dict(details)
+        return houses
+
+    def _get_houses_data(self, subject):
+        """Get the houses block of chart data for a kerykeion subject"""
+        return self._format_houses([getattr(subject, attr, None) for attr in self.HOUSE_ATTRIBUTES])
+
+    def _get_transit_natal_data(self, date_str):
+        """Get the natal side of transit chart data, with declinations for the given date"""
+        return {
+            "subject": {
+                "name": self.subject.name,
+                "birth_data": {
+                    "date": f"{self.subject.year}-{self.subject.month}-{self.subject.day}",
+                    "time": f"{self.subject.hour}:{self.subject.minute}",
+                    "location": f"{self.subject.city}, {self.subject.nation}",
+                    "longitude": round(self.longitude, 4),
+                    "latitude": round(self.latitude, 4)
+                },
+                "planets": {
+                    planet: self._get_transit_planet_details(getattr(self.subject, planet), date_str)
+                    for planet in self.TRANSIT_PLANETS
+                },
+                "houses": self._get_houses_data(self.subject)
+            }
+        }
+
+    def _assemble_transit_chart_data(self, natal_data, transit_data, chart_path):
+        """Run the transit calculators and assemble the final transit chart data"""
+        # Calculate aspects after both natal and transit data are created
+        super_calc = SuperAspectCalculator()
+        super_aspects = super_calc.find_super_aspects(natal_data)
+        transit_super_aspects = super_calc.find_super_aspects(transit_data)
+
+        # Positions as arrays, shared by the linkage and turbulent transit calculators
+        natal_state = ChartState.from_chart_data(natal_data)
+        transit_state = ChartState.from_chart_data(transit_data)
+
+        # Calculate Cinderella aspects
+        linkage_calc = MagiLinkageCalculator()
+        cinderella_aspects = linkage_calc.find_cinderella_linkages(natal_state, transit_state)
+        
+        # Calculate Golden Transits
+        golden_transits = linkage_calc.find_golden_transits(natal_state, transit_state)
+
+        # Add aspects to transit data
+        transit_data["transit_super_aspects"] = transit_super_aspects
+        transit_data["cinderella_aspects"] = cinderella_aspects
+        transit_data["cinderella_transits"] = cinderella_aspects
+        transit_data["aspects"] = []  # Keep empty array for consistency
+        transit_data["turbulent_transits"] = []  # Will be filled later
+        transit_data["golden_transits"] = golden_transits  # Add golden transits
+
+        # Add turbulent transit analysis
+        turbulent_transits = self.turbulent_transit_service.analyze_turbulent_transits(
+            natal_data=natal_state,
+            transit_data=transit_state
+        )
+
+        # Create final chart data
+        chart_data = {
+            "natal": natal_data["subject"],
+            "transit": transit_data,
+            "natal_super_aspects": super_aspects,
+            "chart_path": chart_path,
+            "turbulent_transits": turbulent_transits,
+            "golden_transits": golden_transits,  # Add golden transits here too
+            "cinderella_transits": cinderella_aspects
+        }
+
+        logger.info(f"Found {len(turbulent_transits)} turbulent transits")
+        logger.info(f"Found {len(golden_transits)} golden transits")
+        logger.info(f"Found {len(cinderella_aspects)} cinderella transits")
+        return chart_data
+
 
     def calculate_obliquity(self, year, month, day):
         """
@@ -716,16 +873,16 @@ class ChartCreator:
             lat = latitude if latitude is not None else self.subject.lat
             
             print(f"Getting declination for {planet_name} on {date_str}")
-            declination = self.nasa_service.get_declination(
+            declination = self.declination_service.get_declination(
                 planet_name,
                 date_str,
                 lng,
                 lat
             )
             
-            # Only fall back to calculation if NASA API fails
+            # Only fall back to the longitude-only calculation for bodies without local ephemeris
             if declination is None:
-                logger.warning(f"NASA API failed for {planet_name}, using calculation fallback")
+                logger.warning(f"No local declination for {planet_name}, using calculation fallback")
                 return self.calculate_declination(abs_pos)
                 
             return declination
@@ -795,92 +952,7 @@ class ChartCreator:
                         "rahu": get_planet_details(self.subject.true_node),
                         "ketu": get_planet_details(self.subject.true_south_node)
                     },
-                    "houses": {
-                        "ascendant": {
-                            "sign": self.subject.first_house["sign"],
-                            "position": self.subject.first_house["position"],
-                            "abs_pos": self.subject.first_house["abs_pos"],
-                            "house_num": 1
-                        },
-                        "house_1": {
-                            "sign": self.subject.first_house["sign"],
-                            "position": self.subject.first_house["position"],
-                            "abs_pos": self.subject.first_house["abs_pos"],
-                            "house_num": 1
-                        },
-                        "house_2": {
-                            "sign": self.subject.second_house["sign"] if hasattr(self.subject, "second_house") else "",
-                            "position": self.subject.second_house["position"] if hasattr(self.subject, "second_house") else 0,
-                            "abs_pos": self.subject.second_house["abs_pos"] if hasattr(self.subject, "second_house") else 0,
-                            "house_num": 2
-                        },
-                        "house_3": {
-                            "sign": self.subject.third_house["sign"] if hasattr(self.subject, "third_house") else "",
-                            "position": self.subject.third_house["position"] if hasattr(self.subject, "third_house") else 0,
-                            "abs_pos": self.subject.third_house["abs_pos"] if hasattr(self.subject, "third_house") else 0,
-                            "house_num": 3
-                        },
-                        "house_4": {
-                            "sign": self.subject.fourth_house["sign"] if hasattr(self.subject, "fourth_house") else "",
-                            "position": self.subject.fourth_house["position"] if hasattr(self.subject, "fourth_house") else 0,
-                            "abs_pos": self.subject.fourth_house["abs_pos"] if hasattr(self.subject, "fourth_house") else 0,
-                            "house_num": 4
-                        },
-                        "house_5": {
-                            "sign": self.subject.fifth_house["sign"] if hasattr(self.subject, "fifth_house") else "",
-                            "position": self.subject.fifth_house["position"] if hasattr(self.subject, "fifth_house") else 0,
-                            "abs_pos": self.subject.fifth_house["abs_pos"] if hasattr(self.subject, "fifth_house") else 0,
-                            "house_num": 5
-                        },
-                        "house_6": {
-                            "sign": self.subject.sixth_house["sign"] if hasattr(self.subject, "sixth_house") else "",
-                            "position": self.subject.sixth_house["position"] if hasattr(self.subject, "sixth_house") else 0,
-                            "abs_pos": self.subject.sixth_house["abs_pos"] if hasattr(self.subject, "sixth_house") else 0,
-                            "house_num": 6
-                        },
-                        "house_7": {
-                            "sign": self.subject.seventh_house["sign"] if hasattr(self.subject, "seventh_house") else "",
-                            "position": self.subject.seventh_house["position"] if hasattr(self.subject, "seventh_house") else 0,
-                            "abs_pos": self.subject.seventh_house["abs_pos"] if hasattr(self.subject, "seventh_house") else 0,
-                            "house_num": 7
-                        },
-                        "house_8": {
-                            "sign": self.subject.eighth_house["sign"] if hasattr(self.subject, "eighth_house") else "",
-                            "position": self.subject.eighth_house["position"] if hasattr(self.subject, "eighth_house") else 0,
-                            "abs_pos": self.subject.eighth_house["abs_pos"] if hasattr(self.subject, "eighth_house") else 0,
-                            "house_num": 8
-                        },
-                        "house_9": {
-                            "sign": self.subject.ninth_house["sign"] if hasattr(self.subject, "ninth_house") else "",
-                            "position": self.subject.ninth_house["position"] if hasattr(self.subject, "ninth_house") else 0,
-                            "abs_pos": self.subject.ninth_house["abs_pos"] if hasattr(self.subject, "ninth_house") else 0,
-                            "house_num": 9
-                        },
-                        "house_10": {
-                            "sign": self.subject.tenth_house["sign"],
-                            "position": self.subject.tenth_house["position"],
-                            "abs_pos": self.subject.tenth_house["abs_pos"],
-                            "house_num": 10
-                        },
-                        "midheaven": {
-                            "sign": self.subject.tenth_house["sign"],
-                            "position": self.subject.tenth_house["position"],
-                            "abs_pos": self.subject.tenth_house["abs_pos"],
-                            "house_num": 10
-                        },
-                        "house_11": {
-                            "sign": self.subject.eleventh_house["sign"] if hasattr(self.subject, "eleventh_house") else "",
-                            "position": self.subject.eleventh_house["position"] if hasattr(self.subject, "eleventh_house") else 0,
-                            "abs_pos": self.subject.eleventh_house["abs_pos"] if hasattr(self.subject, "eleventh_house") else 0,
-                            "house_num": 11
-                        },
-                        "house_12": {
-                            "sign": self.subject.twelfth_house["sign"] if hasattr(self.subject, "twelfth_house") else "",
-                            "position": self.subject.twelfth_house["position"] if hasattr(self.subject, "twelfth_house") else 0,
-                            "abs_pos": self.subject.twelfth_house["abs_pos"] if hasattr(self.subject, "twelfth_house") else 0,
-                            "house_num": 12
-                        }
-                    }
+                    "houses": self._get_houses_data(self.subject)
                 }
             }
 
@@ -972,8 +1044,7 @@ class ChartCreator:
             lat2, lng2 = coordinates2
             
             # Get timezone for second person
-            tf = TimezoneFinder()
-            tz_str2 = tf.timezone_at(lat=lat2, lng=lng2)
+            tz_str2 = get_timezone(lat2, lng2)
             if not tz_str2:
                 raise ValueError(f"Could not determine timezone for coordinates: {lat2}, {lng2}")
 
@@ -1108,28 +1179,19 @@ class ChartCreator:
                 }
             }
 
-            # Calculate Saturn clashes
+            # Calculate Saturn clashes and the Cinderella, Sexual, Romance and Marital linkages in one pass
             magi_calc = MagiSynastryCalculator()
-            saturn_clashes = magi_calc.check_saturn_clashes(person1_data, person2_data)
-
-            # Calculate Cinderella linkages
-            linkage_calc = MagiLinkageCalculator()
-            sexual_calc = SexualLinkageCalculator()
-            cinderella_linkages = linkage_calc.find_cinderella_linkages(person1_data, person2_data)
+            linkages = magi_calc.find_linkages(person1_data, person2_data)
+            saturn_clashes = linkages['saturn_clashes']
+            cinderella_linkages = linkages['cinderella_linkages']
+            sexual_linkages = linkages['sexual_linkages']
+            romance_linkages = linkages['romance_linkages']
+            marital_linkages = linkages['marital_linkages']
 
             # Calculate Super aspects for both charts
             super_calc = SuperAspectCalculator()
             person1_super_aspects = super_calc.find_super_aspects(person1_data)
             person2_super_aspects = super_calc.find_super_aspects(person2_data)
-            sexual_linkages = sexual_calc.find_sexual_linkages(person1_data, person2_data)
-
-            # Calculate Romance linkages
-            romance_calc = RomanceLinkageCalculator()
-            romance_linkages = romance_calc.find_romance_linkages(person1_data, person2_data)
-            
-            # Calculate Marital linkages
-            marital_calc = MaritalLinkageCalculator()
-            marital_linkages = marital_calc.find_marital_linkages(person1_data, person2_data)
             
             # Calculate synastry score
             score_calculator = SynastryScoreCalculator()
@@ -1165,6 +1227,81 @@ class ChartCreator:
             logger.error(f"Error converting synastry data to JSON: {str(e)}")
             raise
 
+    def _transit_loop_day(self, date_str: str, transit_data: Dict, midpoints: Optional[Dict] = None,
+                          cosmo_calc: Optional[CosmobiologyCalculator] = None) -> Dict:
+        """
+        Build one day's record of a transit loop
+        
+        Args:
+            date_str (str): Date in YYYY-MM-DD format
+            transit_data (Dict): Transit chart data of the day
+            midpoints (Dict): Natal midpoints to check for activations
+            cosmo_calc (CosmobiologyCalculator): Calculator for the midpoint activations
+            
+        Returns:
+            Dict: date, daily_aspects, turbulent_transits, cinderella_transits and
+            golden_transits (plus cosmobiology_activations when midpoints are given)
+        """
+        record = {"date": date_str, "daily_aspects": transit_data}
+        
+        # Extract and add transit_date to each transit
+        for key in ("turbulent_transits", "cinderella_transits", "golden_transits"):
+            if key in transit_data:
+                transits = transit_data[key]
+                for transit in transits:
+                    transit['transit_date'] = date_str
+                record[key] = transits
+        
+        # Only process cosmobiology if midpoints were provided
+        if midpoints and cosmo_calc:
+            daily_cosmo_activations = cosmo_calc.find_midpoint_activations(
+                midpoints, ChartState.from_chart_data(transit_data['transit'])
+            )
+            for activation in daily_cosmo_activations:
+                activation['date'] = date_str
+            record["cosmobiology_activations"] = daily_cosmo_activations
+        
+        return record
+
+    def iter_transit_loop(self, from_date: str, to_date: str, midpoints: Optional[Dict] = None,
+                          transit_hour: int = 12, transit_minute: int = 0,
+                          chunk_days: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Yield a transit loop one day at a time
+        
+        Days are computed a chunk at a time (reusing cached days), so only one chunk
+        is held in memory however long the range is.
+        
+        Args:
+            from_date (str): Start date in YYYY-MM-DD format
+            to_date (str): End date in YYYY-MM-DD format (inclusive)
+            midpoints (Dict): Natal midpoints to check for activations
+            transit_hour (int): Local hour of each daily transit
+            transit_minute (int): Local minute of each daily transit
+            chunk_days (int): Days per step (defaults to TRANSIT_STREAM_CHUNK_DAYS)
+            
+        Yields:
+            Dict: One day's record (see _transit_loop_day), in date order
+        """
+        cosmo_calc = CosmobiologyCalculator() if midpoints else None
+        logger.info(f"Streaming transit loop from {from_date} to {to_date}")
+        
+        for start, end in self._split_date_range(from_date, to_date, chunk_days or self.TRANSIT_STREAM_CHUNK_DAYS):
+            transit_days = self.get_transit_range_data_incremental(start, end, transit_hour, transit_minute)
+            for date_str, transit_data in transit_days.items():
+                yield self._transit_loop_day(date_str, transit_data, midpoints, cosmo_calc)
+
+    async def stream_transit_loop(self, from_date: str, to_date: str, midpoints: Optional[Dict] = None,
+                                  transit_hour: int = 12, transit_minute: int = 0,
+                                  chunk_days: Optional[int] = None) -> AsyncIterator[Dict]:
+        """Async version of iter_transit_loop; each step runs on the chart executor"""
+        days = self.iter_transit_loop(from_date, to_date, midpoints, transit_hour, transit_minute, chunk_days)
+        while True:
+            record = await run_blocking(next, days, None)
+            if record is None:
+                break
+            yield record
+
     async def create_transit_loop(
         self,
         from_date: str,
@@ -1174,17 +1311,17 @@ class ChartCreator:
         aspects_only: bool = False,
         filter_orb: Optional[float] = None,
         filter_aspects: Optional[List[str]] = None,
-        filter_planets: Optional[List[str]] = None
+        filter_planets: Optional[List[str]] = None,
+        progress: Optional[Callable[[int, int], None]] = None
     ) -> Dict:
-        """Create transit loop charts for a date range"""
+        """Create transit loop charts for a date range
+
+        progress, when given, is called with (days done, total days) as the days are computed.
+        """
         try:
             # Initialize cosmobiology calculator only if midpoints are provided
             cosmo_calc = CosmobiologyCalculator() if midpoints else None
-            
-            # Convert string dates to datetime objects
-            start_date = datetime.strptime(from_date, "%Y-%m-%d")
-            end_date = datetime.strptime(to_date, "%Y-%m-%d")
-            logger.info(f"Creating transit loop from {start_date} to {end_date}")
+            logger.info(f"Creating transit loop from {from_date} to {to_date}")
             
             daily_aspects = {}
             turbulent_transits = {}
@@ -1192,74 +1329,23 @@ class ChartCreator:
             golden_transits = {}
             cosmobiology_activations = {} if midpoints else None
             
-            current_date = start_date
-            while current_date <= end_date:
-                # Create transit chart for current date
-                transit_data = await self.create_transit_chart(  # Add await here
-                    transit_year=current_date.year,
-                    transit_month=current_date.month,
-                    transit_day=current_date.day,
-                    transit_hour=12,  # Default to noon
-                    transit_minute=0
-                )
-                
-                # Process the transit data and store results
-                date_str = current_date.strftime("%Y-%m-%d")
-                if isinstance(transit_data, str):
-                    transit_data = json.loads(transit_data)
-                    
-                daily_aspects[date_str] = transit_data
-                
-                # Extract and add transit_date to each transit
-                if "turbulent_transits" in transit_data:
-                    turbulent_list = transit_data["turbulent_transits"]
-                    for transit in turbulent_list:
-                        transit['transit_date'] = date_str
-                    turbulent_transits[date_str] = turbulent_list
-
-                if "cinderella_transits" in transit_data:
-                    cinderella_list = transit_data["cinderella_transits"]
-                    for transit in cinderella_list:
-                        transit['transit_date'] = date_str
-                    cinderella_transits[date_str] = cinderella_list
-
-                if "golden_transits" in transit_data:
-                    golden_list = transit_data["golden_transits"]
-                    for transit in golden_list:
-                        transit['transit_date'] = date_str
-                    golden_transits[date_str] = golden_list
-                
-                # Only process cosmobiology if midpoints were provided
-                if midpoints and cosmo_calc:
-                    daily_cosmo_activations = []
-                    transit_planets = transit_data['transit']['subject']['planets']
-                    
-                    # Convert midpoints data to format needed by CosmobiologyCalculator
-                    for mp_name, mp_data in midpoints.items():
-                        # Split the midpoint name (format is "planet1-planet2")
-                        p1, p2 = mp_name.split('-')
-                        midpoint_planets = (p1, p2)
-                        midpoint_pos = mp_data['midpoint']
-                        
-                        for transit_planet_name, transit_planet_data in transit_planets.items():
-                            transit_pos = transit_planet_data['abs_pos']
-                            
-                            activation = cosmo_calc.analyze_transit_to_midpoint(
-                                midpoint_pos=midpoint_pos,
-                                transit_planet=transit_planet_name,
-                                transit_pos=transit_pos,
-                                midpoint_planets=midpoint_planets
-                            )
-                            
-                            if activation:
-                                activation['date'] = date_str
-                                daily_cosmo_activations.append(activation)
-                    
-                    if daily_cosmo_activations:
-                        cosmobiology_activations[date_str] = daily_cosmo_activations
-                
-                # Move to next day
-                current_date += timedelta(days=1)
+            # Every day's transits, reusing days computed by earlier loops (noon by default)
+            transit_days = await run_blocking(
+                self.get_transit_range_data_incremental, from_date, to_date, transit_hour=12, transit_minute=0,
+                progress=progress
+            )
+            
+            for date_str, transit_data in transit_days.items():
+                record = self._transit_loop_day(date_str, transit_data, midpoints, cosmo_calc)
+                daily_aspects[date_str] = record["daily_aspects"]
+                if "turbulent_transits" in record:
+                    turbulent_transits[date_str] = record["turbulent_transits"]
+                if "cinderella_transits" in record:
+                    cinderella_transits[date_str] = record["cinderella_transits"]
+                if "golden_transits" in record:
+                    golden_transits[date_str] = record["golden_transits"]
+                if record.get("cosmobiology_activations"):
+                    cosmobiology_activations[date_str] = record["cosmobiology_activations"]
             
             result = {
                 "daily_aspects": daily_aspects,
@@ -1389,78 +1475,62 @@ class ChartCreator:
         Focuses specifically on Cinderella and Turbulent transits.
         """
         try:
-            # Convert date strings to datetime objects
-            start_date = datetime.strptime(from_date, "%Y-%m-%d")
-            end_date = datetime.strptime(to_date, "%Y-%m-%d")
-            
             # Initialize results dictionary
             results = {}
             
             # Define marriage-relevant planets to filter
             marriage_planets = ["chiron", "neptune", "venus", "saturn", "jupiter", "sun"]
             
+            # Transit data for the whole range, without rendering any charts
+            transit_days = self.get_transit_range_data_incremental(from_date, to_date, transit_hour, transit_minute)
+            linkage_calc = MagiLinkageCalculator()
+            
             # Loop through each date
-            current_date = start_date
-            while current_date <= end_date:
-                # Create transit chart for current date
-                transit_data = self.create_transit_chart(
-                    transit_year=current_date.year,
-                    transit_month=current_date.month,
-                    transit_day=current_date.day,
-                    transit_hour=transit_hour,
-                    transit_minute=transit_minute
-                )
-                
-                if isinstance(transit_data, str):
-                    try:
-                        data = json.loads(transit_data)
-                        
-                        # Filter for marriage-relevant planets only
-                        natal_planets = data["natal"]["planets"]
-                        transit_planets = data["transit"]["subject"]["planets"]
-                        
-                        filtered_natal = {k: v for k, v in natal_planets.items() 
-                                       if k.lower() in marriage_planets}
-                        filtered_transit = {k: v for k, v in transit_planets.items() 
-                                         if k.lower() in marriage_planets}
-                        
-                        # Update the data with filtered planets
-                        data["natal"]["planets"] = filtered_natal
-                        data["transit"]["subject"]["planets"] = filtered_transit
-                        
-                        # Get Cinderella aspects
-                        linkage_calc = MagiLinkageCalculator()
-                        cinderella_aspects = linkage_calc.find_cinderella_linkages(
-                            {"subject": data["natal"]},
-                            data["transit"]
-                        )
-                        
-                        # Get turbulent transits
-                        turbulent_transits = self.turbulent_transit_service.analyze_turbulent_transits(
-                            natal_data={"subject": data["natal"]},
-                            transit_data=data["transit"]["subject"]
-                        )
-                        
-                        # Create final structure for this date
-                        date_data = {
-                            "date": current_date.strftime("%Y-%m-%d"),
-                            "time": f"{transit_hour:02d}:{transit_minute:02d}",
-                            "natal_planets": filtered_natal,
-                            "transit_planets": filtered_transit,
-                            "cinderella_aspects": cinderella_aspects,
-                            "turbulent_transits": turbulent_transits
-                        }
-                        
-                        # Only include dates with relevant aspects
-                        if cinderella_aspects or turbulent_transits:
-                            results[current_date.strftime("%Y-%m-%d")] = date_data
-                        
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Error decoding transit data for {current_date}: {e}")
-                        continue
+            for date_key, data in transit_days.items():
+                current_date = datetime.strptime(date_key, "%Y-%m-%d")
+                try:
+                    # Filter for marriage-relevant planets only
+                    natal_planets = data["natal"]["planets"]
+                    transit_planets = data["transit"]["subject"]["planets"]
+                    
+                    filtered_natal = {k: v for k, v in natal_planets.items() 
+                                   if k.lower() in marriage_planets}
+                    filtered_transit = {k: v for k, v in transit_planets.items() 
+                                     if k.lower() in marriage_planets}
+                    
+                    # Update the data with filtered planets
+                    data["natal"]["planets"] = filtered_natal
+                    data["transit"]["subject"]["planets"] = filtered_transit
+                    
+                    natal_state = ChartState.from_planets(filtered_natal, data["natal"]["name"])
+                    transit_state = ChartState.from_planets(filtered_transit, "Transit")
+                    
+                    # Get Cinderella aspects
+                    cinderella_aspects = linkage_calc.find_cinderella_linkages(natal_state, transit_state)
+                    
+                    # Get turbulent transits
+                    turbulent_transits = self.turbulent_transit_service.analyze_turbulent_transits(
+                        natal_data=natal_state,
+                        transit_data=transit_state
+                    )
+                    
+                    # Create final structure for this date
+                    date_data = {
+                        "date": current_date.strftime("%Y-%m-%d"),
+                        "time": f"{transit_hour:02d}:{transit_minute:02d}",
+                        "natal_planets": filtered_natal,
+                        "transit_planets": filtered_transit,
+                        "cinderella_aspects": cinderella_aspects,
+                        "turbulent_transits": turbulent_transits
+                    }
+                    
+                    # Only include dates with relevant aspects
+                    if cinderella_aspects or turbulent_transits:
+                        results[current_date.strftime("%Y-%m-%d")] = date_data
                     
-                # Move to next day
-                current_date += timedelta(days=1)
+                except KeyError as e:
+                    logger.error(f"Missing transit data for {current_date}: {e}")
+                    continue
             
             return results
             
@@ -1507,9 +1577,9 @@ class ChartCreator:
     async def find_degree_rising_time(self, date: str, degree: float, sign: str) -> Dict:
         """Find when a specific degree of a zodiac sign rises as the Ascendant.
         
-        Uses a two-pass algorithm for better precision:
-        1. First pass: Check every 4 minutes to find approximate time
-        2. Second pass: Fine-tune around found time checking every minute
+        The Ascendant is computed directly from local sidereal time, latitude and the
+        obliquity of the ecliptic. The day is sampled every 4 minutes to bracket the
+        crossing, which is then refined by bisection to a fraction of a second.
         
         Args:
             date (str): Date to check in YYYY-MM-DD format
@@ -1519,147 +1589,88 @@ class ChartCreator:
         Returns:
             Dict: Time details when the degree rises, or best approximation
         """
-        # Convert date string to datetime
-        date_obj = datetime.strptime(date, "%Y-%m-%d")
+        return await run_blocking(self._find_degree_rising_time, date, degree, sign)
+
+    async def find_degree_rising_times(self, dates: List[str], degree: float, sign: str) -> Dict[str, Dict]:
+        """Find when a degree rises on each of several dates.
         
-        # Get sign number (0-11)
-        signs = ["Ari", "Tau", "Gem", "Can", "Leo", "Vir", "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis"]
-        sign_num = signs.index(sign)
+        Args:
+            dates (List[str]): Dates to check in YYYY-MM-DD format
+            degree (float): Degree within sign (0-29.99)
+            sign (str): Three-letter zodiac sign code
+            
+        Returns:
+            Dict: Date string -> time details as returned by find_degree_rising_time
+        """
+        return await run_blocking(
+            lambda: {day: self._find_degree_rising_time(day, degree, sign) for day in dates}
+        )
+
+    def _find_degree_rising_time(self, date: str, degree: float, sign: str) -> Dict:
+        """Blocking implementation of find_degree_rising_time"""
+        target_pos = (SIGNS.index(sign) * 30) + degree
         
-        # Calculate absolute position (0-360)
-        target_pos = (sign_num * 30) + degree
+        # Search from local midnight to the next local midnight
+        day_start = datetime.strptime(date, "%Y-%m-%d")
+        start_jd, end_jd = EphemerisEngine.julian_days(
+            [day_start, day_start + timedelta(days=1)], self.timezone_str
+        )
         
-        # Initialize results list
-        results = []
-        best_match = None
-        smallest_diff = float('inf')
+        sidereal = getattr(self.subject, 'zodiac_type', None) == "Sidereal"
+        with SWISSEPH_LOCK:
+            if sidereal:
+                set_sidereal_mode(getattr(self.subject, 'sidereal_mode', None))
+            crossings = find_ascendant_crossings(
+                start_jd, end_jd, self.latitude, self.longitude, target_pos, sidereal=sidereal
+            )
+            # Near the poles some degrees never rise; fall back to the closest approach
+            closest = None if crossings else closest_ascendant_sample(
+                start_jd, end_jd, self.latitude, self.longitude, target_pos, sidereal=sidereal
+            )
         
-        # First pass: Check every 4 minutes
-        for hour in range(24):
-            for minute in range(0, 60, 4):
-                current_time = date_obj.replace(hour=hour, minute=minute)
-                
-                # Create base parameters for transit subject
-                transit_params = {
-                    "name": "Transit",
-                    "year": current_time.year,
-                    "month": current_time.month,
-                    "day": current_time.day,
-                    "hour": current_time.hour,
-                    "minute": current_time.minute,
-                    "city": self.subject.city,
-                    "nation": self.subject.nation,
-                    "lat": self.latitude,
-                    "lng": self.longitude,
-                    "tz_str": self.timezone_str,
-                    "online": False
-                }
-                
-                # Use the same zodiac settings as the natal chart if they were specified
-                if hasattr(self.subject, 'zodiac_type'):
-                    transit_params["zodiac_type"] = self.subject.zodiac_type
-                    
-                    # If sidereal zodiac is specified, also use the same sidereal_mode
-                    if self.subject.zodiac_type == "Sidereal" and hasattr(self.subject, 'sidereal_mode'):
-                        transit_params["sidereal_mode"] = self.subject.sidereal_mode
-                
-                # Create transit subject with the parameters
-                transit_subject = AstrologicalSubject(**transit_params)
-                
-                # Get the Ascendant position
-                asc_pos = transit_subject.first_house["abs_pos"]
-                
-                # Calculate difference, handling 360° wrap
-                diff = min(
-                    abs(asc_pos - target_pos),
-                    abs(asc_pos - target_pos - 360),
-                    abs(asc_pos - target_pos + 360)
-                )
-                
-                # Keep track of best match
-                if diff < smallest_diff:
-                    smallest_diff = diff
-                    best_match = (hour, minute, asc_pos)
-                
-                # If within initial orb, add to results
-                if diff < 0.5:
-                    results.append((hour, minute, asc_pos))
+        local_tz = pytz.timezone(self.timezone_str)
         
-        # If we found any matches in first pass
-        if results:
-            # Second pass: Fine-tune each potential match
-            refined_results = []
-            for hour, minute, _ in results:
-                # Check 5 minutes before and after in 1-minute increments
-                for fine_minute in range(max(0, minute - 5), min(60, minute + 6)):
-                    current_time = date_obj.replace(hour=hour, minute=fine_minute)
-                    
-                    # Create base parameters for transit subject
-                    transit_params = {
-                        "name": "Transit",
-                        "year": current_time.year,
-                        "month": current_time.month,
-                        "day": current_time.day,
-                        "hour": current_time.hour,
-                        "minute": fine_minute,
-                        "city": self.subject.city,
-                        "nation": self.subject.nation,
-                        "lat": self.latitude,
-                        "lng": self.longitude,
-                        "tz_str": self.timezone_str,
-                        "online": False
-                    }
-                    
-                    # Use the same zodiac settings as the natal chart if they were specified
-                    if hasattr(self.subject, 'zodiac_type'):
-                        transit_params["zodiac_type"] = self.subject.zodiac_type
-                        
-                        # If sidereal zodiac is specified, also use the same sidereal_mode
-                        if self.subject.zodiac_type == "Sidereal" and hasattr(self.subject, 'sidereal_mode'):
-                            transit_params["sidereal_mode"] = self.subject.sidereal_mode
-                    
-                    # Create transit subject with the parameters
-                    transit_subject = AstrologicalSubject(**transit_params)
-                    
-                    asc_pos = transit_subject.first_house["abs_pos"]
-                    diff = min(
-                        abs(asc_pos - target_pos),
-                        abs(asc_pos - target_pos - 360),
-                        abs(asc_pos - target_pos + 360)
-                    )
-                    
-                    if diff < 0.1:  # Tighter orb for refined results
-                        # Convert to local time
-                        local_tz = pytz.timezone(self.timezone_str)
-                        local_time = current_time.replace(tzinfo=pytz.UTC).astimezone(local_tz)
-                        
-                        refined_results.append({
-                            "time": local_time.strftime("%H:%M"),
-                            "date": local_time.strftime("%Y-%m-%d"),
-                            "timezone": str(local_time.tzinfo),
-                            "ascendant_pos": asc_pos,
-                            "difference": round(diff, 6)
-                        })
-            
-            # Sort by smallest difference and return best match
-            if refined_results:
-                return min(refined_results, key=lambda x: x['difference'])
+        if crossings:
+            local_times = [julian_day_to_datetime(jd).astimezone(local_tz) for jd, _ in crossings]
+            local_time = local_times[0]
+            asc_pos = crossings[0][1]
+            
+            return {
+                "time": local_time.strftime("%H:%M"),
+                "time_precise": local_time.strftime("%H:%M:%S"),
+                "date": local_time.strftime("%Y-%m-%d"),
+                "timezone": str(local_time.tzinfo),
+                "ascendant_pos": asc_pos,
+                "difference": round(abs(normalize_angle(asc_pos - target_pos)), 6),
+                "all_times": [t.strftime("%H:%M:%S") for t in local_times]
+            }
         
-        # If no precise match found, use best approximation
-        if best_match:
-            hour, minute, asc_pos = best_match
-            current_time = date_obj.replace(hour=hour, minute=minute)
-            local_tz = pytz.timezone(self.timezone_str)
-            local_time = current_time.replace(tzinfo=pytz.UTC).astimezone(local_tz)
+        if closest:
+            jd, asc_pos, distance = closest
+            local_time = julian_day_to_datetime(jd).astimezone(local_tz)
             
             return {
                 "time": local_time.strftime("%H:%M"),
                 "date": local_time.strftime("%Y-%m-%d"),
                 "timezone": str(local_time.tzinfo),
                 "ascendant_pos": asc_pos,
-                "difference": round(smallest_diff, 6),
+                "difference": round(distance, 6),
                 "is_approximate": True
             }
         
         # If all else fails
-        raise ValueError(f"Could not find time when {degree}° {sign} rises on {date}")
\ No newline at end of file
+        raise ValueError(f"Could not find time when {degree}° {sign} rises on {date}")
+
+
+# ChartCreators kept alive in each pool worker, keyed by constructor arguments
+_worker_chart_creators = LRUCache(maxsize=8)
+
+def _transit_range_chunk(init_params: Dict, from_date: str, to_date: str,
+                         transit_hour: int, transit_minute: int) -> Dict[str, Dict]:
+    """Process pool task: transit data for one chunk of a date range"""
+    key = tuple(sorted(init_params.items()))
+    chart_creator = _worker_chart_creators.get(key)
+    if chart_creator is None:
+        chart_creator = ChartCreator(**init_params)
+        _worker_chart_creators.set(key, chart_creator)
+    return chart_creator.get_transit_range_data(from_date, to_date, transit_hour, transit_minute)
@@ -1,6 +1,10 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 import logging
 
+import numpy as np
+
+from .models.chart_state import BODIES, ChartState
+
 # Set up logger
 logger = logging.getLogger(__name__)
 
@@ -127,4 +131,47 @@ class CosmobiologyCalculator:
                     f"{midpoint_planets[0]}/{midpoint_planets[1]} midpoint"
                 )
         
-        return None 
\ No newline at end of file
+        return None 
+
+    def find_midpoint_activations(self, midpoints: Dict,
+                                  transit_data: Union[Dict, ChartState]) -> List[Dict]:
+        """
+        Find every transit planet making a hard aspect to a natal midpoint
+
+        All transit planets are checked against each midpoint at once; only the hits
+        go through analyze_transit_to_midpoint for categorization.
+
+        Args:
+            midpoints: "planet1-planet2" -> dict with the midpoint position (see
+                ChartCreator.calculate_natal_midpoints)
+            transit_data: Transit ChartState, or transit chart data
+
+        Returns:
+            List[Dict]: Activations in midpoint order, then transit planet order
+        """
+        transit = ChartState.coerce(transit_data)
+        columns = np.flatnonzero(transit.present)
+        positions = transit.longitude[columns]
+        aspect_angles = np.array(list(self.hard_aspects.values()), dtype=np.float64)
+
+        activations = []
+        for mp_name, mp_data in midpoints.items():
+            # Split the midpoint name (format is "planet1-planet2")
+            p1, p2 = mp_name.split('-')
+            midpoint_pos = mp_data['midpoint']
+
+            diff = np.abs(positions - midpoint_pos)
+            angles = np.where(diff > 180, 360 - diff, diff)
+            hits = np.any(np.abs(angles[:, np.newaxis] - aspect_angles) <= self.orb, axis=1)
+
+            for k in np.flatnonzero(hits):
+                activation = self.analyze_transit_to_midpoint(
+                    midpoint_pos=midpoint_pos,
+                    transit_planet=BODIES[columns[k]],
+                    transit_pos=float(positions[k]),
+                    midpoint_planets=(p1, p2)
+                )
+                if activation:
+                    activations.append(activation)
+
+        return activations
@@ -1,7 +1,14 @@
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Union
 import math
 
+import numpy as np
+
+from .models.chart_state import BODIES, BODY_INDEX, ChartState
+
+# Aspects measured between declinations rather than longitudes
+DECLINATION_ASPECTS = ('parallel', 'contraparallel')
+
 @dataclass
 class MagiAspect:
     """Class to hold Magi Aspect data"""
@@ -53,6 +60,32 @@ class MagiAspectCalculator:
             ('chiron', 'neptune')
         ]
 
+        # Aspect tables for the vectorized kernel; longitude aspects keep their priority order
+        self.longitude_aspect_names = [name for name in self.magi_aspects if name not in DECLINATION_ASPECTS]
+        self.aspect_names = self.longitude_aspect_names + list(DECLINATION_ASPECTS)
+        self._longitude_degrees = np.array(
+            [self.magi_aspects[name]['degrees'] for name in self.longitude_aspect_names], dtype=np.float64
+        )
+        self._longitude_orbs = np.array(
+            [self.magi_aspects[name]['orb'] for name in self.longitude_aspect_names], dtype=np.float64
+        )
+
+        # Body pair flags over ChartState columns
+        self.pair_flags = {
+            'is_cinderella': self._pair_matrix(self.cinderella_pairs),
+            'is_sexual': self._pair_matrix(self.sexual_pairs),
+            'is_romance': self._pair_matrix(self.romance_pairs)
+        }
+
+    @staticmethod
+    def _pair_matrix(pairs: List[tuple]) -> np.ndarray:
+        """Symmetric (bodies, bodies) mask that is True for the given planet pairs"""
+        matrix = np.zeros((len(BODIES), len(BODIES)), dtype=bool)
+        for planet1, planet2 in pairs:
+            i, j = BODY_INDEX[planet1], BODY_INDEX[planet2]
+            matrix[i, j] = matrix[j, i] = True
+        return matrix
+
     def calculate_angle_distance(self, pos1: float, pos2: float) -> float:
         """Calculate the shortest angular distance between two positions"""
         diff = abs(pos1 - pos2)
@@ -167,68 +200,106 @@ class MagiAspectCalculator:
             }
         return None
 
-    def calculate_all_aspects(self, planets_data: Dict) -> List[MagiAspect]:
-        """Calculate all aspects between planets"""
+    def find_aspect_hits(self, state: ChartState) -> Dict[str, np.ndarray]:
+        """
+        Match every body pair of a chart, or of each day of a stacked chart, against the Magi aspects
+
+        Builds the pairwise angular distance and declination difference matrices for
+        all days at once and compares them with every aspect angle and orb by
+        broadcasting. Only the hits are returned.
+
+        Args:
+            state: Single or stacked (days, bodies) ChartState
+
+        Returns:
+            Dict[str, np.ndarray]: Arrays with one entry per hit: day, p1 and p2 (body
+            columns, p1 < p2), aspect (index into aspect_names), orbit and actual_degrees.
+            Hits are ordered by day and pair, with the longitude aspect of a pair first.
+        """
+        longitude = np.atleast_2d(state.longitude)
+        declination = np.atleast_2d(state.declination)
+        upper = np.triu(np.ones((longitude.shape[-1],) * 2, dtype=bool), k=1)
+
+        # Longitude aspects; the first matching aspect in magi_aspects order wins
+        diff = np.abs(longitude[:, :, np.newaxis] - longitude[:, np.newaxis, :])
+        angle = np.where(diff > 180, 360 - diff, diff)
+        deviation = np.abs(angle[..., np.newaxis] - self._longitude_degrees)
+        matches = deviation <= self._longitude_orbs
+        day, p1, p2 = np.nonzero(matches.any(axis=-1) & upper)
+        aspect = np.argmax(matches[day, p1, p2], axis=-1)
+        longitude_hits = (day, p1, p2, aspect, deviation[day, p1, p2, aspect], angle[day, p1, p2])
+
+        # Declination aspects; NaN (unknown) declinations never match
+        dec_diff = np.abs(declination[:, :, np.newaxis] - declination[:, np.newaxis, :])
+        parallel = dec_diff <= self.magi_aspects['parallel']['orb']
+        contraparallel = ~parallel & (np.abs(dec_diff - 180) <= self.magi_aspects['contraparallel']['orb'])
+        day, p1, p2 = np.nonzero((parallel | contraparallel) & upper)
+        is_parallel = parallel[day, p1, p2]
+        actual = dec_diff[day, p1, p2]
+        parallel_index = self.aspect_names.index('parallel')
+        declination_hits = (
+            day, p1, p2,
+            np.where(is_parallel, parallel_index, parallel_index + 1),
+            np.where(is_parallel, actual, np.abs(actual - 180)),
+            actual
+        )
+
+        columns = [np.concatenate(pair) for pair in zip(longitude_hits, declination_hits)]
+        kind = np.concatenate([np.zeros(len(longitude_hits[0]), dtype=int), np.ones(len(declination_hits[0]), dtype=int)])
+        order = np.lexsort((kind, columns[2], columns[1], columns[0]))
+        return {
+            name: values[order]
+            for name, values in zip(('day', 'p1', 'p2', 'aspect', 'orbit', 'actual_degrees'), columns)
+        }
+
+    def _aspects_from_hits(self, hits: Dict[str, np.ndarray], rows) -> List[MagiAspect]:
+        """Build MagiAspect objects for the given rows of find_aspect_hits output"""
         aspects = []
-        planet_names = list(planets_data.keys())
-        
-        for i in range(len(planet_names)):
-            for j in range(i + 1, len(planet_names)):
-                p1_name = planet_names[i]
-                p2_name = planet_names[j]
-                p1_data = planets_data[p1_name]
-                p2_data = planets_data[p2_name]
-                
-                # Check longitude aspects
-                aspect = self.get_aspect(
-                    p1_data['abs_pos'], 
-                    p2_data['abs_pos'],
-                    p1_name,
-                    p2_name
-                )
-                
-                if aspect:
-                    aspects.append(MagiAspect(
-                        p1_name=p1_name,
-                        p2_name=p2_name,
-                        aspect_name=aspect['name'],
-                        aspect_degrees=aspect['degrees'],
-                        orbit=aspect['orbit'],
-                        actual_degrees=self.calculate_angle_distance(
-                            p1_data['abs_pos'], 
-                            p2_data['abs_pos']
-                        ),
-                        is_harmonious=aspect['harmonious'],
-                        is_cinderella=aspect['is_cinderella'],
-                        is_sexual=aspect['is_sexual'],
-                        is_romance=aspect['is_romance']
-                    ))
-                
-                # Check declination aspects
-                if 'declination' in p1_data and 'declination' in p2_data:
-                    dec_aspect = self.get_declination_aspect(
-                        p1_data['declination'],
-                        p2_data['declination'],
-                        p1_name,
-                        p2_name
-                    )
-                    
-                    if dec_aspect:
-                        aspects.append(MagiAspect(
-                            p1_name=p1_name,
-                            p2_name=p2_name,
-                            aspect_name=dec_aspect['name'],
-                            aspect_degrees=dec_aspect['degrees'],
-                            orbit=dec_aspect['orbit'],
-                            actual_degrees=abs(p1_data['declination'] - p2_data['declination']),
-                            is_harmonious=dec_aspect['harmonious'],
-                            is_cinderella=dec_aspect['is_cinderella'],
-                            is_sexual=dec_aspect['is_sexual'],
-                            is_romance=dec_aspect['is_romance']
-                        ))
-        
+        for k in rows:
+            i, j = hits['p1'][k], hits['p2'][k]
+            aspect_name = self.aspect_names[hits['aspect'][k]]
+            aspect_data = self.magi_aspects[aspect_name]
+            aspects.append(MagiAspect(
+                p1_name=BODIES[i],
+                p2_name=BODIES[j],
+                aspect_name=aspect_name,
+                aspect_degrees=aspect_data['degrees'],
+                orbit=float(hits['orbit'][k]),
+                actual_degrees=float(hits['actual_degrees'][k]),
+                is_harmonious=aspect_data['harmonious'],
+                is_cinderella=bool(self.pair_flags['is_cinderella'][i, j]),
+                is_sexual=bool(self.pair_flags['is_sexual'][i, j]),
+                is_romance=bool(self.pair_flags['is_romance'][i, j])
+            ))
         return aspects
 
+    def calculate_all_aspects(self, planets_data: Union[Dict, ChartState]) -> List[MagiAspect]:
+        """Calculate all aspects between planets
+
+        Args:
+            planets_data: ChartState, or planet name -> dict with abs_pos and declination
+        """
+        state = planets_data if isinstance(planets_data, ChartState) else ChartState.from_planets(planets_data)
+        hits = self.find_aspect_hits(state.day(0))
+        return self._aspects_from_hits(hits, range(len(hits['day'])))
+
+    def calculate_daily_aspects(self, state: ChartState) -> List[List[MagiAspect]]:
+        """
+        Calculate all aspects for every day of a stacked chart in one pass
+
+        Args:
+            state: Stacked (days, bodies) ChartState, e.g. the transits of a whole loop
+
+        Returns:
+            List[List[MagiAspect]]: Aspects of each day, in day order
+        """
+        hits = self.find_aspect_hits(state)
+        boundaries = np.searchsorted(hits['day'], np.arange(state.days + 1))
+        return [
+            self._aspects_from_hits(hits, range(boundaries[d], boundaries[d + 1]))
+            for d in range(state.days)
+        ]
+
 class SuperAspectCalculator:
     """Calculate Super aspects between planets"""
     
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import logging
 
+from .models.chart_state import ChartState
+from .services.linkage_engine import DECLINATION, AspectCheck, LinkageEngine, LinkageRule
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -16,35 +19,55 @@ class CinderellaLinkage:
     orbit: float
     actual_degrees: float
 
+# Aspects checked by the Cinderella and Golden Transit families
+MAGI_LINKAGE_CHECKS = [
+    AspectCheck('conjunction', 0, 3),
+    # AspectCheck('opposition', 180, 3),
+    AspectCheck('trine', 120, 3),
+    # AspectCheck('square', 90, 3),
+    # AspectCheck('sextile', 60, 3),
+    AspectCheck('quincunx', 150, 3),
+    AspectCheck('parallel', 0, 1, measure=DECLINATION),
+    AspectCheck('contraparallel', 180, 1, measure=DECLINATION)
+]
+
+CINDERELLA_PLANETS = ['jupiter', 'venus', 'neptune', 'chiron']
+CINDERELLA_RULE = LinkageRule(
+    name='cinderella_linkages',
+    planets1=CINDERELLA_PLANETS,
+    planets2=CINDERELLA_PLANETS,
+    pairs=[
+        ('jupiter', 'chiron'),
+        ('venus', 'chiron'),
+        ('neptune', 'chiron')
+    ],
+    checks=MAGI_LINKAGE_CHECKS,
+    symmetric=True
+)
+
+GOLDEN_PLANETS = ['jupiter', 'pluto', 'neptune', 'venus']
+GOLDEN_RULE = LinkageRule(
+    name='golden_transits',
+    planets1=GOLDEN_PLANETS,
+    planets2=GOLDEN_PLANETS,
+    pairs=[
+        ('jupiter', 'pluto'),
+        ('pluto', 'neptune'),
+        ('pluto', 'venus')
+    ],
+    checks=MAGI_LINKAGE_CHECKS,
+    symmetric=True
+)
+
+_cinderella_engine = LinkageEngine([CINDERELLA_RULE])
+_golden_engine = LinkageEngine([GOLDEN_RULE])
+
 class MagiLinkageCalculator:
     """Calculate Cinderella linkages between two people's charts"""
     
     def __init__(self):
-        # Define valid Cinderella planet pairs
-        self.cinderella_pairs = [
-            ('jupiter', 'chiron'),
-            ('venus', 'chiron'),
-            ('neptune', 'chiron')
-        ]
-
-        # Add Golden Transit pairs
-        self.golden_pairs = [
-            ('jupiter', 'pluto'),
-            ('pluto', 'neptune'),
-            ('pluto', 'venus')
-        ]
-
-        # Define valid aspect angles and orbs
-        self.valid_aspects = {
-            'conjunction': {'angle': 0, 'orb': 3},
-            # 'opposition': {'angle': 180, 'orb': 3},
-            'trine': {'angle': 120, 'orb': 3},
-            # 'square': {'angle': 90, 'orb': 3},
-            # 'sextile': {'angle': 60, 'orb': 3},
-            'quincunx': {'angle': 150, 'orb': 3},
-            'parallel': {'angle': 0, 'orb': 1},  # For declination
-            'contraparallel': {'angle': 180, 'orb': 1}  # For declination
-        }
+        self.cinderella_pairs = CINDERELLA_RULE.pairs
+        self.golden_pairs = GOLDEN_RULE.pairs
 
     def is_cinderella_pair(self, planet1: str, planet2: str) -> bool:
         """Check if two planets form a valid Cinderella pair"""
@@ -61,169 +84,56 @@ class MagiLinkageCalculator:
         diff = abs(pos1 - pos2)
         return 360 - diff if diff > 180 else diff
 
-    def find_cinderella_linkages(self, person1_data: Dict, person2_data: Dict) -> List[Dict]:
-        """Find all Cinderella linkages between two people's charts"""
-        linkages = []
-        
-        # Get relevant planets for each person (accounting for 'subject' nesting)
-        person1_planets = {
-            'jupiter': person1_data['subject']['planets']['jupiter'],
-            'venus': person1_data['subject']['planets']['venus'],
-            'neptune': person1_data['subject']['planets']['neptune'],
-            'chiron': person1_data['subject']['planets']['chiron']
-        }
-        
-        person2_planets = {
-            'jupiter': person2_data['subject']['planets']['jupiter'],
-            'venus': person2_data['subject']['planets']['venus'],
-            'neptune': person2_data['subject']['planets']['neptune'],
-            'chiron': person2_data['subject']['planets']['chiron']
-        }
-
-        # Check each possible combination
-        for p1_name, p1_data in person1_planets.items():
-            for p2_name, p2_data in person2_planets.items():
-                # Skip if not a Cinderella pair
-                if not self.is_cinderella_pair(p1_name, p2_name):
-                    continue
-
-                # Calculate longitude aspects
-                angle = self.calculate_angle_distance(
-                    p1_data['abs_pos'], 
-                    p2_data['abs_pos']
-                )
-
-                # Check each aspect
-                for aspect_name, aspect_data in self.valid_aspects.items():
-                    # Skip declination aspects for longitude calculations
-                    if aspect_name in ['parallel', 'contraparallel']:
-                        continue
-
-                    orb = abs(angle - aspect_data['angle'])
-                    if orb <= aspect_data['orb']:
-                        # Create dictionary instead of CinderellaLinkage object
-                        linkages.append({
-                            'person1_name': person1_data['subject']['name'],
-                            'person2_name': person2_data['subject']['name'],
-                            'planet1_name': p1_name,
-                            'planet2_name': p2_name,
-                            'aspect_name': aspect_name,
-                            'aspect_degrees': aspect_data['angle'],
-                            'orbit': round(orb, 4),
-                            'actual_degrees': round(angle, 4)
-                        })
-
-                # Check declination aspects if both planets have declination values
-                dec1 = p1_data.get('declination')
-                dec2 = p2_data.get('declination')
-                
-                if dec1 is not None and dec2 is not None:
-                    dec_diff = abs(dec1 - dec2)
-                    
-                    # Check parallel
-                    if dec_diff <= self.valid_aspects['parallel']['orb']:
-                        linkages.append({
-                            'person1_name': person1_data['subject']['name'],
-                            'person2_name': person2_data['subject']['name'],
-                            'planet1_name': p1_name,
-                            'planet2_name': p2_name,
-                            'aspect_name': 'parallel',
-                            'aspect_degrees': 0,
-                            'orbit': round(dec_diff, 4),
-                            'actual_degrees': round(dec_diff, 4)
-                        })
-                    
-                    # Check contraparallel
-                    elif abs(dec_diff - 180) <= self.valid_aspects['contraparallel']['orb']:
-                        linkages.append({
-                            'person1_name': person1_data['subject']['name'],
-                            'person2_name': person2_data['subject']['name'],
-                            'planet1_name': p1_name,
-                            'planet2_name': p2_name,
-                            'aspect_name': 'contraparallel',
-                            'aspect_degrees': 180,
-                            'orbit': round(abs(dec_diff - 180), 4),
-                            'actual_degrees': round(dec_diff, 4)
-                        })
-
-        return linkages
-
-    def find_golden_transits(self, natal_data: Dict, transit_data: Dict) -> List[Dict]:
-        """Find all Golden Transit aspects between natal and transit charts"""
-        golden_transits = []
-        
-        # Get relevant planets for each chart - correcting the data structure access
-        natal_planets = {
-            'jupiter': natal_data['subject']['planets']['jupiter'],
-            'pluto': natal_data['subject']['planets']['pluto'],
-            'neptune': natal_data['subject']['planets']['neptune'],
-            'venus': natal_data['subject']['planets']['venus']
-        }
-        
-        transit_planets = {
-            'jupiter': transit_data['subject']['planets']['jupiter'],
-            'pluto': transit_data['subject']['planets']['pluto'],
-            'neptune': transit_data['subject']['planets']['neptune'],
-            'venus': transit_data['subject']['planets']['venus']
-        }
-
-        # Check each possible combination
-        for natal_planet, natal_data in natal_planets.items():
-            for transit_planet, transit_data in transit_planets.items():
-                # Skip if not a Golden Transit pair
-                if not self.is_golden_pair(natal_planet, transit_planet):
-                    continue
-
-                # Calculate longitude aspects
-                angle = self.calculate_angle_distance(
-                    natal_data['abs_pos'], 
-                    transit_data['abs_pos']
-                )
-
-                # Check each aspect
-                for aspect_name, aspect_data in self.valid_aspects.items():
-                    # Skip declination aspects for longitude calculations
-                    if aspect_name in ['parallel', 'contraparallel']:
-                        continue
-
-                    orb = abs(angle - aspect_data['angle'])
-                    if orb <= aspect_data['orb']:
-                        golden_transits.append({
-                            'natal_planet': natal_planet,
-                            'transit_planet': transit_planet,
-                            'aspect_name': aspect_name,
-                            'aspect_degrees': aspect_data['angle'],
-                            'orbit': round(orb, 4),
-                            'actual_degrees': round(angle, 4)
-                        })
-
-                # Check declination aspects
-                dec1 = natal_data.get('declination')
-                dec2 = transit_data.get('declination')
-                
-                if dec1 is not None and dec2 is not None:
-                    dec_diff = abs(dec1 - dec2)
-                    
-                    # Check parallel
-                    if dec_diff <= self.valid_aspects['parallel']['orb']:
-                        golden_transits.append({
-                            'natal_planet': natal_planet,
-                            'transit_planet': transit_planet,
-                            'aspect_name': 'parallel',
-                            'aspect_degrees': 0,
-                            'orbit': round(dec_diff, 4),
-                            'actual_degrees': round(dec_diff, 4)
-                        })
-                    
-                    # Check contraparallel
-                    elif abs(dec_diff - 180) <= self.valid_aspects['contraparallel']['orb']:
-                        golden_transits.append({
-                            'natal_planet': natal_planet,
-                            'transit_planet': transit_planet,
-                            'aspect_name': 'contraparallel',
-                            'aspect_degrees': 180,
-                            'orbit': round(abs(dec_diff - 180), 4),
-                            'actual_degrees': round(dec_diff, 4)
-                        })
-
-        return golden_transits
+    def format_cinderella_linkages(self, hits: List[Dict], person1_name: str, person2_name: str) -> List[Dict]:
+        """Cinderella linkage records from CINDERELLA_RULE hits"""
+        return [
+            {
+                'person1_name': person1_name,
+                'person2_name': person2_name,
+                'planet1_name': hit['planet1_name'],
+                'planet2_name': hit['planet2_name'],
+                'aspect_name': hit['aspect_name'],
+                'aspect_degrees': hit['aspect_degrees'],
+                'orbit': hit['orbit'],
+                'actual_degrees': hit['actual_degrees']
+            }
+            for hit in hits
+        ]
+
+    def find_cinderella_linkages(self, person1_data: Union[Dict, ChartState],
+                                 person2_data: Union[Dict, ChartState]) -> List[Dict]:
+        """Find all Cinderella linkages between two people's charts
+
+        Args:
+            person1_data: ChartState, or chart data with a 'subject' level
+            person2_data: ChartState, or chart data with a 'subject' level
+        """
+        person1 = ChartState.coerce(person1_data)
+        person2 = ChartState.coerce(person2_data)
+        hits = _cinderella_engine.evaluate(person1, person2)[CINDERELLA_RULE.name]
+        return self.format_cinderella_linkages(hits, person1.name, person2.name)
+
+    def format_golden_transits(self, hits: List[Dict]) -> List[Dict]:
+        """Golden Transit records from GOLDEN_RULE hits (natal chart as chart A)"""
+        return [
+            {
+                'natal_planet': hit['planet1_name'],
+                'transit_planet': hit['planet2_name'],
+                'aspect_name': hit['aspect_name'],
+                'aspect_degrees': hit['aspect_degrees'],
+                'orbit': hit['orbit'],
+                'actual_degrees': hit['actual_degrees']
+            }
+            for hit in hits
+        ]
+
+    def find_golden_transits(self, natal_data: Union[Dict, ChartState],
+                             transit_data: Union[Dict, ChartState]) -> List[Dict]:
+        """Find all Golden Transit aspects between natal and transit charts
+
+        Args:
+            natal_data: Natal ChartState, or chart data with a 'subject' level
+            transit_data: Transit ChartState, or chart data with a 'subject' level
+        """
+        hits = _golden_engine.evaluate(ChartState.coerce(natal_data), ChartState.coerce(transit_data))
+        return self.format_golden_transits(hits[GOLDEN_RULE.name])
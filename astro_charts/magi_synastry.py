@@ -1,74 +1,164 @@
-from typing import Dict, List
+from typing import Dict, List, Sequence, Union
+
+from .magi_linkages import CINDERELLA_RULE, MagiLinkageCalculator
+from .marital_linkages import MARITAL_RULE, MaritalLinkageCalculator
+from .models.chart_state import BODIES, ChartState
+from .romance_linkages import ROMANCE_RULE, RomanceLinkageCalculator
+from .services.linkage_engine import AspectCheck, LinkageEngine, LinkageRule
+from .sexual_linkages import SEXUAL_RULE, SexualLinkageCalculator
+
+PERSONAL_PLANETS = [
+    'sun', 'moon', 'mercury', 'venus', 'mars',
+    'jupiter', 'chiron', 'uranus', 'neptune', 'pluto'
+]
+SATURN_ORB = 3.0  # degrees
+SATURN_CLASH_CHECKS = [
+    AspectCheck('square', 90, SATURN_ORB),       # 90-degree angle
+    AspectCheck('quincunx', 150, SATURN_ORB),    # 150-degree angle
+    AspectCheck('opposition', 180, SATURN_ORB)   # 180-degree angle
+]
+
+# Personal planets in chart order
+_CLASH_PLANETS = [planet for planet in BODIES if planet in PERSONAL_PLANETS]
+
+# Person 1's Saturn against Person 2's planets
+SATURN_CLASH_RULE = LinkageRule(
+    name='saturn_clashes',
+    planets1=['saturn'],
+    planets2=_CLASH_PLANETS,
+    pairs=[('saturn', planet) for planet in _CLASH_PLANETS],
+    checks=SATURN_CLASH_CHECKS
+)
+
+# Person 2's Saturn against Person 1's planets
+REVERSE_SATURN_CLASH_RULE = LinkageRule(
+    name='reverse_saturn_clashes',
+    planets1=_CLASH_PLANETS,
+    planets2=['saturn'],
+    pairs=[(planet, 'saturn') for planet in _CLASH_PLANETS],
+    checks=SATURN_CLASH_CHECKS
+)
+
+_saturn_clash_engine = LinkageEngine([SATURN_CLASH_RULE, REVERSE_SATURN_CLASH_RULE])
+
+# Every linkage family that goes into a synastry score, evaluated in one pass
+_synastry_engine = LinkageEngine([
+    SATURN_CLASH_RULE, REVERSE_SATURN_CLASH_RULE,
+    CINDERELLA_RULE, SEXUAL_RULE, ROMANCE_RULE, MARITAL_RULE
+])
 
 class MagiSynastryCalculator:
     """Calculate various synastry aspects according to Magi Astrology"""
-    
+
     def __init__(self):
-        self.saturn_clash_aspects = {
-            'square': 90,      # 90-degree angle
-            'quincunx': 150,   # 150-degree angle
-            'opposition': 180   # 180-degree angle
-        }
-        self.personal_planets = [
-            'sun', 'moon', 'mercury', 'venus', 'mars', 
-            'jupiter', 'chiron', 'uranus', 'neptune', 'pluto'
-        ]
-        self.saturn_orb = 3.0  # degrees
-        
-    def check_saturn_clashes(self, person1_data: Dict, person2_data: Dict) -> List[Dict]:
-        """Check for Saturn clashes between two charts"""
+        self.saturn_clash_aspects = {check.name: check.degrees for check in SATURN_CLASH_CHECKS}
+        self.personal_planets = PERSONAL_PLANETS
+        self.saturn_orb = SATURN_ORB
+
+    def _format_saturn_clashes(self, hits: Dict[str, List[Dict]], person1_name: str,
+                               person2_name: str) -> List[Dict]:
+        """Saturn clash records from the hits of both Saturn clash rules"""
         clashes = []
-        
-        # Get Saturn positions for both people
-        saturn1 = person1_data['subject']['planets']['saturn']
-        saturn2 = person2_data['subject']['planets']['saturn']
-        
-        # Check Person 1's Saturn against Person 2's planets
-        for planet_name, planet_data in person2_data['subject']['planets'].items():
-            if planet_name in self.personal_planets:
-                angle = self.calculate_angle_distance(
-                    saturn1['abs_pos'],
-                    planet_data['abs_pos']
-                )
-                
-                # Check each aspect
-                for aspect_name, aspect_data in self.saturn_clash_aspects.items():
-                    orb = abs(angle - aspect_data)
-                    if orb <= self.saturn_orb:
-                        clashes.append({
-                            'saturn_person': person1_data['subject']['name'],
-                            'planet_person': person2_data['subject']['name'],
-                            'planet2_name': planet_name,
-                            'aspect_name': aspect_name,
-                            'aspect_degrees': aspect_data,
-                            'orbit': round(orb, 4),
-                            'actual_degrees': round(angle, 4)
-                        })
-        
-        # Check Person 2's Saturn against Person 1's planets
-        for planet_name, planet_data in person1_data['subject']['planets'].items():
-            if planet_name in self.personal_planets:
-                angle = self.calculate_angle_distance(
-                    saturn2['abs_pos'],
-                    planet_data['abs_pos']
-                )
-                
-                # Check each aspect
-                for aspect_name, aspect_data in self.saturn_clash_aspects.items():
-                    orb = abs(angle - aspect_data)
-                    if orb <= self.saturn_orb:
-                        clashes.append({
-                            'saturn_person': person2_data['subject']['name'],
-                            'planet_person': person1_data['subject']['name'],
-                            'planet2_name': planet_name,
-                            'aspect_name': aspect_name,
-                            'aspect_degrees': aspect_data,
-                            'orbit': round(orb, 4),
-                            'actual_degrees': round(angle, 4)
-                        })
-        
+        for rule, saturn_person, planet_person, planet_key in (
+            (SATURN_CLASH_RULE, person1_name, person2_name, 'planet2_name'),
+            (REVERSE_SATURN_CLASH_RULE, person2_name, person1_name, 'planet1_name')
+        ):
+            for hit in hits[rule.name]:
+                clashes.append({
+                    'saturn_person': saturn_person,
+                    'planet_person': planet_person,
+                    'planet2_name': hit[planet_key],
+                    'aspect_name': hit['aspect_name'],
+                    'aspect_degrees': hit['aspect_degrees'],
+                    'orbit': hit['orbit'],
+                    'actual_degrees': hit['actual_degrees']
+                })
         return clashes
-    
+
+    def check_saturn_clashes(self, person1_data: Union[Dict, ChartState],
+                             person2_data: Union[Dict, ChartState]) -> List[Dict]:
+        """Check for Saturn clashes between two charts
+
+        Args:
+            person1_data: ChartState, or chart data with a 'subject' level
+            person2_data: ChartState, or chart data with a 'subject' level
+        """
+        person1 = ChartState.coerce(person1_data)
+        person2 = ChartState.coerce(person2_data)
+        hits = _saturn_clash_engine.evaluate(person1, person2)
+        return self._format_saturn_clashes(hits, person1.name, person2.name)
+
+    def find_linkages(self, person1_data: Union[Dict, ChartState],
+                      person2_data: Union[Dict, ChartState]) -> Dict[str, List[Dict]]:
+        """
+        Find Saturn clashes and the Cinderella, sexual, romance and marital linkages in one pass
+
+        Gives the same records as check_saturn_clashes and the family calculators'
+        find_* methods, but computes the distance matrices between the charts once.
+
+        Args:
+            person1_data: ChartState with its birth date, or chart data with a 'subject' level
+            person2_data: ChartState with its birth date, or chart data with a 'subject' level
+
+        Returns:
+            Dict: saturn_clashes, cinderella_linkages, sexual_linkages, romance_linkages and marital_linkages
+        """
+        person1 = ChartState.coerce(person1_data)
+        person2 = ChartState.coerce(person2_data)
+        romance_calc = RomanceLinkageCalculator()
+        ecliptic_tilt = romance_calc.average_ecliptic_tilt(person1.date, person2.date)
+
+        hits = _synastry_engine.evaluate(person1, person2, ecliptic_tilt=ecliptic_tilt)
+        names = (person1.name, person2.name)
+        return {
+            'saturn_clashes': self._format_saturn_clashes(hits, *names),
+            'cinderella_linkages': MagiLinkageCalculator().format_cinderella_linkages(hits[CINDERELLA_RULE.name], *names),
+            'sexual_linkages': SexualLinkageCalculator().format_sexual_linkages(hits[SEXUAL_RULE.name], *names),
+            'romance_linkages': romance_calc.format_romance_linkages(hits[ROMANCE_RULE.name], *names),
+            'marital_linkages': MaritalLinkageCalculator().format_marital_linkages(hits[MARITAL_RULE.name], *names)
+        }
+
+    def find_linkages_many(self, person1_data: Union[Dict, ChartState], candidates: ChartState,
+                           names: Sequence[str], dates: Sequence[str]) -> List[Dict[str, List[Dict]]]:
+        """
+        Find the linkages between one chart and every chart of a stack in one pass
+
+        Args:
+            person1_data: ChartState with its birth date, or chart data with a 'subject' level
+            candidates: Stacked ChartState with one chart per candidate
+            names: Name of every candidate
+            dates: Birth date (YYYY-MM-DD) of every candidate
+
+        Returns:
+            List[Dict]: One find_linkages result per candidate, in stack order
+        """
+        person1 = ChartState.coerce(person1_data)
+        romance_calc = RomanceLinkageCalculator()
+        tilts = {date: romance_calc.calculate_ecliptic_tilt(date) for date in {person1.date, *dates}}
+        ecliptic_tilt = [(tilts[person1.date] + tilts[date]) / 2 for date in dates]
+
+        hits = _synastry_engine.evaluate(person1, candidates, ecliptic_tilt=ecliptic_tilt)
+        by_day = {name: [[] for _ in range(candidates.days)] for name in hits}
+        for rule_name, rule_hits in hits.items():
+            for hit in rule_hits:
+                by_day[rule_name][hit['day']].append(hit)
+
+        cinderella_calc = MagiLinkageCalculator()
+        sexual_calc = SexualLinkageCalculator()
+        marital_calc = MaritalLinkageCalculator()
+        results = []
+        for day, person2_name in enumerate(names):
+            day_hits = {rule_name: days[day] for rule_name, days in by_day.items()}
+            names_pair = (person1.name, person2_name)
+            results.append({
+                'saturn_clashes': self._format_saturn_clashes(day_hits, *names_pair),
+                'cinderella_linkages': cinderella_calc.format_cinderella_linkages(day_hits[CINDERELLA_RULE.name], *names_pair),
+                'sexual_linkages': sexual_calc.format_sexual_linkages(day_hits[SEXUAL_RULE.name], *names_pair),
+                'romance_linkages': romance_calc.format_romance_linkages(day_hits[ROMANCE_RULE.name], *names_pair),
+                'marital_linkages': marital_calc.format_marital_linkages(day_hits[MARITAL_RULE.name], *names_pair)
+            })
+        return results
+
     def calculate_angle_distance(self, pos1: float, pos2: float) -> float:
         """Calculate the shortest angular distance between two positions"""
         diff = abs(pos1 - pos2)
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Union
 from datetime import datetime
 import ephem
 import logging
 from astro_charts.utils.ecliptic_tilt import get_ecliptic_tilt
+from .models.chart_state import ChartState
+from .services.linkage_engine import (
+    DECLINATION, DECLINATION_SUM, ECLIPTIC_TILT, AspectCheck, LinkageEngine, LinkageRule
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,119 +23,86 @@ class MaritalLinkage:
     orbit: float
     actual_degrees: float
 
+PARALLEL_ORB = 5.0
+CONTRAPARALLEL_ORB = 1.5
+LONGITUDE_ORB = 3.0
+
+MARITAL_RULE = LinkageRule(
+    name='marital_linkages',
+    planets1=['venus', 'chiron'],
+    planets2=['venus', 'chiron'],
+    # Valid Marital planet pairs (both directions)
+    pairs=[
+        ('venus', 'chiron'),
+        ('chiron', 'venus')
+    ],
+    checks=[
+        AspectCheck('conjunction', 0, LONGITUDE_ORB),
+        AspectCheck('trine', 120, LONGITUDE_ORB),
+        AspectCheck('opposition', 180, LONGITUDE_ORB),
+        AspectCheck('quincunx', 150, LONGITUDE_ORB),
+        # Parallel when both N or both S
+        AspectCheck('parallel', 0, PARALLEL_ORB, measure=DECLINATION, signs='same'),
+        # Contraparallel when one N and one S, measured against the ecliptic tilt
+        AspectCheck('contraparallel', 180, CONTRAPARALLEL_ORB, measure=DECLINATION_SUM,
+                    target=ECLIPTIC_TILT, signs='opposite')
+    ]
+)
+
+_marital_engine = LinkageEngine([MARITAL_RULE])
+
 class MaritalLinkageCalculator:
     """Calculate Marital linkages (Venus-Chiron) between two people's charts"""
     
     def __init__(self):
-        # Define valid Marital planet pairs (both directions)
-        self.marital_pairs = [
-            ('venus', 'chiron'),
-            ('chiron', 'venus')
-        ]
+        self.marital_pairs = MARITAL_RULE.pairs
 
     def calculate_ecliptic_tilt(self, date_str: str) -> float:
         """Get ecliptic tilt for a given date"""
         return get_ecliptic_tilt(date_str)
 
-    def find_marital_linkages(self, person1_data: Dict, person2_data: Dict) -> List[Dict]:
-        """Find all Marital linkages between two people's charts"""
-        linkages = []
-        PARALLEL_ORB = 5.0
-        CONTRAPARALLEL_ORB = 1.5
-        LONGITUDE_ORB = 3.0
+    def average_ecliptic_tilt(self, date1: str, date2: str) -> float:
+        """Average ecliptic tilt between both birth dates"""
+        tilt1 = self.calculate_ecliptic_tilt(date1)
+        tilt2 = self.calculate_ecliptic_tilt(date2)
+        ecliptic_tilt = (tilt1 + tilt2) / 2
         
-        # Define valid longitude-based aspects
-        VALID_ASPECTS = {
-            'conjunction': {'angle': 0, 'orb': LONGITUDE_ORB},
-            'trine': {'angle': 120, 'orb': LONGITUDE_ORB},
-            'opposition': {'angle': 180, 'orb': LONGITUDE_ORB},
-            'quincunx': {'angle': 150, 'orb': LONGITUDE_ORB}
-        }
-        
-        try:
-            # Get birth dates
-            date1 = person1_data['subject']['birth_data']['date']
-            date2 = person2_data['subject']['birth_data']['date']
-            
-            # Calculate average ecliptic tilt between both birth dates
-            tilt1 = self.calculate_ecliptic_tilt(date1)
-            tilt2 = self.calculate_ecliptic_tilt(date2)
-            ecliptic_tilt = (tilt1 + tilt2) / 2
-            
-            logger.info(f"Calculated ecliptic tilt for marital linkages: {ecliptic_tilt}° "
-                       f"(Person 1: {tilt1}°, Person 2: {tilt2}°)")
-
-            person1_planets = person1_data['subject']['planets']
-            person2_planets = person2_data['subject']['planets']
+        logger.info(f"Calculated ecliptic tilt for marital linkages: {ecliptic_tilt}° "
+                   f"(Person 1: {tilt1}°, Person 2: {tilt2}°)")
+        return ecliptic_tilt
 
-            # Check Venus-Chiron combinations
-            for p1_name in ['venus', 'chiron']:
-                for p2_name in ['venus', 'chiron']:
-                    # Skip if same planet or not a valid marital pair
-                    if p1_name == p2_name or (p1_name, p2_name) not in self.marital_pairs:
-                        continue
-
-                    p1_data = person1_planets[p1_name]
-                    p2_data = person2_planets[p2_name]
-
-                    # Get positions and declinations
-                    pos1 = float(p1_data['abs_pos'])
-                    pos2 = float(p2_data['abs_pos'])
-                    dec1 = float(p1_data['declination'])
-                    dec2 = float(p2_data['declination'])
-
-                    # Check longitude-based aspects
-                    angle_diff = abs(pos1 - pos2)
-                    if angle_diff > 180:
-                        angle_diff = 360 - angle_diff
-
-                    # Check for all valid aspects
-                    for aspect_name, aspect_data in VALID_ASPECTS.items():
-                        if abs(angle_diff - aspect_data['angle']) <= aspect_data['orb']:
-                            linkages.append({
-                                'person1_name': person1_data['subject']['name'],
-                                'person2_name': person2_data['subject']['name'],
-                                'planet1_name': p1_name,
-                                'planet2_name': p2_name,
-                                'aspect_name': aspect_name,
-                                'aspect_degrees': aspect_data['angle'],
-                                'orbit': round(abs(angle_diff - aspect_data['angle']), 4),
-                                'actual_degrees': round(angle_diff, 4)
-                            })
+    def format_marital_linkages(self, hits: List[Dict], person1_name: str, person2_name: str) -> List[Dict]:
+        """Marital linkage records from MARITAL_RULE hits"""
+        return [
+            {
+                'person1_name': person1_name,
+                'person2_name': person2_name,
+                'planet1_name': hit['planet1_name'],
+                'planet2_name': hit['planet2_name'],
+                'aspect_name': hit['aspect_name'],
+                'aspect_degrees': hit['aspect_degrees'],
+                'orbit': hit['orbit'],
+                'actual_degrees': hit['actual_degrees']
+            }
+            for hit in hits
+        ]
 
-                    # Check for parallel (when both N or both S)
-                    if (dec1 * dec2) > 0:  # Same sign
-                        dec_diff = abs(dec1 - dec2)
-                        if dec_diff <= PARALLEL_ORB:
-                            linkages.append({
-                                'person1_name': person1_data['subject']['name'],
-                                'person2_name': person2_data['subject']['name'],
-                                'planet1_name': p1_name,
-                                'planet2_name': p2_name,
-                                'aspect_name': 'parallel',
-                                'aspect_degrees': 0,
-                                'orbit': round(dec_diff, 4),
-                                'actual_degrees': round(dec_diff, 4)
-                            })
+    def find_marital_linkages(self, person1_data: Union[Dict, ChartState],
+                              person2_data: Union[Dict, ChartState]) -> List[Dict]:
+        """Find all Marital linkages between two people's charts
 
-                    # Check for contraparallel (when one N and one S)
-                    if (dec1 * dec2) < 0:  # Different signs
-                        dec_sum = abs(dec1) + abs(dec2)
-                        contra_diff = abs(dec_sum - ecliptic_tilt)
-                        if contra_diff <= CONTRAPARALLEL_ORB:
-                            linkages.append({
-                                'person1_name': person1_data['subject']['name'],
-                                'person2_name': person2_data['subject']['name'],
-                                'planet1_name': p1_name,
-                                'planet2_name': p2_name,
-                                'aspect_name': 'contraparallel',
-                                'aspect_degrees': 180,
-                                'orbit': round(contra_diff, 4),
-                                'actual_degrees': round(dec_sum, 4)
-                            })
+        Args:
+            person1_data: ChartState with its birth date, or chart data with a 'subject' level
+            person2_data: ChartState with its birth date, or chart data with a 'subject' level
+        """
+        try:
+            person1 = ChartState.coerce(person1_data)
+            person2 = ChartState.coerce(person2_data)
+            ecliptic_tilt = self.average_ecliptic_tilt(person1.date, person2.date)
 
-            return linkages
+            hits = _marital_engine.evaluate(person1, person2, ecliptic_tilt=ecliptic_tilt)[MARITAL_RULE.name]
+            return self.format_marital_linkages(hits, person1.name, person2.name)
 
         except Exception as e:
             logger.error(f"Error in find_marital_linkages: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
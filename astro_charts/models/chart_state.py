@@ -0,0 +1,219 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+# Fixed body order; a body's index is its column in every ChartState array
+BODIES = (
+    "sun", "moon", "mercury", "venus", "mars", "jupiter",
+    "saturn", "uranus", "neptune", "pluto", "chiron", "rahu", "ketu"
+)
+BODY_INDEX = {body: i for i, body in enumerate(BODIES)}
+
+
+def body_index(body: str) -> int:
+    """Column of a body in ChartState arrays"""
+    return BODY_INDEX[body.lower()]
+
+
+def body_mask(bodies: Sequence[str]) -> np.ndarray:
+    """Boolean mask over BODIES that is True for the given bodies"""
+    mask = np.zeros(len(BODIES), dtype=bool)
+    for body in bodies:
+        mask[body_index(body)] = True
+    return mask
+
+
+@dataclass
+class ChartState:
+    """Class to hold the body positions of one chart, or of one chart per day
+
+    Arrays are shaped (bodies,) for a single chart or (days, bodies) for a stack of
+    charts, with columns in BODIES order. Bodies the chart does not include are NaN
+    in longitude; declination, latitude and speed are NaN where they are unknown.
+    Retrograde flags are packed into a bitmask with bit i set for body BODIES[i].
+
+    Calculators take ChartState directly; planet dictionaries are only converted to
+    and from it at the edges (see from_chart_data and to_planets).
+    """
+    longitude: np.ndarray     # ecliptic longitude in degrees
+    declination: np.ndarray   # declination in degrees
+    latitude: np.ndarray      # ecliptic latitude in degrees
+    speed: np.ndarray         # longitude speed in degrees/day
+    retrograde: Union[int, np.ndarray] = 0
+    name: str = ""
+    date: str = ""            # chart date (YYYY-MM-DD), e.g. the birth date
+
+    @classmethod
+    def empty(cls, days: Optional[int] = None, name: str = "", date: str = "") -> 'ChartState':
+        """A chart (or stack of charts) with no bodies set"""
+        shape = (len(BODIES),) if days is None else (days, len(BODIES))
+        return cls(
+            longitude=np.full(shape, np.nan),
+            declination=np.full(shape, np.nan),
+            latitude=np.full(shape, np.nan),
+            speed=np.full(shape, np.nan),
+            retrograde=0 if days is None else np.zeros(days, dtype=np.uint32),
+            name=name,
+            date=date
+        )
+
+    @classmethod
+    def from_planets(cls, planets: Dict[str, Dict[str, Any]], name: str = "", date: str = "") -> 'ChartState':
+        """
+        Build a chart state from planet dictionaries
+
+        Args:
+            planets: Planet name -> dict with abs_pos and optionally declination,
+                latitude, speed and retrograde (as found in chart data)
+            name: Subject name
+            date: Chart date (YYYY-MM-DD)
+
+        Returns:
+            ChartState: Single chart state; planets outside BODIES are ignored
+        """
+        state = cls.empty(name=name, date=date)
+        retrograde = 0
+        for planet, data in planets.items():
+            index = BODY_INDEX.get(planet.lower())
+            if index is None or data is None or data.get('abs_pos') is None:
+                continue
+            state.longitude[index] = float(data['abs_pos']) % 360
+            for field in ('declination', 'latitude', 'speed'):
+                if data.get(field) is not None:
+                    getattr(state, field)[index] = float(data[field])
+            if data.get('retrograde'):
+                retrograde |= 1 << index
+        state.retrograde = retrograde
+        return state
+
+    @classmethod
+    def from_chart_data(cls, chart_data: Dict[str, Any]) -> 'ChartState':
+        """Build a chart state from chart data with or without the 'subject' level"""
+        subject = chart_data.get('subject', chart_data)
+        date = (subject.get('birth_data') or {}).get('date', "")
+        return cls.from_planets(subject['planets'], subject.get('name', ""), date)
+
+    @classmethod
+    def coerce(cls, chart: Union['ChartState', Dict[str, Any]]) -> 'ChartState':
+        """Return a ChartState as is, or build one from chart data"""
+        return chart if isinstance(chart, ChartState) else cls.from_chart_data(chart)
+
+    @classmethod
+    def from_ephemeris_table(cls, table: Any, declination: Optional[np.ndarray] = None,
+                             name: str = "Transit") -> 'ChartState':
+        """
+        Build a stacked chart state from an EphemerisTable
+
+        Args:
+            table: EphemerisTable from EphemerisEngine
+            declination: Optional declinations shaped like table.longitude
+            name: Subject name
+
+        Returns:
+            ChartState: Arrays shaped (times, bodies)
+        """
+        state = cls.empty(days=len(table.julian_days), name=name)
+        columns = [BODY_INDEX[body] for body in table.bodies]
+        state.longitude[:, columns] = table.longitude
+        state.latitude[:, columns] = table.latitude
+        state.speed[:, columns] = table.speed
+        if declination is not None:
+            state.declination[:, columns] = declination
+        bits = np.array([1 << column for column in columns], dtype=np.uint32)
+        state.retrograde = np.bitwise_or.reduce(np.where(table.retrograde, bits, 0).astype(np.uint32), axis=1)
+        return state
+
+    @classmethod
+    def stack(cls, states: Sequence['ChartState']) -> 'ChartState':
+        """Stack single chart states into one (days, bodies) state"""
+        return cls(
+            longitude=np.stack([s.longitude for s in states]),
+            declination=np.stack([s.declination for s in states]),
+            latitude=np.stack([s.latitude for s in states]),
+            speed=np.stack([s.speed for s in states]),
+            retrograde=np.array([s.retrograde for s in states], dtype=np.uint32),
+            name=states[0].name if states else "",
+            date=states[0].date if states else ""
+        )
+
+    @property
+    def is_stacked(self) -> bool:
+        return self.longitude.ndim == 2
+
+    @property
+    def days(self) -> int:
+        return self.longitude.shape[0] if self.is_stacked else 1
+
+    def day(self, index: int) -> 'ChartState':
+        """Single chart state for one day of a stack"""
+        if not self.is_stacked:
+            return self
+        return ChartState(
+            longitude=self.longitude[index],
+            declination=self.declination[index],
+            latitude=self.latitude[index],
+            speed=self.speed[index],
+            retrograde=int(self.retrograde[index]),
+            name=self.name,
+            date=self.date
+        )
+
+    @property
+    def present(self) -> np.ndarray:
+        """Boolean mask of the bodies this chart includes"""
+        return ~np.isnan(self.longitude)
+
+    @property
+    def bodies(self) -> List[str]:
+        """Names of the bodies this chart includes, in BODIES order (single charts only)"""
+        return [BODIES[i] for i in np.flatnonzero(self.present)]
+
+    def has(self, body: str) -> bool:
+        index = BODY_INDEX.get(body.lower())
+        return index is not None and bool(self.present[..., index].all())
+
+    def is_retrograde(self, body: str) -> Union[bool, np.ndarray]:
+        """Retrograde flag of a body (an array of flags for a stack)"""
+        bit = 1 << body_index(body)
+        if self.is_stacked:
+            return (np.asarray(self.retrograde) & bit) != 0
+        return bool(self.retrograde & bit)
+
+    @property
+    def retrograde_flags(self) -> np.ndarray:
+        """Retrograde bitmask unpacked to booleans shaped like longitude"""
+        bits = np.array([1 << i for i in range(len(BODIES))], dtype=np.uint32)
+        return (np.asarray(self.retrograde, dtype=np.uint32)[..., np.newaxis] & bits) != 0
+
+    def select(self, bodies: Sequence[str]) -> 'ChartState':
+        """Copy of the chart with only the given bodies set"""
+        keep = body_mask(bodies)
+        mask = int(sum(1 << i for i in np.flatnonzero(keep)))
+        return ChartState(
+            longitude=np.where(keep, self.longitude, np.nan),
+            declination=np.where(keep, self.declination, np.nan),
+            latitude=np.where(keep, self.latitude, np.nan),
+            speed=np.where(keep, self.speed, np.nan),
+            retrograde=np.asarray(self.retrograde) & mask if self.is_stacked else self.retrograde & mask,
+            name=self.name,
+            date=self.date
+        )
+
+    def to_planets(self) -> Dict[str, Dict[str, Any]]:
+        """Planet dictionaries (abs_pos, declination, latitude, speed, retrograde) for a single chart"""
+        planets = {}
+        for body in self.bodies:
+            index = BODY_INDEX[body]
+            planets[body] = {
+                "abs_pos": float(self.longitude[index]),
+                "declination": _optional_float(self.declination[index]),
+                "latitude": _optional_float(self.latitude[index]),
+                "speed": _optional_float(self.speed[index]),
+                "retrograde": self.is_retrograde(body)
+            }
+        return planets
+
+
+def _optional_float(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
@@ -1,8 +1,12 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import logging
 from datetime import datetime
 from astro_charts.utils.ecliptic_tilt import get_ecliptic_tilt
+from .models.chart_state import ChartState
+from .services.linkage_engine import (
+    DECLINATION, DECLINATION_SUM, ECLIPTIC_TILT, AspectCheck, LinkageEngine, LinkageRule
+)
 
 logger = logging.getLogger(__name__)
 
@@ -18,31 +22,41 @@ class RomanceLinkage:
     orbit: float
     actual_degrees: float
 
+ROMANCE_PLANETS = ['venus', 'chiron', 'neptune', 'jupiter']
+PARALLEL_ORB = 2.5
+CONTRAPARALLEL_ORB = 1.5
+
+ROMANCE_RULE = LinkageRule(
+    name='romance_linkages',
+    planets1=ROMANCE_PLANETS,
+    planets2=ROMANCE_PLANETS,
+    # Valid Romance planet pairs (both directions)
+    pairs=[
+        ('venus', 'chiron'),
+        ('chiron', 'venus'),
+        ('venus', 'neptune'),
+        ('neptune', 'venus'),
+        ('chiron', 'neptune'),
+        ('neptune', 'chiron'),
+        ('jupiter', 'chiron'),
+        ('chiron', 'jupiter')
+    ],
+    checks=[
+        # Parallel when both N or both S
+        AspectCheck('parallel', 0, PARALLEL_ORB, measure=DECLINATION, signs='same'),
+        # Contraparallel when one N and one S, measured against the ecliptic tilt
+        AspectCheck('contraparallel', 180, CONTRAPARALLEL_ORB, measure=DECLINATION_SUM,
+                    target=ECLIPTIC_TILT, signs='opposite')
+    ]
+)
+
+_romance_engine = LinkageEngine([ROMANCE_RULE])
+
 class RomanceLinkageCalculator:
     """Calculate Romance linkages between two people's charts"""
     
     def __init__(self):
-        # Define valid Romance planet pairs (both directions)
-        self.romance_pairs = [
-            ('venus', 'chiron'),
-            ('chiron', 'venus'),
-            ('venus', 'neptune'),
-            ('neptune', 'venus'),
-            ('chiron', 'neptune'),
-            ('neptune', 'chiron'),
-            ('jupiter', 'chiron'),
-            ('chiron', 'jupiter')
-        ]
-
-        # Define valid aspect angles and orbs
-        self.valid_aspects = {
-            'conjunction': {'angle': 0, 'orb': 3},
-            'sextile': {'angle': 60, 'orb': 3},
-            'trine': {'angle': 120, 'orb': 3},
-            'opposition': {'angle': 180, 'orb': 3},
-            'parallel': {'angle': 0, 'orb': 3},
-            'contraparallel': {'angle': 180, 'orb': 3}
-        }
+        self.romance_pairs = ROMANCE_RULE.pairs
 
     def is_romance_pair(self, planet1: str, planet2: str) -> bool:
         """Check if two planets form a valid Romance pair"""
@@ -57,73 +71,48 @@ class RomanceLinkageCalculator:
         """Get ecliptic tilt for a given date"""
         return get_ecliptic_tilt(date_str)
 
-    def find_romance_linkages(self, person1_data: Dict, person2_data: Dict) -> List[Dict]:
-        """Find all Romance linkages between two people's charts"""
-        linkages = []
-        PARALLEL_ORB = 2.5
-        CONTRAPARALLEL_ORB = 1.5
+    def average_ecliptic_tilt(self, date1: str, date2: str) -> float:
+        """Average ecliptic tilt between both birth dates"""
+        tilt1 = self.calculate_ecliptic_tilt(date1)
+        tilt2 = self.calculate_ecliptic_tilt(date2)
+        ecliptic_tilt = (tilt1 + tilt2) / 2
         
-        try:
-            # Get birth dates
-            date1 = person1_data['subject']['birth_data']['date']
-            date2 = person2_data['subject']['birth_data']['date']
-            
-            # Calculate average ecliptic tilt between both birth dates
-            tilt1 = self.calculate_ecliptic_tilt(date1)
-            tilt2 = self.calculate_ecliptic_tilt(date2)
-            ecliptic_tilt = (tilt1 + tilt2) / 2
-            
-            logger.info(f"Calculated ecliptic tilt: {ecliptic_tilt}° "
-                       f"(Person 1: {tilt1}°, Person 2: {tilt2}°)")
-
-            person1_planets = person1_data['subject']['planets']
-            person2_planets = person2_data['subject']['planets']
-
-            # Check each combination
-            for p1_name in ['venus', 'chiron', 'neptune', 'jupiter']:
-                for p2_name in ['venus', 'chiron', 'neptune', 'jupiter']:
-                    if not self.is_romance_pair(p1_name, p2_name):
-                        continue
-
-                    p1_data = person1_planets[p1_name]
-                    p2_data = person2_planets[p2_name]
-
-                    dec1 = float(p1_data['declination'])
-                    dec2 = float(p2_data['declination'])
+        logger.info(f"Calculated ecliptic tilt: {ecliptic_tilt}° "
+                   f"(Person 1: {tilt1}°, Person 2: {tilt2}°)")
+        return ecliptic_tilt
+
+    def format_romance_linkages(self, hits: List[Dict], person1_name: str, person2_name: str) -> List[Dict]:
+        """Romance linkage records from ROMANCE_RULE hits"""
+        return [
+            {
+                'person1_name': person1_name,
+                'person2_name': person2_name,
+                'planet1_name': hit['planet1_name'],
+                'planet2_name': hit['planet2_name'],
+                'aspect_name': hit['aspect_name'],
+                'aspect_degrees': hit['aspect_degrees'],
+                'orbit': hit['orbit'],
+                'actual_degrees': hit['actual_degrees']
+            }
+            for hit in hits
+        ]
 
-                    # Check for parallel (when both N or both S)
-                    if (dec1 * dec2) > 0:  # Same sign
-                        dec_diff = abs(dec1 - dec2)
-                        if dec_diff <= PARALLEL_ORB:
-                            linkages.append({
-                                'person1_name': person1_data['subject']['name'],
-                                'person2_name': person2_data['subject']['name'],
-                                'planet1_name': p1_name,
-                                'planet2_name': p2_name,
-                                'aspect_name': 'parallel',
-                                'aspect_degrees': 0,
-                                'orbit': round(dec_diff, 4),
-                                'actual_degrees': round(dec_diff, 4)
-                            })
+    def find_romance_linkages(self, person1_data: Union[Dict, ChartState],
+                              person2_data: Union[Dict, ChartState]) -> List[Dict]:
+        """Find all Romance linkages between two people's charts
 
-                    # Check for contraparallel (when one N and one S)
-                    if (dec1 * dec2) < 0:  # Different signs
-                        dec_sum = abs(dec1) + abs(dec2)
-                        contra_diff = abs(dec_sum - ecliptic_tilt)
-                        if contra_diff <= CONTRAPARALLEL_ORB:
-                            linkages.append({
-                                'person1_name': person1_data['subject']['name'],
-                                'person2_name': person2_data['subject']['name'],
-                                'planet1_name': p1_name,
-                                'planet2_name': p2_name,
-                                'aspect_name': 'contraparallel',
-                                'aspect_degrees': 180,
-                                'orbit': round(contra_diff, 4),
-                                'actual_degrees': round(dec_sum, 4)
-                            })
+        Args:
+            person1_data: ChartState with its birth date, or chart data with a 'subject' level
+            person2_data: ChartState with its birth date, or chart data with a 'subject' level
+        """
+        try:
+            person1 = ChartState.coerce(person1_data)
+            person2 = ChartState.coerce(person2_data)
+            ecliptic_tilt = self.average_ecliptic_tilt(person1.date, person2.date)
 
-            return linkages
+            hits = _romance_engine.evaluate(person1, person2, ecliptic_tilt=ecliptic_tilt)[ROMANCE_RULE.name]
+            return self.format_romance_linkages(hits, person1.name, person2.name)
 
         except Exception as e:
             logger.error(f"Error in find_romance_linkages: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
@@ -1,8 +1,6 @@
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 import logging
 from ..chart_creator import ChartCreator
-import json
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +19,19 @@ class AltMarriageDateFinder:
         
     async def find_matching_dates(self, synastry_data: Dict, from_date: str, 
                                 to_date: str, transit_hour: int, transit_minute: int,
-                                user_id: str, job_id: str) -> Dict:
+                                user_id: str, job_id: str,
+                                progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+        """
+        Find dates where both people have Cinderella or turbulent transits
+
+        progress, when given, is called with (days scanned, total days) across both
+        people's transit ranges.
+        """
+        def person_progress(index: int) -> Optional[Callable[[int, int], None]]:
+            if progress is None:
+                return None
+            return lambda done, total: progress(index * total + done, 2 * total)
+
         try:
             logger.info(f"Synastry data: {synastry_data}")
             # Extract both persons' data
@@ -42,14 +52,14 @@ class AltMarriageDateFinder:
             # Process transits for both people
             person1_transits = await self._get_transits(
                 person1, from_date, to_date, transit_hour, transit_minute,
-                user_id, job_id, filter_planets
+                user_id, job_id, filter_planets, person_progress(0)
             )
             logger.info(f"Person 1 transits: {person1_transits}")
             
             
             person2_transits = await self._get_transits(
                 person2, from_date, to_date, transit_hour, transit_minute,
-                user_id, job_id, filter_planets
+                user_id, job_id, filter_planets, person_progress(1)
             )
             logger.info(f"Person 2 transits: {person2_transits}")
             
@@ -65,7 +75,8 @@ class AltMarriageDateFinder:
     async def _get_transits(self, person: Dict, from_date: str, to_date: str,
                           transit_hour: int, transit_minute: int,
                           user_id: str, job_id: str,
-                          filter_planets: List[str]) -> Dict:
+                          filter_planets: List[str],
+                          progress: Optional[Callable[[int, int], None]] = None) -> Dict:
         """Get transits using the specialized marriage transit loop"""
         try:
             # Extract birth data
@@ -88,49 +99,18 @@ class AltMarriageDateFinder:
             # Initialize results dictionary
             results = {}
             
-            # Convert date strings to datetime objects
-            start_date = datetime.strptime(from_date, "%Y-%m-%d")
-            end_date = datetime.strptime(to_date, "%Y-%m-%d")
-            current_date = start_date
+            # Compute the whole date range from one ephemeris pass
+            transit_days = chart_creator.get_transit_range_data_incremental(
+                from_date, to_date,
+                transit_hour=transit_hour if transit_hour is not None else 0,
+                transit_minute=transit_minute if transit_minute is not None else 0,
+                progress=progress
+            )
             
-            while current_date <= end_date:
+            for date_key, transit_data in transit_days.items():
                 try:
-                    # Format date string
-                    date_key = current_date.strftime("%Y-%m-%d")
                     logger.debug(f"Processing date_key: {date_key}")
                     
-                    # Split date_key into components
-                    year, month, day = map(int, date_key.split('-'))
-                    
-                    # Create transit time using the split components
-                    transit_time = datetime(
-                        year=year,
-                        month=month,
-                        day=day,
-                        hour=transit_hour if transit_hour is not None else 0,
-                        minute=transit_minute if transit_minute is not None else 0
-                    )
-                    
-                    logger.info(f"Creating transit chart for {person['name']} on {transit_time}")
-                    transit_data = await chart_creator.create_transit_chart(transit_year=transit_time.year,
-                transit_month=transit_time.month,
-                transit_day=transit_time.day,
-                transit_hour=transit_time.hour,
-                transit_minute=transit_time.minute)
-                    
-                    logger.info(f"Transit data: {transit_data}")
-                    
-                    # Debug the incoming data type
-                    logger.debug(f"Transit data type: {type(transit_data)}")
-                    
-                    # Parse the JSON string into a dictionary if it's a string
-                    if isinstance(transit_data, str):
-                        try:
-                            transit_data = json.loads(transit_data)
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse transit data JSON: {e}")
-                            continue
-                    
                     cinderella_aspects = []
                     turbulent_transits = []
                     
@@ -164,10 +144,8 @@ class AltMarriageDateFinder:
                     logger.debug(f"Successfully processed results for {date_key}")
                     
                 except Exception as e:
-                    logger.error(f"Error processing date {current_date} for {person['name']}: {str(e)}")
-                    logger.error(f"Transit data: {transit_data if 'transit_data' in locals() else 'No transit chart created'}")
-                    
-                current_date += timedelta(days=1)
+                    logger.error(f"Error processing date {date_key} for {person['name']}: {str(e)}")
+                    logger.error(f"Transit data: {transit_data}")
             
             logger.info(f"Completed transit calculations for {person['name']}")
             logger.info(f"Final results: {results}")
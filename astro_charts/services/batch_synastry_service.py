@@ -0,0 +1,274 @@
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .declination_service import DeclinationService
+from .ephemeris_engine import EphemerisEngine
+from .geo_service import GeoService
+from .synastry_score_calculator import SynastryScoreCalculator
+from ..magi_aspects import SuperAspectCalculator
+from ..magi_synastry import MagiSynastryCalculator
+from ..models.chart_state import ChartState
+from ..utils.ascendant_utils import datetime_to_julian_day
+from ..utils.timezone_utils import get_timezone
+
+logger = logging.getLogger(__name__)
+
+# Candidates scored per vectorized pass; bounds the (checks, candidates, bodies, bodies) arrays
+BATCH_SYNASTRY_CHUNK_SIZE = int(os.getenv('BATCH_SYNASTRY_CHUNK_SIZE', '256'))
+
+# Bodies of a synastry chart, as in ChartCreator._get_synastry_data_as_json
+SYNASTRY_BODIES = [
+    "sun", "moon", "mercury", "venus", "mars",
+    "jupiter", "saturn", "uranus", "neptune", "pluto", "chiron"
+]
+
+
+class BatchSynastryService:
+    """Score one reference chart against many candidate birth records
+
+    Only what SynastryScoreCalculator.calculate_scores needs is computed: planet
+    positions for every candidate come from one EphemerisEngine call, declinations
+    are calculated once per distinct birth date, and the Saturn clashes and linkage
+    families are found for a whole chunk of candidates in one LinkageEngine pass.
+    Nothing is rendered or saved.
+
+    Positions and declinations follow /charts/synastry: longitudes rounded to 4
+    places, declinations at 00:00 UT of the birth date seen from the reference
+    person's birth place, so a candidate scores the same here as in a single
+    synastry chart.
+    """
+
+    def __init__(self, zodiac_type: Optional[str] = None, sidereal_mode: Optional[str] = None,
+                 geo_service: Optional[GeoService] = None):
+        """
+        Initialize the batch synastry service
+
+        Args:
+            zodiac_type: "Tropic" or "Sidereal" (defaults to tropical)
+            sidereal_mode: Swiss Ephemeris sidereal mode name, e.g. "LAHIRI"
+            geo_service: Geocoder for records without coordinates (created on first use)
+        """
+        self.ephemeris_engine = EphemerisEngine(zodiac_type, sidereal_mode, bodies=SYNASTRY_BODIES)
+        self.declination_service = DeclinationService(validate_with_horizons=False)
+        self.magi_calc = MagiSynastryCalculator()
+        self.super_calc = SuperAspectCalculator()
+        self.score_calculator = SynastryScoreCalculator()
+        self._geo_service = geo_service
+        self._locations: Dict[Tuple[str, str], Tuple[float, float, str]] = {}
+
+    @property
+    def geo_service(self) -> GeoService:
+        if self._geo_service is None:
+            self._geo_service = GeoService(os.getenv('GEONAMES_USERNAME'))
+        return self._geo_service
+
+    def locate(self, record: Dict[str, Any]) -> Tuple[float, float, str]:
+        """
+        Find the latitude, longitude and timezone of a birth record
+
+        Uses lat, lng and tz_str from the record when given, otherwise geocodes
+        city and nation (each place once per service).
+
+        Returns:
+            Tuple[float, float, str]: lat, lng and IANA timezone
+        """
+        lat, lng, tz_str = record.get('lat'), record.get('lng'), record.get('tz_str')
+        if lat is not None and lng is not None:
+            return lat, lng, tz_str or get_timezone(lat, lng)
+
+        place = (record['city'], record['nation'])
+        if place not in self._locations:
+            coordinates = self.geo_service.get_coordinates(*place)
+            if not coordinates:
+                raise ValueError(f"Could not find coordinates for {place[0]}, {place[1]}")
+            lat, lng = coordinates
+            tz_str = get_timezone(lat, lng)
+            if not tz_str:
+                raise ValueError(f"Could not determine timezone for coordinates: {lat}, {lng}")
+            self._locations[place] = (lat, lng, tz_str)
+        return self._locations[place]
+
+    def build_charts(self, records: Sequence[Dict[str, Any]],
+                     site: Optional[Tuple[float, float]] = None) -> Tuple[ChartState, List[int], List[Dict]]:
+        """
+        Calculate the synastry chart of every birth record in one pass
+
+        Args:
+            records: Birth records with name, year, month, day, hour, minute and
+                either city and nation or lat, lng (and optionally tz_str)
+            site: (lat, lng) declinations are seen from, i.e. the reference birth place
+
+        Returns:
+            Tuple: Stacked ChartState of the records that could be placed, the index
+            of each of those records, and an error entry for every other record
+        """
+        julian_days, indices, dates, errors = [], [], [], []
+        for index, record in enumerate(records):
+            try:
+                _, _, tz_str = self.locate(record)
+                birth = datetime(record['year'], record['month'], record['day'], record['hour'], record['minute'])
+                julian_days.append(datetime_to_julian_day(birth, tz_str))
+                dates.append(f"{record['year']}-{record['month']:02d}-{record['day']:02d}")
+                indices.append(index)
+            except Exception as e:
+                logger.error(f"Error placing birth record {index} ({record.get('name')}): {str(e)}")
+                errors.append({'index': index, 'name': record.get('name'), 'error': str(e)})
+
+        if not indices:
+            return ChartState.empty(days=0), indices, errors
+
+        table = self.ephemeris_engine.compute_julian_days(np.array(julian_days))
+        table.longitude = np.round(table.longitude, 4)
+        lat, lng = site if site is not None else (None, None)
+        declination = self.declination_service.get_declinations(table.bodies, dates, lng, lat)
+
+        charts = ChartState.from_ephemeris_table(table, declination, name="")
+        return charts, indices, errors
+
+    def build_chart(self, record: Dict[str, Any],
+                    site: Optional[Tuple[float, float]] = None) -> ChartState:
+        """Calculate the synastry chart of one birth record (see build_charts)"""
+        charts, _, errors = self.build_charts([record], site)
+        if errors:
+            raise ValueError(errors[0]['error'])
+        chart = charts.day(0)
+        chart.name = record['name']
+        chart.date = f"{record['year']}-{record['month']:02d}-{record['day']:02d}"
+        return chart
+
+    def _super_aspects(self, chart: ChartState) -> List[Dict]:
+        return self.super_calc.find_super_aspects({'subject': {'planets': chart.to_planets()}})
+
+    def score_chunk(self, reference: ChartState, records: Sequence[Dict[str, Any]],
+                    site: Optional[Tuple[float, float]] = None, offset: int = 0,
+                    include_linkages: bool = False,
+                    reference_super_aspects: Optional[List[Dict]] = None) -> List[Dict]:
+        """
+        Score one chunk of candidates against the reference chart
+
+        Args:
+            reference: Reference ChartState with its name and birth date
+            records: Candidate birth records
+            site: (lat, lng) declinations are seen from
+            offset: Index of the first record within the whole batch
+            include_linkages: Also return the linkages behind every score
+            reference_super_aspects: Super aspects of the reference, if already found
+
+        Returns:
+            List[Dict]: One entry per record with index, name, id and scores, or
+            index, name, id and error when the record could not be scored
+        """
+        charts, indices, errors = self.build_charts(records, site)
+        for error in errors:
+            error['id'] = records[error['index']].get('id')
+            error['index'] += offset
+
+        if reference_super_aspects is None:
+            reference_super_aspects = self._super_aspects(reference)
+
+        results = []
+        if indices:
+            names = [records[i]['name'] for i in indices]
+            dates = [f"{records[i]['year']}-{records[i]['month']:02d}-{records[i]['day']:02d}" for i in indices]
+            linkages = self.magi_calc.find_linkages_many(reference, charts, names, dates)
+
+            for day, index in enumerate(indices):
+                candidate_super_aspects = self._super_aspects(charts.day(day))
+                scores = self.score_calculator.calculate_scores({
+                    **linkages[day],
+                    'person1_super_aspects': reference_super_aspects,
+                    'person2_super_aspects': candidate_super_aspects
+                })
+                result = {
+                    'index': offset + index,
+                    'name': names[day],
+                    'id': records[index].get('id'),
+                    'scores': scores
+                }
+                if include_linkages:
+                    result['linkages'] = linkages[day]
+                    result['person2_super_aspects'] = candidate_super_aspects
+                results.append(result)
+
+        return sorted(results + errors, key=lambda result: result['index'])
+
+    def score_candidates(self, reference: Union[Dict[str, Any], ChartState],
+                         candidates: Sequence[Dict[str, Any]],
+                         chunk_size: int = BATCH_SYNASTRY_CHUNK_SIZE,
+                         site: Optional[Tuple[float, float]] = None,
+                         include_linkages: bool = False) -> Iterator[List[Dict]]:
+        """
+        Score a reference chart against every candidate, one chunk at a time
+
+        Args:
+            reference: Reference birth record, or a ChartState with its name and birth date
+            candidates: Candidate birth records (an optional 'id' is passed through)
+            chunk_size: Candidates per vectorized pass
+            site: (lat, lng) declinations are seen from; defaults to the
+                reference record's birth place
+            include_linkages: Also return the linkages behind every score
+
+        Yields:
+            List[Dict]: Scored entries of each chunk, in candidate order (see score_chunk)
+        """
+        if not isinstance(reference, ChartState):
+            if site is None:
+                lat, lng, _ = self.locate(reference)
+                site = (lat, lng)
+            reference = self.build_chart(reference, site)
+
+        reference_super_aspects = self._super_aspects(reference)
+        chunk_size = max(1, chunk_size)
+        for offset in range(0, len(candidates), chunk_size):
+            yield self.score_chunk(
+                reference, candidates[offset:offset + chunk_size], site, offset,
+                include_linkages, reference_super_aspects
+            )
+
+    @staticmethod
+    def ranking_entry(result: Dict) -> Dict:
+        """
+        The part of a scored entry rank() needs
+
+        Keeping only this per candidate lets a long batch be ranked without holding
+        every score breakdown and linkage until the end.
+        """
+        entry = {'index': result['index'], 'name': result['name'], 'id': result['id']}
+        if 'scores' in result:
+            entry['scores'] = {'overall': result['scores']['overall']}
+        return entry
+
+    @staticmethod
+    def rank(results: Sequence[Dict], top_n: Optional[int] = None) -> List[Dict]:
+        """
+        Rank scored entries by overall score (best first)
+
+        Ties keep candidate order; entries with an error are left out.
+
+        Args:
+            results: Entries from score_chunk / score_candidates
+            top_n: Keep only the best top_n entries
+
+        Returns:
+            List[Dict]: index, name, id, rank and the overall score of each entry
+        """
+        scored = sorted(
+            (result for result in results if 'scores' in result),
+            key=lambda result: (-result['scores']['overall'], result['index'])
+        )
+        if top_n is not None:
+            scored = scored[:top_n]
+        return [
+            {
+                'rank': rank,
+                'index': result['index'],
+                'name': result['name'],
+                'id': result['id'],
+                'overall': result['scores']['overall']
+            }
+            for rank, result in enumerate(scored, start=1)
+        ]
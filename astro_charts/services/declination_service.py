@@ -0,0 +1,197 @@
+import logging
+import os
+from datetime import datetime
+from typing import Optional, Sequence
+
+import numpy as np
+import swisseph as swe
+
+from .ephemeris_engine import EphemerisEngine
+from .nasa_horizons_service import NASAHorizonsService
+from ..utils.ascendant_utils import SWISSEPH_LOCK
+from ..utils.ecliptic_tilt import declination_from_ecliptic, get_true_obliquity
+
+logger = logging.getLogger(__name__)
+
+class DeclinationService:
+    """Offline declinations from ecliptic coordinates and the true obliquity of the ecliptic"""
+
+    BODY_IDS = EphemerisEngine.BODY_IDS
+
+    def __init__(self, validate_with_horizons: Optional[bool] = None, validation_tolerance: float = 0.5):
+        """
+        Initialize the declination service
+
+        Args:
+            validate_with_horizons: Also query NASA Horizons and log disagreements.
+                Defaults to the DECLINATION_VALIDATE_HORIZONS environment variable.
+            validation_tolerance: Difference in degrees above which a disagreement is logged
+        """
+        if validate_with_horizons is None:
+            validate_with_horizons = os.getenv('DECLINATION_VALIDATE_HORIZONS', '').lower() in ('1', 'true', 'yes')
+
+        self.validation_tolerance = validation_tolerance
+        self.horizons_service = NASAHorizonsService() if validate_with_horizons else None
+
+        if self.horizons_service:
+            logger.info("Declination service will validate against NASA Horizons")
+
+    def get_ecliptic_position(self, body_name: str, date: str,
+                              longitude: Optional[float] = None,
+                              latitude: Optional[float] = None) -> Optional[tuple]:
+        """
+        Get the tropical ecliptic longitude and latitude of a body at 00:00 UT
+
+        Args:
+            body_name (str): Name of the celestial body
+            date (str): Date in YYYY-MM-DD format
+            longitude (float): Observer longitude (topocentric when given with latitude)
+            latitude (float): Observer latitude
+
+        Returns:
+            Optional[tuple]: (ecliptic longitude, ecliptic latitude) in degrees or None if unknown
+        """
+        body_id = self.BODY_IDS.get(body_name.lower())
+        if body_id is None:
+            return None
+
+        dt = datetime.strptime(date, '%Y-%m-%d')
+        julian_day = swe.julday(dt.year, dt.month, dt.day, 0.0)
+
+        iflag = swe.FLG_SWIEPH
+        with SWISSEPH_LOCK:
+            if longitude is not None and latitude is not None:
+                swe.set_topo(longitude, latitude, 0)
+                iflag += swe.FLG_TOPOCTR
+
+            values = swe.calc_ut(julian_day, body_id, iflag)[0]
+        return values[0], values[1]
+
+    def get_declination(self,
+                        body_name: str,
+                        date: str,
+                        longitude: Optional[float] = None,
+                        latitude: Optional[float] = None) -> Optional[float]:
+        """
+        Get declination for a celestial body at a specific date and location
+
+        Uses the same instant (00:00 UT) and site as NASAHorizonsService.get_declination,
+        so the two can be compared directly.
+
+        Args:
+            body_name (str): Name of the celestial body
+            date (str): Date in YYYY-MM-DD format
+            longitude (float): Observer longitude
+            latitude (float): Observer latitude
+
+        Returns:
+            Optional[float]: Declination in degrees or None if error
+        """
+        try:
+            position = self.get_ecliptic_position(body_name, date, longitude, latitude)
+            if position is None:
+                logger.debug(f"No local ephemeris for body: {body_name}")
+                return None
+
+            ecliptic_longitude, ecliptic_latitude = position
+            obliquity = get_true_obliquity(date)
+            declination = round(float(declination_from_ecliptic(ecliptic_longitude, ecliptic_latitude, obliquity)), 4)
+
+            if self.horizons_service:
+                self._validate(body_name, date, longitude, latitude, declination)
+
+            return declination
+
+        except Exception as e:
+            logger.error(f"Error calculating declination for {body_name}: {str(e)}")
+            return None
+
+    def get_declinations(self, bodies: Sequence[str], dates: Sequence[str],
+                         longitude: Optional[float] = None,
+                         latitude: Optional[float] = None) -> np.ndarray:
+        """
+        Get declinations for several bodies on many dates at once
+
+        Gives the same values as get_declination for every (date, body), but each
+        distinct date is calculated once and the conversion from ecliptic
+        coordinates is done for the whole table in one step.
+
+        Args:
+            bodies: Body names (all must be in BODY_IDS)
+            dates: Dates in YYYY-MM-DD format, repeats allowed
+            longitude (float): Observer longitude (topocentric when given with latitude)
+            latitude (float): Observer latitude
+
+        Returns:
+            np.ndarray: Declinations in degrees shaped (dates, bodies), rounded to 4 places
+        """
+        unique_dates, inverse = np.unique(np.asarray(dates, dtype=str), return_inverse=True)
+        body_ids = [self.BODY_IDS[body.lower()] for body in bodies]
+
+        ecliptic_longitude = np.empty((len(unique_dates), len(body_ids)), dtype=np.float64)
+        ecliptic_latitude = np.empty_like(ecliptic_longitude)
+        obliquity = np.empty((len(unique_dates), 1), dtype=np.float64)
+
+        iflag = swe.FLG_SWIEPH
+        with SWISSEPH_LOCK:
+            if longitude is not None and latitude is not None:
+                swe.set_topo(longitude, latitude, 0)
+                iflag += swe.FLG_TOPOCTR
+
+            for i, date in enumerate(unique_dates):
+                dt = datetime.strptime(date, '%Y-%m-%d')
+                julian_day = swe.julday(dt.year, dt.month, dt.day, 0.0)
+                for j, body_id in enumerate(body_ids):
+                    values = swe.calc_ut(julian_day, body_id, iflag)[0]
+                    ecliptic_longitude[i, j] = values[0]
+                    ecliptic_latitude[i, j] = values[1]
+                obliquity[i] = get_true_obliquity(date)
+
+        declinations = np.round(declination_from_ecliptic(ecliptic_longitude, ecliptic_latitude, obliquity), 4)
+        return declinations[inverse.reshape(-1)]
+
+    def prefetch_range(self, start_date: str, end_date: str,
+                       longitude: Optional[float] = None,
+                       latitude: Optional[float] = None) -> None:
+        """
+        Fetch Horizons declinations for a whole date range ahead of per-day validation
+
+        Makes one Horizons request per body for the range so the daily lookups in
+        _validate are served from the cache. Does nothing when validation is off.
+
+        Args:
+            start_date (str): First date in YYYY-MM-DD format
+            end_date (str): Last date in YYYY-MM-DD format (inclusive)
+            longitude (float): Observer longitude
+            latitude (float): Observer latitude
+        """
+        if not self.horizons_service:
+            return
+
+        self.horizons_service.prefetch_declinations(
+            start_date,
+            end_date,
+            longitude if longitude is not None else 0.0,
+            latitude if latitude is not None else 0.0
+        )
+
+    def _validate(self, body_name: str, date: str, longitude: Optional[float],
+                  latitude: Optional[float], declination: float) -> None:
+        """Compare a local declination with NASA Horizons and log any disagreement"""
+        horizons_declination = self.horizons_service.get_declination(
+            body_name,
+            date,
+            longitude if longitude is not None else 0.0,
+            latitude if latitude is not None else 0.0
+        )
+
+        if horizons_declination is None:
+            logger.warning(f"Horizons validation unavailable for {body_name} on {date}")
+            return
+
+        difference = abs(horizons_declination - declination)
+        if difference > self.validation_tolerance:
+            logger.warning(
+                f"Declination mismatch for {body_name} on {date}: "
+                f"local {declination}°, Horizons {horizons_declination}° (diff {difference:.4f}°)"
+            )
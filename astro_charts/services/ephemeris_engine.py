@@ -0,0 +1,289 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+import kerykeion
+import numpy as np
+import pytz
+import swisseph as swe
+
+from .ephemeris_store import get_ephemeris_store
+from ..utils.ascendant_utils import SWISSEPH_LOCK
+
+logger = logging.getLogger(__name__)
+
+# Use the ephemeris files bundled with kerykeion so positions match AstrologicalSubject
+swe.set_ephe_path(str(Path(kerykeion.__file__).parent.absolute() / "sweph"))
+
+SIGNS = ["Ari", "Tau", "Gem", "Can", "Leo", "Vir", "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis"]
+
+HOUSE_NAMES = [
+    "First_House", "Second_House", "Third_House", "Fourth_House",
+    "Fifth_House", "Sixth_House", "Seventh_House", "Eighth_House",
+    "Ninth_House", "Tenth_House", "Eleventh_House", "Twelfth_House"
+]
+
+
+def assign_houses(longitude: np.ndarray, house_cusps: np.ndarray) -> np.ndarray:
+    """
+    Find the house (0-11) each longitude falls in
+
+    Args:
+        longitude: Positions shaped (..., bodies)
+        house_cusps: Cusps shaped (..., 12) with matching leading dimensions
+
+    Returns:
+        np.ndarray: House numbers shaped like longitude
+    """
+    cusps = house_cusps[..., np.newaxis, :]
+    width = (np.roll(house_cusps, -1, axis=-1)[..., np.newaxis, :] - cusps) % 360
+    offset = (longitude[..., np.newaxis] - cusps) % 360
+    return np.argmax(offset < width, axis=-1)
+
+
+@dataclass
+class EphemerisTable:
+    """Class to hold body positions sampled over a series of times"""
+    bodies: List[str]
+    times: List[datetime]      # Local (naive) sample times
+    julian_days: np.ndarray    # (times,)
+    longitude: np.ndarray      # (times, bodies) ecliptic longitude in degrees
+    latitude: np.ndarray       # (times, bodies) ecliptic latitude in degrees
+    speed: np.ndarray          # (times, bodies) longitude speed in degrees/day
+    retrograde: np.ndarray     # (times, bodies) bool
+    house_cusps: Optional[np.ndarray] = None  # (times, 12) when a location was given
+
+    def body_index(self, body_name: str) -> int:
+        """Return the column index of a body"""
+        return self.bodies.index(body_name.lower())
+
+    @property
+    def sign_index(self) -> np.ndarray:
+        """Zodiac sign number (0-11) of every sampled position"""
+        return (self.longitude // 30).astype(int) % 12
+
+    @property
+    def sign_position(self) -> np.ndarray:
+        """Degrees within the sign of every sampled position"""
+        return self.longitude % 30
+
+    @property
+    def house_index(self) -> Optional[np.ndarray]:
+        """House number (0-11) each body falls in, or None without house cusps"""
+        if self.house_cusps is None:
+            return None
+        return assign_houses(self.longitude, self.house_cusps)
+
+
+class EphemerisEngine:
+    """Batched ephemeris calculations over date ranges using the Swiss Ephemeris"""
+
+    # Same bodies as NASAHorizonsService.BODY_IDS, in chart order
+    BODY_IDS = {
+        'sun': swe.SUN,
+        'moon': swe.MOON,
+        'mercury': swe.MERCURY,
+        'venus': swe.VENUS,
+        'mars': swe.MARS,
+        'jupiter': swe.JUPITER,
+        'saturn': swe.SATURN,
+        'uranus': swe.URANUS,
+        'neptune': swe.NEPTUNE,
+        'pluto': swe.PLUTO,
+        'chiron': swe.CHIRON
+    }
+
+    def __init__(self, zodiac_type: Optional[str] = None, sidereal_mode: Optional[str] = None,
+                 bodies: Optional[List[str]] = None, houses_system: str = "P", use_store: bool = True):
+        """
+        Initialize the ephemeris engine
+
+        Args:
+            zodiac_type: "Tropic" or "Sidereal" (defaults to tropical)
+            sidereal_mode: Swiss Ephemeris sidereal mode name, e.g. "LAHIRI"
+            bodies: Bodies to calculate (defaults to every body in BODY_IDS)
+            houses_system: Swiss Ephemeris house system identifier
+            use_store: Interpolate from the precomputed ephemeris store when it covers a request
+        """
+        self.zodiac_type = zodiac_type
+        self.sidereal_mode = sidereal_mode
+        self.bodies = [b.lower() for b in bodies] if bodies else list(self.BODY_IDS.keys())
+        self.houses_system = houses_system
+        self.use_store = use_store
+
+        unknown = [b for b in self.bodies if b not in self.BODY_IDS]
+        if unknown:
+            raise ValueError(f"Unknown bodies for ephemeris engine: {unknown}")
+
+        self.iflag = swe.FLG_SWIEPH + swe.FLG_SPEED
+        self.houses_flag = swe.FLG_SWIEPH
+        if self.is_sidereal:
+            self.iflag += swe.FLG_SIDEREAL
+            self.houses_flag += swe.FLG_SIDEREAL
+
+    @property
+    def is_sidereal(self) -> bool:
+        return self.zodiac_type == "Sidereal"
+
+    def _set_sidereal_mode(self) -> None:
+        """Apply the sidereal mode; swisseph keeps it as global state, so hold SWISSEPH_LOCK"""
+        if self.is_sidereal:
+            mode = self.sidereal_mode or "FAGAN_BRADLEY"
+            swe.set_sid_mode(getattr(swe, f"SIDM_{mode}"))
+
+    @staticmethod
+    def daily_times(from_date: str, to_date: str, hour: int = 12, minute: int = 0) -> List[datetime]:
+        """Build one local sample time per day between two YYYY-MM-DD dates (inclusive)"""
+        start_date = datetime.strptime(from_date, "%Y-%m-%d").replace(hour=hour, minute=minute)
+        end_date = datetime.strptime(to_date, "%Y-%m-%d").replace(hour=hour, minute=minute)
+
+        times = []
+        current_date = start_date
+        while current_date <= end_date:
+            times.append(current_date)
+            current_date += timedelta(days=1)
+        return times
+
+    @staticmethod
+    def julian_days(times: List[datetime], tz_str: str) -> np.ndarray:
+        """
+        Convert local times to Julian days the same way kerykeion does
+
+        Args:
+            times: Naive local datetimes
+            tz_str: IANA timezone the times are expressed in
+
+        Returns:
+            np.ndarray: Julian day (UT) for every time
+        """
+        local_tz = pytz.timezone(tz_str)
+        julian_days = np.empty(len(times), dtype=np.float64)
+
+        for i, local_time in enumerate(times):
+            utc_time = local_tz.localize(local_time, is_dst=None).astimezone(pytz.utc)
+            julian_days[i] = swe.julday(
+                utc_time.year, utc_time.month, utc_time.day,
+                utc_time.hour + utc_time.minute / 60
+            )
+        return julian_days
+
+    def compute(self, times: List[datetime], tz_str: str,
+                lat: Optional[float] = None, lng: Optional[float] = None) -> EphemerisTable:
+        """
+        Calculate positions, speeds and retrograde flags for every body at every time
+
+        Args:
+            times: Naive local datetimes to sample
+            tz_str: IANA timezone of the sample times
+            lat: Observer latitude, required for house cusps
+            lng: Observer longitude, required for house cusps
+
+        Returns:
+            EphemerisTable: Arrays shaped (times, bodies)
+        """
+        return self.compute_julian_days(self.julian_days(times, tz_str), lat, lng, times=times)
+
+    def compute_julian_days(self, julian_days: np.ndarray,
+                            lat: Optional[float] = None, lng: Optional[float] = None,
+                            times: Optional[List[datetime]] = None) -> EphemerisTable:
+        """
+        Calculate positions for every body at Julian days (UT) rather than local times
+
+        Args:
+            julian_days: Julian days (UT) to sample
+            lat: Observer latitude, required for house cusps
+            lng: Observer longitude, required for house cusps
+            times: Local times matching julian_days, kept on the table for reference
+
+        Returns:
+            EphemerisTable: Arrays shaped (julian_days, bodies)
+        """
+        julian_days = np.asarray(julian_days, dtype=np.float64)
+        shape = (len(julian_days), len(self.bodies))
+
+        store = get_ephemeris_store(self.zodiac_type, self.sidereal_mode) if self.use_store else None
+        from_store = store is not None and store.covers(julian_days, self.bodies)
+        if from_store:
+            longitude, latitude, speed = store.interpolate(julian_days, self.bodies)
+        else:
+            longitude = np.empty(shape, dtype=np.float64)
+            latitude = np.empty(shape, dtype=np.float64)
+            speed = np.empty(shape, dtype=np.float64)
+
+        with_houses = lat is not None and lng is not None
+        house_cusps = np.empty((len(julian_days), 12), dtype=np.float64) if with_houses else None
+        houses_system = self.houses_system.encode()
+        body_ids = [self.BODY_IDS[b] for b in self.bodies]
+
+        with SWISSEPH_LOCK:
+            self._set_sidereal_mode()
+            for i, julian_day in enumerate(julian_days):
+                if not from_store:
+                    for j, body_id in enumerate(body_ids):
+                        values = swe.calc_ut(julian_day, body_id, self.iflag)[0]
+                        longitude[i, j] = values[0]
+                        latitude[i, j] = values[1]
+                        speed[i, j] = values[3]
+
+                if with_houses:
+                    house_cusps[i] = swe.houses_ex(julian_day, lat, lng, houses_system, self.houses_flag)[0][:12]
+
+        source = "ephemeris store" if from_store else "Swiss Ephemeris"
+        logger.info(f"Computed ephemeris for {len(self.bodies)} bodies over {len(julian_days)} samples from {source}")
+
+        return EphemerisTable(
+            bodies=list(self.bodies),
+            times=list(times) if times is not None else [],
+            julian_days=julian_days,
+            longitude=longitude,
+            latitude=latitude,
+            speed=speed,
+            retrograde=speed < 0,
+            house_cusps=house_cusps
+        )
+
+    def body_position(self, body: str, julian_day: float) -> tuple:
+        """Longitude and longitude speed (degrees/day) of one body at one Julian day (UT)"""
+        with SWISSEPH_LOCK:
+            self._set_sidereal_mode()
+            values = swe.calc_ut(julian_day, self.BODY_IDS[body.lower()], self.iflag)[0]
+        return values[0], values[3]
+
+    def compute_range(self, from_date: str, to_date: str, tz_str: str,
+                      hour: int = 12, minute: int = 0,
+                      lat: Optional[float] = None, lng: Optional[float] = None) -> EphemerisTable:
+        """Calculate one sample per day between two YYYY-MM-DD dates (inclusive)"""
+        return self.compute(self.daily_times(from_date, to_date, hour, minute), tz_str, lat, lng)
+
+    def positions_at(self, table: EphemerisTable, index: int) -> Dict[str, Dict]:
+        """
+        Extract one sample of a table as per-body dictionaries
+
+        Args:
+            table: Table returned by compute()
+            index: Sample index
+
+        Returns:
+            Dict: body name -> sign, position, abs_pos, speed, retrograde and house
+        """
+        longitude = table.longitude[index]
+        sign_index = (longitude // 30).astype(int) % 12
+        house_index = None
+        if table.house_cusps is not None:
+            house_index = assign_houses(longitude, table.house_cusps[index])
+        positions = {}
+
+        for j, body in enumerate(table.bodies):
+            positions[body] = {
+                "name": body.capitalize(),
+                "sign": SIGNS[sign_index[j]],
+                "position": float(longitude[j] % 30),
+                "abs_pos": float(longitude[j]),
+                "latitude": float(table.latitude[index, j]),
+                "speed": float(table.speed[index, j]),
+                "retrograde": bool(table.retrograde[index, j]),
+                "house": HOUSE_NAMES[house_index[j]] if house_index is not None else None
+            }
+        return positions
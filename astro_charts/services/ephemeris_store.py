@@ -0,0 +1,234 @@
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from ..utils.ascendant_utils import SWISSEPH_LOCK
+from ..utils.cache_utils import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Location and coverage of the precomputed ephemeris files
+EPHEMERIS_STORE_DIR = os.getenv('EPHEMERIS_STORE_DIR', os.path.join(CACHE_DIR, 'ephemeris'))
+EPHEMERIS_STORE_START_YEAR = int(os.getenv('EPHEMERIS_STORE_START_YEAR', '1900'))
+EPHEMERIS_STORE_END_YEAR = int(os.getenv('EPHEMERIS_STORE_END_YEAR', '2100'))
+EPHEMERIS_STORE_STEP_HOURS = float(os.getenv('EPHEMERIS_STORE_STEP_HOURS', '24'))
+
+# Set to 0 to always calculate positions directly
+EPHEMERIS_STORE_ENABLED = os.getenv('EPHEMERIS_STORE_ENABLED', '1').lower() not in ('0', 'false', 'no')
+
+# Build a missing store the first time it is needed instead of calculating directly
+EPHEMERIS_STORE_BUILD = os.getenv('EPHEMERIS_STORE_BUILD', '').lower() in ('1', 'true', 'yes')
+
+# Bump when the stored values change, so stores built by older code are not opened
+EPHEMERIS_STORE_VERSION = 2
+
+
+class EphemerisStore:
+    """Precomputed body positions, memory-mapped from a .npy file
+
+    The data array is shaped (samples, bodies, 4) and holds float32 longitude,
+    latitude, longitude speed and latitude speed at a fixed step from start_jd. Values
+    between samples are found by cubic Hermite interpolation using the stored speeds,
+    which keeps even the Moon well under an arcsecond off at a one day step.
+
+    The file is opened read-only with mmap, so every process serving charts shares
+    the same pages from the OS cache instead of holding its own copy.
+    """
+
+    LONGITUDE, LATITUDE, SPEED, LATITUDE_SPEED = range(4)
+
+    def __init__(self, path: str, data: np.ndarray, start_jd: float, step_days: float, bodies: List[str],
+                 zodiac_type: Optional[str] = None, sidereal_mode: Optional[str] = None):
+        self.path = path
+        self.data = data
+        self.start_jd = start_jd
+        self.step_days = step_days
+        self.bodies = bodies
+        self.zodiac_type = zodiac_type
+        self.sidereal_mode = sidereal_mode
+        self.end_jd = start_jd + (len(data) - 1) * step_days
+        self._body_columns = {body: i for i, body in enumerate(bodies)}
+
+    @staticmethod
+    def file_stem(zodiac_type: Optional[str], sidereal_mode: Optional[str], start_year: int,
+                  end_year: int, step_hours: float) -> str:
+        """Name of the store file for a zodiac setting and coverage"""
+        zodiac = f"sidereal_{(sidereal_mode or 'FAGAN_BRADLEY').lower()}" if zodiac_type == "Sidereal" else "tropical"
+        return f"ephemeris_v{EPHEMERIS_STORE_VERSION}_{zodiac}_{start_year}_{end_year}_{step_hours:g}h"
+
+    @classmethod
+    def open(cls, directory: str, zodiac_type: Optional[str] = None, sidereal_mode: Optional[str] = None,
+             start_year: int = EPHEMERIS_STORE_START_YEAR, end_year: int = EPHEMERIS_STORE_END_YEAR,
+             step_hours: float = EPHEMERIS_STORE_STEP_HOURS) -> Optional['EphemerisStore']:
+        """
+        Memory-map an existing store
+
+        Returns:
+            Optional[EphemerisStore]: The store, or None if its files do not exist
+        """
+        stem = os.path.join(directory, cls.file_stem(zodiac_type, sidereal_mode, start_year, end_year, step_hours))
+        if not (os.path.exists(f"{stem}.npy") and os.path.exists(f"{stem}.json")):
+            return None
+
+        with open(f"{stem}.json") as f:
+            meta = json.load(f)
+        data = np.load(f"{stem}.npy", mmap_mode='r')
+        logger.info(f"Memory-mapped ephemeris store {stem}.npy ({data.shape[0]} samples)")
+        return cls(f"{stem}.npy", data, meta["start_jd"], meta["step_days"], meta["bodies"],
+                   zodiac_type, sidereal_mode)
+
+    @classmethod
+    def build(cls, directory: str, zodiac_type: Optional[str] = None, sidereal_mode: Optional[str] = None,
+              start_year: int = EPHEMERIS_STORE_START_YEAR, end_year: int = EPHEMERIS_STORE_END_YEAR,
+              step_hours: float = EPHEMERIS_STORE_STEP_HOURS) -> 'EphemerisStore':
+        """
+        Calculate every body from January 1 of start_year to January 1 of end_year + 1 and save it
+
+        Args:
+            directory: Directory for the .npy data file and its .json description
+            zodiac_type: "Tropic" or "Sidereal"
+            sidereal_mode: Swiss Ephemeris sidereal mode name, e.g. "LAHIRI"
+            start_year: First year covered
+            end_year: Last year covered
+            step_hours: Hours between samples
+
+        Returns:
+            EphemerisStore: The new store, memory-mapped
+        """
+        from .ephemeris_engine import EphemerisEngine
+
+        engine = EphemerisEngine(zodiac_type, sidereal_mode)
+        step_days = step_hours / 24
+        start_jd = swe.julday(start_year, 1, 1, 0.0)
+        end_jd = swe.julday(end_year + 1, 1, 1, 0.0)
+        count = int(np.ceil((end_jd - start_jd) / step_days)) + 1
+
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, cls.file_stem(zodiac_type, sidereal_mode, start_year, end_year, step_hours))
+        temp_path = f"{stem}.tmp.npy"
+        logger.info(f"Building ephemeris store {stem}.npy: {count} samples x {len(engine.bodies)} bodies")
+
+        data = np.lib.format.open_memmap(temp_path, mode='w+', dtype=np.float32,
+                                         shape=(count, len(engine.bodies), 4))
+        body_ids = [engine.BODY_IDS[body] for body in engine.bodies]
+        with SWISSEPH_LOCK:
+            engine._set_sidereal_mode()
+            for i in range(count):
+                julian_day = start_jd + i * step_days
+                for j, body_id in enumerate(body_ids):
+                    values = swe.calc_ut(julian_day, body_id, engine.iflag)[0]
+                    data[i, j] = (values[0], values[1], values[3], values[4])
+        data.flush()
+        del data
+
+        # Write the description first; the data file only appears once complete
+        with open(f"{stem}.json", "w") as f:
+            json.dump({
+                "start_jd": start_jd,
+                "step_days": step_days,
+                "bodies": engine.bodies,
+                "zodiac_type": zodiac_type,
+                "sidereal_mode": sidereal_mode
+            }, f)
+        os.replace(temp_path, f"{stem}.npy")
+
+        return cls.open(directory, zodiac_type, sidereal_mode, start_year, end_year, step_hours)
+
+    def covers(self, julian_days: np.ndarray, bodies: List[str]) -> bool:
+        """Whether every Julian day and body can be served from the store"""
+        if len(julian_days) == 0 or any(body not in self._body_columns for body in bodies):
+            return False
+        return self.start_jd <= float(np.min(julian_days)) and float(np.max(julian_days)) <= self.end_jd
+
+    def interpolate(self, julian_days: np.ndarray,
+                    bodies: List[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Interpolate positions between stored samples
+
+        Args:
+            julian_days: Julian days (UT) within the store's coverage
+            bodies: Bodies to return, in column order
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: longitude, latitude and speed shaped (julian_days, bodies)
+        """
+        position = (np.asarray(julian_days, dtype=np.float64) - self.start_jd) / self.step_days
+        index = np.clip(np.floor(position).astype(np.int64), 0, len(self.data) - 2)
+        t = (position - index)[:, np.newaxis]
+        columns = [self._body_columns[body] for body in bodies]
+
+        before = np.asarray(self.data[index][:, columns], dtype=np.float64)
+        after = np.asarray(self.data[index + 1][:, columns], dtype=np.float64)
+
+        # Hermite basis functions and their derivatives
+        t2, t3 = t * t, t * t * t
+        h00, h10, h01, h11 = 2 * t3 - 3 * t2 + 1, t3 - 2 * t2 + t, -2 * t3 + 3 * t2, t3 - t2
+        d00, d10, d01, d11 = 6 * t2 - 6 * t, 3 * t2 - 4 * t + 1, -6 * t2 + 6 * t, 3 * t2 - 2 * t
+        step = self.step_days
+
+        lon0 = before[..., self.LONGITUDE]
+        # Unwrap across 0/360 so the next sample is on the same side of the circle
+        lon1 = lon0 + (after[..., self.LONGITUDE] - lon0 + 180) % 360 - 180
+        speed0, speed1 = before[..., self.SPEED] * step, after[..., self.SPEED] * step
+
+        longitude = (h00 * lon0 + h10 * speed0 + h01 * lon1 + h11 * speed1) % 360
+        speed = (d00 * lon0 + d10 * speed0 + d01 * lon1 + d11 * speed1) / step
+        latitude = (h00 * before[..., self.LATITUDE] + h10 * before[..., self.LATITUDE_SPEED] * step
+                    + h01 * after[..., self.LATITUDE] + h11 * after[..., self.LATITUDE_SPEED] * step)
+
+        return longitude, latitude, speed
+
+
+_stores: Dict[Tuple[Optional[str], Optional[str]], EphemerisStore] = {}
+_stores_lock = threading.Lock()
+
+def get_ephemeris_store(zodiac_type: Optional[str] = None,
+                        sidereal_mode: Optional[str] = None) -> Optional[EphemerisStore]:
+    """
+    Return the shared store for a zodiac setting
+
+    Opens (or, with EPHEMERIS_STORE_BUILD, builds) the store on first use. Only an
+    opened store is kept, so one built or fixed later is picked up on a later call.
+
+    Returns:
+        Optional[EphemerisStore]: The store, or None when disabled or not built
+    """
+    if not EPHEMERIS_STORE_ENABLED:
+        return None
+
+    key = ("Sidereal", sidereal_mode or "FAGAN_BRADLEY") if zodiac_type == "Sidereal" else (None, None)
+    with _stores_lock:
+        if key not in _stores:
+            try:
+                store = EphemerisStore.open(EPHEMERIS_STORE_DIR, *key)
+                if store is None and EPHEMERIS_STORE_BUILD:
+                    store = EphemerisStore.build(EPHEMERIS_STORE_DIR, *key)
+            except Exception as e:
+                logger.error(f"Error opening ephemeris store for {key}: {str(e)}")
+                store = None
+            if store is None:
+                return None
+            _stores[key] = store
+        return _stores[key]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build a precomputed ephemeris store")
+    parser.add_argument("--zodiac-type", default=None, help='"Tropic" (default) or "Sidereal"')
+    parser.add_argument("--sidereal-mode", default=None, help="Swiss Ephemeris sidereal mode, e.g. LAHIRI")
+    parser.add_argument("--start-year", type=int, default=EPHEMERIS_STORE_START_YEAR)
+    parser.add_argument("--end-year", type=int, default=EPHEMERIS_STORE_END_YEAR)
+    parser.add_argument("--step-hours", type=float, default=EPHEMERIS_STORE_STEP_HOURS)
+    parser.add_argument("--directory", default=EPHEMERIS_STORE_DIR)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    EphemerisStore.build(args.directory, args.zodiac_type, args.sidereal_mode,
+                         args.start_year, args.end_year, args.step_hours)
@@ -0,0 +1,331 @@
+import logging
+import math
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from .ephemeris_engine import EphemerisEngine, SIGNS
+from ..utils.ascendant_utils import (
+    SWISSEPH_LOCK, ascendant_at, find_ascendant_crossings, normalize_angle, set_sidereal_mode
+)
+
+logger = logging.getLogger(__name__)
+
+# Aspects checked against the Yogi and Ava Yogi points
+DEFAULT_ASPECTS = {'conjunction': 0.0, 'opposition': 180.0}
+
+
+def wrap_degrees(values: np.ndarray) -> np.ndarray:
+    """Wrap angles to [-180, 180) element-wise"""
+    return (values + 180.0) % 360.0 - 180.0
+
+
+class EventFinder:
+    """Finds exact times of aspects, ingresses, stations and Ascendant crossings over a date range
+
+    Each search samples the body's longitude (or speed) on a grid fine enough that an
+    event cannot slip between two samples, brackets the sign changes of the sampled
+    function with NumPy and refines each bracket by bisection. Because real positions
+    are used, retrograde loops produce their full set of passes instead of a single
+    linear estimate. Event fields are plain Python floats and bools, so they can go
+    straight into JSON responses.
+    """
+
+    # Sampling step per body in days; a body must not move through a whole event between samples
+    SAMPLE_STEP_DAYS = {
+        'moon': 0.25,
+        'mercury': 0.5,
+        'venus': 0.5,
+        'sun': 1.0,
+        'mars': 1.0
+    }
+    DEFAULT_STEP_DAYS = 2.0
+
+    # The lunar nodes are not ephemeris engine bodies; both come from the mean node,
+    # Ketu opposite Rahu
+    NODE_OFFSETS = {
+        'rahu': 0.0,
+        'ketu': 180.0
+    }
+
+    def __init__(self, zodiac_type: Optional[str] = None, sidereal_mode: Optional[str] = None,
+                 tolerance_seconds: float = 1.0):
+        """
+        Initialize the event finder
+
+        Args:
+            zodiac_type: "Tropic" or "Sidereal" (defaults to tropical)
+            sidereal_mode: Swiss Ephemeris sidereal mode name, e.g. "LAHIRI"
+            tolerance_seconds: Precision of refined event times
+        """
+        self.zodiac_type = zodiac_type
+        self.sidereal_mode = sidereal_mode
+        self.tolerance = tolerance_seconds / (24 * 60 * 60)
+        self._engines: Dict[str, EphemerisEngine] = {}
+
+    @property
+    def is_sidereal(self) -> bool:
+        return self.zodiac_type == "Sidereal"
+
+    def _engine(self, body: str) -> EphemerisEngine:
+        """Single-body ephemeris engine, so samples only calculate what is asked for"""
+        body = body.lower()
+        if body not in self._engines:
+            self._engines[body] = EphemerisEngine(self.zodiac_type, self.sidereal_mode, bodies=[body])
+        return self._engines[body]
+
+    def _node_positions(self, body: str, julian_days: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Longitudes and speeds of a lunar node at Julian days (UT)"""
+        iflag = swe.FLG_SWIEPH + swe.FLG_SPEED
+        if self.is_sidereal:
+            iflag += swe.FLG_SIDEREAL
+        values = np.empty((len(julian_days), 2), dtype=np.float64)
+        with SWISSEPH_LOCK:
+            if self.is_sidereal:
+                set_sidereal_mode(self.sidereal_mode)
+            for i, julian_day in enumerate(julian_days):
+                position = swe.calc_ut(float(julian_day), swe.MEAN_NODE, iflag)[0]
+                values[i] = position[0], position[3]
+        return (values[:, 0] + self.NODE_OFFSETS[body.lower()]) % 360, values[:, 1]
+
+    def step_days(self, body: str) -> float:
+        return self.SAMPLE_STEP_DAYS.get(body.lower(), self.DEFAULT_STEP_DAYS)
+
+    def sample(self, body: str, start_jd: float, end_jd: float,
+               step: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sample a body's longitude and speed between two Julian days (inclusive)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Julian days, longitudes and speeds (degrees/day)
+        """
+        step = step or self.step_days(body)
+        count = max(2, int(math.ceil((end_jd - start_jd) / step)) + 1)
+        julian_days = np.minimum(start_jd + np.arange(count) * step, end_jd)
+        if body.lower() in self.NODE_OFFSETS:
+            return (julian_days, *self._node_positions(body, julian_days))
+        table = self._engine(body).compute_julian_days(julian_days)
+        return julian_days, table.longitude[:, 0], table.speed[:, 0]
+
+    def position(self, body: str, julian_day: float) -> Tuple[float, float]:
+        """Longitude and speed of a body at one Julian day"""
+        if body.lower() in self.NODE_OFFSETS:
+            longitudes, speeds = self._node_positions(body, np.array([julian_day]))
+            return float(longitudes[0]), float(speeds[0])
+        longitude, speed = self._engine(body).body_position(body, julian_day)
+        return float(longitude), float(speed)
+
+    def calibrate(self, body: str, observed_lon: float, julian_day: float) -> float:
+        """
+        Offset between a longitude taken from chart data and this finder's own at the same time
+
+        Adding the offset to computed longitudes reproduces the frame of the chart data
+        (for example a different ayanamsa), so events line up with the positions the
+        caller already shows.
+        """
+        return float(normalize_angle(observed_lon - self.position(body, julian_day)[0]))
+
+    def calibrate_ascendant(self, observed_asc: float, julian_day: float, lat: float, lng: float) -> float:
+        """Same as calibrate, for the Ascendant"""
+        with SWISSEPH_LOCK:
+            if self.is_sidereal:
+                set_sidereal_mode(self.sidereal_mode)
+            return float(normalize_angle(observed_asc - ascendant_at(julian_day, lat, lng, self.is_sidereal)))
+
+    def _bisect(self, func: Callable[[float], float], low: float, high: float) -> float:
+        """Narrow a bracket where func changes from negative to non-negative (or back) to a root"""
+        low_negative = func(low) < 0
+        while high - low > self.tolerance:
+            middle = (low + high) / 2
+            if (func(middle) < 0) == low_negative:
+                low = middle
+            else:
+                high = middle
+        return float((low + high) / 2)
+
+    def _crossings(self, body: str, julian_days: np.ndarray, longitudes: np.ndarray,
+                   target: float, offset: float) -> List[Dict]:
+        """Refine every sampled interval where the longitude passes a target"""
+        diff = wrap_degrees(longitudes + offset - target)
+        above = diff >= 0
+        # The wrap from +180 to -180 on the far side of the circle is not a crossing
+        brackets = np.nonzero((above[:-1] != above[1:]) & (np.abs(np.diff(diff)) < 180))[0]
+
+        events = []
+        for i in brackets:
+            root = self._bisect(
+                lambda jd: normalize_angle(self.position(body, jd)[0] + offset - target),
+                julian_days[i], julian_days[i + 1]
+            )
+            longitude, speed = self.position(body, root)
+            events.append({
+                "julian_day": root,
+                "longitude": (longitude + offset) % 360,
+                "speed": speed,
+                "is_retrograde": bool(speed < 0)
+            })
+        return events
+
+    def find_longitude_crossings(self, body: str, target: float, start_jd: float, end_jd: float,
+                                 offset: float = 0.0) -> List[Dict]:
+        """
+        Find every time a body passes a longitude, in either direction
+
+        Args:
+            body: Body name, e.g. "jupiter"
+            target: Ecliptic longitude in degrees
+            start_jd: Start of the search (Julian day, UT)
+            end_jd: End of the search (Julian day, UT)
+            offset: Calibration offset added to computed longitudes (see calibrate)
+
+        Returns:
+            List[Dict]: julian_day, longitude, speed and is_retrograde of each pass, in time order
+        """
+        julian_days, longitudes, _ = self.sample(body, start_jd, end_jd)
+        return self._crossings(body, julian_days, longitudes, target % 360, offset)
+
+    def find_aspects(self, body: str, point: float, start_jd: float, end_jd: float,
+                     aspects: Optional[Dict[str, float]] = None, offset: float = 0.0) -> List[Dict]:
+        """
+        Find the exact times a body aspects a fixed point
+
+        Args:
+            body: Body name
+            point: Longitude of the point (e.g. the Yogi Point)
+            start_jd: Start of the search (Julian day, UT)
+            end_jd: End of the search (Julian day, UT)
+            aspects: Aspect name to angle from the point (defaults to conjunction and opposition);
+                use signed angles, e.g. {"trine1": 120, "trine2": -120}, for both sides
+            offset: Calibration offset added to computed longitudes
+
+        Returns:
+            List[Dict]: Events with type, point and the crossing fields, in time order
+        """
+        aspects = aspects or DEFAULT_ASPECTS
+        julian_days, longitudes, _ = self.sample(body, start_jd, end_jd)
+
+        events = []
+        for name, angle in aspects.items():
+            target = float((point + angle) % 360)
+            for event in self._crossings(body, julian_days, longitudes, target, offset):
+                event.update({"type": name, "point": target})
+                events.append(event)
+
+        events.sort(key=lambda event: event["julian_day"])
+        return events
+
+    def find_orb_window(self, body: str, target: float, exact_jd: float, orb: float,
+                        offset: float = 0.0, max_days: float = 400.0) -> Tuple[float, float]:
+        """
+        Find when a body enters and leaves the orb around an exact pass of a longitude
+
+        Retrograde loops near the target keep the body within orb for the whole loop,
+        so the window can be much longer than orb divided by the mean motion.
+
+        Returns:
+            Tuple[float, float]: Julian days the body enters and leaves the orb
+        """
+        step = self.step_days(body)
+
+        def outside(jd):
+            return abs(normalize_angle(self.position(body, jd)[0] + offset - target)) - orb
+
+        window = []
+        for direction in (-1, 1):
+            inside_jd = exact_jd
+            while abs(inside_jd - exact_jd) < max_days:
+                next_jd = inside_jd + direction * step
+                if outside(next_jd) >= 0:
+                    window.append(self._bisect(outside, inside_jd, next_jd))
+                    break
+                inside_jd = next_jd
+            else:
+                window.append(inside_jd)
+        return window[0], window[1]
+
+    def find_ingresses(self, body: str, start_jd: float, end_jd: float, offset: float = 0.0) -> List[Dict]:
+        """
+        Find every time a body changes sign
+
+        Returns:
+            List[Dict]: julian_day, from_sign, sign and is_retrograde of each ingress, in time order
+        """
+        julian_days, longitudes, _ = self.sample(body, start_jd, end_jd)
+        signs = (((longitudes + offset) % 360) // 30).astype(int)
+
+        events = []
+        for i in np.nonzero(signs[:-1] != signs[1:])[0]:
+            from_sign, to_sign = signs[i], signs[i + 1]
+            boundary = to_sign * 30.0 if to_sign == (from_sign + 1) % 12 else from_sign * 30.0
+            root = self._bisect(
+                lambda jd: normalize_angle(self.position(body, jd)[0] + offset - boundary),
+                julian_days[i], julian_days[i + 1]
+            )
+            events.append({
+                "julian_day": root,
+                "from_sign": SIGNS[from_sign],
+                "sign": SIGNS[to_sign],
+                "is_retrograde": bool(self.position(body, root)[1] < 0)
+            })
+        return events
+
+    def find_stations(self, body: str, start_jd: float, end_jd: float, offset: float = 0.0) -> List[Dict]:
+        """
+        Find every time a body turns retrograde or direct
+
+        Returns:
+            List[Dict]: julian_day, type ("retrograde" or "direct") and longitude of each station
+        """
+        julian_days, _, speeds = self.sample(body, start_jd, end_jd)
+        direct = speeds >= 0
+
+        events = []
+        for i in np.nonzero(direct[:-1] != direct[1:])[0]:
+            root = self._bisect(lambda jd: self.position(body, jd)[1], julian_days[i], julian_days[i + 1])
+            events.append({
+                "julian_day": root,
+                "type": "retrograde" if direct[i] else "direct",
+                "longitude": (self.position(body, root)[0] + offset) % 360
+            })
+        return events
+
+    def find_ascendant_crossings(self, target: float, start_jd: float, end_jd: float,
+                                 lat: float, lng: float, offset: float = 0.0) -> List[Dict]:
+        """
+        Find every time the Ascendant reaches a longitude
+
+        Args:
+            target: Ecliptic longitude in the caller's frame
+            start_jd: Start of the search (Julian day, UT)
+            end_jd: End of the search (Julian day, UT)
+            lat: Geographic latitude
+            lng: Geographic longitude
+            offset: Ascendant calibration offset (see calibrate_ascendant)
+
+        Returns:
+            List[Dict]: julian_day and longitude of each crossing, in time order
+        """
+        with SWISSEPH_LOCK:
+            if self.is_sidereal:
+                set_sidereal_mode(self.sidereal_mode)
+            crossings = find_ascendant_crossings(
+                start_jd, end_jd, lat, lng, (target - offset) % 360, sidereal=self.is_sidereal
+            )
+        return [
+            {"julian_day": float(julian_day), "longitude": float((ascendant + offset) % 360)}
+            for julian_day, ascendant in crossings
+        ]
+
+
+_finders: Dict[Tuple[Optional[str], Optional[str]], EventFinder] = {}
+_finders_lock = threading.Lock()
+
+def get_event_finder(zodiac_type: Optional[str] = None, sidereal_mode: Optional[str] = None) -> EventFinder:
+    """Return a shared event finder for a zodiac setting"""
+    key = (zodiac_type, sidereal_mode)
+    with _finders_lock:
+        if key not in _finders:
+            _finders[key] = EventFinder(zodiac_type, sidereal_mode)
+        return _finders[key]
@@ -0,0 +1,101 @@
+import csv
+import difflib
+import logging
+import os
+import threading
+import unicodedata
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+def normalize_place(name: str) -> str:
+    """Lower-case a place name and strip accents, punctuation and extra spaces"""
+    text = unicodedata.normalize('NFKD', name or '')
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    text = ''.join(c if c.isalnum() else ' ' for c in text)
+    return ' '.join(text.split())
+
+
+class Gazetteer:
+    """Offline city lookup loaded from a CSV with city, nation, latitude and longitude columns"""
+
+    def __init__(self, path: str, fuzzy_cutoff: float = 0.85):
+        """
+        Initialize the gazetteer
+
+        Args:
+            path: CSV file with a header row containing city, nation, latitude, longitude
+            fuzzy_cutoff: Minimum similarity (0-1) for a fuzzy city match
+        """
+        self.path = path
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self._places: Dict[str, Dict[str, Tuple[float, float]]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """Read the CSV into nation -> normalized city -> (lat, lng)"""
+        count = 0
+        with open(self.path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                try:
+                    nation = row['nation'].strip().upper()
+                    city = normalize_place(row['city'])
+                    coordinates = (float(row['latitude']), float(row['longitude']))
+                except (KeyError, TypeError, ValueError):
+                    continue
+                # Keep the first entry for duplicate names (list larger places first)
+                self._places.setdefault(nation, {}).setdefault(city, coordinates)
+                count += 1
+
+        logger.info(f"Loaded {count} places from gazetteer {self.path}")
+
+    def lookup(self, city: str, nation: str) -> Optional[Tuple[float, float]]:
+        """
+        Find coordinates for a city, falling back to the closest spelling in the same nation
+
+        Args:
+            city: City name as entered by the user
+            nation: Two-letter country code
+
+        Returns:
+            Optional[Tuple[float, float]]: (latitude, longitude) or None if not found
+        """
+        cities = self._places.get((nation or '').strip().upper())
+        if not cities:
+            return None
+
+        key = normalize_place(city)
+        if key in cities:
+            return cities[key]
+
+        matches = difflib.get_close_matches(key, cities.keys(), n=1, cutoff=self.fuzzy_cutoff)
+        if matches:
+            logger.info(f"Gazetteer matched '{city}' to '{matches[0]}' in {nation}")
+            return cities[matches[0]]
+
+        return None
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_loaded = False
+_gazetteer_lock = threading.Lock()
+
+def get_gazetteer() -> Optional[Gazetteer]:
+    """
+    Return the process-wide gazetteer, or None when GEO_GAZETTEER_PATH is unset or missing
+
+    The file is loaded once on first use.
+    """
+    global _gazetteer, _gazetteer_loaded
+    with _gazetteer_lock:
+        if not _gazetteer_loaded:
+            _gazetteer_loaded = True
+            path = os.getenv('GEO_GAZETTEER_PATH')
+            if path and os.path.exists(path):
+                try:
+                    _gazetteer = Gazetteer(path, float(os.getenv('GEO_GAZETTEER_FUZZY_CUTOFF', '0.85')))
+                except Exception as e:
+                    logger.error(f"Error loading gazetteer {path}: {str(e)}")
+            elif path:
+                logger.warning(f"Gazetteer file not found: {path}")
+        return _gazetteer
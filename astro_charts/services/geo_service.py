@@ -1,42 +1,129 @@
 import logging
+import os
 import requests
+import aiohttp
+from .gazetteer import get_gazetteer, normalize_place
+from ..utils.cache_utils import get_persistent_cache
+from ..utils.http_utils import get_aiohttp_session, get_http_session
 
 logger = logging.getLogger(__name__)
 
 class GeoService:
-    def __init__(self, username):
+    # Persistent geocoding cache settings
+    CACHE_FILENAME = "geocoding_cache.sqlite"
+    CACHE_TTL_DAYS = float(os.getenv('GEOCODING_CACHE_TTL_DAYS', '365'))
+    CACHE_MAX_ENTRIES = int(os.getenv('GEOCODING_CACHE_MAX_ENTRIES', '100000'))
+    CACHE_MEMORY_SIZE = 2048
+
+    def __init__(self, username, use_cache=True):
         if not username:
             raise ValueError("GeoNames username is required")
         self.username = username
         self.base_url = "https://geocoder.commentking.net/geocode"
+        self.cache = get_persistent_cache(
+            self.CACHE_FILENAME,
+            ttl_seconds=self.CACHE_TTL_DAYS * 24 * 60 * 60,
+            max_entries=self.CACHE_MAX_ENTRIES,
+            memory_size=self.CACHE_MEMORY_SIZE
+        ) if use_cache else None
+        self.gazetteer = get_gazetteer()
         logger.info(f"Initialized GeoService with username: {username[:3]}***")
 
+    @staticmethod
+    def _cache_key(city, nation):
+        """Key that treats spelling variants like 'New York' and 'new-york' the same"""
+        return f"{normalize_place(city)}|{(nation or '').strip().upper()}"
+
+    def _get_local_coordinates(self, city, nation):
+        """Look up coordinates in the geocoding cache (memory, then disk) and the offline gazetteer"""
+        cache_key = self._cache_key(city, nation)
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Cached coordinates for {city}, {nation}: {tuple(cached)}")
+                return tuple(cached)
+
+        if self.gazetteer:
+            coordinates = self.gazetteer.lookup(city, nation)
+            if coordinates:
+                logger.info(f"Found coordinates for {city}, {nation} in gazetteer: {coordinates}")
+                self._store(city, nation, coordinates)
+                return coordinates
+
+        return None
+
+    def _store(self, city, nation, coordinates):
+        """Write found coordinates to the geocoding cache"""
+        if coordinates and self.cache:
+            self.cache.set(self._cache_key(city, nation), list(coordinates))
+
     def get_coordinates(self, city, nation):
+        """
+        Get coordinates for a city and nation.
+
+        Looks in the geocoding cache (memory, then disk), then the offline gazetteer
+        if one is configured, and only calls the geocoding API on a miss.
+        """
+        coordinates = self._get_local_coordinates(city, nation)
+        if coordinates:
+            return coordinates
+
+        coordinates = self._fetch_coordinates(city, nation)
+        self._store(city, nation, coordinates)
+        return coordinates
+
+    async def get_coordinates_async(self, city, nation):
+        """Same as get_coordinates, but calls the geocoding API without blocking the event loop."""
+        coordinates = self._get_local_coordinates(city, nation)
+        if coordinates:
+            return coordinates
+
+        try:
+            session = await get_aiohttp_session()
+            async with session.get(self.base_url, params={'location': f"{city},{nation}"}) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+
+            coordinates = self._parse_response(data, city, nation)
+            self._store(city, nation, coordinates)
+            return coordinates
+
+        except aiohttp.ClientError as e:
+            logger.error(f"Error getting coordinates for {city}, {nation}: {str(e)}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error getting coordinates for {city}, {nation}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _parse_response(data, city, nation):
+        """Extract (lat, lng) from a geocoding API response"""
+        if data and len(data) > 0 and len(data[0]) > 0:
+            location = data[0][0]
+            lat = float(location['latitude'])
+            lng = float(location['longitude'])
+            logger.info(f"Found coordinates for {city}, {nation}: ({lat}, {lng})")
+            return lat, lng
+        else:
+            logger.error(f"Could not find coordinates for {city}, {nation}")
+            return None
+
+    def _fetch_coordinates(self, city, nation):
         """Get coordinates for a city and nation using custom geocoding API."""
         try:
             location = f"{city},{nation}"
             params = {
                 'location': location
             }
-            
-            response = requests.get(self.base_url, params=params)
+
+            response = get_http_session().get(self.base_url, params=params)
             response.raise_for_status()
-            
-            data = response.json()
-            
-            if data and len(data) > 0 and len(data[0]) > 0:
-                location = data[0][0]
-                lat = float(location['latitude'])
-                lng = float(location['longitude'])
-                logger.info(f"Found coordinates for {city}, {nation}: ({lat}, {lng})")
-                return lat, lng
-            else:
-                logger.error(f"Could not find coordinates for {city}, {nation}")
-                return None
-                
+
+            return self._parse_response(response.json(), city, nation)
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting coordinates for {city}, {nation}: {str(e)}")
             return None
         except Exception as e:
             logger.error(f"Unexpected error getting coordinates for {city}, {nation}: {str(e)}")
-            return None 
\ No newline at end of file
+            return None
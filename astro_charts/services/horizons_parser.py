@@ -1,5 +1,6 @@
 import re
 import logging
+from datetime import datetime
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,14 @@ class HorizonsParser:
             re.MULTILINE
         )
         
+        # Pattern for every ephemeris row of a multi-day response
+        self.row_pattern = re.compile(
+            r'^\s*(\d{4}-[A-Za-z]{3}-\d{2})\s+\d+:\d+\s+(?:[*A-Za-z]{1,2}\s+)?'  # Date, time and flags
+            r'\d+\s+\d+\s+[\d.]+\s+'                                           # RA part
+            r'([-+]?\d+)\s+(\d+)\s+([\d.]+)',                                   # DEC part
+            re.MULTILINE
+        )
+        
         # Add this pattern in the __init__ method after dec_pattern2
         self.dec_pattern3 = re.compile(
             r'\d{4}-[A-Za-z]+-\d+\s+\d+:\d+\s+[A-Za-z]{1,2}\s+'  # Date and time part with Am
@@ -85,4 +94,48 @@ class HorizonsParser:
             
         except Exception as e:
             logger.error(f"Error parsing Horizons response: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+    def parse_declination_series(self, response: Dict[str, Any]) -> Dict[str, float]:
+        """
+        Parse every daily declination from a multi-day NASA Horizons API response
+        
+        Args:
+            response: Raw API response dictionary
+            
+        Returns:
+            Dict[str, float]: Date (YYYY-MM-DD) -> declination in decimal degrees
+        """
+        series = {}
+        try:
+            data = response.get('result', '')
+            if not data:
+                logger.error("Empty response data")
+                return series
+            
+            # Only look at the ephemeris block
+            start = data.find('$$SOE')
+            end = data.find('$$EOE')
+            if start != -1 and end != -1:
+                data = data[start + len('$$SOE'):end]
+            
+            for match in self.row_pattern.finditer(data):
+                date = datetime.strptime(match.group(1), '%Y-%b-%d').strftime('%Y-%m-%d')
+                
+                # Keep the sign from the text so -00 degrees stays negative
+                degrees_text = match.group(2)
+                dec_degrees = abs(int(degrees_text)) + int(match.group(3))/60.0 + float(match.group(4))/3600.0
+                if degrees_text.startswith('-'):
+                    dec_degrees = -dec_degrees
+                
+                # First row of each day wins
+                series.setdefault(date, round(dec_degrees, 4))
+            
+            if not series:
+                logger.error("Could not find any declination rows in response")
+            
+            return series
+            
+        except Exception as e:
+            logger.error(f"Error parsing Horizons series response: {str(e)}")
+            return series
@@ -0,0 +1,304 @@
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..utils.cache_utils import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Signature of a job handler: (payload, progress callback) -> JSON serializable result
+JobHandler = Callable[[Dict[str, Any], Callable[[float, str], None]], Awaitable[Any]]
+
+# How often a queue marks its jobs as alive, and how long without that before another
+# queue sharing the database takes them over
+JOB_HEARTBEAT_SECONDS = float(os.getenv('JOB_HEARTBEAT_SECONDS', '30'))
+JOB_STALE_SECONDS = float(os.getenv('JOB_STALE_SECONDS', '300'))
+
+# Owners of the queues started and not yet stopped in this process
+_running_owners = set()
+
+class JobQueue:
+    """Background job queue with job state persisted in SQLite.
+
+    Jobs are submitted with a kind and a JSON payload and run by a fixed number of
+    asyncio workers on the API event loop (handlers offload their heavy work to the
+    chart executors). Status, progress, result and error are stored in the database,
+    so they survive restarts.
+
+    Several processes may share the database. Each job records the queue that owns
+    it, workers claim a queued job atomically before running it, and a queue only
+    takes over unfinished jobs whose owner has exited or stopped sending heartbeats,
+    so a job never runs twice at the same time.
+    """
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+
+    def __init__(self, db_path: Optional[str] = None, workers: Optional[int] = None):
+        """
+        Initialize the job queue
+
+        Args:
+            db_path: SQLite file for job state (defaults to JOB_DB_PATH or jobs.sqlite in CACHE_DIR)
+            workers: Number of jobs run at the same time (defaults to JOB_WORKERS or 2)
+        """
+        self.db_path = db_path or os.getenv('JOB_DB_PATH', os.path.join(CACHE_DIR, 'jobs.sqlite'))
+        self.workers = workers or int(os.getenv('JOB_WORKERS', '2'))
+        self.handlers: Dict[str, JobHandler] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._lock = threading.Lock()
+        self.owner: Optional[str] = None
+
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, "
+                "progress REAL NOT NULL DEFAULT 0, message TEXT, user_id TEXT, "
+                "payload TEXT NOT NULL, result TEXT, error TEXT, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")]
+            if "owner" not in columns:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            self._conn.commit()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Register the coroutine that runs jobs of a kind"""
+        self.handlers[kind] = handler
+
+    async def start(self) -> None:
+        """Start the workers and take over jobs left unfinished by owners that are gone"""
+        self._queue = asyncio.Queue()
+        # host:pid:run, so jobs of an earlier start() or of a process that reused the pid count as abandoned
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        _running_owners.add(self.owner)
+        requeued = self._requeue_abandoned()
+
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._heartbeat()))
+        logger.info(f"Started job queue {self.owner} with {self.workers} workers ({requeued} jobs requeued)")
+
+    async def stop(self) -> None:
+        """Cancel the workers; running jobs are requeued once this owner is gone"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        _running_owners.discard(self.owner)
+        logger.info("Stopped job queue")
+
+    def submit(self, kind: str, payload: Dict[str, Any], job_id: Optional[str] = None,
+               user_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Queue a job
+
+        Submitting a job_id that already exists returns the existing job instead of
+        running it again.
+
+        Args:
+            kind: Registered job kind
+            payload: JSON serializable job input passed to the handler
+            job_id: Job identifier (generated when not given)
+            user_id: Owner of the job
+
+        Returns:
+            Dict: The job status record
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        if self._queue is None:
+            raise RuntimeError("Job queue is not started")
+
+        job_id = job_id or uuid.uuid4().hex
+        existing = self.get(job_id)
+        if existing:
+            logger.info(f"Job {job_id} already exists with status {existing['status']}")
+            return existing
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (job_id, kind, status, progress, message, user_id, owner, payload, created_at, updated_at) "
+                "VALUES (?, ?, ?, 0, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, self.STATUS_QUEUED, "Queued", user_id, self.owner, json.dumps(payload), now, now)
+            )
+            self._conn.commit()
+
+        self._queue.put_nowait(job_id)
+        logger.info(f"Queued {kind} job {job_id}")
+        return self.get(job_id)
+
+    def get(self, job_id: str, include_result: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Get the status of a job
+
+        Args:
+            job_id: Job identifier
+            include_result: Also decode and return the stored result
+
+        Returns:
+            Optional[Dict]: Job status record, or None if the job does not exist
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT job_id, kind, status, progress, message, user_id, error, created_at, updated_at, result "
+                "FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        job = {
+            "job_id": row[0],
+            "kind": row[1],
+            "status": row[2],
+            "progress": row[3],
+            "message": row[4],
+            "user_id": row[5],
+            "error": row[6],
+            "created_at": row[7],
+            "updated_at": row[8]
+        }
+        if include_result:
+            job["result"] = json.loads(row[9]) if row[9] else None
+        return job
+
+    def _owner_is_gone(self, owner: Optional[str], updated_at: float) -> bool:
+        """Whether the queue that owns an unfinished job has exited or stopped sending heartbeats"""
+        if owner in _running_owners:
+            return False
+        if not owner or time.time() - updated_at > JOB_STALE_SECONDS:
+            return True
+
+        host, _, rest = owner.partition(":")
+        pid = rest.partition(":")[0]
+        if host != socket.gethostname() or not pid.isdigit():
+            return False
+        if int(pid) == os.getpid():
+            return True  # A stopped queue of this process
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+        return False
+
+    def _requeue_abandoned(self) -> int:
+        """
+        Take over unfinished jobs whose owner is gone and queue them here
+
+        Returns:
+            int: Number of jobs requeued
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id, status, owner, updated_at FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                (self.STATUS_QUEUED, self.STATUS_RUNNING)
+            ).fetchall()
+
+        requeued = 0
+        for job_id, status, owner, updated_at in rows:
+            if not self._owner_is_gone(owner, updated_at):
+                continue
+            # Only one queue wins the takeover: the row must still be as it was read
+            with self._lock:
+                taken = self._conn.execute(
+                    "UPDATE jobs SET status = ?, owner = ?, message = ?, updated_at = ? "
+                    "WHERE job_id = ? AND status = ? AND owner IS ? AND updated_at = ?",
+                    (self.STATUS_QUEUED, self.owner, "Requeued", time.time(), job_id, status, owner, updated_at)
+                ).rowcount
+                self._conn.commit()
+            if taken:
+                logger.info(f"Requeued {status} job {job_id} from {owner or 'unknown owner'}")
+                self._queue.put_nowait(job_id)
+                requeued += 1
+        return requeued
+
+    def _claim(self, job_id: str) -> bool:
+        """Mark a queued job as running under this queue; False if another worker got it first"""
+        with self._lock:
+            claimed = self._conn.execute(
+                "UPDATE jobs SET status = ?, owner = ?, progress = 0, message = ?, updated_at = ? "
+                "WHERE job_id = ? AND status = ?",
+                (self.STATUS_RUNNING, self.owner, "Running", time.time(), job_id, self.STATUS_QUEUED)
+            ).rowcount
+            self._conn.commit()
+        return claimed == 1
+
+    async def _heartbeat(self) -> None:
+        """Keep this queue's unfinished jobs fresh and pick up jobs abandoned by other owners"""
+        while True:
+            await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+            try:
+                with self._lock:
+                    self._conn.execute(
+                        "UPDATE jobs SET updated_at = ? WHERE owner = ? AND status IN (?, ?)",
+                        (time.time(), self.owner, self.STATUS_QUEUED, self.STATUS_RUNNING)
+                    )
+                    self._conn.commit()
+                self._requeue_abandoned()
+            except sqlite3.Error as e:
+                logger.error(f"Job queue heartbeat failed: {str(e)}")
+
+    def _update(self, job_id: str, **fields) -> None:
+        """Write the given columns of a job"""
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._lock:
+            self._conn.execute(f"UPDATE jobs SET {columns} WHERE job_id = ?", (*fields.values(), job_id))
+            self._conn.commit()
+
+    async def _worker(self, worker_id: int) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        """Claim one job, run it and record its outcome"""
+        if not self._claim(job_id):
+            logger.info(f"Job {job_id} was claimed elsewhere or is no longer queued")
+            return
+        with self._lock:
+            row = self._conn.execute("SELECT kind, payload FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+
+        kind, payload = row[0], json.loads(row[1])
+
+        def progress(fraction: float, message: str = "") -> None:
+            self._update(job_id, progress=max(0.0, min(1.0, fraction)), message=message)
+
+        logger.info(f"Running {kind} job {job_id}")
+
+        try:
+            result = await self.handlers[kind](payload, progress)
+            self._update(
+                job_id,
+                status=self.STATUS_COMPLETED,
+                progress=1.0,
+                message="Completed",
+                result=json.dumps(result, default=str)
+            )
+            logger.info(f"Completed {kind} job {job_id}")
+
+        except asyncio.CancelledError:
+            # Leave the job as running; it is requeued once this owner is gone
+            raise
+        except Exception as e:
+            error = getattr(e, 'detail', None) or str(e)
+            logger.error(f"Job {job_id} ({kind}) failed: {error}")
+            self._update(job_id, status=self.STATUS_FAILED, message="Failed", error=str(error))
@@ -0,0 +1,175 @@
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..models.chart_state import BODIES, BODY_INDEX, ChartState
+
+logger = logging.getLogger(__name__)
+
+# What an aspect check measures between a planet of chart A and a planet of chart B
+LONGITUDE = 'longitude'                # shortest angular distance in longitude
+DECLINATION = 'declination'            # difference of declinations
+DECLINATION_SUM = 'declination_sum'    # sum of absolute declinations (contraparallels across the equator)
+MEASURES = (LONGITUDE, DECLINATION, DECLINATION_SUM)
+
+# Hemisphere conditions on the two declinations
+SIGN_CONDITIONS = (None, 'same', 'opposite')
+
+# Target resolved per evaluation from the ecliptic_tilt parameter
+ECLIPTIC_TILT = 'ecliptic_tilt'
+
+
+@dataclass
+class AspectCheck:
+    """One aspect a linkage family looks for"""
+    name: str
+    degrees: float                          # aspect_degrees reported for a hit
+    orb: float
+    measure: str = LONGITUDE
+    target: Union[float, str, None] = None  # value the measure is compared with (defaults to degrees)
+    signs: Optional[str] = None             # 'same' or 'opposite' hemisphere declinations
+
+
+@dataclass
+class LinkageRule:
+    """Declarative description of a linkage family
+
+    A hit is reported for every (planet1 of chart A, planet2 of chart B) in pairs and
+    every check whose measure is within orb of its target. Hits come out ordered by
+    planets1, then planets2, then checks, which is the order the family lists them in.
+    """
+    name: str
+    planets1: List[str]
+    planets2: List[str]
+    pairs: List[Tuple[str, str]]
+    checks: List[AspectCheck]
+    symmetric: bool = False   # pairs also match with the planets swapped
+
+    def pair_matrix(self) -> np.ndarray:
+        """(bodies, bodies) mask of chart A planet x chart B planet combinations the rule checks"""
+        matrix = np.zeros((len(BODIES), len(BODIES)), dtype=bool)
+        allowed1 = {BODY_INDEX[p] for p in self.planets1}
+        allowed2 = {BODY_INDEX[p] for p in self.planets2}
+        for planet1, planet2 in self.pairs:
+            combinations = [(planet1, planet2), (planet2, planet1)] if self.symmetric else [(planet1, planet2)]
+            for a, b in combinations:
+                i, j = BODY_INDEX[a], BODY_INDEX[b]
+                if i in allowed1 and j in allowed2:
+                    matrix[i, j] = True
+        return matrix
+
+
+class LinkageEngine:
+    """Bipartite aspect engine for linkages between two charts
+
+    The angular distance, declination difference and declination sum matrices between
+    every planet of chart A and every planet of chart B are computed once. Every check
+    of every rule is then applied in one broadcast comparison, with each rule's pair
+    mask selecting the combinations it cares about. Either chart may be a stacked
+    ChartState, in which case every day is evaluated in the same pass.
+    """
+
+    def __init__(self, rules: Sequence[LinkageRule]):
+        """
+        Initialize the engine
+
+        Args:
+            rules: Linkage families evaluated together
+        """
+        self.rules = list(rules)
+        checks = [(r, check) for r, rule in enumerate(self.rules) for check in rule.checks]
+
+        self._check_rule = np.array([r for r, _ in checks], dtype=np.int64)
+        self._check_measure = np.array([MEASURES.index(c.measure) for _, c in checks], dtype=np.int64)
+        self._check_signs = np.array([SIGN_CONDITIONS.index(c.signs) for _, c in checks], dtype=np.int64)
+        self._check_orb = np.array([c.orb for _, c in checks], dtype=np.float64)
+        self._checks = [c for _, c in checks]
+
+        pair_matrices = [rule.pair_matrix() for rule in self.rules]
+        self._check_pairs = np.array([pair_matrices[r] for r, _ in checks], dtype=bool).reshape(
+            len(checks), len(BODIES), len(BODIES)
+        )
+
+        # Output order of each body within each rule
+        unranked = len(BODIES)
+        self._row_rank = np.full((len(self.rules), len(BODIES)), unranked, dtype=np.int64)
+        self._col_rank = np.full((len(self.rules), len(BODIES)), unranked, dtype=np.int64)
+        for r, rule in enumerate(self.rules):
+            for rank, planet in enumerate(rule.planets1):
+                self._row_rank[r, BODY_INDEX[planet]] = rank
+            for rank, planet in enumerate(rule.planets2):
+                self._col_rank[r, BODY_INDEX[planet]] = rank
+
+    def _targets(self, parameters: Dict[str, Union[float, np.ndarray]]) -> np.ndarray:
+        """Target of every check, shaped (checks, 1) or (checks, days) when a parameter varies per day"""
+        values = {name: np.atleast_1d(np.asarray(value, dtype=np.float64))
+                  for name, value in parameters.items() if value is not None}
+        width = max((len(value) for value in values.values()), default=1)
+        targets = np.empty((len(self._checks), width), dtype=np.float64)
+        for k, check in enumerate(self._checks):
+            target = check.degrees if check.target is None else check.target
+            if isinstance(target, str):
+                if target not in values:
+                    raise ValueError(f"Linkage check '{check.name}' needs the '{target}' parameter")
+                target = values[target]
+            targets[k] = target
+        return targets
+
+    def evaluate(self, chart1: ChartState, chart2: ChartState, **parameters) -> Dict[str, List[Dict]]:
+        """
+        Find the hits of every rule between two charts
+
+        Args:
+            chart1: Chart A (planets1 side), single or stacked
+            chart2: Chart B (planets2 side), single or stacked with the same number of days
+            **parameters: Values for named check targets, e.g. ecliptic_tilt; either a
+                scalar or one value per day
+
+        Returns:
+            Dict[str, List[Dict]]: Rule name -> hits with day, planet1_name, planet2_name,
+            aspect_name, aspect_degrees, orbit and actual_degrees (rounded to 4 places)
+        """
+        targets = self._targets(parameters)
+
+        lon1 = np.atleast_2d(chart1.longitude)[:, :, np.newaxis]
+        lon2 = np.atleast_2d(chart2.longitude)[:, np.newaxis, :]
+        dec1 = np.atleast_2d(chart1.declination)[:, :, np.newaxis]
+        dec2 = np.atleast_2d(chart2.declination)[:, np.newaxis, :]
+
+        diff = np.abs(lon1 - lon2)
+        measures = np.stack(np.broadcast_arrays(
+            np.where(diff > 180, 360 - diff, diff),
+            np.abs(dec1 - dec2),
+            np.abs(dec1) + np.abs(dec2)
+        ))
+        product = dec1 * dec2
+        sign_masks = np.stack(np.broadcast_arrays(np.ones_like(product, dtype=bool), product > 0, product < 0))
+
+        # (checks, days, bodies, bodies)
+        values = measures[self._check_measure]
+        deviation = np.abs(values - targets[:, :, np.newaxis, np.newaxis])
+        hits = (
+            (deviation <= self._check_orb[:, np.newaxis, np.newaxis, np.newaxis])
+            & sign_masks[self._check_signs]
+            & self._check_pairs[:, np.newaxis]
+        )
+
+        k, day, i, j = np.nonzero(hits)
+        rule_index = self._check_rule[k]
+        order = np.lexsort((k, self._col_rank[rule_index, j], self._row_rank[rule_index, i], day, rule_index))
+
+        results = {rule.name: [] for rule in self.rules}
+        for n in order:
+            check = self._checks[k[n]]
+            results[self.rules[rule_index[n]].name].append({
+                'day': int(day[n]),
+                'planet1_name': BODIES[i[n]],
+                'planet2_name': BODIES[j[n]],
+                'aspect_name': check.name,
+                'aspect_degrees': check.degrees,
+                'orbit': round(float(deviation[k[n], day[n], i[n], j[n]]), 4),
+                'actual_degrees': round(float(values[k[n], day[n], i[n], j[n]]), 4)
+            })
+        return results
@@ -1,9 +1,12 @@
 import requests
 import re
+import os
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List
 from .horizons_parser import HorizonsParser
+from ..utils.cache_utils import PersistentCache, get_persistent_cache
+from ..utils.http_utils import get_http_session
 
 
 logger = logging.getLogger(__name__)
@@ -28,10 +31,36 @@ class NASAHorizonsService:
         'chiron': '2060'
     }
     
-    def __init__(self):
-        """Initialize the NASA Horizons Service"""
+    # Persistent declination cache settings
+    CACHE_FILENAME = "horizons_declination_cache.sqlite"
+    CACHE_TTL_DAYS = float(os.getenv('HORIZONS_CACHE_TTL_DAYS', '365'))
+    CACHE_MAX_ENTRIES = int(os.getenv('HORIZONS_CACHE_MAX_ENTRIES', '500000'))
+    CACHE_MEMORY_SIZE = 4096
+    
+    def __init__(self, cache: Optional[PersistentCache] = None, use_cache: bool = True):
+        """
+        Initialize the NASA Horizons Service
+        
+        Args:
+            cache: Declination cache to use (defaults to the shared on-disk cache)
+            use_cache: Set to False to always query Horizons
+        """
         logger.info("Initializing NASA Horizons Service")
         self.parser = HorizonsParser()
+        
+        if cache is None and use_cache:
+            cache = get_persistent_cache(
+                self.CACHE_FILENAME,
+                ttl_seconds=self.CACHE_TTL_DAYS * 24 * 60 * 60,
+                max_entries=self.CACHE_MAX_ENTRIES,
+                memory_size=self.CACHE_MEMORY_SIZE
+            )
+        self.cache = cache
+    
+    @staticmethod
+    def _cache_key(body_id: str, date: str, longitude: float, latitude: float) -> str:
+        """Cache key for a declination; the site is rounded to ~1 km"""
+        return f"{body_id}|{date}|{float(longitude):.2f},{float(latitude):.2f}"
     
     def get_declination(self, 
                        body_name: str, 
@@ -56,6 +85,13 @@ class NASAHorizonsService:
                 logger.error(f"Unknown body name: {body_name}")
                 return None
                 
+            cache_key = self._cache_key(body_id, date, longitude, latitude)
+            if self.cache:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Cached declination for {body_name} on {date}: {cached}°")
+                    return cached
+                
             params = self._build_query_params(body_id, date, longitude, latitude)
             response = self._make_api_request(params)
             
@@ -64,6 +100,8 @@ class NASAHorizonsService:
 
                 if declination is not None:
                     logger.info(f"Got declination for {body_name} on {date}: {declination}°")
+                    if self.cache:
+                        self.cache.set(cache_key, declination)
                     return declination
             
             return None
@@ -72,16 +110,99 @@ class NASAHorizonsService:
             logger.error(f"Error getting declination for {body_name}: {str(e)}")
             return None
     
+    def get_declination_range(self,
+                              body_name: str,
+                              start_date: str,
+                              end_date: str,
+                              longitude: float,
+                              latitude: float) -> Dict[str, float]:
+        """
+        Get daily declinations for a celestial body over a date range in one request
+        
+        Dates already in the cache are not requested again; only the span
+        covering the missing dates is fetched.
+        
+        Args:
+            body_name (str): Name of the celestial body
+            start_date (str): First date in YYYY-MM-DD format
+            end_date (str): Last date in YYYY-MM-DD format (inclusive)
+            longitude (float): Observer longitude
+            latitude (float): Observer latitude
+            
+        Returns:
+            Dict[str, float]: Date -> declination in degrees for every date found
+        """
+        try:
+            body_id = self.BODY_IDS.get(body_name.lower())
+            if not body_id:
+                logger.error(f"Unknown body name: {body_name}")
+                return {}
+            
+            dates = self._date_range(start_date, end_date)
+            series = {}
+            missing = []
+            for date in dates:
+                cached = self.cache.get(self._cache_key(body_id, date, longitude, latitude)) if self.cache else None
+                if cached is not None:
+                    series[date] = cached
+                else:
+                    missing.append(date)
+            
+            if not missing:
+                return series
+            
+            params = self._build_query_params(body_id, missing[0], longitude, latitude, stop_date=missing[-1])
+            response = self._make_api_request(params)
+            
+            if response:
+                fetched = self.parser.parse_declination_series(response)
+                logger.info(f"Got {len(fetched)} declinations for {body_name} from {missing[0]} to {missing[-1]}")
+                
+                for date in missing:
+                    if date in fetched:
+                        series[date] = fetched[date]
+                        if self.cache:
+                            self.cache.set(self._cache_key(body_id, date, longitude, latitude), fetched[date])
+            
+            return dict(sorted(series.items()))
+            
+        except Exception as e:
+            logger.error(f"Error getting declination range for {body_name}: {str(e)}")
+            return {}
+    
+    def prefetch_declinations(self,
+                              start_date: str,
+                              end_date: str,
+                              longitude: float,
+                              latitude: float,
+                              body_names: Optional[List[str]] = None) -> None:
+        """Warm the cache for several bodies over a date range, one request per body"""
+        for body_name in body_names or list(self.BODY_IDS.keys()):
+            self.get_declination_range(body_name, start_date, end_date, longitude, latitude)
+    
+    @staticmethod
+    def _date_range(start_date: str, end_date: str) -> List[str]:
+        """List every YYYY-MM-DD date between start_date and end_date (inclusive)"""
+        current = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+        dates = []
+        while current <= end:
+            dates.append(current.strftime('%Y-%m-%d'))
+            current += timedelta(days=1)
+        return dates
+    
     def _build_query_params(self, 
                           body_id: str, 
                           date: str, 
                           longitude: float, 
-                          latitude: float) -> Dict[str, str]:
-        """Build query parameters for the API request"""
+                          latitude: float,
+                          stop_date: Optional[str] = None) -> Dict[str, str]:
+        """Build query parameters for the API request (daily rows from date to stop_date)"""
         try:
             dt = datetime.strptime(date, '%Y-%m-%d')
+            stop_dt = datetime.strptime(stop_date, '%Y-%m-%d') if stop_date else dt
             start_time = dt.strftime('%Y-%m-%d %H:%M')
-            stop_time = (dt.replace(hour=23, minute=59)).strftime('%Y-%m-%d %H:%M')
+            stop_time = (stop_dt.replace(hour=23, minute=59)).strftime('%Y-%m-%d %H:%M')
             
             return {
                 'format': 'json',
@@ -106,7 +227,7 @@ class NASAHorizonsService:
     def _make_api_request(self, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """Make request to NASA Horizons API"""
         try:
-            response = requests.get(self.BASE_URL, params=params)
+            response = get_http_session().get(self.BASE_URL, params=params)
             response.raise_for_status()
             return response.json()
             
@@ -0,0 +1,123 @@
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from ..utils.cache_utils import BudgetLRUCache, LRUCache, get_persistent_cache
+
+logger = logging.getLogger(__name__)
+
+# Memory budget for serialized natal chart data
+NATAL_CACHE_MEMORY_MB = float(os.getenv('NATAL_CACHE_MEMORY_MB', '64'))
+
+# Write entries evicted from memory to SQLite and read them back on a memory miss
+NATAL_CACHE_DISK = os.getenv('NATAL_CACHE_DISK', '1').lower() not in ('0', 'false', 'no')
+NATAL_CACHE_TTL_DAYS = float(os.getenv('NATAL_CACHE_TTL_DAYS', '30'))
+NATAL_CACHE_MAX_ENTRIES = int(os.getenv('NATAL_CACHE_MAX_ENTRIES', '50000'))
+
+# Number of ChartCreator instances kept for endpoints that also calculate transits
+NATAL_CACHE_CREATORS = int(os.getenv('NATAL_CACHE_CREATORS', '32'))
+
+
+class NatalCache:
+    """Natal chart data cached by birth moment, place and zodiac settings
+
+    The same person asking several endpoints in a row gets the natal calculation
+    (subject, declinations, aspects) done once. Keys ignore the name, so the stored
+    data is name-agnostic and the name and location text are filled in per request.
+    Payloads are kept as JSON strings in a memory-budgeted LRU; entries that fall
+    out of memory spill to a SQLite cache when disk spillover is enabled.
+    """
+
+    CACHE_FILENAME = "natal_cache.sqlite"
+
+    def __init__(self, max_bytes: int = int(NATAL_CACHE_MEMORY_MB * 1024 * 1024),
+                 disk: bool = NATAL_CACHE_DISK, creators: int = NATAL_CACHE_CREATORS):
+        """
+        Initialize the natal cache
+
+        Args:
+            max_bytes: Memory budget for serialized payloads
+            disk: Spill entries evicted from memory to disk
+            creators: Number of ChartCreator instances to keep (0 disables)
+        """
+        self.disk = get_persistent_cache(
+            self.CACHE_FILENAME,
+            ttl_seconds=NATAL_CACHE_TTL_DAYS * 24 * 60 * 60,
+            max_entries=NATAL_CACHE_MAX_ENTRIES,
+            memory_size=0
+        ) if disk else None
+        self.memory = BudgetLRUCache(max_bytes, on_evict=self._spill)
+        self.creators = LRUCache(creators) if creators > 0 else None
+
+    @staticmethod
+    def key(year: int, month: int, day: int, hour: int, minute: int, lat: float, lng: float,
+            zodiac_type: Optional[str] = None, sidereal_mode: Optional[str] = None) -> str:
+        """Cache key for a birth moment and place; unset zodiac settings match their defaults"""
+        if zodiac_type == "Sidereal":
+            zodiac = f"Sidereal:{sidereal_mode or 'FAGAN_BRADLEY'}"
+        else:
+            zodiac = "Tropic"
+        return (f"{int(year):04d}-{int(month):02d}-{int(day):02d}T{int(hour):02d}:{int(minute):02d}"
+                f"|{round(lat, 4):.4f}|{round(lng, 4):.4f}|{zodiac}")
+
+    def _spill(self, key: str, payload: str) -> None:
+        if self.disk is not None:
+            self.disk.set(key, payload)
+
+    def get(self, key: str, name: str, location: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached natal chart data
+
+        Args:
+            key: Key from NatalCache.key
+            name: Name to put in the returned data
+            location: "City, Nation" text to put in the returned data
+
+        Returns:
+            Optional[Dict]: A fresh copy of the chart data, or None on a miss
+        """
+        payload = self.memory.get(key)
+        if payload is None and self.disk is not None:
+            payload = self.disk.get(key)
+            if payload is not None:
+                self.memory.set(key, payload)
+        if payload is None:
+            return None
+
+        logger.info(f"Natal cache hit for {key}")
+        chart_data = json.loads(payload)
+        subject = chart_data.get("subject", {})
+        subject["name"] = name
+        if "birth_data" in subject:
+            subject["birth_data"]["location"] = location
+        return chart_data
+
+    def set(self, key: str, chart_data: Dict[str, Any]) -> None:
+        """Store natal chart data (as returned by get_chart_data_as_json)"""
+        try:
+            self.memory.set(key, json.dumps(chart_data))
+        except (TypeError, ValueError) as e:
+            logger.error(f"Could not cache natal chart data for {key}: {str(e)}")
+
+    def get_creator(self, key: str, name: str) -> Any:
+        """Return a cached ChartCreator for the same person, or None"""
+        return self.creators.get((key, name)) if self.creators is not None else None
+
+    def set_creator(self, key: str, name: str, chart_creator: Any) -> None:
+        """Keep a ChartCreator for later requests about the same person"""
+        if self.creators is not None:
+            self.creators.set((key, name), chart_creator)
+
+
+_natal_cache: Optional[NatalCache] = None
+_natal_cache_lock = threading.Lock()
+
+def get_natal_cache() -> NatalCache:
+    """Return the process-wide natal cache"""
+    global _natal_cache
+    with _natal_cache_lock:
+        if _natal_cache is None:
+            _natal_cache = NatalCache()
+        return _natal_cache
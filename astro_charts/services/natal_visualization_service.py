@@ -1,8 +1,9 @@
 import altair as alt
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 import os
+from ..utils.artifact_utils import ChartArtifact, render_chart_pair
 
 logger = logging.getLogger(__name__)
 
@@ -88,8 +89,8 @@ class NatalVisualizationService:
         logger.info(f"Created DataFrame with aspect counts:\n{df}")
         return df
     
-    def create_visualization(self, natal_data: Dict[str, Any], output_path: str, html_path: str) -> tuple[str, str]:
-        """Create and save visualizations of natal aspects"""
+    def create_visualization(self, natal_data: Dict[str, Any], output_path: str, html_path: str) -> Tuple[Optional[ChartArtifact], Optional[ChartArtifact]]:
+        """Create SVG and HTML visualizations of natal aspects, named after output_path and html_path"""
         try:
             # Get subject name and birth details
             subject = natal_data.get('subject', {})
@@ -186,11 +187,8 @@ class NatalVisualizationService:
                 anchor='middle'
             )
             
-            # Save both SVG and HTML versions
-            final_chart.save(output_path)
-            final_chart.save(html_path)
-            
-            return output_path, html_path
+            # Render both SVG and HTML versions
+            return render_chart_pair(final_chart, output_path, html_path)
             
         except Exception as e:
             logger.error(f"Error creating natal visualization: {str(e)}")
@@ -1,56 +1,154 @@
-import requests
+import asyncio
+import base64
 import json
 import logging
-from typing import Dict, Any, Optional
 import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
 import aiohttp
+import requests
+
+from ..utils.artifact_utils import ChartArtifact
+from ..utils.async_utils import run_blocking
+from ..utils.http_utils import get_aiohttp_session, get_http_session
 
 logger = logging.getLogger(__name__)
 
+POCKETBASE_URL = os.getenv('POCKETBASE_URL', "https://magi.pockethost.io")
+
+# Re-authenticate this long before the token expires
+POCKETBASE_TOKEN_REFRESH_SECONDS = float(os.getenv('POCKETBASE_TOKEN_REFRESH_SECONDS', '300'))
+# Lifetime assumed for a token whose expiry cannot be read
+POCKETBASE_TOKEN_TTL_SECONDS = float(os.getenv('POCKETBASE_TOKEN_TTL_SECONDS', '3600'))
+
+# Write-behind queue: records sent together, how long to wait for a batch to fill, and retries
+POCKETBASE_WRITE_BATCH_SIZE = int(os.getenv('POCKETBASE_WRITE_BATCH_SIZE', '10'))
+POCKETBASE_WRITE_FLUSH_SECONDS = float(os.getenv('POCKETBASE_WRITE_FLUSH_SECONDS', '0.5'))
+POCKETBASE_WRITE_MAX_ATTEMPTS = int(os.getenv('POCKETBASE_WRITE_MAX_ATTEMPTS', '5'))
+POCKETBASE_WRITE_BACKOFF_SECONDS = float(os.getenv('POCKETBASE_WRITE_BACKOFF_SECONDS', '1'))
+
+# (filename sent to PocketBase, file contents, content type)
+RecordFile = Tuple[str, bytes, str]
+
+# A chart file to upload: rendered in memory, or a path on disk
+ChartFile = Union[ChartArtifact, str, None]
+
+
+@dataclass
+class PocketbaseRecord:
+    """A record ready to be sent to a PocketBase collection
+
+    File contents are read when the record is built, so a record can be sent (or
+    retried) later even if the chart files have been cleaned up in the meantime.
+    """
+    collection: str
+    fields: Dict[str, Any]
+    files: Dict[str, RecordFile] = field(default_factory=dict)
+    multipart: bool = True    # form data with files; JSON body when False
+
+    @property
+    def endpoint(self) -> str:
+        return f"/api/collections/{self.collection}/records"
+
+
+def _token_expiry(token: str) -> float:
+    """Expiry time of a PocketBase JWT (now + POCKETBASE_TOKEN_TTL_SECONDS when unreadable)"""
+    try:
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except Exception:
+        return time.time() + POCKETBASE_TOKEN_TTL_SECONDS
+
+
+def _read_files(paths: Dict[str, Tuple[str, ChartFile, str]]) -> Dict[str, RecordFile]:
+    """
+    Read the chart files of a record
+
+    Args:
+        paths: Field name -> (filename sent to PocketBase, rendered artifact or
+            path on disk, content type)
+
+    Returns:
+        Dict: Field name -> (filename, contents, content type) for the artifacts
+        given and the paths that exist
+    """
+    files = {}
+    for field_name, (filename, path, content_type) in paths.items():
+        if isinstance(path, ChartArtifact):
+            files[field_name] = (filename, path.getvalue(), content_type)
+            logger.info(f"Adding {field_name} file from rendered {path.filename}")
+        elif path and os.path.exists(path):
+            with open(path, 'rb') as f:
+                files[field_name] = (filename, f.read(), content_type)
+            logger.info(f"Adding {field_name} file from {path}")
+    return files
+
+
+def _with_ids(data: Dict[str, Any], user_id: Optional[str], job_id: Optional[str]) -> Dict[str, Any]:
+    """Add user_id and job_id to record fields when they are set"""
+    if user_id:
+        data['user_id'] = user_id
+    if job_id:
+        data['job_id'] = job_id
+    return data
+
+
 class PocketbaseService:
-    def __init__(self, base_url: str = "https://magi.pockethost.io"):
-        """Initialize PocketBase service"""
+    """PocketBase client shared by every request of the process
+
+    Requests go over the pooled keep-alive sessions from http_utils. The admin
+    token is cached and refreshed shortly before it expires (or after a 401), so
+    saving a record normally costs a single request. Records are described by
+    PocketbaseRecord; the *_record methods build them and the create_* methods
+    build and send them in one call.
+    """
+
+    def __init__(self, base_url: str = POCKETBASE_URL):
+        """Initialize PocketBase service (authentication happens on first use)"""
         self.base_url = base_url.rstrip('/')
+        self.session = get_http_session()
         self.token = None
+        self.token_expires_at = 0.0
         self.headers = {
             'Content-Type': 'application/json'
         }
-        # Authenticate on initialization
-        self.authenticate()
+        self._auth_lock = threading.Lock()
+        self._async_auth_lock: Optional[asyncio.Lock] = None
+
+    def _credentials(self) -> Dict[str, str]:
+        email = os.getenv('POCKETBASE_EMAIL')
+        password = os.getenv('POCKETBASE_PASSWORD')
+
+        if not email or not password:
+            raise ValueError("POCKETBASE_EMAIL and POCKETBASE_PASSWORD must be set in environment")
+
+        return {"identity": email, "password": password}
+
+    def _set_token(self, token: str) -> None:
+        self.token = token
+        self.token_expires_at = _token_expiry(token)
+        self.headers['Authorization'] = f'Bearer {self.token}'
+        logger.info("Successfully authenticated with PocketBase")
+
+    @property
+    def token_valid(self) -> bool:
+        return self.token is not None and time.time() < self.token_expires_at - POCKETBASE_TOKEN_REFRESH_SECONDS
 
     def authenticate(self) -> None:
         """Authenticate with PocketBase using credentials from environment"""
         try:
-            email = os.getenv('POCKETBASE_EMAIL')
-            password = os.getenv('POCKETBASE_PASSWORD')
-            
-            if not email or not password:
-                raise ValueError("POCKETBASE_EMAIL and POCKETBASE_PASSWORD must be set in environment")
-
-            endpoint = f"{self.base_url}/api/admins/auth-with-password"
-            
-            payload = {
-                "identity": email,
-                "password": password
-            }
-            
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=payload
+            response = self.session.post(
+                f"{self.base_url}/api/admins/auth-with-password",
+                headers={'Content-Type': 'application/json'},
+                json=self._credentials()
             )
-            
             response.raise_for_status()
-            
-            # Extract and store the token
-            auth_data = response.json()
-            self.token = auth_data['token']
-            
-            # Update headers with the new token
-            self.headers['Authorization'] = f'Bearer {self.token}'
-            
-            logger.info("Successfully authenticated with PocketBase")
-            
+            self._set_token(response.json()['token'])
+
         except requests.exceptions.RequestException as e:
             logger.error(f"Authentication failed: {str(e)}")
             if hasattr(e.response, 'text'):
@@ -60,357 +158,281 @@ class PocketbaseService:
             logger.error(f"Authentication error: {str(e)}")
             raise
 
+    async def authenticate_async(self) -> None:
+        """Authenticate with PocketBase without blocking the event loop"""
+        try:
+            session = await get_aiohttp_session()
+            async with session.post(
+                f"{self.base_url}/api/admins/auth-with-password",
+                json=self._credentials()
+            ) as response:
+                if response.status >= 400:
+                    logger.error(f"Response: {await response.text()}")
+                response.raise_for_status()
+                self._set_token((await response.json())['token'])
+
+        except Exception as e:
+            logger.error(f"Authentication error: {str(e)}")
+            raise
+
+    def ensure_token(self, force: bool = False) -> None:
+        """Authenticate unless the cached token is still good"""
+        with self._auth_lock:
+            if force or not self.token_valid:
+                self.authenticate()
+
+    async def ensure_token_async(self, force: bool = False) -> None:
+        """Async ensure_token; concurrent callers share one authentication"""
+        if self._async_auth_lock is None:
+            self._async_auth_lock = asyncio.Lock()
+        async with self._async_auth_lock:
+            if force or not self.token_valid:
+                await self.authenticate_async()
+
+    def create_record(self, record: PocketbaseRecord) -> Dict[str, Any]:
+        """
+        Send a record to PocketBase
+
+        Re-authenticates and retries once if the token was rejected.
+
+        Args:
+            record: Record to create
+
+        Returns:
+            Dict: The created record
+        """
+        self.ensure_token()
+        endpoint = f"{self.base_url}{record.endpoint}"
+        logger.info(f"Sending request to {endpoint}")
+
+        for attempt in range(2):
+            if record.multipart:
+                # Let requests set the multipart Content-Type
+                headers = {k: v for k, v in self.headers.items() if k != 'Content-Type'}
+                response = self.session.post(
+                    endpoint,
+                    headers=headers,
+                    data=record.fields,
+                    files=record.files or None
+                )
+            else:
+                response = self.session.post(endpoint, headers=self.headers, json=record.fields)
+
+            if response.status_code == 401 and attempt == 0:
+                logger.info("PocketBase token rejected, re-authenticating")
+                self.ensure_token(force=True)
+                continue
+            break
+
+        if response.status_code >= 400:
+            logger.error(f"Response status: {response.status_code}")
+            logger.error(f"Response text: {response.text}")
+        response.raise_for_status()
+        return response.json()
+
+    async def create_record_async(self, record: PocketbaseRecord) -> Dict[str, Any]:
+        """Async create_record over the shared aiohttp session"""
+        await self.ensure_token_async()
+        session = await get_aiohttp_session()
+        endpoint = f"{self.base_url}{record.endpoint}"
+
+        for attempt in range(2):
+            headers = {'Authorization': self.headers['Authorization']}
+            if record.multipart:
+                form = aiohttp.FormData()
+                for name, value in record.fields.items():
+                    form.add_field(name, value if isinstance(value, str) else str(value))
+                for name, (filename, content, content_type) in record.files.items():
+                    form.add_field(name, content, filename=filename, content_type=content_type)
+                request = session.post(endpoint, headers=headers, data=form)
+            else:
+                request = session.post(endpoint, headers=headers, json=record.fields)
+
+            async with request as response:
+                if response.status == 401 and attempt == 0:
+                    logger.info("PocketBase token rejected, re-authenticating")
+                    await self.ensure_token_async(force=True)
+                    continue
+                if response.status >= 400:
+                    logger.error(f"Response status: {response.status}")
+                    logger.error(f"Response text: {await response.text()}")
+                response.raise_for_status()
+                return await response.json()
+
+    async def create_async(self, build: Callable[..., PocketbaseRecord], *args, **kwargs) -> Dict[str, Any]:
+        """
+        Build a record on the chart executor (reading its files there) and send it asynchronously
+
+        Args:
+            build: One of the *_record methods
+            *args: Positional arguments for build
+            **kwargs: Keyword arguments for build
+
+        Returns:
+            Dict: The created record
+        """
+        record = await run_blocking(build, *args, **kwargs)
+        return await self.create_record_async(record)
+
+    def transit_chart_record(self, transit_data: Dict[str, Any], user_id: str = None,
+                             job_id: str = None) -> PocketbaseRecord:
+        """Transit chart record (transit_charts)"""
+        payload = _with_ids({"transit_data": json.dumps(transit_data)}, user_id, job_id)
+        logger.info(f"Creating transit chart with payload fields: {list(payload.keys())}")
+        return PocketbaseRecord("transit_charts", payload, multipart=False)
+
     def create_transit_chart(self, transit_data: Dict[str, Any], user_id: str = None, job_id: str = None) -> Dict[str, Any]:
         """Create a new transit chart record in PocketBase"""
         try:
-            endpoint = f"{self.base_url}/api/collections/transit_charts/records"
-            
-            # Prepare the data
-            payload = {
-                "transit_data": json.dumps(transit_data)
-            }
-            
-            # Only add user_id and job_id if they are not None
-            if user_id:
-                payload["user_id"] = user_id
-            if job_id:
-                payload["job_id"] = job_id
-            
-            # Log the payload for debugging
-            logger.info(f"Creating transit chart with payload: {payload}")
-            
-            # Make the request
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=payload
-            )
-            
-            # Check if request was successful
-            response.raise_for_status()
-            
-            # Log the response for debugging
-            logger.info(f"PocketBase response: {response.json()}")
-            
-            # Return the created record
-            return response.json()
-            
+            return self.create_record(self.transit_chart_record(transit_data, user_id, job_id))
         except requests.exceptions.RequestException as e:
             logger.error(f"Error creating transit chart record: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
             raise
 
+    def transit_loop_record(self, transit_loop_data: Dict[str, Any], user_id: str = None,
+                            job_id: str = None) -> PocketbaseRecord:
+        """Transit loop record with its visualization (transit_charts)"""
+        data = _with_ids({
+            'transit_data': json.dumps({
+                'daily_aspects': transit_loop_data.get('transit_data', {}).get('daily_aspects', {}),
+                'turbulent_transits': transit_loop_data.get('transit_data', {}).get('turbulent_transits', {}),
+                'date_range': transit_loop_data.get('date_range', {})
+            })
+        }, user_id, job_id)
+        files = _read_files({
+            'loop_chart': ('visualization.svg', transit_loop_data.get('visualization_path'), 'image/svg+xml'),
+            'loop_chart_html': ('visualization.html', transit_loop_data.get('visualization_html_path'), 'text/html')
+        })
+        return PocketbaseRecord("transit_charts", data, files)
+
     def create_transit_loop_charts(self, transit_loop_data: Dict[str, Any], user_id: str = None, job_id: str = None) -> Dict[str, Any]:
         """Create transit loop record with visualization in PocketBase"""
         try:
-            endpoint = f"{self.base_url}/api/collections/transit_charts/records"
-            
-            # Prepare the form data
-            data = {
-                'transit_data': json.dumps({
-                    'daily_aspects': transit_loop_data.get('transit_data', {}).get('daily_aspects', {}),
-                    'turbulent_transits': transit_loop_data.get('transit_data', {}).get('turbulent_transits', {}),
-                    'date_range': transit_loop_data.get('date_range', {})
-                })
-            }
-            
-            if user_id:
-                data['user_id'] = user_id
-            if job_id:
-                data['job_id'] = job_id
-            
-            # Get the visualization paths
-            viz_path = transit_loop_data.get('visualization_path')
-            viz_html_path = transit_loop_data.get('visualization_html_path')
-            
-            # Prepare files dictionary
-            files = {}
-            
-            # Add SVG visualization if it exists
-            if viz_path and os.path.exists(viz_path):
-                files['loop_chart'] = ('visualization.svg', open(viz_path, 'rb'), 'image/svg+xml')
-                logger.info(f"Adding visualization SVG from {viz_path}")
-            
-            # Add HTML visualization if it exists
-            if viz_html_path and os.path.exists(viz_html_path):
-                files['loop_chart_html'] = ('visualization.html', open(viz_html_path, 'rb'), 'text/html')
-                logger.info(f"Adding visualization HTML from {viz_html_path}")
-            
-            # Remove Content-Type header for multipart request
-            headers = {k: v for k, v in self.headers.items() if k != 'Content-Type'}
-            
-            # Log request details
-            logger.info(f"Sending request to {endpoint}")
-            logger.info(f"Data fields: {list(data.keys())}")
-            if files:
-                logger.info(f"File fields: {list(files.keys())}")
-            
-            try:
-                # Make the request
-                response = requests.post(
-                    endpoint,
-                    headers=headers,
-                    data=data,
-                    files=files if files else None
-                )
-                
-                # Log response for debugging
-                if response.status_code != 200:
-                    logger.error(f"Response status: {response.status_code}")
-                    logger.error(f"Response text: {response.text}")
-                
-                # Check if request was successful
-                response.raise_for_status()
-                
-                return response.json()
-                
-            finally:
-                # Clean up file handles
-                for file_key in files:
-                    files[file_key][1].close()
-            
+            return self.create_record(self.transit_loop_record(transit_loop_data, user_id, job_id))
         except requests.exceptions.RequestException as e:
             logger.error(f"Error creating transit loop record: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
-                logger.error(f"Request data: {data}")
-                if files:
-                    logger.error(f"Files included: {list(files.keys())}")
             raise
 
-    def create_natal_chart(self, natal_data: Dict[str, Any], chart_path: str = None, 
-                          easy_chart: str = None, easy_chart_html: str = None, 
+    def natal_chart_record(self, natal_data: Dict[str, Any], chart_path: ChartFile = None,
+                           easy_chart: ChartFile = None, easy_chart_html: ChartFile = None,
+                           user_id: str = None, job_id: str = None) -> PocketbaseRecord:
+        """Natal chart record with its chart files (natal_charts)"""
+        data = _with_ids({
+            'natal_data': json.dumps(natal_data) if isinstance(natal_data, dict) else natal_data,
+        }, user_id, job_id)
+        files = _read_files({
+            'chart': ('chart.svg', chart_path, 'image/svg+xml'),
+            'easy_chart': ('easy_chart.svg', easy_chart, 'image/svg+xml'),
+            'easy_chart_html': ('easy_chart.html', easy_chart_html, 'text/html')
+        })
+        return PocketbaseRecord("natal_charts", data, files)
+
+    def create_natal_chart(self, natal_data: Dict[str, Any], chart_path: ChartFile = None,
+                          easy_chart: ChartFile = None, easy_chart_html: ChartFile = None,
                           user_id: str = None, job_id: str = None) -> Dict[str, Any]:
         """Create a new natal chart record in PocketBase with chart files"""
         try:
-            endpoint = f"{self.base_url}/api/collections/natal_charts/records"
-            
-            # Prepare the form data
-            data = {
-                'natal_data': json.dumps(natal_data) if isinstance(natal_data, dict) else natal_data,
-            }
-            
-            if user_id:
-                data['user_id'] = user_id
-            if job_id:
-                data['job_id'] = job_id
-            
-            # Prepare files dictionary
-            files = {}
-            
-            # Add traditional chart if it exists
-            if chart_path and os.path.exists(chart_path):
-                files['chart'] = ('chart.svg', open(chart_path, 'rb'), 'image/svg+xml')
-                logger.info(f"Adding traditional chart file from {chart_path}")
-            
-            # Add easy visualization SVG if it exists
-            if easy_chart and os.path.exists(easy_chart):
-                files['easy_chart'] = ('easy_chart.svg', open(easy_chart, 'rb'), 'image/svg+xml')
-                logger.info(f"Adding easy visualization SVG from {easy_chart}")
-            
-            # Add easy visualization HTML if it exists
-            if easy_chart_html and os.path.exists(easy_chart_html):
-                files['easy_chart_html'] = ('easy_chart.html', open(easy_chart_html, 'rb'), 'text/html')
-                logger.info(f"Adding easy visualization HTML from {easy_chart_html}")
-            
-            # Remove Content-Type header for multipart request
-            headers = {k: v for k, v in self.headers.items() if k != 'Content-Type'}
-            
-            # Log request details
-            logger.info(f"Sending request to {endpoint}")
-            logger.info(f"Data fields: {list(data.keys())}")
-            if files:
-                logger.info(f"File fields: {list(files.keys())}")
-            
-            try:
-                # Make the request
-                response = requests.post(
-                    endpoint,
-                    headers=headers,
-                    data=data,
-                    files=files if files else None
-                )
-                
-                # Check if request was successful
-                response.raise_for_status()
-                
-                return response.json()
-                
-            finally:
-                # Clean up file handles
-                for file_key in files:
-                    files[file_key][1].close()
-        
+            return self.create_record(self.natal_chart_record(
+                natal_data, chart_path, easy_chart, easy_chart_html, user_id, job_id
+            ))
         except requests.exceptions.RequestException as e:
             logger.error(f"Error creating natal chart record: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
-                logger.error(f"Request data: {data}")
-                if files:
-                    logger.error(f"Files included: {list(files.keys())}")
             raise
 
+    def single_transit_chart_record(self, transit_data: Dict[str, Any], chart_path: ChartFile = None,
+                                    easy_chart: ChartFile = None, easy_chart_html: ChartFile = None,
+                                    user_id: str = None, job_id: str = None) -> PocketbaseRecord:
+        """Single transit chart record with its chart files (single_transit_chart)"""
+        data = _with_ids({
+            'transit_data': json.dumps(transit_data) if isinstance(transit_data, dict) else transit_data,
+        }, user_id, job_id)
+        files = _read_files({
+            'chart': ('chart.svg', chart_path, 'image/svg+xml'),
+            'easy_chart': ('easy_chart.svg', easy_chart, 'image/svg+xml'),
+            'easy_chart_html': ('easy_chart_html.html', easy_chart_html, 'text/html')
+        })
+        return PocketbaseRecord("single_transit_chart", data, files)
+
     def create_single_transit_chart(
-        self, 
-        transit_data: Dict[str, Any], 
-        chart_path: str = None,
-        easy_chart: str = None,
-        easy_chart_html: str = None,
-        user_id: str = None, 
+        self,
+        transit_data: Dict[str, Any],
+        chart_path: ChartFile = None,
+        easy_chart: ChartFile = None,
+        easy_chart_html: ChartFile = None,
+        user_id: str = None,
         job_id: str = None
     ) -> Dict[str, Any]:
         """Create a new transit chart record in PocketBase"""
         try:
-            endpoint = f"{self.base_url}/api/collections/single_transit_chart/records"
-            
-            # Prepare the form data
-            data = {
-                'transit_data': json.dumps(transit_data) if isinstance(transit_data, dict) else transit_data,
-            }
-            
-            if user_id:
-                data['user_id'] = user_id
-            if job_id:
-                data['job_id'] = job_id
-            
-            # Prepare files dictionary
-            files = {}
-            
-            # Add traditional chart if it exists
-            if chart_path and os.path.exists(chart_path):
-                files['chart'] = ('chart.svg', open(chart_path, 'rb'), 'image/svg+xml')
-                logger.info(f"Adding traditional chart file from {chart_path}")
-            
-            # Add easy visualization SVG if it exists
-            if easy_chart and os.path.exists(easy_chart):
-                files['easy_chart'] = ('easy_chart.svg', open(easy_chart, 'rb'), 'image/svg+xml')
-                logger.info(f"Adding easy visualization SVG from {easy_chart}")
-            
-            # Add easy visualization HTML if it exists
-            if easy_chart_html and os.path.exists(easy_chart_html):
-                files['easy_chart_html'] = ('easy_chart_html.html', open(easy_chart_html, 'rb'), 'text/html')
-                logger.info(f"Adding easy visualization HTML from {easy_chart_html}")
-            
-            # Remove Content-Type header for multipart request
-            headers = {k: v for k, v in self.headers.items() if k != 'Content-Type'}
-            
-            try:
-                # Make the request
-                response = requests.post(
-                    endpoint,
-                    headers=headers,
-                    data=data,
-                    files=files if files else None
-                )
-                
-                response.raise_for_status()
-                return response.json()
-                
-            finally:
-                # Clean up file handles
-                for file_key in files:
-                    files[file_key][1].close()
-                
+            return self.create_record(self.single_transit_chart_record(
+                transit_data, chart_path, easy_chart, easy_chart_html, user_id, job_id
+            ))
         except Exception as e:
             logger.error(f"Error creating transit chart record: {str(e)}")
             raise
 
-    def create_synastry_chart(self, synastry_data: Dict[str, Any], chart_path: str = None, easy_chart_path: str = None, easy_chart_html_path: str = None, user_id: str = None, job_id: str = None, is_marriage_request: bool = False) -> Dict[str, Any]:
+    def synastry_chart_record(self, synastry_data: Dict[str, Any], chart_path: ChartFile = None,
+                              easy_chart_path: ChartFile = None, easy_chart_html_path: ChartFile = None,
+                              user_id: str = None, job_id: str = None,
+                              is_marriage_request: bool = False) -> PocketbaseRecord:
+        """Synastry record with its chart files (synastry_charts)"""
+        data = _with_ids({'synastry_data': json.dumps(synastry_data)}, user_id, job_id)
+        data['is_marriage_request'] = bool(is_marriage_request)
+
+        logger.info(f"Easy chart html path: {easy_chart_html_path}")
+        files = _read_files({
+            'chart': ('chart.svg', chart_path, 'image/svg+xml'),
+            'easy_chart': ('easy_chart.svg', easy_chart_path, 'image/svg+xml'),
+            'easy_chart_html': ('easy_chart_html.html', easy_chart_html_path, 'text/html')
+        })
+        return PocketbaseRecord("synastry_charts", data, files)
+
+    def create_synastry_chart(self, synastry_data: Dict[str, Any], chart_path: ChartFile = None, easy_chart_path: ChartFile = None, easy_chart_html_path: ChartFile = None, user_id: str = None, job_id: str = None, is_marriage_request: bool = False) -> Dict[str, Any]:
         """Create synastry record with visualization in PocketBase"""
         try:
-            endpoint = f"{self.base_url}/api/collections/synastry_charts/records"
-            
-            # Prepare the form data
-            data = {
-                'synastry_data': json.dumps(synastry_data)
-            }
-         
-            
-            if user_id:
-                data['user_id'] = user_id
-            if job_id:
-                data['job_id'] = job_id
-            if is_marriage_request:
-                data['is_marriage_request'] = True
-            else:
-                data['is_marriage_request'] = False
-                
-            logger.info(f"Easy chart html path: {easy_chart_html_path}")
-            # Prepare files
-            files = {}
-            if chart_path and os.path.exists(chart_path):
-                files['chart'] = ('chart.svg', open(chart_path, 'rb'), 'image/svg+xml')
-            if easy_chart_path and os.path.exists(easy_chart_path):
-                files['easy_chart'] = ('easy_chart.svg', open(easy_chart_path, 'rb'), 'image/svg+xml')
-            if easy_chart_html_path and os.path.exists(easy_chart_html_path):
-                files['easy_chart_html'] = ('easy_chart_html.html', open(easy_chart_html_path, 'rb'), 'text/html')
-        
-              # Remove Content-Type header for multipart request
-            headers = {k: v for k, v in self.headers.items() if k != 'Content-Type'}
-            
-            # Make the request
-            response = requests.post(
-                endpoint,
-                headers=headers,
-                data=data,
-                files=files if files else None
-            )
-            
-            response.raise_for_status()
-            return response.json()
-            
+            return self.create_record(self.synastry_chart_record(
+                synastry_data, chart_path, easy_chart_path, easy_chart_html_path,
+                user_id, job_id, is_marriage_request
+            ))
         except Exception as e:
             logger.error(f"Error creating synastry chart record: {str(e)}")
             raise
 
-    def create_cosmo_chart(self, transit_data: Dict[str, Any], chart_path: str = None, chart_html_path: str = None, user_id: str = None, job_id: str = None) -> Dict[str, Any]:
+    def cosmo_chart_record(self, transit_data: Dict[str, Any], chart_path: ChartFile = None,
+                           chart_html_path: ChartFile = None, user_id: str = None,
+                           job_id: str = None) -> PocketbaseRecord:
+        """Cosmobiology chart record with its chart files (cosmo_charts)"""
+        data = _with_ids({'transit_data': json.dumps(transit_data)}, user_id, job_id)
+        files = _read_files({
+            'cosmo_chart': ('chart.svg', chart_path, 'image/svg+xml'),
+            'cosmo_chart_html': ('chart.html', chart_html_path, 'text/html')
+        })
+        return PocketbaseRecord("cosmo_charts", data, files)
+
+    def create_cosmo_chart(self, transit_data: Dict[str, Any], chart_path: ChartFile = None, chart_html_path: ChartFile = None, user_id: str = None, job_id: str = None) -> Dict[str, Any]:
         """Create a new cosmobiology chart record in PocketBase"""
         try:
-            endpoint = f"{self.base_url}/api/collections/cosmo_charts/records"
-            
-            # Prepare the data
-            data = {
-                'transit_data': json.dumps(transit_data)
-            }
-            
-            # Add optional fields if provided
-            if user_id:
-                data['user_id'] = user_id
-            if job_id:
-                data['job_id'] = job_id
-            
-            # Prepare files
-            files = {}
-            if chart_path and os.path.exists(chart_path):
-                files['cosmo_chart'] = ('chart.svg', open(chart_path, 'rb'), 'image/svg+xml')
-            if chart_html_path and os.path.exists(chart_html_path):
-                files['cosmo_chart_html'] = ('chart.html', open(chart_html_path, 'rb'), 'text/html')
-            
-            # Remove Content-Type header for multipart request
-            headers = {k: v for k, v in self.headers.items() if k != 'Content-Type'}
-            
-            try:
-                # Make the request
-                response = requests.post(
-                    endpoint,
-                    headers=headers,
-                    data=data,
-                    files=files if files else None
-                )
-                
-                response.raise_for_status()
-                return response.json()
-                
-            finally:
-                # Clean up file handles
-                for file_key in files:
-                    files[file_key][1].close()
-                
+            return self.create_record(self.cosmo_chart_record(transit_data, chart_path, chart_html_path, user_id, job_id))
         except Exception as e:
             logger.error(f"Error creating cosmobiology chart record: {str(e)}")
             raise
 
+    def vedic_lucky_times_record(self, natal_data: Dict[str, Any], yogi_point_data: Dict[str, Any],
+                                 user_id: str = None, job_id: str = None) -> PocketbaseRecord:
+        """Vedic lucky times record (lucky_times_vedic)"""
+        # Add person's name to the lucky times data
+        yogi_point_data["person_name"] = natal_data.get("subject", {}).get("name", "Unknown")
+
+        payload = _with_ids({
+            "lucky_times_data": json.dumps({
+                # "natal_data": natal_data,
+                "yogi_point_data": yogi_point_data
+            }),
+            "lucky_dates_summary": json.dumps({
+                "dates_summary": yogi_point_data["dates_summary"]
+            })
+        }, user_id, job_id)
+        return PocketbaseRecord("lucky_times_vedic", payload, multipart=False)
 
     def create_vedic_lucky_times_record(
         self,
@@ -421,45 +443,50 @@ class PocketbaseService:
     ) -> Dict[str, Any]:
         """Create a new Vedic lucky times record in PocketBase"""
         try:
-            endpoint = f"{self.base_url}/api/collections/lucky_times_vedic/records"
-            
-            # Add person's name to the lucky times data
-            yogi_point_data["person_name"] = natal_data.get("subject", {}).get("name", "Unknown")
-            
-            # Prepare the data
-            payload = {
-                "lucky_times_data": json.dumps({
-                    # "natal_data": natal_data,
-                    "yogi_point_data": yogi_point_data
-                }),
-                "lucky_dates_summary": json.dumps({
-                    "dates_summary": yogi_point_data["dates_summary"]
-                })
-            }
-            
-            if user_id:
-                payload["user_id"] = user_id
-            if job_id:
-                payload["job_id"] = job_id
-            
-            # Make the request
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=payload
-            )
-            
-            # Check if request was successful
-            response.raise_for_status()
-            
-            return response.json()
-            
+            return self.create_record(self.vedic_lucky_times_record(natal_data, yogi_point_data, user_id, job_id))
         except requests.exceptions.RequestException as e:
             logger.error(f"Error creating Vedic lucky times record: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
             raise
 
+    def sports_prediction_record(self, chart_data: Dict[str, Any], prediction_results: Dict[str, Any],
+                                 event_name: str, favorite_name: str, underdog_name: str,
+                                 user_id: str = None, job_id: str = None) -> PocketbaseRecord:
+        """Sports prediction record (sports_predictions)"""
+        prediction = prediction_results.get("prediction", {})
+
+        # Prepare the data - structure for efficient retrieval
+        payload = _with_ids({
+            "event_name": event_name,
+            "favorite_name": favorite_name,
+            "underdog_name": underdog_name,
+            "prediction_data": json.dumps(prediction_results),
+            "prediction_summary": json.dumps({
+                "predicted_winner": prediction.get("predicted_winner", "Unknown"),
+                "confidence_level": prediction.get("confidence_level", "Unknown"),
+                "is_tie": prediction.get("is_tie", False),
+                "favorite_malefic_count": prediction.get("favorite_malefic_count", 0),
+                "underdog_malefic_count": prediction.get("underdog_malefic_count", 0),
+                "favorite_total_score": prediction.get("favorite_total_score", 0),
+                "underdog_total_score": prediction.get("underdog_total_score", 0),
+                "favorite_sky": prediction.get("has_favorite_sky", False),
+                "underdog_sky": prediction.get("has_underdog_sky", False),
+                "favorite_pky": prediction.get("has_favorite_pky", False),
+                "underdog_pky": prediction.get("has_underdog_pky", False),
+                "favorite_sky_count": prediction.get("favorite_sky_count", 0),
+                "underdog_sky_count": prediction.get("underdog_sky_count", 0),
+                "favorite_pky_count": prediction.get("favorite_pky_count", 0),
+                "underdog_pky_count": prediction.get("underdog_pky_count", 0),
+                "favorite_cuspal": prediction.get("has_favorite_cuspal", False),
+                "underdog_cuspal": prediction.get("has_underdog_cuspal", False),
+                "favorite_cuspal_score": prediction.get("favorite_cuspal_score", 0),
+                "underdog_cuspal_score": prediction.get("underdog_cuspal_score", 0),
+                "favorite_cuspal_count": prediction.get("favorite_cuspal_count", 0),
+                "underdog_cuspal_count": prediction.get("underdog_cuspal_count", 0),
+                "event_date": prediction_results.get("event_details", {}).get("event_date", "Unknown")
+            })
+        }, user_id, job_id)
+        return PocketbaseRecord("sports_predictions", payload, multipart=False)
+
     def create_sports_prediction_record(
         self,
         chart_data: Dict[str, Any],
@@ -472,60 +499,129 @@ class PocketbaseService:
     ) -> Dict[str, Any]:
         """Create a new sports prediction record in PocketBase"""
         try:
-            endpoint = f"{self.base_url}/api/collections/sports_predictions/records"
-            
-            # Prepare the data - structure for efficient retrieval
-            payload = {
-                "event_name": event_name,
-                "favorite_name": favorite_name,
-                "underdog_name": underdog_name,
-                "prediction_data": json.dumps(prediction_results),
-                "prediction_summary": json.dumps({
-                    "predicted_winner": prediction_results.get("prediction", {}).get("predicted_winner", "Unknown"),
-                    "confidence_level": prediction_results.get("prediction", {}).get("confidence_level", "Unknown"),
-                    "is_tie": prediction_results.get("prediction", {}).get("is_tie", False),
-                    "favorite_malefic_count": prediction_results.get("prediction", {}).get("favorite_malefic_count", 0),
-                    "underdog_malefic_count": prediction_results.get("prediction", {}).get("underdog_malefic_count", 0),
-                    "favorite_total_score": prediction_results.get("prediction", {}).get("favorite_total_score", 0),
-                    "underdog_total_score": prediction_results.get("prediction", {}).get("underdog_total_score", 0),
-                    "favorite_sky": prediction_results.get("prediction", {}).get("has_favorite_sky", False),
-                    "underdog_sky": prediction_results.get("prediction", {}).get("has_underdog_sky", False),
-                    "favorite_pky": prediction_results.get("prediction", {}).get("has_favorite_pky", False),
-                    "underdog_pky": prediction_results.get("prediction", {}).get("has_underdog_pky", False),
-                    "favorite_sky_count": prediction_results.get("prediction", {}).get("favorite_sky_count", 0),
-                    "underdog_sky_count": prediction_results.get("prediction", {}).get("underdog_sky_count", 0),
-                    "favorite_pky_count": prediction_results.get("prediction", {}).get("favorite_pky_count", 0),
-                    "underdog_pky_count": prediction_results.get("prediction", {}).get("underdog_pky_count", 0),
-                    "favorite_cuspal": prediction_results.get("prediction", {}).get("has_favorite_cuspal", False),
-                    "underdog_cuspal": prediction_results.get("prediction", {}).get("has_underdog_cuspal", False),
-                    "favorite_cuspal_score": prediction_results.get("prediction", {}).get("favorite_cuspal_score", 0),
-                    "underdog_cuspal_score": prediction_results.get("prediction", {}).get("underdog_cuspal_score", 0),
-                    "favorite_cuspal_count": prediction_results.get("prediction", {}).get("favorite_cuspal_count", 0),
-                    "underdog_cuspal_count": prediction_results.get("prediction", {}).get("underdog_cuspal_count", 0),
-                    "event_date": prediction_results.get("event_details", {}).get("event_date", "Unknown")
-                })
-            }
-            
-            # Add optional fields if provided
-            if user_id:
-                payload["user_id"] = user_id
-            if job_id:
-                payload["job_id"] = job_id
-            
-            # Make the request
-            response = requests.post(
-                endpoint,
-                headers=self.headers,
-                json=payload
-            )
-            
-            # Check if request was successful
-            response.raise_for_status()
-            
-            return response.json()
-            
+            return self.create_record(self.sports_prediction_record(
+                chart_data, prediction_results, event_name, favorite_name, underdog_name, user_id, job_id
+            ))
         except requests.exceptions.RequestException as e:
             logger.error(f"Error creating sports prediction record: {str(e)}")
-            if hasattr(e.response, 'text'):
-                logger.error(f"Response: {e.response.text}")
             raise
+
+
+class PocketbaseWriteQueue:
+    """Write-behind queue for PocketBase records nobody waits for
+
+    Endpoints that do not return the saved record enqueue it and respond right
+    away. A background task collects up to batch_size records (waiting at most
+    flush_seconds for a batch to fill), authenticates once for the batch and sends
+    the records concurrently. Failed writes are retried with exponential backoff;
+    client errors other than 401/429 are not retried.
+    """
+
+    def __init__(self, service: PocketbaseService, batch_size: int = POCKETBASE_WRITE_BATCH_SIZE,
+                 flush_seconds: float = POCKETBASE_WRITE_FLUSH_SECONDS,
+                 max_attempts: int = POCKETBASE_WRITE_MAX_ATTEMPTS,
+                 backoff_seconds: float = POCKETBASE_WRITE_BACKOFF_SECONDS):
+        """
+        Initialize the write queue
+
+        Args:
+            service: Client used to send the records
+            batch_size: Most records sent together
+            flush_seconds: Longest wait for a batch to fill
+            max_attempts: Attempts per record before it is dropped
+            backoff_seconds: Delay before the first retry, doubled for every further retry
+        """
+        self.service = service
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start the background writer"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Started PocketBase write queue (batch size {self.batch_size})")
+
+    async def stop(self, timeout: float = 30) -> None:
+        """Send the records still queued (waiting at most timeout seconds) and stop the writer"""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Stopping PocketBase write queue with {self._queue.qsize()} records unsent")
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("Stopped PocketBase write queue")
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def enqueue(self, record: PocketbaseRecord) -> None:
+        """Queue a record to be sent in the background"""
+        if self._queue is None:
+            raise RuntimeError("PocketBase write queue is not started")
+        self._queue.put_nowait(record)
+
+    async def _next_batch(self) -> List[PocketbaseRecord]:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.service.ensure_token_async()
+            except Exception as e:
+                logger.error(f"PocketBase authentication failed before sending {len(batch)} records: {str(e)}")
+            try:
+                await asyncio.gather(*(self._write(record) for record in batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _retryable(error: Exception) -> bool:
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status >= 500 or error.status in (401, 408, 429)
+        return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+    async def _write(self, record: PocketbaseRecord) -> None:
+        """Send one record, retrying with exponential backoff"""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self.service.create_record_async(record)
+                return
+            except Exception as e:
+                if attempt == self.max_attempts or not self._retryable(e):
+                    logger.error(f"Dropping {record.collection} record after {attempt} attempts: {str(e)}")
+                    return
+                delay = self.backoff_seconds * 2 ** (attempt - 1)
+                logger.warning(f"Writing {record.collection} record failed ({str(e)}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+
+_pocketbase_service: Optional[PocketbaseService] = None
+_pocketbase_lock = threading.Lock()
+
+def get_pocketbase_service() -> PocketbaseService:
+    """Return the process-wide PocketBase client"""
+    global _pocketbase_service
+    with _pocketbase_lock:
+        if _pocketbase_service is None:
+            _pocketbase_service = PocketbaseService()
+        return _pocketbase_service
@@ -3,6 +3,7 @@ import pandas as pd
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
+from ..utils.artifact_utils import ChartArtifact, render_chart_pair
 
 logger = logging.getLogger(__name__)
 
@@ -98,8 +99,8 @@ class SingleTransitVisualizationService:
         transit_data: Dict[str, Any], 
         output_path: str,
         html_path: str
-    ) -> Tuple[Optional[str], Optional[str]]:
-        """Create and save visualization of single transit aspects"""
+    ) -> Tuple[Optional[ChartArtifact], Optional[ChartArtifact]]:
+        """Create SVG and HTML visualizations of single transit aspects, named after output_path and html_path"""
         try:
             # Prepare the data
             df = self.prepare_data(transit_data)
@@ -191,12 +192,11 @@ class SingleTransitVisualizationService:
                 anchor='middle'
             )
             
-            # Save both SVG and HTML versions
-            final_chart.save(output_path)
-            final_chart.save(html_path)
+            # Render both SVG and HTML versions
+            artifacts = render_chart_pair(final_chart, output_path, html_path)
             
-            logger.info(f"Successfully saved visualizations to {output_path} and {html_path}")
-            return output_path, html_path
+            logger.info(f"Successfully rendered visualizations {output_path} and {html_path}")
+            return artifacts
             
         except Exception as e:
             logger.error(f"Error creating transit visualization: {str(e)}")
@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..utils.async_utils import get_stage_timeout_executor
+
+logger = logging.getLogger(__name__)
+
+
+class StageTimeoutError(TimeoutError):
+    """A stage did not finish within its timeout"""
+
+
+class StageGraph:
+    """Named computation stages, each run at most once
+
+    A stage is a function of the results of the stages it depends on. It runs on
+    first use, in whichever thread asks for it first; any other thread asking for
+    it meanwhile waits for that result instead of computing it again. Stages are
+    added after their dependencies, so the graph has no cycles and a thread only
+    ever waits on a stage another thread is already computing.
+
+    A stage may have a timeout and a fallback. When it fails or runs out of time,
+    the fallback's value stands in for its result (also for the stages depending on
+    it) and the error is kept in failures, so one slow or broken analysis leaves the
+    rest of the results intact. A stage's timeout starts once its dependencies are
+    ready, so timed stages depending on timed stages add up; a deadline for the whole
+    graph caps them all.
+
+    memo() gives the same compute-once guarantee to any keyed value, e.g. a helper
+    call several stages repeat with the same arguments.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, timeout_executor: Optional[Executor] = None,
+                 deadline: Optional[float] = None):
+        """
+        Initialize an empty graph
+
+        Args:
+            executor: Executor run() spreads stages over (None runs them in order)
+            timeout_executor: Bounded executor for stages with a timeout (defaults to
+                the shared stage timeout executor); must not be executor, whose
+                threads wait on it
+            deadline: Seconds from now by which every stage with a timeout must
+                finish, however long the stages before it took (None for no limit)
+        """
+        self.executor = executor
+        self.timeout_executor = timeout_executor
+        self.deadline = time.monotonic() + deadline if deadline is not None else None
+        self.failures: Dict[str, str] = {}
+        self._stages: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...], Optional[float],
+                                      Optional[Callable[[Exception], Any]]]] = {}
+        self._results: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, func: Callable[..., Any], *dependencies: str, timeout: Optional[float] = None,
+            fallback: Optional[Callable[[Exception], Any]] = None) -> None:
+        """
+        Add a stage
+
+        Args:
+            name: Stage name
+            func: Called with the result of each dependency, in order
+            *dependencies: Names of stages added before this one
+            timeout: Seconds func may take once its dependencies are ready (None waits indefinitely)
+            fallback: Called with the error when the stage fails or times out; its value
+                is used as the stage's result (without a fallback the error propagates)
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage {name} is already defined")
+        missing = [dependency for dependency in dependencies if dependency not in self._stages]
+        if missing:
+            raise ValueError(f"Stage {name} depends on undefined stages: {', '.join(missing)}")
+        self._stages[name] = (func, dependencies, timeout, fallback)
+
+    def memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the value stored under key, computing it the first time
+
+        Exceptions are stored too, and re-raised for every caller.
+        """
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = self._results[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(value)
+        return value
+
+    def get(self, name: str) -> Any:
+        """Result of a stage (computing it and its dependencies as needed)"""
+        return self.memo(('stage', name), lambda: self._compute(name))
+
+    def _compute(self, name: str) -> Any:
+        func, dependencies, timeout, fallback = self._stages[name]
+        try:
+            args = [self.get(dependency) for dependency in dependencies]
+            if timeout is None:
+                return func(*args)
+            deadline = time.monotonic() + timeout
+            if self.deadline is not None:
+                deadline = min(deadline, self.deadline)
+            return self._call_with_timeout(name, func, args, deadline)
+        except Exception as e:
+            if fallback is None:
+                raise
+            logger.error(f"Stage {name} failed, using its fallback: {str(e)}")
+            with self._lock:
+                self.failures[name] = str(e)
+            return fallback(e)
+
+    def _call_with_timeout(self, name: str, func: Callable[..., Any], args: list, deadline: float) -> Any:
+        """
+        Call func on the timeout executor and wait for it until deadline (time.monotonic())
+
+        A running call cannot be stopped, so one that runs out of time keeps its
+        executor thread until it returns and its result is discarded; a call still
+        queued when the deadline passes is cancelled.
+        """
+        if time.monotonic() >= deadline:
+            raise StageTimeoutError(f"{name} did not start in time")
+        executor = self.timeout_executor or get_stage_timeout_executor()
+        future = executor.submit(func, *args)
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            future.cancel()
+            raise StageTimeoutError(f"{name} did not finish in time")
+
+    def run(self, *names: str) -> Dict[str, Any]:
+        """
+        Compute several stages concurrently
+
+        Each stage runs on the executor and resolves its own dependencies, so
+        independent branches proceed side by side while shared stages still run once.
+
+        Args:
+            *names: Stages to compute
+
+        Returns:
+            Dict: Stage name -> result (the first failing stage's exception is raised)
+        """
+        if self.executor is None or len(names) < 2:
+            return {name: self.get(name) for name in names}
+        futures = {name: self.executor.submit(self.get, name) for name in names}
+        return {name: future.result() for name, future in futures.items()}
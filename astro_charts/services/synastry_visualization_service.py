@@ -1,7 +1,13 @@
 import altair as alt
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
 import logging
+from ..utils.artifact_utils import ChartArtifact, render_chart_pair
+from ..utils.svg_chart_utils import (
+    PANEL_SPACING, RENDER_MODE_FAST, SvgCanvas, horizontal_bar_panel, interpolate_color,
+    render_svg_pair, resolve_render_mode, stacked_bar_panel
+)
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +27,10 @@ class SynastryVisualizationService:
     
     def prepare_data(self, synastry_data: Dict[str, Any]) -> pd.DataFrame:
         """Prepare data for visualization"""
+        return pd.DataFrame(self._linkage_records(synastry_data))
+
+    def _linkage_records(self, synastry_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Count and tooltip description of each linkage type"""
         linkage_counts = {
             'Cinderella': len(synastry_data.get('cinderella_linkages', [])),
             'Romance': len(synastry_data.get('romance_linkages', [])),
@@ -29,13 +39,10 @@ class SynastryVisualizationService:
             'Saturn Clashes': len(synastry_data.get('saturn_clashes', []))  # Renamed and moved to end
         }
         
-        # Create DataFrame
-        df = pd.DataFrame([
+        return [
             {'type': k, 'count': v, 'description': self._get_aspect_descriptions(synastry_data, k.lower().replace(' clashes', ''))}
             for k, v in linkage_counts.items()
-        ])
-        
-        return df
+        ]
     
     def _get_aspect_descriptions(self, data: Dict[str, Any], aspect_type: str) -> str:
         """Get formatted descriptions of aspects for tooltips"""
@@ -55,8 +62,17 @@ class SynastryVisualizationService:
             
         return "\n".join(descriptions)
 
-    def create_visualization(self, synastry_data: Dict[str, Any], output_path: str, easy_chart_html_path: str) -> str:
+    def create_visualization(self, synastry_data: Dict[str, Any], output_path: str, easy_chart_html_path: str,
+                             render_mode: Optional[str] = None) -> Tuple[ChartArtifact, ChartArtifact]:
+        """Create SVG and HTML relationship charts, named after output_path and easy_chart_html_path
+
+        render_mode "fast" draws the SVG directly (see create_fast_visualization)
+        instead of going through Altair; None uses VISUALIZATION_RENDER_MODE.
+        """
         try:
+            if resolve_render_mode(render_mode) == RENDER_MODE_FAST:
+                return self.create_fast_visualization(synastry_data, output_path, easy_chart_html_path)
+
             # Prepare the data for aspects
             df_aspects = self.prepare_data(synastry_data)
             
@@ -137,31 +153,22 @@ class SynastryVisualizationService:
                 anchor='middle'
             )
             
-            # Save the chart
-            final_chart.save(output_path)
-            final_chart.save(easy_chart_html_path)
-            
-            
-            return output_path, easy_chart_html_path
+            # Render the chart
+            return render_chart_pair(final_chart, output_path, easy_chart_html_path)
             
         except Exception as e:
             logger.error(f"Error creating synastry visualization: {str(e)}")
             raise
 
-    def _create_aspects_chart(self, df: pd.DataFrame, person1_name: str, person2_name: str) -> alt.Chart:
-        """Create the aspects bar chart with split coloring for critical Saturn Clashes"""
-        # Get the maximum count and create array of tick values
-        max_count = max(df['count'])
-        tick_values = list(range(0, int(max_count) + 2))
-        
+    def _split_saturn_clashes(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Linkage rows with a subtype, Saturn Clashes split into critical and regular ones"""
         # Define critical planets for Saturn Clashes
         critical_planets = ['chiron', 'pluto', 'neptune', 'venus', 'jupiter', 'uranus', 'sun']
         
         # Create separate rows for critical and regular Saturn Clashes
-        df = df.copy()
         new_rows = []
         
-        for idx, row in df.iterrows():
+        for row in records:
             if row['type'] == 'Saturn Clashes':
                 # Count critical clashes
                 critical_count = sum(1 for planet in critical_planets 
@@ -191,7 +198,15 @@ class SynastryVisualizationService:
                     'description': row['description']
                 })
         
-        df_new = pd.DataFrame(new_rows)
+        return new_rows
+
+    def _create_aspects_chart(self, df: pd.DataFrame, person1_name: str, person2_name: str) -> alt.Chart:
+        """Create the aspects bar chart with split coloring for critical Saturn Clashes"""
+        # Get the maximum count and create array of tick values
+        max_count = max(df['count'])
+        tick_values = list(range(0, int(max_count) + 2))
+        
+        df_new = pd.DataFrame(self._split_saturn_clashes(df.to_dict('records')))
         
         # Define colors including darker shade for critical Saturn Clashes
         colors = self.colors.copy()
@@ -287,6 +302,10 @@ class SynastryVisualizationService:
 
     def _prepare_marriage_dates_data(self, marriage_dates: List[Dict]) -> pd.DataFrame:
         """Prepare marriage dates data for visualization"""
+        return pd.DataFrame(self._marriage_date_records(marriage_dates))
+
+    def _marriage_date_records(self, marriage_dates: List[Dict]) -> List[Dict[str, Any]]:
+        """Transit counts, score and tooltip text of each potential marriage date"""
         records = []
         logger.info(f"Marriage Dates: {marriage_dates}")
         for date_info in marriage_dates:
@@ -356,7 +375,7 @@ class SynastryVisualizationService:
                 'turbulent_aspects': turbulent_text
             })
         
-        return pd.DataFrame(records)
+        return records
 
     def _create_marriage_dates_chart(self, df: pd.DataFrame) -> alt.Chart:
         """Create the marriage dates visualization with stacked bars"""
@@ -434,3 +453,77 @@ class SynastryVisualizationService:
         )
         
         return marriage_chart
+
+    def create_fast_visualization(self, synastry_data: Dict[str, Any], output_path: str,
+                                  easy_chart_html_path: str) -> Tuple[ChartArtifact, ChartArtifact]:
+        """Draw the linkage, score and marriage date charts straight to SVG
+
+        Same panels, colors and hover texts as the Altair version, laid out from
+        the linkage and marriage date records without building DataFrames.
+        """
+        person1_name = synastry_data['person1']['subject']['name']
+        person2_name = synastry_data['person2']['subject']['name']
+
+        canvas = SvgCanvas()
+        canvas.title(20, 26, f"Relationship Analysis: {person1_name} & {person2_name}",
+                     "Hover over elements for details", size=20)
+        top = 50.0
+
+        # Linkages, Saturn Clashes split into critical and regular ones
+        subtype_colors = {**self.colors, 'Critical': '#B22222', 'Regular': self.colors['Saturn Clashes']}
+        linkage_rows: Dict[str, List[Tuple[float, str, str]]] = {}
+        for row in self._split_saturn_clashes(self._linkage_records(synastry_data)):
+            linkage_rows.setdefault(row['type'], []).append((
+                row['count'], subtype_colors[row['subtype']],
+                f"{row['type']} ({row['subtype']}): {row['count']}\n{row['description']}"
+            ))
+        linkage_rows = {linkage_type: linkage_rows.get(linkage_type, []) for linkage_type in self.colors}
+        max_count = max(sum(segment[0] for segment in segments) for segments in linkage_rows.values())
+        top = horizontal_bar_panel(
+            canvas, 0, top, list(linkage_rows.items()), "Linkages", x_max=max_count + 1,
+            x_title='Number of Linkages'
+        ) + PANEL_SPACING
+
+        # Compatibility scores on a red-yellow-green scale
+        scores = synastry_data.get('compatibility_scores', {})
+        score_rows = []
+        for category in ['Romance', 'Compatibility', 'Longevity', 'Overall']:
+            score = scores.get(category.lower(), 0)
+            color = interpolate_color(score, [0, 50, 100], ['#ff6b6b', '#ffd93d', '#4CAF50'])
+            score_rows.append((category, [(score, color, f"{category}: {score:.0f}")]))
+        top = horizontal_bar_panel(
+            canvas, 0, top, score_rows, "Compatibility Scores", x_max=100, x_title='Score',
+            track='#eee', value_labels=True
+        ) + PANEL_SPACING
+
+        # Potential marriage dates with their score line
+        marriage_dates = synastry_data.get('potential_marriage_dates', {}).get('matching_dates', [])
+        if marriage_dates:
+            records = self._marriage_date_records(marriage_dates)
+            labels = [str(record['date']) for record in records]
+            tooltips = {
+                transit_type: [
+                    f"{record['date']}\n{transit_type}: {record[transit_type]}\n"
+                    f"Cinderella Transits: {record['cinderella_aspects']}\n"
+                    f"Turbulent Transits: {record['turbulent_aspects']}"
+                    for record in records
+                ]
+                for transit_type in ('Cinderella', 'Turbulent')
+            }
+            columns = {
+                transit_type: np.array([record[transit_type] for record in records])
+                for transit_type in ('Cinderella', 'Turbulent')
+            }
+            score_values = np.array([record['score'] for record in records])
+            stacked_bar_panel(
+                canvas, 0, top, labels, columns,
+                {'Cinderella': self.colors['Cinderella'], 'Turbulent': self.colors['Saturn Clashes']},
+                title="Potential Marriage Dates Analysis", subtitle="Hover over bars for details",
+                y_title='Number of Transits', y_max=int((columns['Cinderella'] + columns['Turbulent']).max()) + 1,
+                tooltips=tooltips, height=300, label_angle=-45, legend_title='Transit Type',
+                line=('Date Score', score_values, 'blue',
+                      [f"{label}\nDate Score: {score}" for label, score in zip(labels, score_values)])
+            )
+
+        return render_svg_pair(canvas, f"Relationship Analysis: {person1_name} & {person2_name}",
+                               output_path, easy_chart_html_path)
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from ..utils.cache_utils import get_persistent_cache
+
+logger = logging.getLogger(__name__)
+
+# Set to 0 to compute every day of a transit loop from scratch
+TRANSIT_DAY_CACHE_ENABLED = os.getenv('TRANSIT_DAY_CACHE_ENABLED', '1').lower() not in ('0', 'false', 'no')
+TRANSIT_DAY_CACHE_TTL_DAYS = float(os.getenv('TRANSIT_DAY_CACHE_TTL_DAYS', '30'))
+# A day is ~7.5 KB of JSON, so the default keeps ~150 MB on disk: about 55 year-long loops
+TRANSIT_DAY_CACHE_MAX_ENTRIES = int(os.getenv('TRANSIT_DAY_CACHE_MAX_ENTRIES', '20000'))
+
+# Bump when the layout or calculation of daily transit data changes, so old days are not reused
+TRANSIT_DAY_CACHE_VERSION = 1
+
+
+class TransitDayCache:
+    """Daily transit chart data kept on disk per natal chart, date, time and zodiac
+
+    A transit loop asks for one record per day; rerunning it with a shifted or
+    extended range only needs the days that were not computed before. Records are
+    stored as JSON strings so every read hands out a fresh copy the caller may
+    modify. Keys start with a fingerprint of the natal chart, which covers the
+    birth moment, place, zodiac settings and the name and location text the
+    records contain.
+    """
+
+    CACHE_FILENAME = "transit_day_cache.sqlite"
+    MEMORY_SIZE = 512
+
+    def __init__(self):
+        self.cache = get_persistent_cache(
+            self.CACHE_FILENAME,
+            ttl_seconds=TRANSIT_DAY_CACHE_TTL_DAYS * 24 * 60 * 60,
+            max_entries=TRANSIT_DAY_CACHE_MAX_ENTRIES,
+            memory_size=self.MEMORY_SIZE
+        )
+
+    @staticmethod
+    def fingerprint(natal_key: str, name: str, location: str) -> str:
+        """
+        Fingerprint of a natal chart
+
+        Args:
+            natal_key: Key from NatalCache.key (birth moment, place and zodiac settings)
+            name: Subject name, as it appears in the daily records
+            location: "City, Nation" text, as it appears in the daily records
+
+        Returns:
+            str: Short hex digest
+        """
+        text = f"v{TRANSIT_DAY_CACHE_VERSION}|{natal_key}|{name}|{location}"
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()[:20]
+
+    @staticmethod
+    def key(fingerprint: str, date_str: str, transit_hour: int, transit_minute: int) -> str:
+        return f"{fingerprint}|{date_str}|{int(transit_hour):02d}:{int(transit_minute):02d}"
+
+    def get_days(self, fingerprint: str, dates: List[str],
+                 transit_hour: int, transit_minute: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the cached records of several days
+
+        Args:
+            fingerprint: Natal chart fingerprint
+            dates: Dates in YYYY-MM-DD format
+            transit_hour: Local hour of each daily transit
+            transit_minute: Local minute of each daily transit
+
+        Returns:
+            Dict: Date string -> transit chart data for the days found
+        """
+        keys = {self.key(fingerprint, date_str, transit_hour, transit_minute): date_str for date_str in dates}
+        found = self.cache.get_many(list(keys))
+        return {keys[key]: json.loads(payload) for key, payload in found.items()}
+
+    def set_days(self, fingerprint: str, days: Dict[str, Dict[str, Any]],
+                 transit_hour: int, transit_minute: int) -> None:
+        """Store daily records (date string -> transit chart data)"""
+        try:
+            self.cache.set_many({
+                self.key(fingerprint, date_str, transit_hour, transit_minute): json.dumps(data)
+                for date_str, data in days.items()
+            })
+        except (TypeError, ValueError) as e:
+            logger.error(f"Could not cache transit days for {fingerprint}: {str(e)}")
+
+
+_transit_day_cache: Optional[TransitDayCache] = None
+_transit_day_cache_lock = threading.Lock()
+
+def get_transit_day_cache() -> Optional[TransitDayCache]:
+    """Return the process-wide transit day cache, or None when disabled"""
+    global _transit_day_cache
+    if not TRANSIT_DAY_CACHE_ENABLED:
+        return None
+    with _transit_day_cache_lock:
+        if _transit_day_cache is None:
+            _transit_day_cache = TransitDayCache()
+        return _transit_day_cache
@@ -1,7 +1,5 @@
-from datetime import datetime, timedelta
 import logging
-from typing import List, Dict, Any, Optional
-import json
+from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -29,27 +27,14 @@ class TransitLoopService:
             List of transit chart data dictionaries
         """
         try:
-            transit_data = []
-            current_date = datetime.strptime(from_date, '%Y-%m-%d')
-            end_date = datetime.strptime(to_date, '%Y-%m-%d')
-            
-            while current_date <= end_date:
-                logger.info(f"Processing transit for {current_date.date()}")
-                
-                data = self.chart_creator.create_transit_chart(
-                    transit_year=current_date.year,
-                    transit_month=current_date.month,
-                    transit_day=current_date.day,
-                    transit_hour=transit_hour,
-                    transit_minute=transit_minute
-                )
-                
-                if data:  # Only append if we got valid data
-                    # Parse the JSON string into a dictionary
-                    chart_data = json.loads(data) if isinstance(data, str) else data
-                    transit_data.append(chart_data)
-                
-                current_date += timedelta(days=1)
+            # Data-only transits for the whole range; no chart is rendered per day
+            transit_days = self.chart_creator.get_transit_range_data_incremental(
+                from_date,
+                to_date,
+                transit_hour=transit_hour,
+                transit_minute=transit_minute
+            )
+            transit_data = [chart_data for chart_data in transit_days.values() if chart_data]
             
             logger.info(f"Processed {len(transit_data)} transit charts")
             
@@ -72,11 +57,6 @@ class TransitLoopService:
                 "natal_super_aspects": transit_data[0].get("natal_super_aspects", [])
             }
             
-            # Print the formatted JSON to console
-            print("\nTransit Chart Data:")
-            print("==================")
-            print(json.dumps(output_data, indent=2))
-            
             return output_data
             
         except Exception as e:
@@ -5,6 +5,11 @@ from datetime import datetime
 import logging
 import tempfile
 import os
+import numpy as np
+from ..utils.artifact_utils import ChartArtifact, render_chart_pair
+from ..utils.svg_chart_utils import (
+    PANEL_SPACING, RENDER_MODE_FAST, SvgCanvas, render_svg_pair, resolve_render_mode, stacked_bar_panel
+)
 
 logger = logging.getLogger(__name__)
 
@@ -106,8 +111,17 @@ class TransitLoopMidpointVisualizationService:
         else:
             return 10  # Thinner bars for many dates
 
-    def create_visualization(self, chart_data: Dict[str, Any], output_path: str, html_path: str) -> Tuple[Optional[str], Optional[str]]:
+    def create_visualization(self, chart_data: Dict[str, Any], output_path: str, html_path: str,
+                             render_mode: Optional[str] = None) -> Tuple[Optional[ChartArtifact], Optional[ChartArtifact]]:
+        """Create SVG and HTML visualizations of midpoint activations, named after output_path and html_path
+
+        render_mode "fast" draws the SVG directly (see create_fast_visualization)
+        instead of going through Altair; None uses VISUALIZATION_RENDER_MODE.
+        """
         try:
+            if resolve_render_mode(render_mode) == RENDER_MODE_FAST:
+                return self.create_fast_visualization(chart_data, output_path, html_path)
+
             # Prepare the data
             df = self.prepare_data(chart_data)
             
@@ -147,11 +161,8 @@ class TransitLoopMidpointVisualizationService:
             else:
                 final_chart = overall_chart
 
-            # Save visualizations
-            final_chart.save(output_path)
-            final_chart.save(html_path)
-            
-            return output_path, html_path
+            # Render visualizations
+            return render_chart_pair(final_chart, output_path, html_path)
 
         except Exception as e:
             logger.error(f"Error creating transit loop midpoint visualization: {str(e)}")
@@ -198,4 +209,70 @@ class TransitLoopMidpointVisualizationService:
             },
             width=600,
             height=200
-        )
\ No newline at end of file
+        )
+
+    def prepare_columns(self, transit_data: Dict[str, Any]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Daily activation counts per category as columns, in date order
+
+        Args:
+            transit_data: Midpoint transit loop results
+
+        Returns:
+            Tuple: Dates (datetime64[D]) and category -> count on each date
+        """
+        activations = transit_data.get('cosmobiology_activations', {})
+        date_strs = list(activations)
+        dates = np.array(date_strs, dtype='datetime64[D]')
+        order = np.argsort(dates, kind='stable')
+
+        categories = list(self.categories.keys())
+        column = {category: i for i, category in enumerate(categories)}
+        counts = np.zeros((len(categories), len(date_strs)), dtype=int)
+        for day, date_index in enumerate(order):
+            for activation in activations[date_strs[date_index]]:
+                row = column.get(activation['category'])
+                if row is not None:
+                    counts[row, day] += 1
+        return dates[order], {category: counts[i] for i, category in enumerate(categories)}
+
+    def create_fast_visualization(self, chart_data: Dict[str, Any], output_path: str,
+                                  html_path: str) -> Tuple[Optional[ChartArtifact], Optional[ChartArtifact]]:
+        """Draw the overall and monthly activation charts straight to SVG
+
+        Same panels as the Altair version: an overall view, then one chart per
+        month when the loop spans several months.
+        """
+        dates, counts = self.prepare_columns(chart_data)
+        if not len(dates):
+            logger.warning("No data found for visualization")
+            return None, None
+
+        daily_aspects = chart_data.get('daily_aspects', {})
+        name = next(iter(daily_aspects.values()))['natal']['name']
+        first, last = dates[[0, -1]].astype(object)
+        date_range = first.strftime('%B %Y')
+        if first.month != last.month:
+            date_range += f" - {last.strftime('%B %Y')}"
+        labels = [date.strftime('%b %d') for date in dates.astype(object)]
+
+        def panel(top: float, days: np.ndarray, panel_range: str, subtitle: str) -> float:
+            columns = {category: column[days] for category, column in counts.items()}
+            y_max = max(5, int(sum(columns.values()).max()))
+            return stacked_bar_panel(
+                canvas, 0, top, [labels[i] for i in days], columns, self.categories,
+                title=f"Transit Loop Midpoint Activations for {name} ({panel_range})",
+                subtitle=subtitle, y_title='Number of Activations', y_max=y_max,
+                width=max(600, min(4 * len(days), 1600)), height=200, legend_title='category'
+            ) + PANEL_SPACING
+
+        canvas = SvgCanvas()
+        top = panel(0.0, np.arange(len(dates)), date_range, "Overall View")
+
+        months = dates.astype('datetime64[M]')
+        boundaries = np.flatnonzero(months[1:] != months[:-1]) + 1
+        if len(boundaries):
+            for days in np.split(np.arange(len(dates)), boundaries):
+                top = panel(top, days, dates[days[0]].astype(object).strftime('%B %Y'), "Monthly View")
+
+        return render_svg_pair(canvas, f"Transit Loop Midpoint Activations for {name}", output_path, html_path)
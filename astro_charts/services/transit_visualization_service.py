@@ -5,6 +5,11 @@ from datetime import datetime
 import logging
 import tempfile
 import os
+import numpy as np
+from ..utils.artifact_utils import ChartArtifact, render_chart_pair
+from ..utils.svg_chart_utils import (
+    PANEL_SPACING, RENDER_MODE_FAST, SvgCanvas, render_svg_pair, resolve_render_mode, stacked_bar_panel
+)
 
 logger = logging.getLogger(__name__)
 
@@ -217,10 +222,18 @@ class TransitVisualizationService:
         self, 
         transit_data: Dict[str, Any], 
         output_path: str,
-        html_path: str
-    ) -> Tuple[Optional[str], Optional[str]]:
-        """Create and save visualizations of transit aspects over time"""
+        html_path: str,
+        render_mode: Optional[str] = None
+    ) -> Tuple[Optional[ChartArtifact], Optional[ChartArtifact]]:
+        """Create SVG and HTML visualizations of transit aspects over time, named after output_path and html_path
+
+        render_mode "fast" draws the SVG directly (see create_fast_visualization)
+        instead of going through Altair; None uses VISUALIZATION_RENDER_MODE.
+        """
         try:
+            if resolve_render_mode(render_mode) == RENDER_MODE_FAST:
+                return self.create_fast_visualization(transit_data, output_path, html_path)
+
             # Prepare the data
             df = self.prepare_data(transit_data)
             
@@ -248,13 +261,104 @@ class TransitVisualizationService:
             else:
                 all_charts = alt.vconcat(*monthly_charts)
             
-            # Save visualizations
-            all_charts.save(output_path)
-            all_charts.save(html_path)
+            # Render visualizations
+            artifacts = render_chart_pair(all_charts, output_path, html_path)
             
-            logger.info(f"Successfully saved visualizations to {output_path} and {html_path}")
-            return output_path, html_path
+            logger.info(f"Successfully rendered visualizations {output_path} and {html_path}")
+            return artifacts
                 
         except Exception as e:
             logger.error(f"Error creating transit visualization: {str(e)}")
-            return None, None
\ No newline at end of file
+            return None, None
+
+    def _transit_collections(self, transit_data: Dict[str, Any]) -> Dict[str, Dict[str, List[Dict]]]:
+        """Aspect type -> date -> transits"""
+        return {
+            'Cinderella': transit_data.get('cinderella_transits', {}),
+            'Golden': transit_data.get('golden_transits', {}),
+            'Turbulent': transit_data.get('turbulent_transits', {})
+        }
+
+    def prepare_columns(self, transit_data: Dict[str, Any]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Daily aspect counts as columns, in date order
+
+        Args:
+            transit_data: Transit loop results
+
+        Returns:
+            Tuple: Dates (datetime64[D]) and aspect type -> count on each date
+        """
+        date_strs = list(transit_data.get('daily_aspects', {}))
+        dates = np.array(date_strs, dtype='datetime64[D]')
+        order = np.argsort(dates, kind='stable')
+        date_strs = [date_strs[i] for i in order]
+
+        collections = self._transit_collections(transit_data)
+        counts = {
+            aspect_type: np.fromiter((len(collection.get(date_str, ())) for date_str in date_strs),
+                                     dtype=int, count=len(date_strs))
+            for aspect_type, collection in collections.items()
+        }
+        return dates[order], counts
+
+    def create_fast_visualization(
+        self,
+        transit_data: Dict[str, Any],
+        output_path: str,
+        html_path: str
+    ) -> Tuple[Optional[ChartArtifact], Optional[ChartArtifact]]:
+        """Draw the yearly and monthly transit charts straight to SVG
+
+        Same panels as the Altair version: a yearly overview when the loop spans
+        more than a month, then one chart per month with the transit details in
+        each bar's hover text. Bar positions come from the count columns in one
+        array pass, so the cost grows with the number of bars only.
+        """
+        dates, counts = self.prepare_columns(transit_data)
+        if not len(dates):
+            logger.warning("No aspect data found, creating empty visualization")
+            return None, None
+
+        daily_aspects = transit_data.get('daily_aspects', {})
+        subject_name = next(iter(daily_aspects.values()))['natal']['name']
+        date_strs = dates.astype(str)
+        labels = [date.strftime('%b %d') for date in dates.astype(object)]
+        collections = self._transit_collections(transit_data)
+
+        canvas = SvgCanvas()
+        top = 0.0
+        if (dates[-1] - dates[0]).astype(int) > 31:  # More than one month
+            first, last = dates[[0, -1]].astype(object)
+            date_range = f"({first.strftime('%B %Y')} - {last.strftime('%B %Y')})"
+            top = stacked_bar_panel(
+                canvas, 0, top, labels, counts, self.colors,
+                title=f'{subject_name} - Transit Aspects {date_range}',
+                y_title='Number of Aspects', y_max=10, width=max(500, min(4 * len(dates), 1600)),
+                height=300, label_angle=-45, legend_title='Aspect Type'
+            ) + PANEL_SPACING
+
+        months = dates.astype('datetime64[M]')
+        boundaries = np.flatnonzero(months[1:] != months[:-1]) + 1
+        for month in np.split(np.arange(len(dates)), boundaries):
+            month_labels = [labels[i] for i in month]
+            tooltips = {
+                aspect_type: [
+                    f"{labels[i]}\n{aspect_type}: {counts[aspect_type][i]}\n"
+                    f"{self._format_transit_details(collection.get(date_strs[i], []))}"
+                    for i in month
+                ]
+                for aspect_type, collection in collections.items()
+            }
+            month_year = dates[month[0]].astype(object).strftime('%B %Y')
+            top = stacked_bar_panel(
+                canvas, 0, top, month_labels,
+                {aspect_type: column[month] for aspect_type, column in counts.items()}, self.colors,
+                title=f'{subject_name} - Transit Aspects ({month_year})',
+                y_title='Number of Aspects', y_max=10, tooltips=tooltips, width=400, height=300,
+                legend_title='Aspect Type'
+            ) + PANEL_SPACING
+
+        artifacts = render_svg_pair(canvas, f'{subject_name} - Transit Aspects', output_path, html_path)
+        logger.info(f"Rendered {len(dates)} days of transit visualizations {output_path} and {html_path}")
+        return artifacts
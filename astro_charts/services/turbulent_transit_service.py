@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import logging
 
+from ..models.chart_state import BODIES, BODY_INDEX, ChartState
+from .linkage_engine import AspectCheck, LinkageEngine, LinkageRule
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -49,6 +52,32 @@ class TurbulentTransitService:
             'mars', 'chiron'
         ]
 
+        # One rule per transit type over (transit planet, natal planet) pairs
+        type_pairs = {}
+        for transit_planet in BODIES:
+            for natal_planet in BODIES:
+                transit_type = self.get_transit_type(transit_planet, natal_planet)
+                if transit_type:
+                    type_pairs.setdefault(transit_type, []).append((transit_planet, natal_planet))
+
+        checks = [AspectCheck(name, data['angle'], data['orb']) for name, data in self.valid_aspects.items()]
+        self.aspect_order = {name: k for k, name in enumerate(self.valid_aspects)}
+        self.engine = LinkageEngine([
+            LinkageRule(name=transit_type, planets1=list(BODIES), planets2=list(BODIES), pairs=pairs, checks=checks)
+            for transit_type, pairs in type_pairs.items()
+        ])
+
+    def get_transit_type(self, transit_planet: str, natal_planet: str) -> Optional[str]:
+        """Turbulent transit type of a transit/natal planet combination, if any"""
+        pair = (transit_planet.lower(), natal_planet.lower())
+        if pair in self.heartbreak_pairs:
+            return 'heartbreak'
+        if pair in self.nuclear_pairs:
+            return 'nuclear'
+        if pair[0] == 'saturn' and pair[1] in self.saturn_sensitive_planets:
+            return 'saturn'
+        return None
+
     def calculate_angle_distance(self, pos1: float, pos2: float) -> float:
         """Calculate the shortest angular distance between two positions"""
         diff = abs(pos1 - pos2)
@@ -74,57 +103,43 @@ class TurbulentTransitService:
         
         return min(round(base_score * multiplier), 10)
 
-    def analyze_turbulent_transits(self, natal_data: Dict, transit_data: Dict) -> List[Dict]:
-        """Analyze chart data for turbulent transits"""
+    def analyze_turbulent_transits(self, natal_data: Union[Dict, ChartState],
+                                   transit_data: Union[Dict, ChartState]) -> List[Dict]:
+        """Analyze chart data for turbulent transits
+
+        Args:
+            natal_data: Natal ChartState, or natal chart data with a 'subject' level
+            transit_data: Transit ChartState, or the transit subject data
+        """
         turbulent_transits = []
         
         try:
-            natal_planets = natal_data['subject']['planets']
-            natal_subject_name = natal_data['subject']['name']
-            
-            transit_planets = transit_data['planets']
-
-
-            # Check each combination for turbulent aspects
-            for transit_planet, t_data in transit_planets.items():
-                for natal_planet, n_data in natal_planets.items():
-                    
-                    # Determine transit type
-                    transit_type = None
-                    if (transit_planet.lower(), natal_planet.lower()) in self.heartbreak_pairs:
-                        transit_type = 'heartbreak'
-                    elif (transit_planet.lower(), natal_planet.lower()) in self.nuclear_pairs:
-                        transit_type = 'nuclear'
-                    elif transit_planet.lower() == 'saturn' and natal_planet.lower() in self.saturn_sensitive_planets:
-                        transit_type = 'saturn'
-                    
-                    if not transit_type:
-                        continue
-
-                    # Check each aspect
-                    for aspect_name, aspect_data in self.valid_aspects.items():
-                        angle_diff = self.calculate_angle_distance(
-                            float(t_data['abs_pos']), 
-                            float(n_data['abs_pos'])
-                        )
-                        
-                        if abs(angle_diff - aspect_data['angle']) <= aspect_data['orb']:
-                            impact_score = self.calculate_impact_score(transit_type, aspect_name)
-                            
-                            turbulent_transits.append({
-                                'natal_subject_name': natal_subject_name,
-                                'natal_planet': natal_planet,
-                                'transit_planet': transit_planet,
-                                'aspect_name': aspect_name,
-                                'aspect_degrees': aspect_data['angle'],
-                                'orbit': round(abs(angle_diff - aspect_data['angle']), 4),
-                                'actual_degrees': round(angle_diff, 4),
-                                'transit_type': transit_type,
-                                'impact_score': impact_score
-                            })
+            natal = ChartState.coerce(natal_data)
+            transit = ChartState.coerce(transit_data)
+            natal_subject_name = natal.name
+
+            # Check every combination of every transit type in one pass
+            hits = self.engine.evaluate(transit, natal)
+            for transit_type, type_hits in hits.items():
+                for hit in type_hits:
+                    turbulent_transits.append({
+                        'natal_subject_name': natal_subject_name,
+                        'natal_planet': hit['planet2_name'],
+                        'transit_planet': hit['planet1_name'],
+                        'aspect_name': hit['aspect_name'],
+                        'aspect_degrees': hit['aspect_degrees'],
+                        'orbit': hit['orbit'],
+                        'actual_degrees': hit['actual_degrees'],
+                        'transit_type': transit_type,
+                        'impact_score': self.calculate_impact_score(transit_type, hit['aspect_name'])
+                    })
 
+            # Transit planet, natal planet and aspect order, then most severe first
+            turbulent_transits.sort(key=lambda x: (
+                BODY_INDEX[x['transit_planet']], BODY_INDEX[x['natal_planet']], self.aspect_order[x['aspect_name']]
+            ))
             return sorted(turbulent_transits, key=lambda x: x['impact_score'], reverse=True)
 
         except Exception as e:
             logger.error(f"Error analyzing turbulent transits: {str(e)}")
-            raise
\ No newline at end of file
+            raise
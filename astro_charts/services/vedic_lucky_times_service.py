@@ -3,7 +3,8 @@ from datetime import datetime, timedelta
 import os
 import math
 import traceback
-from typing import Dict, Any, List, Optional, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 # Import utility modules
 from ..utils.yogi_point_utils import (
@@ -20,7 +21,7 @@ from ..utils.dasha_utils import (
 )
 from ..utils.chart_utils import (
     sanitize_response_for_json, calculate_d9_chart, find_stacked_alignments,
-    find_internally_stacked_dates, get_nearest_future_date
+    find_internally_stacked_dates, get_nearest_future_date, extract_reference_time
 )
 from ..utils.lucky_times_utils import (
     calculate_jupiter_pof_last_conjunction, get_next_venus_aspects,
@@ -42,6 +43,15 @@ from ..utils.pof_utils import calculate_part_of_fortune_rahu_conjunctions, calcu
 
 from ..utils.location_utils import calculate_location_specific_yogi_alignments
 
+from ..utils.async_utils import get_stage_executor
+
+from .stage_graph import StageGraph
+
+# Seconds the analyses (Bullseye periods, Yogi configurations, Part of Fortune conjunctions,
+# location alignments) may take together before the response goes out without the unfinished
+# ones (0 waits indefinitely)
+VEDIC_ANALYSIS_TIMEOUT_SECONDS = float(os.getenv('VEDIC_ANALYSIS_TIMEOUT_SECONDS', '60'))
+
 class VedicLuckyTimesService:
     def __init__(self):
         pass
@@ -56,8 +66,8 @@ class VedicLuckyTimesService:
     def get_available_dasha_lord(self, dasha_lord: str, available_planets: List[str]) -> str:
         return get_available_dasha_lord(dasha_lord, available_planets)
 
-    def find_closest_aspect(self, current_pos: float, daily_motion: float, yogi_point: float, is_retrograde: bool = False, orb: float = 3.0, reference_time: Optional[datetime] = None) -> Dict[str, Any]:
-        return find_closest_aspect(current_pos, daily_motion, yogi_point, is_retrograde, orb, reference_time)
+    def find_closest_aspect(self, current_pos: float, daily_motion: float, yogi_point: float, is_retrograde: bool = False, orb: float = 3.0, reference_time: Optional[datetime] = None, planet: Optional[str] = None) -> Dict[str, Any]:
+        return find_closest_aspect(current_pos, daily_motion, yogi_point, is_retrograde, orb, reference_time, planet)
 
     def calculate_yogi_point(self, natal_data: Dict[str, Any]) -> float:
         return calculate_yogi_point(natal_data)
@@ -68,8 +78,8 @@ class VedicLuckyTimesService:
     def sanitize_response_for_json(self, response: Dict[str, Any]) -> Dict[str, Any]:
         return sanitize_response_for_json(response)
 
-    def find_last_aspect(self, current_pos: float, daily_motion: float, yogi_point: float, is_retrograde: bool = False, orb: float = 3.0, reference_time: Optional[datetime] = None) -> Dict[str, Any]:
-        return find_last_aspect(current_pos, daily_motion, yogi_point, is_retrograde, orb, reference_time)
+    def find_last_aspect(self, current_pos: float, daily_motion: float, yogi_point: float, is_retrograde: bool = False, orb: float = 3.0, reference_time: Optional[datetime] = None, planet: Optional[str] = None) -> Dict[str, Any]:
+        return find_last_aspect(current_pos, daily_motion, yogi_point, is_retrograde, orb, reference_time, planet)
 
     def calculate_ava_yogi_point(self, yogi_point: float) -> float:
         return calculate_ava_yogi_point(yogi_point)
@@ -97,10 +107,13 @@ class VedicLuckyTimesService:
 
     def calculate_alignment_duration(self, exact_time: datetime, slower_planet: str = None, alignment_type: str = "conjunction", orb: float = 3.0) -> Dict[str, Any]:
         return calculate_alignment_duration(exact_time, slower_planet, alignment_type, orb)
+
+    def get_reference_time(self, transit_data: Dict[str, Any], label: str = "") -> datetime:
+        return extract_reference_time(transit_data, label)
     
     # Use the extracted utility functions
     def calculate_jupiter_pof_last_conjunction(self, natal_data: Dict[str, Any], transit_data: Dict[str, Any]) -> Dict[str, Any]:
-        return calculate_jupiter_pof_last_conjunction(natal_data, transit_data)
+        return calculate_jupiter_pof_last_conjunction(natal_data, transit_data, self.get_reference_time(transit_data, "Jupiter-PoF"))
     
     def get_next_venus_aspects(self, natal_data: Dict[str, Any], transit_data: Dict[str, Any], orb: float = 3.0) -> Dict[str, Any]:
         return get_next_venus_aspects(natal_data, transit_data, orb)
@@ -116,19 +129,25 @@ class VedicLuckyTimesService:
                                           ascendant_lord, lord_daily_motion, ascendant_lord_retrograde, orb)
     
     def find_mutual_yogi_ruler_alignments(self, yogi_point: float, duplicate_yogi_planet: str, duplicate_yogi_pos: float, 
-                                        ascendant_pos: float, transit_data: Dict[str, Any], num_forecasts: int = 3) -> List[Dict[str, Any]]:
+                                        ascendant_pos: float, transit_data: Dict[str, Any], num_forecasts: int = 3,
+                                        reference_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
         return find_mutual_yogi_ruler_alignments(yogi_point, duplicate_yogi_planet, duplicate_yogi_pos, 
-                                               ascendant_pos, transit_data, num_forecasts)
+                                               ascendant_pos, transit_data, num_forecasts, reference_time)
     
     def find_yearly_power_alignments(self, yogi_point: float, duplicate_yogi_planet: str, 
                                     duplicate_yogi_pos: float, is_retrograde: bool,
-                                    ascendant_pos: float, orb: float = 3.0) -> List[Dict[str, Any]]:
+                                    ascendant_pos: float, orb: float = 3.0,
+                                    reference_time: Optional[datetime] = None,
+                                    lat: Optional[float] = None, lng: Optional[float] = None) -> List[Dict[str, Any]]:
         return find_yearly_power_alignments(yogi_point, duplicate_yogi_planet, duplicate_yogi_pos, 
-                                           is_retrograde, ascendant_pos, orb)
+                                           is_retrograde, ascendant_pos, orb, reference_time, lat, lng)
     
     # The rest of the service methods that haven't been moved to utility files...
     def process_vedic_lucky_times(self, natal_data: Dict[str, Any], transit_data: Dict[str, Any], birth_date: str, from_date: str, name: str, orb: float = 3.0,
-                                 location_specific_alignments: Dict[str, Any] = None) -> Dict[str, Any]:
+                                 location_specific_alignments: Dict[str, Any] = None,
+                                 current_city: Optional[str] = None, current_nation: Optional[str] = None,
+                                 location_transit_data: Optional[Dict[str, Any]] = None,
+                                 analysis_timeout: Optional[float] = VEDIC_ANALYSIS_TIMEOUT_SECONDS) -> Dict[str, Any]:
         """Process vedic lucky times data and generate comprehensive results
         
         Args:
@@ -139,6 +158,11 @@ class VedicLuckyTimesService:
             name: The person's name
             orb: The orb value to use for aspects (default: 3.0)
             location_specific_alignments: Optional pre-calculated location-specific alignments
+            current_city: Current city, to calculate location-specific alignments alongside the other analyses
+            current_nation: Current nation, to calculate location-specific alignments alongside the other analyses
+            location_transit_data: Transit chart data for the current location (defaults to transit_data)
+            analysis_timeout: Seconds all analyses together may take (None or 0 waits indefinitely);
+                analyses that fail or time out are left out and listed under "failed_analyses"
             
         Returns:
             Dictionary containing comprehensive results
@@ -148,262 +172,40 @@ class VedicLuckyTimesService:
             print(f"Natal data: {natal_data}")
             print(f"Transit data: {transit_data}")
 
-            # --- Determine the reference time for calculations (Added) ---
-            reference_time = None
-            try:
-                # Attempt 1: Get precise UTC time from transit data if available
-                if transit_data and "transit" in transit_data and isinstance(transit_data['transit'], dict):
-                    if "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict):
-                        if "date_utc" in transit_data["transit"]["subject"]:
-                            date_utc_str = transit_data["transit"]["subject"]["date_utc"]
-                            if date_utc_str:
-                                if date_utc_str.endswith('Z'): date_utc_str = date_utc_str[:-1] + '+00:00'
-                                if '.' in date_utc_str:
-                                    parts = date_utc_str.split('.')
-                                    date_utc_str = parts[0] + '.' + parts[1][:6] # Truncate microseconds
-                                    if '+' not in date_utc_str and '-' not in date_utc_str[10:]: date_utc_str += '+00:00'
-                                reference_time = datetime.fromisoformat(date_utc_str)
-                                print(f"[ProcessVedic] SUCCESS: Using reference time from transit.subject.date_utc: {reference_time}")
-
-                # Attempt 2: Reconstruct from transit subject birth_data
-                if reference_time is None and transit_data:
-                     if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                         "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                         "birth_data" in transit_data["transit"]["subject"] and isinstance(transit_data['transit']['subject']['birth_data'], dict)):
-                         t_info = transit_data["transit"]["subject"]["birth_data"]
-                         required_keys = ["date", "time"]
-                         if all(k in t_info for k in required_keys) and t_info["date"] and t_info["time"]:
-                             datetime_str = f"{t_info['date']} {t_info['time']}"
-                             try:
-                                 reference_time = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-                                 print(f"[ProcessVedic] SUCCESS: Using reference time reconstructed from transit.subject.birth_data: {reference_time} (Assumed Local)")
-                             except ValueError as parse_error:
-                                 print(f"[ProcessVedic] DEBUG: Attempt 2 Error parsing date/time string '{datetime_str}': {parse_error}")
-
-                # Attempt 3: Reconstruct from top-level transit info
-                if reference_time is None and transit_data:
-                    required_keys = ["transit_year", "transit_month", "transit_day", "transit_hour", "transit_minute"]
-                    if all(k in transit_data for k in required_keys):
-                        reference_time = datetime(
-                            int(transit_data["transit_year"]), int(transit_data["transit_month"]), int(transit_data["transit_day"]),
-                            int(transit_data["transit_hour"]), int(transit_data["transit_minute"])
-                        )
-                        print(f"[ProcessVedic] SUCCESS: Using reference time reconstructed from top-level transit_data keys: {reference_time} (Assumed Local)")
-
-            except Exception as e:
-                print(f"[ProcessVedic] ERROR: Exception during reference time extraction: {e}")
+            # Every stage below runs once; independent ones run concurrently on the stage executor.
+            # Helpers get the request-scoped calculator, so the Yogi Point, D9 chart, rulers,
+            # day/night status and reference time they share are calculated only once.
+            # Analyses get a stand-in result for when they fail or run out of time. The timeout
+            # is one deadline for all of them: the Part of Fortune conjunctions wait on lucky
+            # dates, which wait on the Bullseye periods and Yogi configurations, and per-stage
+            # timeouts would add up along that chain.
+            timeout = analysis_timeout if analysis_timeout and analysis_timeout > 0 else None
+            graph = StageGraph(get_stage_executor(), deadline=timeout)
+            calc = VedicLuckyTimesContext(graph)
 
-            # Fallback if no time could be extracted
-            if reference_time is None:
-                reference_time = datetime.now()
-                print(f"[ProcessVedic] WARNING: Could not extract reference time from transit_data. Falling back to current time: {reference_time}. Results may drift.")
-            # --- End of added reference_time logic ---
+            def error_list(description):
+                return lambda e: [{"error": f"Error calculating {description}: {str(e)}"}]
 
-            # Calculate Yogi Point
-            yogi_point = self.calculate_yogi_point(natal_data)
-            
-            # Calculate Ava Yogi Point (unlucky point)
-            ava_yogi_point = self.calculate_ava_yogi_point(yogi_point)
-            
-            # Calculate when Jupiter was last conjunct with Part of Fortune
-            jupiter_pof_data = self.calculate_jupiter_pof_last_conjunction(natal_data, transit_data)
-            
-            # Add Jupiter-POF next conjunction to dates_summary when we build the response
-            if "next_conjunction" in jupiter_pof_data:
-                next_conj_data = jupiter_pof_data["next_conjunction"]
-                pof_sign = jupiter_pof_data["part_of_fortune"]["sign"]
-                pof_degree = jupiter_pof_data["part_of_fortune"]["degree"]
-                
-                jupiter_pof_date = {
-                    "date": next_conj_data["date"],
-                    "name": "jupiter_pof_conjunction",
-                    "description": f"Jupiter conjunct Natal Part of Fortune in {pof_sign} {pof_degree}°",
-                    "days_away": next_conj_data["days_away"],
-                    "significance": "Jupiter conjunct your natal Part of Fortune brings a period of expanded fortune and opportunity that occurs approximately once every 12 years.",
-                    "duration": next_conj_data["duration"]
-                }
-            
-            # Calculate D9 chart
-            d9_chart = self.calculate_d9_chart(natal_data)
-            print(f"D9 chart: {d9_chart}")
-            
-            # Get transit planets
-            transit_planets = transit_data["transit"]["subject"]["planets"]
-            print(f"Transit planets: {transit_planets}")
-            
-            # Get ascendant ruler
-            ascendant_sign = natal_data["subject"]["houses"]["ascendant"]["sign"]
-            ascendant_ruler = self.get_ascendant_ruler(ascendant_sign, zodiac_type="Sidereal")
-            
-            # Get ascendant ruler position
-            if ascendant_ruler in transit_planets:
-                current_ruler_pos = transit_planets[ascendant_ruler]["abs_pos"]
-                current_ruler_sign = transit_planets[ascendant_ruler]["sign"]
-                current_ruler_degree = current_ruler_pos % 30
-                ruler_retrograde = transit_planets[ascendant_ruler]["retrograde"]
-            else:
+            def find_ascendant_ruler(transit_planets):
+                ascendant_sign = natal_data["subject"]["houses"]["ascendant"]["sign"]
+                ruler = calc.get_ascendant_ruler(ascendant_sign, zodiac_type="Sidereal")
                 # Fallback to Sun if ruler not in transit
-                ascendant_ruler = "sun"
-                current_ruler_pos = transit_planets["sun"]["abs_pos"]
-                current_ruler_sign = transit_planets["sun"]["sign"]
-                current_ruler_degree = current_ruler_pos % 30
-                ruler_retrograde = transit_planets["sun"]["retrograde"]
-            
-            # Calculate next aspect of ruler to Yogi Point
-            ruler_daily_motion = PLANET_DAILY_MOTION.get(ascendant_ruler, 1.0)
-            ruler_next_aspect = self.find_closest_aspect(
-                current_pos=current_ruler_pos,
-                daily_motion=ruler_daily_motion,
-                yogi_point=yogi_point,
-                is_retrograde=ruler_retrograde,
-                orb=orb,  # Use provided orb
-                reference_time=reference_time # Pass reference time
-            )
-            
-            # Calculate last aspect of ruler to Yogi Point
-            ruler_last_aspect = self.find_last_aspect(
-                current_pos=current_ruler_pos,
-                daily_motion=ruler_daily_motion,
-                yogi_point=yogi_point,
-                is_retrograde=ruler_retrograde,
-                orb=orb,  # Use provided orb
-                reference_time=reference_time # Pass reference time
-            )
-            
-            # Calculate next aspect of ruler to Ava Yogi Point (unlucky point)
-            ruler_next_ava_aspect = self.find_closest_aspect(
-                current_pos=current_ruler_pos,
-                daily_motion=ruler_daily_motion,
-                yogi_point=ava_yogi_point,
-                is_retrograde=ruler_retrograde,
-                orb=orb,  # Use provided orb
-                reference_time=reference_time # Pass reference time
-            )
-            
-            # Calculate last aspect of ruler to Ava Yogi Point
-            ruler_last_ava_aspect = self.find_last_aspect(
-                current_pos=current_ruler_pos,
-                daily_motion=ruler_daily_motion,
-                yogi_point=ava_yogi_point,
-                is_retrograde=ruler_retrograde,
-                orb=orb,  # Use provided orb
-                reference_time=reference_time # Pass reference time
-            )
-            
-            # Calculate current Dasha lord
-            moon_nakshatra_deg = natal_data["subject"]["planets"]["moon"]["abs_pos"]
-            dasha_lord = self.calculate_dasha_lord(moon_nakshatra_deg, birth_date, from_date)
-            dasha_lord = self.get_available_dasha_lord(dasha_lord, list(transit_planets.keys()))
-            
-            # Calculate Dasha lord position
-            current_dasha_pos = transit_planets[dasha_lord]["abs_pos"]
-            current_dasha_sign = transit_planets[dasha_lord]["sign"]
-            current_dasha_degree = current_dasha_pos % 30
-            dasha_retrograde = transit_planets[dasha_lord]["retrograde"]
-            
-            # Calculate next aspect of Dasha lord to Yogi Point
-            dasha_daily_motion = PLANET_DAILY_MOTION.get(dasha_lord, 1.0)
-            dasha_next_aspect = self.find_closest_aspect(
-                current_pos=current_dasha_pos,
-                daily_motion=dasha_daily_motion,
-                yogi_point=yogi_point,
-                is_retrograde=dasha_retrograde,
-                orb=orb,  # Use provided orb
-                reference_time=reference_time # Pass reference time
-            )
-            
-            # Calculate last aspect of Dasha lord to Yogi Point
-            dasha_last_aspect = self.find_last_aspect(
-                current_pos=current_dasha_pos,
-                daily_motion=dasha_daily_motion,
-                yogi_point=yogi_point,
-                is_retrograde=dasha_retrograde,
-                orb=orb,  # Use provided orb
-                reference_time=reference_time # Pass reference time
-            )
-            
-            # Calculate next aspect of Dasha lord to Ava Yogi Point
-            dasha_next_ava_aspect = self.find_closest_aspect(
-                current_pos=current_dasha_pos,
-                daily_motion=dasha_daily_motion,
-                yogi_point=ava_yogi_point,
-                is_retrograde=dasha_retrograde,
-                orb=orb,  # Use provided orb
-                reference_time=reference_time # Pass reference time
-            )
-            
-            # Calculate last aspect of Dasha lord to Ava Yogi Point
-            dasha_last_ava_aspect = self.find_last_aspect(
-                current_pos=current_dasha_pos,
-                daily_motion=dasha_daily_motion,
-                yogi_point=ava_yogi_point,
-                is_retrograde=dasha_retrograde,
-                orb=orb,  # Use provided orb
-                reference_time=reference_time # Pass reference time
-            )
-            
-            # Verify that Yogi Point and Ava Yogi Point aspects have different dates
-            # If they're the same, something went wrong in the calculation, so we'll slightly adjust
-            
-            # Check ascendant ruler next aspects
-            if ruler_next_aspect.get("estimated_date") == ruler_next_ava_aspect.get("estimated_date"):
-                print("Warning: Ruler next aspect dates are the same for Yogi and Ava Yogi. Recalculating...")
-                # Recalculate with a slight adjustment to ensure different results
-                ruler_next_ava_aspect = self.find_closest_aspect(
-                    current_pos=current_ruler_pos,
-                    daily_motion=ruler_daily_motion * 0.99,  # Slight adjustment to motion
-                    yogi_point=ava_yogi_point,
-                    is_retrograde=ruler_retrograde,
-                    orb=orb,  # Use provided orb
-                    reference_time=reference_time # Pass reference time
-                )
-            
-            # Check ascendant ruler last aspects
-            if ruler_last_aspect.get("estimated_date") == ruler_last_ava_aspect.get("estimated_date"):
-                print("Warning: Ruler last aspect dates are the same for Yogi and Ava Yogi. Recalculating...")
-                # Recalculate with a slight adjustment
-                ruler_last_ava_aspect = self.find_last_aspect(
-                    current_pos=current_ruler_pos,
-                    daily_motion=ruler_daily_motion * 0.99,  # Slight adjustment to motion
-                    yogi_point=ava_yogi_point,
-                    is_retrograde=ruler_retrograde,
-                    orb=orb,  # Use provided orb
-                    reference_time=reference_time # Pass reference time
-                )
-            
-            # Check dasha lord next aspects
-            if dasha_next_aspect.get("estimated_date") == dasha_next_ava_aspect.get("estimated_date"):
-                print("Warning: Dasha next aspect dates are the same for Yogi and Ava Yogi. Recalculating...")
-                # Recalculate with a slight adjustment
-                dasha_next_ava_aspect = self.find_closest_aspect(
-                    current_pos=current_dasha_pos,
-                    daily_motion=dasha_daily_motion * 0.99,  # Slight adjustment to motion
-                    yogi_point=ava_yogi_point,
-                    is_retrograde=dasha_retrograde,
-                    orb=orb,  # Use provided orb
-                    reference_time=reference_time # Pass reference time
-                )
-            
-            # Check dasha lord last aspects
-            if dasha_last_aspect.get("estimated_date") == dasha_last_ava_aspect.get("estimated_date"):
-                print("Warning: Dasha last aspect dates are the same for Yogi and Ava Yogi. Recalculating...")
-                # Recalculate with a slight adjustment
-                dasha_last_ava_aspect = self.find_last_aspect(
-                    current_pos=current_dasha_pos,
-                    daily_motion=dasha_daily_motion * 0.99,  # Slight adjustment to motion
-                    yogi_point=ava_yogi_point,
-                    is_retrograde=dasha_retrograde,
-                    orb=orb,  # Use provided orb
-                    reference_time=reference_time # Pass reference time
-                )
-            
-            # Get Yogi configurations if available
-            has_yogi_config = True
-            try:
-                yogi_configurations = self.calculate_yogi_configurations(natal_data, transit_data, orb)
-            except Exception as e:
+                return ruler if ruler in transit_planets else "sun"
+
+            def find_dasha_lord(transit_planets):
+                moon_nakshatra_deg = natal_data["subject"]["planets"]["moon"]["abs_pos"]
+                lord = calc.calculate_dasha_lord(moon_nakshatra_deg, birth_date, from_date)
+                return calc.get_available_dasha_lord(lord, list(transit_planets.keys()))
+
+            def yogi_aspects(find, label):
+                def stage(planet, transit_planets, yogi_point, ava_yogi_point, reference_time):
+                    return calc.find_yogi_aspect_pair(find, planet, transit_planets[planet], yogi_point,
+                                                      ava_yogi_point, orb, reference_time, label)
+                return stage
+
+            def yogi_configurations_fallback(e):
                 print(f"Error calculating Yogi configurations: {str(e)}")
-                yogi_configurations = {
+                return {
                     "duplicate_yogi": {
                         "planet": "unknown",
                         "position": 0,
@@ -416,8 +218,112 @@ class VedicLuckyTimesService:
                         "time": None,
                         "formatted_time": None
                     }
+                }, False
+
+            def location_alignments_fallback(e):
+                return {
+                    "error": f"Error calculating location-specific Yogi alignments: {str(e)}",
+                    "current_location": {
+                        "city": current_city,
+                        "nation": current_nation
+                    },
+                    "calculation_date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+                    "power_alignments": [],
+                    "daily_alignments": []
                 }
-                has_yogi_config = False
+
+            def gather_lucky_dates(bullseye_periods, configurations, ruler_next_aspects, dasha_next_aspects):
+                yogi_configurations, has_yogi_config = configurations
+                next_transit_dates = [ruler_next_aspects[0].get("estimated_date"), dasha_next_aspects[0].get("estimated_date")]
+                return calc.collect_lucky_dates(bullseye_periods, yogi_configurations if has_yogi_config else None, next_transit_dates)
+
+            def find_ascendant_pof_conjunctions():
+                # Calculate when the ascendant will conjunct the natal Part of Fortune (next 7 days)
+                # Debug transit structure before calculation
+                print("Transit data structure debug:")
+                if "transit" in transit_data:
+                    print(f"Transit keys: {list(transit_data['transit'].keys())}")
+                    if "subject" in transit_data["transit"]:
+                        print(f"Transit subject keys: {list(transit_data['transit']['subject'].keys())}")
+                        if "houses" in transit_data["transit"]["subject"]:
+                            print(f"Houses available: {transit_data['transit']['subject']['houses'].keys()}")
+                        else:
+                            print("Transit houses not directly available in the expected structure")
+                    if "houses" in transit_data:
+                        print(f"Houses keys at root: {list(transit_data['houses'].keys())}")
+
+                return calc.calculate_ascendant_part_of_fortune_conjunctions(
+                    natal_data=natal_data,
+                    transit_data=transit_data,
+                    num_days=7,
+                    orb=orb  # Pass the user-provided orb parameter
+                )
+
+            graph.add("reference_time", lambda: calc.get_reference_time(transit_data, "ProcessVedic"))
+            graph.add("yogi_point", lambda: calc.calculate_yogi_point(natal_data))
+            graph.add("ava_yogi_point", calc.calculate_ava_yogi_point, "yogi_point")
+            graph.add("jupiter_pof", lambda: calc.calculate_jupiter_pof_last_conjunction(natal_data, transit_data))
+            graph.add("d9_chart", lambda: calc.calculate_d9_chart(natal_data))
+            graph.add("transit_planets", lambda: transit_data["transit"]["subject"]["planets"])
+            graph.add("ascendant_ruler", find_ascendant_ruler, "transit_planets")
+            graph.add("dasha_lord", find_dasha_lord, "transit_planets")
+            aspect_inputs = ("transit_planets", "yogi_point", "ava_yogi_point", "reference_time")
+            graph.add("ruler_next_aspects", yogi_aspects(calc.find_closest_aspect, "Ruler next"), "ascendant_ruler", *aspect_inputs)
+            graph.add("ruler_last_aspects", yogi_aspects(calc.find_last_aspect, "Ruler last"), "ascendant_ruler", *aspect_inputs)
+            graph.add("dasha_next_aspects", yogi_aspects(calc.find_closest_aspect, "Dasha next"), "dasha_lord", *aspect_inputs)
+            graph.add("dasha_last_aspects", yogi_aspects(calc.find_last_aspect, "Dasha last"), "dasha_lord", *aspect_inputs)
+            graph.add("yogi_configurations", lambda: (calc.calculate_yogi_configurations(natal_data, transit_data, orb), True),
+                      timeout=timeout, fallback=yogi_configurations_fallback)
+            graph.add("bullseye_periods", lambda: calc.calculate_bullseye_periods(natal_data, transit_data),
+                      timeout=timeout, fallback=error_list("Bullseye periods"))
+            graph.add("ascendant_pof_conjunctions", find_ascendant_pof_conjunctions,
+                      timeout=timeout, fallback=lambda e: None)
+            graph.add("lucky_dates", gather_lucky_dates,
+                      "bullseye_periods", "yogi_configurations", "ruler_next_aspects", "dasha_next_aspects")
+            graph.add("pof_rahu", lambda lucky_dates: calc.calculate_part_of_fortune_rahu_conjunctions(natal_data, transit_data, lucky_dates), "lucky_dates",
+                      timeout=timeout, fallback=error_list("Part of Fortune-Rahu conjunctions"))
+            graph.add("pof_regulus", lambda lucky_dates: calc.calculate_part_of_fortune_regulus_conjunctions(natal_data, transit_data, lucky_dates), "lucky_dates",
+                      timeout=timeout, fallback=error_list("Part of Fortune-Regulus conjunctions"))
+            graph.add("pof_lord_lagna", lambda lucky_dates: calc.calculate_part_of_fortune_lord_lagna_conjunctions(natal_data, transit_data, lucky_dates), "lucky_dates",
+                      timeout=timeout, fallback=error_list("Part of Fortune-Lord Lagna conjunctions"))
+            analyses = ["pof_rahu", "pof_regulus", "pof_lord_lagna", "ascendant_pof_conjunctions"]
+            if location_specific_alignments is None and current_city and current_nation:
+                graph.add("location_alignments", lambda: calc.calculate_location_specific_yogi_alignments(
+                              natal_data, current_city, current_nation, orb, location_transit_data or transit_data),
+                          timeout=timeout, fallback=location_alignments_fallback)
+                analyses.append("location_alignments")
+
+            stages = graph.run(*analyses, "ruler_last_aspects", "dasha_last_aspects", "jupiter_pof", "d9_chart")
+            if "location_alignments" in stages:
+                location_specific_alignments = stages["location_alignments"]
+            yogi_point = graph.get("yogi_point")
+            ava_yogi_point = graph.get("ava_yogi_point")
+            jupiter_pof_data = stages["jupiter_pof"]
+            d9_chart = stages["d9_chart"]
+            print(f"D9 chart: {d9_chart}")
+            transit_planets = graph.get("transit_planets")
+            print(f"Transit planets: {transit_planets}")
+            yogi_configurations, has_yogi_config = graph.get("yogi_configurations")
+
+            # Ascendant ruler and its aspects to the Yogi and Ava Yogi Points
+            ascendant_sign = natal_data["subject"]["houses"]["ascendant"]["sign"]
+            ascendant_ruler = graph.get("ascendant_ruler")
+            current_ruler_pos = transit_planets[ascendant_ruler]["abs_pos"]
+            current_ruler_sign = transit_planets[ascendant_ruler]["sign"]
+            current_ruler_degree = current_ruler_pos % 30
+            ruler_retrograde = transit_planets[ascendant_ruler]["retrograde"]
+            ruler_next_aspect, ruler_next_ava_aspect = graph.get("ruler_next_aspects")
+            ruler_last_aspect, ruler_last_ava_aspect = stages["ruler_last_aspects"]
+
+            # Current Dasha lord and its aspects to the Yogi and Ava Yogi Points
+            moon_nakshatra_deg = natal_data["subject"]["planets"]["moon"]["abs_pos"]
+            dasha_lord = graph.get("dasha_lord")
+            current_dasha_pos = transit_planets[dasha_lord]["abs_pos"]
+            current_dasha_sign = transit_planets[dasha_lord]["sign"]
+            current_dasha_degree = current_dasha_pos % 30
+            dasha_retrograde = transit_planets[dasha_lord]["retrograde"]
+            dasha_next_aspect, dasha_next_ava_aspect = graph.get("dasha_next_aspects")
+            dasha_last_aspect, dasha_last_ava_aspect = stages["dasha_last_aspects"]
             
             # Prepare response
             response = {
@@ -601,8 +507,8 @@ class VedicLuckyTimesService:
             if "lagna" in d9_chart and d9_chart["lagna"]:
                 response["interpretation"]["d9_lagna"] = f"Your D9 Ascendant is in {ZODIAC_SIGNS[d9_chart['lagna']['d9_sign']]}, indicating your spiritual partnership tendencies and deeper spiritual purpose."
             
-            # Calculate Bullseye periods
-            bullseye_periods = self.calculate_bullseye_periods(natal_data, transit_data)
+            # Bullseye periods
+            bullseye_periods = graph.get("bullseye_periods")
             
             # Add Bullseye periods to response
             response["bullseye_periods"] = bullseye_periods
@@ -692,126 +598,50 @@ class VedicLuckyTimesService:
             response["interpretation"]["bullseye_period"] = bullseye_interpretation
             # --- End of Adjusted Bullseye Logic ---
             
-            # Calculate when the ascendant will conjunct the natal Part of Fortune (next 7 days)
+            # Ascendant conjunctions with the natal Part of Fortune over the next 7 days (None if they could not be calculated)
+            pof_asc_conjunctions = stages["ascendant_pof_conjunctions"]
             try:
-                # Debug transit structure before calculation
-                print("Transit data structure debug:")
-                if "transit" in transit_data:
-                    print(f"Transit keys: {list(transit_data['transit'].keys())}")
-                    if "subject" in transit_data["transit"]:
-                        print(f"Transit subject keys: {list(transit_data['transit']['subject'].keys())}")
-                        if "houses" in transit_data["transit"]["subject"]:
-                            print(f"Houses available: {transit_data['transit']['subject']['houses'].keys()}")
-                        else:
-                            print("Transit houses not directly available in the expected structure")
-                            # Check houses in other locations if needed
-                    if "houses" in transit_data:
-                        print(f"Houses keys at root: {list(transit_data['houses'].keys())}")
-                
-                pof_asc_conjunctions = self.calculate_ascendant_part_of_fortune_conjunctions(
-                    natal_data=natal_data,
-                    transit_data=transit_data,
-                    num_days=7,
-                    orb=orb  # Pass the user-provided orb parameter
-                )
-                
-                # Add Part of Fortune-Ascendant conjunctions to the response
-                response["ascendant_part_of_fortune_conjunctions"] = pof_asc_conjunctions
+                if pof_asc_conjunctions is not None:
+                    # Add Part of Fortune-Ascendant conjunctions to the response
+                    response["ascendant_part_of_fortune_conjunctions"] = pof_asc_conjunctions
                 
-                # Add interpretation to the main interpretation section
-                if pof_asc_conjunctions and not any("error" in conj for conj in pof_asc_conjunctions):
-                    next_conj = pof_asc_conjunctions[0]
-                    pof_sign = next_conj["part_of_fortune"]["sign"]
-                    pof_degree = next_conj["part_of_fortune"]["degree"]
-                    conj_date = next_conj["conjunction_date"]
+                    # Add interpretation to the main interpretation section
+                    if pof_asc_conjunctions and not any("error" in conj for conj in pof_asc_conjunctions):
+                        next_conj = pof_asc_conjunctions[0]
+                        pof_sign = next_conj["part_of_fortune"]["sign"]
+                        pof_degree = next_conj["part_of_fortune"]["degree"]
+                        conj_date = next_conj["conjunction_date"]
                     
-                    if "hours_away" in next_conj and next_conj["hours_away"] is not None:
-                        hours_text = f" ({next_conj['hours_away']} hours from now)"
-                    else:
-                        hours_text = ""
+                        if "hours_away" in next_conj and next_conj["hours_away"] is not None:
+                            hours_text = f" ({next_conj['hours_away']} hours from now)"
+                        else:
+                            hours_text = ""
                     
-                    estimation_method = next_conj.get("estimation_method", "")
-                    method_text = ""
-                    if estimation_method == "sun_position":
-                        method_text = " (estimated based on sun position)"
-                    elif estimation_method == "time_based":
-                        method_text = " (estimated based on time of day)"
-                    elif estimation_method == "simple_time":
-                        method_text = " (approximated)"
+                        estimation_method = next_conj.get("estimation_method", "")
+                        method_text = ""
+                        if estimation_method == "sun_position":
+                            method_text = " (estimated based on sun position)"
+                        elif estimation_method == "time_based":
+                            method_text = " (estimated based on time of day)"
+                        elif estimation_method == "simple_time":
+                            method_text = " (approximated)"
                     
-                    response["interpretation"]["ascendant_pof_conjunction"] = (
-                        f"The ascendant will next conjunct your natal Part of Fortune at {round(pof_degree, 2)}° {ZODIAC_SIGNS[pof_sign]} "
-                        f"on {conj_date}{hours_text}{method_text}. This daily 15-20 minute window is excellent for starting new ventures, "
-                        f"making important decisions, or any activity where you want to align with fortunate energies."
-                    )
-                else:
-                    # Handle error case with a graceful message
-                    response["interpretation"]["ascendant_pof_conjunction"] = (
-                        "We couldn't precisely calculate when the ascendant will conjunct your natal Part of Fortune. "
-                        "This typically happens once per day for about 15-20 minutes and is an excellent time for starting new ventures."
-                    )
+                        response["interpretation"]["ascendant_pof_conjunction"] = (
+                            f"The ascendant will next conjunct your natal Part of Fortune at {round(pof_degree, 2)}° {ZODIAC_SIGNS[pof_sign]} "
+                            f"on {conj_date}{hours_text}{method_text}. This daily 15-20 minute window is excellent for starting new ventures, "
+                            f"making important decisions, or any activity where you want to align with fortunate energies."
+                        )
+                    else:
+                        # Handle error case with a graceful message
+                        response["interpretation"]["ascendant_pof_conjunction"] = (
+                            "We couldn't precisely calculate when the ascendant will conjunct your natal Part of Fortune. "
+                            "This typically happens once per day for about 15-20 minutes and is an excellent time for starting new ventures."
+                        )
             except Exception as e:
                 print(f"Error calculating ascendant-partof fortune conjunctions: {str(e)}")
-                import traceback
-            #     traceback.print_exc()
-            #     response["ascendant_part_of_fortune_conjunctions"] = [{"error": f"Error calculating conjunctions: {str(e)}"}]
-            #     response["interpretation"]["ascendant_pof_conjunction"] = (
-            #         "We couldn't calculate when the ascendant will conjunct your natal Part of Fortune. "
-            #         "This typically happens once per day for about 15-20 minutes and is an excellent time for starting new ventures."
-            #     )
-                
-            # Get list of significant dates from the calculated data
-            lucky_dates = []
-            unlucky_dates = [] # Initialize unlucky_dates as well
-            
-            # Add all the bullseye periods
-            if "bullseye_periods" in response and isinstance(response["bullseye_periods"], list):
-                for period in response["bullseye_periods"]:
-                    if isinstance(period, dict) and "time" in period:
-                        lucky_dates.append(period["time"])
-            
-            # Add yogi configurations
-            if "yogi_configurations" in response:
-                # Add the next configuration
-                if "next_configuration" in response["yogi_configurations"] and "formatted_time" in response["yogi_configurations"]["next_configuration"]:
-                    lucky_dates.append(response["yogi_configurations"]["next_configuration"]["formatted_time"])
-                
-                # Add ascendant configurations
-                if "ascendant_configurations" in response["yogi_configurations"] and isinstance(response["yogi_configurations"]["ascendant_configurations"], list):
-                    for config in response["yogi_configurations"]["ascendant_configurations"]:
-                        if "formatted_time" in config:
-                            lucky_dates.append(config["formatted_time"])
-                
-                # Add lord configurations
-                if "lord_configurations" in response["yogi_configurations"] and isinstance(response["yogi_configurations"]["lord_configurations"], list):
-                    for config in response["yogi_configurations"]["lord_configurations"]:
-                        if "formatted_time" in config:
-                            lucky_dates.append(config["formatted_time"])
-                
-                # Add triple alignments
-                if "triple_alignments" in response["yogi_configurations"] and isinstance(response["yogi_configurations"]["triple_alignments"], list):
-                    for alignment in response["yogi_configurations"]["triple_alignments"]:
-                        if "formatted_time" in alignment:
-                            lucky_dates.append(alignment["formatted_time"])
-                
-                # Add yearly power alignments
-                if "yearly_power_alignments" in response["yogi_configurations"] and isinstance(response["yogi_configurations"]["yearly_power_alignments"], list):
-                    for alignment in response["yogi_configurations"]["yearly_power_alignments"]:
-                        if "formatted_time" in alignment:
-                            lucky_dates.append(alignment["formatted_time"])
-            
-            # Add next transits
-            if "next_transits" in response:
-                if "ascendant_ruler" in response["next_transits"] and "date" in response["next_transits"]["ascendant_ruler"]:
-                    lucky_dates.append(response["next_transits"]["ascendant_ruler"]["date"])
-                if "dasha_lord" in response["next_transits"] and "date" in response["next_transits"]["dasha_lord"]:
-                    lucky_dates.append(response["next_transits"]["dasha_lord"]["date"])
-            
-            # Remove duplicates and sort
-            lucky_dates = sorted(list(set(filter(None, lucky_dates))))
-            
-            # Calculate Part of Fortune - Rahu conjunctions for these dates
-            pof_rahu_conjunctions = self.calculate_part_of_fortune_rahu_conjunctions(natal_data, transit_data, lucky_dates)
+
+            # Part of Fortune - Rahu conjunctions for the lucky dates
+            pof_rahu_conjunctions = stages["pof_rahu"]
             
             # Add the results to the response
             response["part_of_fortune_rahu_conjunctions"] = pof_rahu_conjunctions
@@ -843,8 +673,8 @@ class VedicLuckyTimesService:
                         "Focus on the other auspicious factors identified in this analysis."
                     )
             
-            # Calculate Part of Fortune - Regulus conjunctions for these dates
-            pof_regulus_conjunctions = self.calculate_part_of_fortune_regulus_conjunctions(natal_data, transit_data, lucky_dates)
+            # Part of Fortune - Regulus conjunctions for these dates
+            pof_regulus_conjunctions = stages["pof_regulus"]
             
             # Add the results to the response
             response["part_of_fortune_regulus_conjunctions"] = pof_regulus_conjunctions
@@ -876,8 +706,8 @@ class VedicLuckyTimesService:
                         "Focus on the other auspicious factors identified in this analysis."
                     )
             
-            # Calculate Part of Fortune - Lord Lagna conjunctions for these dates
-            pof_lord_lagna_conjunctions = self.calculate_part_of_fortune_lord_lagna_conjunctions(natal_data, transit_data, lucky_dates)
+            # Part of Fortune - Lord Lagna conjunctions for these dates
+            pof_lord_lagna_conjunctions = stages["pof_lord_lagna"]
             
             # Add the results to the response
             response["part_of_fortune_lord_lagna_conjunctions"] = pof_lord_lagna_conjunctions
@@ -1359,6 +1189,10 @@ class VedicLuckyTimesService:
                 
                 if last_date:
                     response["dates_summary"]["jupiter_pof_dates"].append({"last_date": last_date})
+
+            # Analyses that failed or ran out of time (their sections hold stand-in results)
+            if graph.failures:
+                response["failed_analyses"] = dict(graph.failures)
             
             return response
             
@@ -1470,6 +1304,87 @@ class VedicLuckyTimesService:
                 }
             }
 
+    def find_yogi_aspect_pair(self, find: Callable[..., Dict[str, Any]], planet: str, planet_data: Dict[str, Any],
+                              yogi_point: float, ava_yogi_point: float, orb: float = 3.0,
+                              reference_time: Optional[datetime] = None, label: str = "") -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Aspects of a transiting planet to the Yogi Point and the Ava Yogi Point
+
+        Args:
+            find: find_closest_aspect for the next aspects, find_last_aspect for the last ones
+            planet: Name of the planet
+            planet_data: The planet's transit data (abs_pos and retrograde)
+            yogi_point: Yogi Point position
+            ava_yogi_point: Ava Yogi Point position
+            orb: The orb value to use for aspects
+            reference_time: Moment the aspects are found from
+            label: Name of the pair for logging, e.g. "Ruler next"
+
+        Returns:
+            Tuple of the aspect to the Yogi Point and the aspect to the Ava Yogi Point
+        """
+        daily_motion = PLANET_DAILY_MOTION.get(planet, 1.0)
+
+        def aspect(point: float, motion: float) -> Dict[str, Any]:
+            return find(
+                current_pos=planet_data["abs_pos"],
+                daily_motion=motion,
+                planet=planet,
+                yogi_point=point,
+                is_retrograde=planet_data["retrograde"],
+                orb=orb,
+                reference_time=reference_time
+            )
+
+        yogi_aspect = aspect(yogi_point, daily_motion)
+        ava_aspect = aspect(ava_yogi_point, daily_motion)
+
+        # Yogi and Ava Yogi aspects on the same date mean something went wrong in the
+        # calculation, so recalculate with a slight adjustment to the motion
+        if yogi_aspect.get("estimated_date") == ava_aspect.get("estimated_date"):
+            print(f"Warning: {label} aspect dates are the same for Yogi and Ava Yogi. Recalculating...")
+            ava_aspect = aspect(ava_yogi_point, daily_motion * 0.99)
+
+        return yogi_aspect, ava_aspect
+
+    def collect_lucky_dates(self, bullseye_periods: List[Dict[str, Any]], yogi_configurations: Optional[Dict[str, Any]],
+                            next_transit_dates: List[Optional[str]]) -> List[str]:
+        """Gather the lucky dates checked for Part of Fortune conjunctions
+
+        Args:
+            bullseye_periods: Result of calculate_bullseye_periods
+            yogi_configurations: Result of calculate_yogi_configurations (None if it failed)
+            next_transit_dates: Dates of the next ascendant ruler and dasha lord aspects to the Yogi Point
+
+        Returns:
+            Sorted dates without duplicates
+        """
+        lucky_dates = []
+
+        # Add all the bullseye periods
+        if isinstance(bullseye_periods, list):
+            for period in bullseye_periods:
+                if isinstance(period, dict) and "time" in period:
+                    lucky_dates.append(period["time"])
+
+        # Add yogi configurations
+        if yogi_configurations is not None:
+            # Add the next configuration
+            if "next_configuration" in yogi_configurations and "formatted_time" in yogi_configurations["next_configuration"]:
+                lucky_dates.append(yogi_configurations["next_configuration"]["formatted_time"])
+
+            # Add ascendant and lord configurations, triple alignments and yearly power alignments
+            for key in ["ascendant_configurations", "lord_configurations", "triple_alignments", "yearly_power_alignments"]:
+                if key in yogi_configurations and isinstance(yogi_configurations[key], list):
+                    for config in yogi_configurations[key]:
+                        if "formatted_time" in config:
+                            lucky_dates.append(config["formatted_time"])
+
+        # Add next transits
+        lucky_dates.extend(next_transit_dates)
+
+        # Remove duplicates and sort
+        return sorted(list(set(filter(None, lucky_dates))))
+
     def calculate_yogi_configurations(self, natal_data: Dict[str, Any], transit_data: Dict[str, Any], orb: float = 3.0) -> Dict[str, Any]:
         """Calculate when Yogi and Duplicate Yogi points are in significant configurations with the ascendant"""
       
@@ -1796,4 +1711,46 @@ class VedicLuckyTimesService:
             "exact_time": exact_time.strftime("%Y-%m-%d %H:%M"),
             "end_time": end_time.strftime("%Y-%m-%d %H:%M"),
             "description": f"This alignment lasts approximately {duration_text}, from {start_time.strftime('%H:%M')} to {end_time.strftime('%H:%M')} (using {orb}° orb)"
-        }
\ No newline at end of file
+        }
+
+
+class VedicLuckyTimesContext(VedicLuckyTimesService):
+    """VedicLuckyTimesService for the stages of one request
+
+    Passed to the utility functions as `self`, so the values several of them work
+    out on their own (Yogi Points, D9 chart, sign rulers, day/night status and the
+    reference time) are calculated once per request, whichever stage asks first.
+    Values are keyed by the identity of the chart data, which lives as long as the
+    request.
+    """
+
+    def __init__(self, graph: StageGraph):
+        super().__init__()
+        self.graph = graph
+
+    def _memo(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        return self.graph.memo(key, compute)
+
+    def get_ascendant_ruler(self, ascendant_sign: str, zodiac_type: str = None) -> str:
+        return self._memo(("ruler", ascendant_sign, zodiac_type),
+                          partial(super().get_ascendant_ruler, ascendant_sign, zodiac_type))
+
+    def calculate_yogi_point(self, natal_data: Dict[str, Any]) -> float:
+        return self._memo(("yogi_point", id(natal_data)), partial(super().calculate_yogi_point, natal_data))
+
+    def calculate_yogi_point_transit(self, transit_data: Dict[str, Any]) -> float:
+        return self._memo(("yogi_point_transit", id(transit_data)),
+                          partial(super().calculate_yogi_point_transit, transit_data))
+
+    def calculate_d9_chart(self, natal_data: Dict[str, Any]) -> Dict[str, Any]:
+        return self._memo(("d9_chart", id(natal_data)), partial(super().calculate_d9_chart, natal_data))
+
+    def determine_day_night_chart(self, sun_pos: float, asc_pos: float, natal_data: Dict[str, Any] = None,
+                            label: str = "") -> bool:
+        data_id = id(natal_data) if natal_data is not None else None
+        return self._memo(("day_night", sun_pos, asc_pos, data_id),
+                          partial(super().determine_day_night_chart, sun_pos, asc_pos, natal_data, label))
+
+    def get_reference_time(self, transit_data: Dict[str, Any], label: str = "") -> datetime:
+        return self._memo(("reference_time", id(transit_data)),
+                          partial(super().get_reference_time, transit_data, label))
@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import logging
 
+from .models.chart_state import ChartState
+from .services.linkage_engine import DECLINATION, DECLINATION_SUM, AspectCheck, LinkageEngine, LinkageRule
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -16,29 +19,37 @@ class SexualLinkage:
     orbit: float
     actual_degrees: float
 
+SEXUAL_PLANETS = ['venus', 'mars', 'pluto']
+PARALLEL_ORB = 2  # Increased from 1.5 to match chart
+
+SEXUAL_RULE = LinkageRule(
+    name='sexual_linkages',
+    planets1=SEXUAL_PLANETS,
+    planets2=SEXUAL_PLANETS,
+    # Valid Sexual planet pairs (both directions)
+    pairs=[
+        ('venus', 'pluto'),
+        ('pluto', 'venus'),
+        ('mars', 'pluto'),
+        ('pluto', 'mars'),
+        ('venus', 'mars'),
+        ('mars', 'venus')
+    ],
+    checks=[
+        # Parallel when both N or both S
+        AspectCheck('parallel', 0, PARALLEL_ORB, measure=DECLINATION, signs='same'),
+        # Contraparallel when one N and one S
+        AspectCheck('contraparallel', 180, PARALLEL_ORB, measure=DECLINATION_SUM, target=46.2868, signs='opposite')
+    ]
+)
+
+_sexual_engine = LinkageEngine([SEXUAL_RULE])
+
 class SexualLinkageCalculator:
     """Calculate Sexual linkages between two people's charts"""
     
     def __init__(self):
-        # Define valid Sexual planet pairs (both directions)
-        self.sexual_pairs = [
-            ('venus', 'pluto'),
-            ('pluto', 'venus'),
-            ('mars', 'pluto'),
-            ('pluto', 'mars'),
-            ('venus', 'mars'),
-            ('mars', 'venus')
-        ]
-
-        # Define valid aspect angles and orbs
-        self.valid_aspects = {
-            'conjunction': {'angle': 0, 'orb': 3},
-            'opposition': {'angle': 180, 'orb': 3},
-            'trine': {'angle': 120, 'orb': 3},
-            'quincunx': {'angle': 150, 'orb': 3},
-            'parallel': {'angle': 0, 'orb': 1.5},
-            'contraparallel': {'angle': 180, 'orb': 1.5}
-        }
+        self.sexual_pairs = SEXUAL_RULE.pairs
 
     def is_sexual_pair(self, planet1: str, planet2: str) -> bool:
         """Check if two planets form a valid Sexual pair"""
@@ -49,60 +60,36 @@ class SexualLinkageCalculator:
         diff = abs(pos1 - pos2)
         return 360 - diff if diff > 180 else diff
 
-    def find_sexual_linkages(self, person1_data: Dict, person2_data: Dict) -> List[Dict]:
-        """Find all Sexual linkages between two people's charts"""
-        linkages = []
-        PARALLEL_ORB = 2  # Increased from 1.5 to match chart
-        
-        try:
-            person1_planets = person1_data['subject']['planets']
-            person2_planets = person2_data['subject']['planets']
-
-            # Check each combination
-            for p1_name in ['venus', 'mars', 'pluto']:
-                for p2_name in ['venus', 'mars', 'pluto']:
-                    if not self.is_sexual_pair(p1_name, p2_name):
-                        continue
-
-                    p1_data = person1_planets[p1_name]
-                    p2_data = person2_planets[p2_name]
-
-                    # Get declination values
-                    dec1 = float(p1_data['declination'])
-                    dec2 = float(p2_data['declination'])
-
-                    # Check for parallel (when both N or both S)
-                    if (dec1 * dec2) > 0:  # Same sign
-                        dec_diff = abs(dec1 - dec2)
-                        if dec_diff <= PARALLEL_ORB:
-                            linkages.append({
-                                'person1_name': person1_data['subject']['name'],
-                                'person2_name': person2_data['subject']['name'],
-                                'planet1_name': p1_name,
-                                'planet2_name': p2_name,
-                                'aspect_name': 'parallel',
-                                'aspect_degrees': 0,
-                                'orbit': round(dec_diff, 4),
-                                'actual_degrees': round(dec_diff, 4)
-                            })
+    def format_sexual_linkages(self, hits: List[Dict], person1_name: str, person2_name: str) -> List[Dict]:
+        """Sexual linkage records from SEXUAL_RULE hits"""
+        return [
+            {
+                'person1_name': person1_name,
+                'person2_name': person2_name,
+                'planet1_name': hit['planet1_name'],
+                'planet2_name': hit['planet2_name'],
+                'aspect_name': hit['aspect_name'],
+                'aspect_degrees': hit['aspect_degrees'],
+                'orbit': hit['orbit'],
+                'actual_degrees': hit['actual_degrees']
+            }
+            for hit in hits
+        ]
 
-                    # Check for contraparallel (when one N and one S)
-                    if (dec1 * dec2) < 0:  # Different signs
-                        dec_sum = abs(dec1) + abs(dec2)
-                        if abs(dec_sum - 46.2868) <= PARALLEL_ORB:
-                            linkages.append({
-                                'person1_name': person1_data['subject']['name'],
-                                'person2_name': person2_data['subject']['name'],
-                                'planet1_name': p1_name,
-                                'planet2_name': p2_name,
-                                'aspect_name': 'contraparallel',
-                                'aspect_degrees': 180,
-                                'orbit': round(abs(dec_sum - 46.2868), 4),
-                                'actual_degrees': round(dec_sum, 4)
-                            })
+    def find_sexual_linkages(self, person1_data: Union[Dict, ChartState],
+                             person2_data: Union[Dict, ChartState]) -> List[Dict]:
+        """Find all Sexual linkages between two people's charts
 
-            return linkages
+        Args:
+            person1_data: ChartState, or chart data with a 'subject' level
+            person2_data: ChartState, or chart data with a 'subject' level
+        """
+        try:
+            person1 = ChartState.coerce(person1_data)
+            person2 = ChartState.coerce(person2_data)
+            hits = _sexual_engine.evaluate(person1, person2)[SEXUAL_RULE.name]
+            return self.format_sexual_linkages(hits, person1.name, person2.name)
 
         except Exception as e:
             logger.error(f"Error in find_sexual_linkages: {str(e)}")
-            raise
\ No newline at end of file
+            raise
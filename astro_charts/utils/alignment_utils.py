@@ -1,12 +1,62 @@
+import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 
 from .yogi_point_utils import ZODIAC_SIGNS
-from .aspect_utils import PLANET_DAILY_MOTION, find_closest_aspect, calculate_alignment_duration
+from .aspect_utils import (
+    PLANET_DAILY_MOTION, YOGI_ASPECTS, find_closest_aspect, calculate_alignment_duration,
+    format_alignment_duration
+)
+from .ascendant_utils import datetime_to_julian_day, normalize_angle
+
+logger = logging.getLogger(__name__)
+
+
+def transit_reference(transit_data: Dict[str, Any]) -> Tuple[Optional[datetime], Optional[float], Optional[float]]:
+    """
+    Get the transit moment and location from transit chart data
+
+    Returns:
+        Tuple: (naive local transit time, latitude, longitude); each is None when missing
+    """
+    try:
+        birth_data = transit_data["transit"]["subject"].get("birth_data") or {}
+    except (KeyError, TypeError, AttributeError):
+        return None, None, None
+
+    reference_time = None
+    if birth_data.get("date") and birth_data.get("time"):
+        try:
+            reference_time = datetime.strptime(f"{birth_data['date']} {birth_data['time']}", "%Y-%m-%d %H:%M")
+        except ValueError:
+            pass
+    return reference_time, birth_data.get("latitude"), birth_data.get("longitude")
+
+
+def transit_julian_day(reference_time: datetime, lat: float, lng: float) -> float:
+    """Julian day of a transit time, reading naive times as local time at the transit location"""
+    tz_str = None
+    if reference_time.tzinfo is None:
+        from .timezone_utils import get_timezone
+        tz_str = get_timezone(lat, lng)
+    return datetime_to_julian_day(reference_time, tz_str)
+
+
+def _closest_ascendant_crossing(finder, targets: List[Tuple[str, float]], start_jd: float, end_jd: float,
+                                lat: float, lng: float, asc_offset: float, exact_jd: float) -> Optional[Tuple[str, float]]:
+    """Find which target the Ascendant reaches closest to exact_jd; earlier targets win ties"""
+    best = None
+    for label, target in targets:
+        for crossing in finder.find_ascendant_crossings(target, start_jd, end_jd, lat, lng, asc_offset):
+            distance = abs(crossing["julian_day"] - exact_jd)
+            if best is None or distance < best[0]:
+                best = (distance, label, crossing["julian_day"])
+    return (best[1], best[2]) if best else None
 
 
 def find_mutual_yogi_ruler_alignments(yogi_point: float, duplicate_yogi_planet: str, duplicate_yogi_pos: float, 
-                                   ascendant_pos: float, transit_data: Dict[str, Any], num_forecasts: int = 3) -> List[Dict[str, Any]]:
+                                   ascendant_pos: float, transit_data: Dict[str, Any], num_forecasts: int = 3,
+                                   reference_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
     """
     Calculate when the Yogi Point and its ruler (Duplicate Yogi) form a mutual aspect (conjunction or opposition)
     while one of them is aligned with the Ascendant. This is a rare and powerful alignment.
@@ -18,10 +68,21 @@ def find_mutual_yogi_ruler_alignments(yogi_point: float, duplicate_yogi_planet:
         ascendant_pos: The current absolute position of the Ascendant
         transit_data: The transit chart data for additional calculations 
         num_forecasts: Number of forecasts to return (default 3)
+        reference_time: Time the positions were taken at (defaults to the transit time in transit_data)
         
     Returns:
         A list of dictionaries containing information about each powerful alignment
     """
+    transit_time, lat, lng = transit_reference(transit_data)
+    if lat is not None and lng is not None:
+        try:
+            return _exact_mutual_yogi_ruler_alignments(
+                yogi_point, duplicate_yogi_planet, duplicate_yogi_pos, ascendant_pos,
+                reference_time or transit_time or datetime.now(), lat, lng, num_forecasts
+            )
+        except Exception as e:
+            logger.error(f"Error finding mutual Yogi ruler alignments from ephemeris, using estimates: {str(e)}")
+
     try:
         # Get planetary motion for the duplicate yogi (ruler planet)
         daily_motion = PLANET_DAILY_MOTION.get(duplicate_yogi_planet, 1.0)
@@ -133,9 +194,169 @@ def find_mutual_yogi_ruler_alignments(yogi_point: float, duplicate_yogi_planet:
         return []
 
 
+def _exact_mutual_yogi_ruler_alignments(yogi_point: float, planet: str, planet_pos: float, ascendant_pos: float,
+                                        reference_time: datetime, lat: float, lng: float,
+                                        num_forecasts: int) -> List[Dict[str, Any]]:
+    """find_mutual_yogi_ruler_alignments from exact aspect and Ascendant crossing times"""
+    from ..services.event_finder import get_event_finder
+
+    finder = get_event_finder()
+    reference_jd = transit_julian_day(reference_time, lat, lng)
+    offset = finder.calibrate(planet, planet_pos, reference_jd)
+    asc_offset = finder.calibrate_ascendant(ascendant_pos, reference_jd, lat, lng)
+    planet_name = planet.capitalize()
+
+    powerful_alignments = []
+    for aspect_name, aspect in YOGI_ASPECTS.items():
+        target_pos = (yogi_point + aspect) % 360
+
+        # If already in aspect (within 8 degrees), skip
+        if abs(normalize_angle(target_pos - planet_pos)) <= 8:
+            continue
+
+        passes = finder.find_longitude_crossings(planet, target_pos, reference_jd, reference_jd + 800, offset)
+        if not passes:
+            continue
+        exact_jd = passes[0]["julian_day"]
+
+        # Within two days of the exact aspect, when does the Ascendant first line up?
+        targets = [
+            ("Ascendant conjunct Yogi Point", yogi_point),
+            ("Ascendant opposite Yogi Point", (yogi_point + 180) % 360),
+            (f"Ascendant conjunct {planet_name}", target_pos),
+            (f"Ascendant opposite {planet_name}", (target_pos + 180) % 360)
+        ]
+        first = None
+        for label, target in targets:
+            crossings = finder.find_ascendant_crossings(target, exact_jd, exact_jd + 2, lat, lng, asc_offset)
+            if crossings and (first is None or crossings[0]["julian_day"] < first[1]):
+                first = (label, crossings[0]["julian_day"])
+        if first is None:
+            continue
+
+        label, julian_day = first
+        current_hour = reference_time + timedelta(days=julian_day - reference_jd)
+        delta = current_hour - reference_time
+        days_away = delta.days
+        hours_away = delta.seconds // 3600
+        minutes_away = (delta.seconds % 3600) // 60
+
+        powerful_alignments.append({
+            "type": f"Powerful Alignment: Yogi Point {aspect_name} {planet_name} with {label}",
+            "time": current_hour.strftime("%Y-%m-%d %H:%M"),
+            "days_away": days_away,
+            "hours_away": hours_away,
+            "minutes_away": days_away * 1440 + hours_away * 60 + minutes_away,
+            "formatted_time": current_hour.strftime("%Y-%m-%d %H:%M"),
+            "time_iso": current_hour.isoformat(),
+            "power_level": "Extremely Powerful",
+            "aspect_degree": int(aspect)
+        })
+
+    powerful_alignments.sort(key=lambda x: x["minutes_away"])
+    return powerful_alignments[:num_forecasts]
+
+
+def _exact_yearly_power_alignments(yogi_point: float, planet: str, planet_pos: float, ascendant_pos: float,
+                                   orb: float, reference_time: datetime, lat: float, lng: float) -> List[Dict[str, Any]]:
+    """find_yearly_power_alignments from exact aspect and Ascendant crossing times"""
+    from ..services.event_finder import get_event_finder
+
+    finder = get_event_finder()
+    reference_jd = transit_julian_day(reference_time, lat, lng)
+    offset = finder.calibrate(planet, planet_pos, reference_jd)
+    asc_offset = finder.calibrate_ascendant(ascendant_pos, reference_jd, lat, lng)
+    planet_name = planet.capitalize()
+
+    def local_time(julian_day):
+        return reference_time + timedelta(days=julian_day - reference_jd)
+
+    def duration(event, alignment_type):
+        start_jd, end_jd = finder.find_orb_window(planet, event["point"], event["julian_day"], orb, offset)
+        return format_alignment_duration(
+            local_time(start_jd), local_time(event["julian_day"]), local_time(end_jd), alignment_type
+        )
+
+    angle = abs(normalize_angle(yogi_point - planet_pos))
+    alignments = []
+
+    if angle < 5 or abs(angle - 180) < 5:
+        # Already in aspect - the Ascendant reaches both points within the next day
+        aspect_type = "conjunction" if angle < 5 else "opposition"
+        nearby = finder.find_aspects(planet, yogi_point, reference_jd - 120, reference_jd + 120,
+                                     {aspect_type: YOGI_ASPECTS[aspect_type]}, offset)
+        if not nearby:
+            raise ValueError(f"No exact {aspect_type} of {planet} near the reference time")
+        event = min(nearby, key=lambda e: abs(e["julian_day"] - reference_jd))
+
+        targets = [
+            ("Ascendant conjunct Yogi Point", yogi_point, f"Yearly Power Alignment: Yogi Point {aspect_type} {planet_name}"),
+            (f"Ascendant conjunct {planet_name}", planet_pos, f"Yearly Power Alignment: Ascendant conjunct {planet_name}")
+        ]
+        for label, target, alignment_type in targets:
+            crossings = finder.find_ascendant_crossings(target, reference_jd, reference_jd + 1, lat, lng, asc_offset)
+            if not crossings:
+                continue
+            julian_day = crossings[0]["julian_day"]
+            alignment_time = local_time(julian_day)
+            alignments.append({
+                "type": f"Powerful Alignment: Yogi Point {aspect_type} {planet_name} with {label}",
+                "time": alignment_time.strftime("%Y-%m-%d %H:%M"),
+                "days_away": int(julian_day - reference_jd),
+                "formatted_time": alignment_time.strftime("%Y-%m-%d %H:%M"),
+                "time_iso": alignment_time.isoformat(),
+                "power_level": "Extremely Powerful - Occurs Today",
+                "duration": duration(event, alignment_type)
+            })
+    else:
+        # Next exact conjunction or opposition, then the Ascendant alignment closest to it
+        events = finder.find_aspects(planet, yogi_point, reference_jd, reference_jd + 400, YOGI_ASPECTS, offset)
+        if not events:
+            raise ValueError(f"No {planet} aspect to the Yogi Point within 400 days")
+        event = events[0]
+        aspect_type = event["type"]
+
+        targets = [
+            ("Ascendant conjunct Yogi Point", yogi_point),
+            (f"Ascendant conjunct {planet_name}", event["point"])
+        ]
+        found = _closest_ascendant_crossing(
+            finder, targets, event["julian_day"] - 0.5, event["julian_day"] + 0.5,
+            lat, lng, asc_offset, event["julian_day"]
+        )
+        if found:
+            label, julian_day = found
+            type_name = f"Powerful Alignment: Yogi Point {aspect_type} {planet_name} with {label}"
+            power_level = "Extremely Powerful - Once Yearly Event"
+            alignment_type = "Yearly Power Alignment"
+        else:
+            # The Ascendant never reaches the points at extreme latitudes
+            julian_day = event["julian_day"]
+            type_name = f"Powerful Alignment: Yogi Point {aspect_type} {planet_name} (approximate)"
+            power_level = "Powerful - Approximate Time"
+            alignment_type = "Yearly Power Alignment (Approximate)"
+
+        alignment_time = local_time(julian_day)
+        alignments.append({
+            "type": type_name,
+            "time": alignment_time.strftime("%Y-%m-%d %H:%M"),
+            "days_away": int(julian_day - reference_jd),
+            "formatted_time": alignment_time.strftime("%Y-%m-%d %H:%M"),
+            "time_iso": alignment_time.isoformat(),
+            "power_level": power_level,
+            "duration": duration(event, alignment_type)
+        })
+
+    if not alignments:
+        raise ValueError("The Ascendant does not reach the Yogi Point or its ruler")
+    return sorted(alignments, key=lambda x: x["days_away"])
+
+
 def find_yearly_power_alignments(yogi_point: float, duplicate_yogi_planet: str, 
                              duplicate_yogi_pos: float, is_retrograde: bool,
-                             ascendant_pos: float, orb: float = 3.0) -> List[Dict[str, Any]]:
+                             ascendant_pos: float, orb: float = 3.0,
+                             reference_time: Optional[datetime] = None,
+                             lat: Optional[float] = None, lng: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     Find dates when the Yogi Point and its ruler (Duplicate Yogi) form a mutual aspect (conjunction or opposition)
     while also being aligned with the Ascendant.
@@ -149,10 +370,22 @@ def find_yearly_power_alignments(yogi_point: float, duplicate_yogi_planet: str,
         is_retrograde: Whether the duplicate yogi planet is retrograde
         ascendant_pos: The current absolute position of the Ascendant
         orb: The orb to use for calculations (default: 3.0°)
+        reference_time: Time the positions were taken at (defaults to now)
+        lat: Latitude of the transit chart; with lng, exact aspect and Ascendant times are used
+        lng: Longitude of the transit chart
         
     Returns:
         A list of dictionaries containing information about each powerful alignment
     """
+    if lat is not None and lng is not None and isinstance(duplicate_yogi_planet, str) and duplicate_yogi_planet:
+        try:
+            return _exact_yearly_power_alignments(
+                float(yogi_point), duplicate_yogi_planet, float(duplicate_yogi_pos), float(ascendant_pos),
+                orb, reference_time or datetime.now(), lat, lng
+            )
+        except Exception as e:
+            logger.error(f"Error finding yearly power alignments from ephemeris, using estimates: {str(e)}")
+
     try:
         # Validate inputs
         if not isinstance(yogi_point, (int, float)) or not isinstance(duplicate_yogi_pos, (int, float)) or not isinstance(ascendant_pos, (int, float)):
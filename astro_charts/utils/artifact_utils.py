@@ -0,0 +1,174 @@
+import io
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Artifacts larger than this are spooled to a temporary file instead of kept in memory
+CHART_ARTIFACT_SPOOL_MB = float(os.getenv('CHART_ARTIFACT_SPOOL_MB', '8'))
+
+# Also write rendered visualizations to their charts/ path (for debugging)
+KEEP_CHART_FILES = os.getenv('KEEP_CHART_FILES', '').lower() in ('1', 'true', 'yes')
+
+# Periodic removal of old files from charts/
+CHART_CLEANUP_INTERVAL_SECONDS = float(os.getenv('CHART_CLEANUP_INTERVAL_SECONDS', '3600'))
+CHART_MAX_AGE_DAYS = float(os.getenv('CHART_MAX_AGE_DAYS', '7'))
+
+CONTENT_TYPES = {
+    'svg': 'image/svg+xml',
+    'html': 'text/html',
+    'json': 'application/json',
+    'png': 'image/png'
+}
+
+
+class ChartArtifact:
+    """A rendered chart file held in memory
+
+    Contents stay in memory up to spool_bytes and move to an anonymous temporary
+    file beyond that, so large renders do not pin memory and small ones never touch
+    the disk. The path is the name the chart would have under charts/; the file is
+    only written there by save().
+    """
+
+    def __init__(self, path: str, content_type: Optional[str] = None,
+                 spool_bytes: int = int(CHART_ARTIFACT_SPOOL_MB * 1024 * 1024)):
+        """
+        Initialize an empty artifact
+
+        Args:
+            path: Name of the chart, e.g. charts/Jane_natal_viz.svg
+            content_type: MIME type (derived from the extension when not given)
+            spool_bytes: Size above which contents are spooled to disk
+        """
+        self.path = path
+        self.filename = os.path.basename(path)
+        extension = os.path.splitext(path)[1].lstrip('.').lower()
+        self.content_type = content_type or CONTENT_TYPES.get(extension, 'application/octet-stream')
+        self.saved = False
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=spool_bytes)
+
+    @classmethod
+    def from_bytes(cls, path: str, content: Union[bytes, str], content_type: Optional[str] = None) -> 'ChartArtifact':
+        artifact = cls(path, content_type)
+        artifact.write(content)
+        return artifact
+
+    def write(self, content: Union[bytes, str]) -> None:
+        """Append bytes (or UTF-8 text)"""
+        self._buffer.write(content.encode('utf-8') if isinstance(content, str) else content)
+
+    def getvalue(self) -> bytes:
+        """The whole contents"""
+        self._buffer.seek(0)
+        content = self._buffer.read()
+        self._buffer.seek(0, io.SEEK_END)
+        return content
+
+    @property
+    def size(self) -> int:
+        position = self._buffer.tell()
+        self._buffer.seek(0, io.SEEK_END)
+        size = self._buffer.tell()
+        self._buffer.seek(position)
+        return size
+
+    @property
+    def spooled(self) -> bool:
+        """Whether the contents were moved to a temporary file"""
+        return bool(getattr(self._buffer, '_rolled', False))
+
+    def save(self, path: Optional[str] = None) -> str:
+        """Write the contents to disk (to self.path by default) and return the path"""
+        path = path or self.path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(self.getvalue())
+        self.saved = True
+        return path
+
+    def close(self) -> None:
+        self._buffer.close()
+
+    def __repr__(self) -> str:
+        return f"ChartArtifact({self.path!r}, {self.size} bytes)"
+
+
+def render_chart(chart: Any, path: str) -> ChartArtifact:
+    """
+    Render an Altair chart into an artifact
+
+    Args:
+        chart: Altair chart
+        path: Chart name; its extension (svg, html, json, png) picks the format
+
+    Returns:
+        ChartArtifact: The rendered chart (also written to path with KEEP_CHART_FILES)
+    """
+    fmt = os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt == 'png':
+        buffer = io.BytesIO()
+        chart.save(buffer, format=fmt)
+    else:
+        buffer = io.StringIO()
+        chart.save(buffer, format=fmt)
+    return text_artifact(path, buffer.getvalue())
+
+
+def text_artifact(path: str, content: Union[bytes, str]) -> ChartArtifact:
+    """
+    Wrap already rendered contents in an artifact
+
+    Args:
+        path: Chart name; its extension gives the content type
+        content: Rendered bytes or text
+
+    Returns:
+        ChartArtifact: The chart (also written to path with KEEP_CHART_FILES)
+    """
+    artifact = ChartArtifact.from_bytes(path, content)
+    if KEEP_CHART_FILES:
+        artifact.save()
+    return artifact
+
+
+def render_chart_pair(chart: Any, svg_path: str, html_path: str) -> Tuple[ChartArtifact, ChartArtifact]:
+    """Render an Altair chart as SVG and HTML artifacts"""
+    return render_chart(chart, svg_path), render_chart(chart, html_path)
+
+
+def artifact_path(artifact: Optional[ChartArtifact]) -> Optional[str]:
+    """Path of an artifact written to disk, or None when it only exists in memory"""
+    return artifact.path if artifact is not None and artifact.saved else None
+
+
+def cleanup_old_files(directory: str = 'charts', max_age_days: float = CHART_MAX_AGE_DAYS) -> int:
+    """
+    Remove files older than max_age_days from a directory
+
+    Args:
+        directory: Directory to clean
+        max_age_days: Age in days above which a file is removed
+
+    Returns:
+        int: Number of files removed
+    """
+    if not os.path.isdir(directory):
+        return 0
+
+    cutoff = time.time() - max_age_days * 24 * 60 * 60
+    removed = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    removed += 1
+            except OSError as e:
+                logger.error(f"Error removing old chart file {entry.path}: {str(e)}")
+    if removed:
+        logger.info(f"Removed {removed} old chart files from {directory}")
+    return removed
@@ -0,0 +1,149 @@
+import math
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+import pytz
+import swisseph as swe
+
+# swisseph keeps the sidereal mode and the topocentric site as global state; hold this
+# lock from setting either until the calculations that depend on it are done
+SWISSEPH_LOCK = threading.RLock()
+
+def normalize_angle(angle: float) -> float:
+    """Wrap an angle to (-180, 180]"""
+    angle = angle % 360
+    return angle - 360 if angle > 180 else angle
+
+def julian_day_to_datetime(julian_day: float) -> datetime:
+    """Convert a Julian day (UT) to a timezone-aware UTC datetime"""
+    year, month, day, hours = swe.revjul(julian_day)
+    return datetime(year, month, day, tzinfo=timezone.utc) + timedelta(hours=hours)
+
+def datetime_to_julian_day(moment: datetime, tz_str: Optional[str] = None) -> float:
+    """
+    Convert a datetime to a Julian day (UT)
+
+    Args:
+        moment: Aware datetime, or naive datetime in tz_str (UTC when tz_str is not given)
+        tz_str: IANA timezone of a naive moment
+
+    Returns:
+        float: Julian day (UT)
+    """
+    if moment.tzinfo is None:
+        moment = pytz.timezone(tz_str).localize(moment) if tz_str else moment.replace(tzinfo=timezone.utc)
+    moment = moment.astimezone(timezone.utc)
+    return swe.julday(
+        moment.year, moment.month, moment.day,
+        moment.hour + moment.minute / 60 + (moment.second + moment.microsecond / 1e6) / 3600
+    )
+
+def set_sidereal_mode(sidereal_mode: Optional[str]) -> None:
+    """
+    Apply a Swiss Ephemeris sidereal mode by name (defaults to Fagan/Bradley like kerykeion)
+
+    Call with SWISSEPH_LOCK held, together with the calculations using the mode.
+    """
+    swe.set_sid_mode(getattr(swe, f"SIDM_{sidereal_mode or 'FAGAN_BRADLEY'}"))
+
+def ascendant_at(julian_day: float, lat: float, lng: float, sidereal: bool = False) -> float:
+    """
+    Calculate the Ascendant from local sidereal time, latitude and the obliquity of the ecliptic
+
+    Args:
+        julian_day: Julian day (UT)
+        lat: Geographic latitude in degrees
+        lng: Geographic longitude in degrees (east positive)
+        sidereal: Subtract the ayanamsa of the current sidereal mode (see set_sidereal_mode)
+
+    Returns:
+        float: Ecliptic longitude of the Ascendant in degrees (0-360)
+    """
+    ramc = math.radians((swe.sidtime(julian_day) * 15 + lng) % 360)
+    obliquity = math.radians(swe.calc_ut(julian_day, swe.ECL_NUT)[0][0])
+    phi = math.radians(lat)
+
+    ascendant = math.degrees(math.atan2(
+        math.cos(ramc),
+        -(math.sin(ramc) * math.cos(obliquity) + math.tan(phi) * math.sin(obliquity))
+    ))
+
+    if sidereal:
+        ascendant -= swe.get_ayanamsa_ut(julian_day)
+    return ascendant % 360
+
+def find_ascendant_crossings(start_jd: float, end_jd: float, lat: float, lng: float,
+                             target_pos: float, sidereal: bool = False,
+                             step_minutes: float = 4.0,
+                             tolerance_seconds: float = 0.1) -> List[Tuple[float, float]]:
+    """
+    Find every time the Ascendant reaches a given ecliptic longitude
+
+    The Ascendant is sampled every step_minutes; intervals where its distance to the
+    target changes sign (ignoring the jump on the far side of the circle) bracket a
+    crossing, which is then narrowed by bisection.
+
+    Args:
+        start_jd: Start of the search window (Julian day, UT)
+        end_jd: End of the search window (Julian day, UT)
+        lat: Geographic latitude in degrees
+        lng: Geographic longitude in degrees
+        target_pos: Ecliptic longitude to find (0-360)
+        sidereal: Use sidereal positions (see set_sidereal_mode)
+        step_minutes: Sampling step; must be shorter than the quickest rising sign
+        tolerance_seconds: Bisection stops once the bracket is narrower than this
+
+    Returns:
+        List[Tuple[float, float]]: (Julian day, Ascendant longitude) of each crossing, in time order
+    """
+    step = step_minutes / (24 * 60)
+    tolerance = tolerance_seconds / (24 * 60 * 60)
+
+    def offset(julian_day):
+        return normalize_angle(ascendant_at(julian_day, lat, lng, sidereal) - target_pos)
+
+    crossings = []
+    previous_jd = start_jd
+    previous = offset(previous_jd)
+
+    while previous_jd < end_jd:
+        current_jd = min(previous_jd + step, end_jd)
+        current = offset(current_jd)
+
+        # A real crossing goes from just below to just above the target; the
+        # sign change on the opposite side of the circle is a jump of ~360
+        if previous <= 0 < current and current - previous < 180:
+            low, high = previous_jd, current_jd
+            while high - low > tolerance:
+                middle = (low + high) / 2
+                if offset(middle) <= 0:
+                    low = middle
+                else:
+                    high = middle
+            root = (low + high) / 2
+            crossings.append((root, ascendant_at(root, lat, lng, sidereal)))
+
+        previous_jd, previous = current_jd, current
+
+    return crossings
+
+def closest_ascendant_sample(start_jd: float, end_jd: float, lat: float, lng: float,
+                             target_pos: float, sidereal: bool = False,
+                             step_minutes: float = 4.0) -> Tuple[float, float, float]:
+    """
+    Find the sampled time the Ascendant comes closest to a longitude (for when it never reaches it)
+
+    Returns:
+        Tuple[float, float, float]: (Julian day, Ascendant longitude, distance in degrees)
+    """
+    step = step_minutes / (24 * 60)
+    best = None
+    julian_day = start_jd
+    while julian_day <= end_jd:
+        ascendant = ascendant_at(julian_day, lat, lng, sidereal)
+        distance = abs(normalize_angle(ascendant - target_pos))
+        if best is None or distance < best[2]:
+            best = (julian_day, ascendant, distance)
+        julian_day += step
+    return best
@@ -1,6 +1,11 @@
-from typing import Dict, List, Any, Optional
+import logging
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
+from .ascendant_utils import datetime_to_julian_day, normalize_angle
+
+logger = logging.getLogger(__name__)
+
 # Planet daily motions with retrograde adjustments
 PLANET_DAILY_MOTION = {
     'sun': 1.0,
@@ -12,8 +17,116 @@ PLANET_DAILY_MOTION = {
     'saturn': 0.034
 }
 
-def find_closest_aspect(current_pos: float, daily_motion: float, yogi_point: float, is_retrograde: bool = False, orb: float = 3.0, reference_time: Optional[datetime] = None) -> Dict[str, Any]:
-    """Find the closest aspect (conjunction, opposition, trine, sextile, square) to the Yogi Point"""
+# Aspects to the Yogi Point checked by find_closest_aspect and find_last_aspect
+YOGI_ASPECTS = {'conjunction': 0.0, 'opposition': 180.0}
+
+# How far find_closest_aspect and find_last_aspect search for an aspect
+MAX_ASPECT_SEARCH_DAYS = 1095
+
+def _find_aspect_event(planet: str, current_pos: float, yogi_point: float, orb: float,
+                       reference_time: datetime, forward: bool) -> Optional[Tuple[Dict[str, Any], float, float]]:
+    """
+    Find the next (or last) exact aspect of a planet to a point from real ephemeris positions
+
+    The planet's computed longitude is calibrated against current_pos at reference_time,
+    so events are in the same frame (tropical or sidereal) as the chart data. When the
+    planet is already within orb, the pass it is in the middle of is returned.
+
+    Returns:
+        Optional[Tuple[Dict, float, float]]: (event, reference Julian day, calibration offset),
+        or None if no aspect happens within MAX_ASPECT_SEARCH_DAYS
+    """
+    from ..services.event_finder import get_event_finder
+
+    finder = get_event_finder()
+    reference_jd = datetime_to_julian_day(reference_time)
+    offset = finder.calibrate(planet, current_pos, reference_jd)
+
+    in_orb_points = [
+        (yogi_point + angle) % 360 for angle in YOGI_ASPECTS.values()
+        if abs(normalize_angle(current_pos - (yogi_point + angle))) <= orb
+    ]
+
+    # Look a little way the other side of the reference time for the pass we may be inside of
+    lookaround = 120
+    if forward:
+        start_jd, end_jd = reference_jd - lookaround, reference_jd + MAX_ASPECT_SEARCH_DAYS
+    else:
+        start_jd, end_jd = reference_jd - MAX_ASPECT_SEARCH_DAYS, reference_jd + lookaround
+    events = finder.find_aspects(planet, yogi_point, start_jd, end_jd, YOGI_ASPECTS, offset)
+
+    current_passes = [e for e in events if any(abs(normalize_angle(e["point"] - p)) < 1e-9 for p in in_orb_points)]
+    if current_passes:
+        event = min(current_passes, key=lambda e: abs(e["julian_day"] - reference_jd))
+    elif forward:
+        event = next((e for e in events if e["julian_day"] >= reference_jd), None)
+    else:
+        event = next((e for e in reversed(events) if e["julian_day"] <= reference_jd), None)
+
+    if event is None:
+        return None
+
+    event["window"] = finder.find_orb_window(planet, event["point"], event["julian_day"], orb, offset)
+    return event, reference_jd, offset
+
+def _aspect_duration(reference_time: datetime, reference_jd: float, event: Dict[str, Any], tense: str) -> Dict[str, Any]:
+    """Duration block of an aspect found by _find_aspect_event"""
+    start_jd, end_jd = event["window"]
+    start_date = reference_time + timedelta(days=start_jd - reference_jd)
+    exact_date = reference_time + timedelta(days=event["julian_day"] - reference_jd)
+    end_date = reference_time + timedelta(days=end_jd - reference_jd)
+    duration_days = int(end_jd - start_jd)
+
+    return {
+        "days": duration_days,
+        "start_date": start_date.strftime("%Y-%m-%d"),
+        "exact_date": exact_date.strftime("%Y-%m-%d"),
+        "end_date": end_date.strftime("%Y-%m-%d"),
+        "description": f"This aspect {tense} active for approximately {duration_days} days, from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+    }
+
+def find_closest_aspect(current_pos: float, daily_motion: float, yogi_point: float, is_retrograde: bool = False, orb: float = 3.0, reference_time: Optional[datetime] = None, planet: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Find the closest aspect (conjunction, opposition) to the Yogi Point
+
+    When the planet is named, the exact time is found from real positions (see
+    EventFinder), which handles retrograde loops; otherwise, or if that fails, the
+    date is extrapolated linearly from daily_motion.
+    """
+    if planet:
+        today = reference_time if reference_time is not None else datetime.now()
+        try:
+            found = _find_aspect_event(planet, current_pos, yogi_point, orb, today, forward=True)
+            if found is None:
+                return {
+                    "type": "none",
+                    "point": 0,
+                    "distance": 0,
+                    "estimated_date": "N/A - no aspect within 3 years",
+                    "estimated_days": 0,
+                    "duration": {
+                        "days": 0,
+                        "start_date": "N/A",
+                        "exact_date": "N/A",
+                        "end_date": "N/A",
+                        "description": "No aspect found within 3 years"
+                    }
+                }
+
+            event, reference_jd, _ = found
+            estimated_date = today + timedelta(days=event["julian_day"] - reference_jd)
+            return {
+                "type": event["type"],
+                "point": event["point"],
+                "distance": float(abs(normalize_angle(current_pos - event["point"]))),
+                "is_applying": bool(event["julian_day"] >= reference_jd),
+                "estimated_date": estimated_date.strftime("%Y-%m-%d %H:%M"),
+                "estimated_days": max(0, int(event["julian_day"] - reference_jd)),
+                "duration": _aspect_duration(today, reference_jd, event, "is")
+            }
+        except Exception as e:
+            logger.error(f"Error finding next {planet} aspect from ephemeris, using linear estimate: {str(e)}")
+
     if daily_motion == 0:
         # Cannot predict aspects if there's no motion
         return {
@@ -145,8 +258,45 @@ def find_closest_aspect(current_pos: float, daily_motion: float, yogi_point: flo
         }
     }
 
-def find_last_aspect(current_pos: float, daily_motion: float, yogi_point: float, is_retrograde: bool = False, orb: float = 3.0, reference_time: Optional[datetime] = None) -> Dict[str, Any]:
-    """Find the most recent aspect (conjunction, opposition) to the Yogi Point"""
+def find_last_aspect(current_pos: float, daily_motion: float, yogi_point: float, is_retrograde: bool = False, orb: float = 3.0, reference_time: Optional[datetime] = None, planet: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Find the most recent aspect (conjunction, opposition) to the Yogi Point
+
+    Uses real positions when the planet is named, like find_closest_aspect.
+    """
+    if planet:
+        today = reference_time if reference_time is not None else datetime.now()
+        try:
+            found = _find_aspect_event(planet, current_pos, yogi_point, orb, today, forward=False)
+            if found is None:
+                return {
+                    "type": "none",
+                    "point": 0,
+                    "distance": 0,
+                    "estimated_date": "N/A - no aspect within past 3 years",
+                    "estimated_days_ago": 0,
+                    "duration": {
+                        "days": 0,
+                        "start_date": "N/A",
+                        "exact_date": "N/A",
+                        "end_date": "N/A",
+                        "description": "No aspect found within past 3 years"
+                    }
+                }
+
+            event, reference_jd, _ = found
+            estimated_date = today + timedelta(days=event["julian_day"] - reference_jd)
+            return {
+                "type": event["type"],
+                "point": event["point"],
+                "distance": float(abs(normalize_angle(current_pos - event["point"]))),
+                "estimated_date": estimated_date.strftime("%Y-%m-%d %H:%M"),
+                "estimated_days_ago": max(0, int(reference_jd - event["julian_day"])),
+                "duration": _aspect_duration(today, reference_jd, event, "was")
+            }
+        except Exception as e:
+            logger.error(f"Error finding last {planet} aspect from ephemeris, using linear estimate: {str(e)}")
+
     if daily_motion == 0:
         # Cannot predict aspects if there's no motion
         return {
@@ -304,8 +454,25 @@ def calculate_alignment_duration(exact_time: datetime, slower_planet: str = None
     # Calculate start and end dates
     start_date = exact_time - timedelta(days=days_for_orb)
     end_date = exact_time + timedelta(days=days_for_orb)
-    total_days = days_for_orb * 2
-    
+
+    return format_alignment_duration(start_date, exact_time, end_date, alignment_type)
+
+def format_alignment_duration(start_date: datetime, exact_time: datetime, end_date: datetime,
+                              alignment_type: str = "conjunction") -> Dict[str, Any]:
+    """
+    Build the duration block of an alignment from when it enters orb, is exact and leaves orb
+
+    Args:
+        start_date: When the alignment comes within orb
+        exact_time: The exact time of alignment
+        end_date: When the alignment leaves orb
+        alignment_type: The type of alignment, used in the description
+
+    Returns:
+        Dictionary with duration details
+    """
+    total_days = (end_date - start_date).total_seconds() / 86400
+
     # Format for output
     start_str = start_date.strftime("%Y-%m-%d")
     exact_str = exact_time.strftime("%Y-%m-%d")
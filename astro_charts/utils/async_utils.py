@@ -0,0 +1,141 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Number of threads available to chart computation; requests beyond this queue up
+CHART_EXECUTOR_WORKERS = int(os.getenv('CHART_EXECUTOR_WORKERS', str(min(8, (os.cpu_count() or 1) + 2))))
+
+# Number of processes for CPU-heavy work that is split into independent chunks (1 disables)
+CHART_PROCESS_WORKERS = int(os.getenv('CHART_PROCESS_WORKERS', str(os.cpu_count() or 1)))
+
+# How pool processes start; forking a server that already runs executor threads can copy
+# held locks (swisseph, logging, caches) into the child, so fork is avoided by default
+CHART_PROCESS_START_METHOD = os.getenv('CHART_PROCESS_START_METHOD', 'forkserver')
+
+# Number of threads running independent stages of one request concurrently (1 runs them in order)
+STAGE_EXECUTOR_WORKERS = int(os.getenv('STAGE_EXECUTOR_WORKERS', str(min(16, 2 * (os.cpu_count() or 1) + 4))))
+
+# Number of threads running stages that have a timeout; calls still running past their
+# timeout keep a thread until they return, so this also caps how many can pile up
+STAGE_TIMEOUT_WORKERS = max(1, int(os.getenv('STAGE_TIMEOUT_WORKERS', str(STAGE_EXECUTOR_WORKERS))))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+_stage_executor: Optional[ThreadPoolExecutor] = None
+_stage_executor_lock = threading.Lock()
+
+_stage_timeout_executor: Optional[ThreadPoolExecutor] = None
+_stage_timeout_executor_lock = threading.Lock()
+
+def get_chart_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor used for blocking chart work"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=CHART_EXECUTOR_WORKERS, thread_name_prefix="chart")
+            logger.info(f"Started chart executor with {CHART_EXECUTOR_WORKERS} workers")
+        return _executor
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """
+    Run a blocking (CPU-bound or synchronous I/O) call on the chart executor
+
+    Keeps the event loop free to serve other requests while the call runs.
+
+    Args:
+        func: Function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Any: Whatever func returns (exceptions are re-raised in the caller)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_chart_executor(), functools.partial(func, *args, **kwargs))
+
+def get_stage_executor() -> Optional[ThreadPoolExecutor]:
+    """Return the process-wide executor for stages within a request, or None when disabled
+
+    Separate from the chart executor: requests already running on the chart executor
+    wait for their stages, which must not queue up behind those same requests.
+    """
+    global _stage_executor
+    if STAGE_EXECUTOR_WORKERS <= 1:
+        return None
+    with _stage_executor_lock:
+        if _stage_executor is None:
+            _stage_executor = ThreadPoolExecutor(max_workers=STAGE_EXECUTOR_WORKERS, thread_name_prefix="stage")
+            logger.info(f"Started stage executor with {STAGE_EXECUTOR_WORKERS} workers")
+        return _stage_executor
+
+def get_stage_timeout_executor() -> ThreadPoolExecutor:
+    """Return the process-wide executor that runs stages with a timeout
+
+    Separate from the stage executor, whose threads wait on these calls.
+    """
+    global _stage_timeout_executor
+    with _stage_timeout_executor_lock:
+        if _stage_timeout_executor is None:
+            _stage_timeout_executor = ThreadPoolExecutor(max_workers=STAGE_TIMEOUT_WORKERS,
+                                                         thread_name_prefix="stage-timeout")
+            logger.info(f"Started stage timeout executor with {STAGE_TIMEOUT_WORKERS} workers")
+        return _stage_timeout_executor
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the process-wide pool used to spread chunked chart work across CPUs"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            start_method = CHART_PROCESS_START_METHOD
+            if start_method not in multiprocessing.get_all_start_methods():
+                start_method = 'spawn'
+            _process_pool = ProcessPoolExecutor(max_workers=CHART_PROCESS_WORKERS,
+                                                mp_context=multiprocessing.get_context(start_method))
+            logger.info(f"Started chart process pool with {CHART_PROCESS_WORKERS} {start_method} workers")
+        return _process_pool
+
+def reset_process_pool() -> None:
+    """Discard the process pool (e.g. after a worker crashed) so the next call starts a new one"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False)
+            _process_pool = None
+
+def shutdown_chart_executor() -> None:
+    """Stop the chart executor, stage executors and process pool, waiting for running work to finish"""
+    global _executor, _stage_executor, _stage_timeout_executor, _process_pool
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
+            logger.info("Chart executor shut down")
+
+    with _stage_executor_lock:
+        if _stage_executor is not None:
+            _stage_executor.shutdown(wait=True)
+            _stage_executor = None
+            logger.info("Stage executor shut down")
+
+    with _stage_timeout_executor_lock:
+        if _stage_timeout_executor is not None:
+            _stage_timeout_executor.shutdown(wait=True)
+            _stage_timeout_executor = None
+            logger.info("Stage timeout executor shut down")
+
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True)
+            _process_pool = None
+            logger.info("Chart process pool shut down")
@@ -0,0 +1,323 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Directory holding the persistent caches (next to kerykeion's geonames cache)
+CACHE_DIR = os.getenv('ASTRO_CACHE_DIR', 'cache')
+
+class LRUCache:
+    """Thread-safe in-process least-recently-used cache"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class BudgetLRUCache:
+    """Thread-safe least-recently-used cache bounded by the total size of its values
+
+    Values are measured with sizeof (len by default, so str and bytes values are
+    bounded by their length). Evicted entries are passed to on_evict, e.g. to spill
+    them to disk.
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int] = len,
+                 on_evict: Optional[Callable[[Any, Any], None]] = None):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+        self.size_bytes = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key][0]
+
+    def set(self, key: Any, value: Any) -> None:
+        size = self.sizeof(value)
+        evicted = []
+        with self._lock:
+            if key in self._data:
+                self.size_bytes -= self._data.pop(key)[1]
+            if size > self.max_bytes:
+                evicted.append((key, value))
+            else:
+                self._data[key] = (value, size)
+                self.size_bytes += size
+            while self.size_bytes > self.max_bytes:
+                old_key, (old_value, old_size) = self._data.popitem(last=False)
+                self.size_bytes -= old_size
+                evicted.append((old_key, old_value))
+
+        # Outside the lock, so a slow callback does not block readers
+        if self.on_evict:
+            for old_key, old_value in evicted:
+                self.on_evict(old_key, old_value)
+
+    def delete(self, key: Any) -> None:
+        with self._lock:
+            if key in self._data:
+                self.size_bytes -= self._data.pop(key)[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.size_bytes = 0
+
+    def __contains__(self, key: Any) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class PersistentCache:
+    """SQLite-backed key/value cache with an in-process LRU in front.
+
+    Values must be JSON serializable. Entries older than ttl_seconds are treated as
+    missing, and the least recently used rows are evicted once max_entries is exceeded.
+    """
+
+    EVICTION_CHECK_INTERVAL = 100  # Writes between size checks
+    BATCH_SIZE = 500               # Keys per query in get_many
+
+    def __init__(self, filename: str, ttl_seconds: Optional[float] = None,
+                 max_entries: Optional[int] = None, memory_size: int = 1024):
+        """
+        Initialize the cache
+
+        Args:
+            filename: SQLite file name inside CACHE_DIR (or an absolute path)
+            ttl_seconds: Maximum age of an entry, None to keep entries forever
+            max_entries: Maximum number of rows on disk, None for unbounded
+            memory_size: Number of entries kept in the in-process LRU
+        """
+        self.path = filename if os.path.isabs(filename) else os.path.join(CACHE_DIR, filename)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory = LRUCache(memory_size)
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)")
+            self._conn.commit()
+
+        logger.info(f"Opened persistent cache at {self.path}")
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or None if missing or expired"""
+        now = time.time()
+        entry = self.memory.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if not self._is_expired(created_at, now):
+                return value
+            self.memory.delete(key)
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                value_json, created_at = row
+                if self._is_expired(created_at, now):
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+
+                self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+
+            value = json.loads(value_json)
+            self.memory.set(key, (created_at, value))
+            return value
+
+        except sqlite3.Error as e:
+            logger.error(f"Error reading cache {self.path}: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON serializable value under key"""
+        now = time.time()
+        self.memory.set(key, (now, value))
+
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(value), now, now)
+                )
+                self._conn.commit()
+                self._writes += 1
+
+                if self.max_entries and self._writes % self.EVICTION_CHECK_INTERVAL == 0:
+                    self._evict()
+
+        except sqlite3.Error as e:
+            logger.error(f"Error writing cache {self.path}: {str(e)}")
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return the cached values of several keys (missing and expired keys are left out)"""
+        now = time.time()
+        found = {}
+        to_read = []
+        for key in keys:
+            entry = self.memory.get(key)
+            if entry is not None and not self._is_expired(entry[0], now):
+                found[key] = entry[1]
+            else:
+                to_read.append(key)
+
+        try:
+            with self._lock:
+                # Stay under SQLite's limit on bound parameters
+                for start in range(0, len(to_read), self.BATCH_SIZE):
+                    batch = to_read[start:start + self.BATCH_SIZE]
+                    rows = self._conn.execute(
+                        f"SELECT key, value, created_at FROM entries WHERE key IN ({','.join('?' * len(batch))})",
+                        batch
+                    ).fetchall()
+                    fresh = [row for row in rows if not self._is_expired(row[2], now)]
+                    self._conn.executemany(
+                        "UPDATE entries SET accessed_at = ? WHERE key = ?", [(now, row[0]) for row in fresh]
+                    )
+                    for key, value_json, created_at in fresh:
+                        value = json.loads(value_json)
+                        self.memory.set(key, (created_at, value))
+                        found[key] = value
+                self._conn.commit()
+
+        except sqlite3.Error as e:
+            logger.error(f"Error reading cache {self.path}: {str(e)}")
+
+        return found
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Store several JSON serializable values in one transaction"""
+        now = time.time()
+        for key, value in items.items():
+            self.memory.set(key, (now, value))
+
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    [(key, json.dumps(value), now, now) for key, value in items.items()]
+                )
+                self._conn.commit()
+                previous = self._writes
+                self._writes += len(items)
+
+                if self.max_entries and previous // self.EVICTION_CHECK_INTERVAL != self._writes // self.EVICTION_CHECK_INTERVAL:
+                    self._evict()
+
+        except sqlite3.Error as e:
+            logger.error(f"Error writing cache {self.path}: {str(e)}")
+
+    def delete(self, key: str) -> None:
+        """Remove key from memory and disk"""
+        self.memory.delete(key)
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error deleting from cache {self.path}: {str(e)}")
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from disk, returning how many were removed"""
+        if self.ttl_seconds is None:
+            return 0
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM entries WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+                )
+                self._conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error purging cache {self.path}: {str(e)}")
+            return 0
+
+    def _evict(self) -> None:
+        """Drop the least recently used rows above max_entries (caller holds the lock)"""
+        count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,)
+            )
+            self._conn.commit()
+            logger.info(f"Evicted {excess} entries from cache {self.path}")
+
+
+_shared_caches: Dict[str, PersistentCache] = {}
+_shared_caches_lock = threading.Lock()
+
+def get_persistent_cache(filename: str, **kwargs) -> PersistentCache:
+    """Return the process-wide PersistentCache for filename, creating it on first use"""
+    with _shared_caches_lock:
+        if filename not in _shared_caches:
+            _shared_caches[filename] = PersistentCache(filename, **kwargs)
+        return _shared_caches[filename]
@@ -1,10 +1,13 @@
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import json
+import logging
 
 from datetime import timedelta
 from .yogi_point_utils import ZODIAC_SIGNS
 
+logger = logging.getLogger(__name__)
+
 def sanitize_response_for_json(response: Dict[str, Any]) -> Dict[str, Any]:
     """Convert any datetime objects to strings and ensure the response is JSON serializable
     
@@ -420,3 +423,67 @@ def determine_day_night_chart(self, sun_pos: float, asc_pos: float, natal_data:
             f"Part of Fortune formula: {'Asc - Moon + Sun' if is_night_chart else 'Asc + Moon - Sun'}")
         
         return is_night_chart
+
+
+def extract_reference_time(transit_data: Optional[Dict[str, Any]], label: str = "") -> datetime:
+    """Determine the moment projections are calculated from
+
+    Tries transit.subject.date_utc, then the date and time in transit.subject.birth_data
+    (assumed local), then the top-level transit_year ... transit_minute keys, and falls
+    back to the current time.
+
+    Args:
+        transit_data: The transit chart data
+        label: Optional label for logging
+
+    Returns:
+        The reference time
+    """
+    prefix = f"[{label}] " if label else ""
+    reference_time = None
+    try:
+        transit_subject = None
+        if transit_data and isinstance(transit_data.get("transit"), dict) and isinstance(transit_data["transit"].get("subject"), dict):
+            transit_subject = transit_data["transit"]["subject"]
+
+        # Attempt 1: Get precise UTC time from transit data if available
+        if transit_subject is not None and transit_subject.get("date_utc"):
+            date_utc_str = transit_subject["date_utc"]
+            if date_utc_str.endswith('Z'): date_utc_str = date_utc_str[:-1] + '+00:00'
+            if '.' in date_utc_str:
+                parts = date_utc_str.split('.')
+                date_utc_str = parts[0] + '.' + parts[1][:6] # Truncate microseconds
+                if '+' not in date_utc_str and '-' not in date_utc_str[10:]: date_utc_str += '+00:00'
+            reference_time = datetime.fromisoformat(date_utc_str)
+            logger.debug(f"{prefix}Using reference time from transit.subject.date_utc: {reference_time}")
+
+        # Attempt 2: Reconstruct from transit subject birth_data
+        if reference_time is None and transit_subject is not None and isinstance(transit_subject.get("birth_data"), dict):
+            t_info = transit_subject["birth_data"]
+            if t_info.get("date") and t_info.get("time"):
+                datetime_str = f"{t_info['date']} {t_info['time']}"
+                try:
+                    reference_time = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
+                    logger.debug(f"{prefix}Using reference time reconstructed from transit.subject.birth_data: {reference_time} (assumed local)")
+                except ValueError as parse_error:
+                    logger.debug(f"{prefix}Could not parse transit.subject.birth_data date/time '{datetime_str}': {parse_error}")
+
+        # Attempt 3: Reconstruct from top-level transit info
+        if reference_time is None and transit_data:
+            required_keys = ["transit_year", "transit_month", "transit_day", "transit_hour", "transit_minute"]
+            if all(k in transit_data for k in required_keys):
+                reference_time = datetime(
+                    int(transit_data["transit_year"]), int(transit_data["transit_month"]), int(transit_data["transit_day"]),
+                    int(transit_data["transit_hour"]), int(transit_data["transit_minute"])
+                )
+                logger.debug(f"{prefix}Using reference time reconstructed from top-level transit_data keys: {reference_time} (assumed local)")
+
+    except Exception as e:
+        logger.warning(f"{prefix}Error extracting reference time: {str(e)}")
+
+    # Fallback if no time could be extracted
+    if reference_time is None:
+        reference_time = datetime.now()
+        logger.warning(f"{prefix}Could not extract reference time from transit_data, falling back to current time: {reference_time}")
+
+    return reference_time
@@ -1,6 +1,7 @@
 import datetime
 from datetime import datetime as dt
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,48 @@ def calculate_obliquity(t):
     # Convert from arcseconds to degrees
     return epsilon_A / 3600.0
 
+def calculate_nutation_in_obliquity(t):
+    """
+    Calculate the nutation in obliquity (low precision series, Meeus ch. 22)
+    
+    Args:
+        t (float or np.ndarray): Time in Julian centuries since J2000.0
+    Returns:
+        float or np.ndarray: Nutation in obliquity in degrees
+    """
+    # Longitude of the Moon's ascending node, mean longitudes of the Sun and Moon
+    omega = np.radians(125.04452 - 1934.136261 * t)
+    sun_longitude = np.radians(280.4665 + 36000.7698 * t)
+    moon_longitude = np.radians(218.3165 + 481267.8813 * t)
+    
+    # Nutation in obliquity in arcseconds
+    delta_epsilon = (9.20 * np.cos(omega) +
+                     0.57 * np.cos(2 * sun_longitude) +
+                     0.10 * np.cos(2 * moon_longitude) -
+                     0.09 * np.cos(2 * omega))
+    
+    return delta_epsilon / 3600.0
+
+def declination_from_ecliptic(longitude, latitude, obliquity):
+    """
+    Convert ecliptic coordinates to declination
+    
+    Args:
+        longitude (float or np.ndarray): Tropical ecliptic longitude in degrees
+        latitude (float or np.ndarray): Ecliptic latitude in degrees
+        obliquity (float or np.ndarray): Obliquity of the ecliptic in degrees
+    Returns:
+        float or np.ndarray: Declination in degrees
+    """
+    lon_rad = np.radians(longitude)
+    lat_rad = np.radians(latitude)
+    obliquity_rad = np.radians(obliquity)
+    
+    sin_dec = (np.sin(lat_rad) * np.cos(obliquity_rad) +
+               np.cos(lat_rad) * np.sin(obliquity_rad) * np.sin(lon_rad))
+    
+    return np.degrees(np.arcsin(np.clip(sin_dec, -1.0, 1.0)))
+
 def julian_centuries_since_j2000(date_str):
     """
     Calculate Julian centuries since J2000.0 from date string
@@ -74,4 +117,21 @@ def get_ecliptic_tilt(date_str):
     except Exception as e:
         logger.error(f"Error calculating ecliptic tilt: {str(e)}")
         # Fallback to mean value if calculation fails
-        return 23.43929111 
\ No newline at end of file
+        return 23.43929111 
+
+def get_true_obliquity(date_str):
+    """
+    Calculate the true obliquity (mean obliquity plus nutation) for a given date
+    
+    Args:
+        date_str (str): Date in format 'YYYY-MM-DD'
+    Returns:
+        float: True obliquity in degrees
+    """
+    try:
+        t = julian_centuries_since_j2000(date_str)
+        return float(calculate_obliquity(t) + calculate_nutation_in_obliquity(t))
+        
+    except Exception as e:
+        logger.error(f"Error calculating true obliquity: {str(e)}")
+        return 23.43929111
@@ -0,0 +1,62 @@
+import logging
+import os
+import threading
+from typing import Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Connection pool settings shared by every outgoing HTTP client
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', '20'))
+HTTP_TIMEOUT_SECONDS = float(os.getenv('HTTP_TIMEOUT_SECONDS', '60'))
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_aiohttp_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide requests session for blocking clients
+
+    Connections are kept alive and pooled per host, so repeated calls to the same
+    API (geocoding, Horizons, PocketBase) skip the TCP and TLS handshakes.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+            logger.info(f"Created shared HTTP session (pool size {HTTP_POOL_SIZE})")
+        return _session
+
+async def get_aiohttp_session() -> aiohttp.ClientSession:
+    """Return the process-wide aiohttp session, creating it on the running event loop"""
+    global _aiohttp_session
+    if _aiohttp_session is None or _aiohttp_session.closed:
+        connector = aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, ttl_dns_cache=300)
+        _aiohttp_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS)
+        )
+        logger.info(f"Created shared aiohttp session (connection limit {HTTP_POOL_SIZE})")
+    return _aiohttp_session
+
+async def close_http_sessions() -> None:
+    """Close the shared sessions (call on application shutdown)"""
+    global _session, _aiohttp_session
+    if _aiohttp_session is not None and not _aiohttp_session.closed:
+        await _aiohttp_session.close()
+    _aiohttp_session = None
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+    logger.info("Closed shared HTTP sessions")
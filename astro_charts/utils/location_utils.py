@@ -44,56 +44,8 @@ def calculate_location_specific_yogi_alignments(self, natal_data: Dict[str, Any]
             # Current date/time
             now = datetime.now()
             
-            # --- Determine the reference time for projections (Added) ---
-            reference_time = None
-            try:
-                # Attempt 1: Get precise UTC time from transit data if available
-                if transit_data and "transit" in transit_data and isinstance(transit_data['transit'], dict):
-                    if "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict):
-                        if "date_utc" in transit_data["transit"]["subject"]:
-                            date_utc_str = transit_data["transit"]["subject"]["date_utc"]
-                            if date_utc_str:
-                                if date_utc_str.endswith('Z'): date_utc_str = date_utc_str[:-1] + '+00:00'
-                                if '.' in date_utc_str:
-                                    parts = date_utc_str.split('.')
-                                    date_utc_str = parts[0] + '.' + parts[1][:6] # Truncate microseconds
-                                    if '+' not in date_utc_str and '-' not in date_utc_str[10:]: date_utc_str += '+00:00'
-                                reference_time = datetime.fromisoformat(date_utc_str)
-                                print(f"[LocSpec] SUCCESS: Using reference time from transit.subject.date_utc: {reference_time}")
-
-                # Attempt 2: Reconstruct from transit subject birth_data
-                if reference_time is None and transit_data:
-                     if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                         "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                         "birth_data" in transit_data["transit"]["subject"] and isinstance(transit_data['transit']['subject']['birth_data'], dict)):
-                         t_info = transit_data["transit"]["subject"]["birth_data"]
-                         required_keys = ["date", "time"]
-                         if all(k in t_info for k in required_keys) and t_info["date"] and t_info["time"]:
-                             datetime_str = f"{t_info['date']} {t_info['time']}"
-                             try:
-                                 reference_time = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-                                 print(f"[LocSpec] SUCCESS: Using reference time reconstructed from transit.subject.birth_data: {reference_time} (Assumed Local)")
-                             except ValueError as parse_error:
-                                 print(f"[LocSpec] DEBUG: Attempt 2 Error parsing date/time string '{datetime_str}': {parse_error}")
-
-                # Attempt 3: Reconstruct from top-level transit info
-                if reference_time is None and transit_data:
-                    required_keys = ["transit_year", "transit_month", "transit_day", "transit_hour", "transit_minute"]
-                    if all(k in transit_data for k in required_keys):
-                        reference_time = datetime(
-                            int(transit_data["transit_year"]), int(transit_data["transit_month"]), int(transit_data["transit_day"]),
-                            int(transit_data["transit_hour"]), int(transit_data["transit_minute"])
-                        )
-                        print(f"[LocSpec] SUCCESS: Using reference time reconstructed from top-level transit_data keys: {reference_time} (Assumed Local)")
-
-            except Exception as e:
-                print(f"[LocSpec] ERROR: Exception during reference time extraction: {e}")
-
-            # Fallback if no time could be extracted
-            if reference_time is None:
-                reference_time = now # Use datetime.now() as fallback, but store it
-                print(f"[LocSpec] WARNING: Could not extract reference time from transit_data. Falling back to current time: {reference_time}. Results may drift.")
-            # --- End of added reference_time logic ---
+            # --- Determine the reference time for projections ---
+            reference_time = self.get_reference_time(transit_data, "LocSpec")
 
             # Create a result dictionary with calculated data
             result = {
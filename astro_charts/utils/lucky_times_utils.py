@@ -1,4 +1,5 @@
 import json
+import logging
 from datetime import datetime, timedelta
 import math
 from typing import Dict, Any, List, Optional, Tuple
@@ -6,69 +7,41 @@ from typing import Dict, Any, List, Optional, Tuple
 # Import other utility modules that might be needed
 from .yogi_point_utils import ZODIAC_SIGNS
 from .aspect_utils import PLANET_DAILY_MOTION, find_closest_aspect, find_last_aspect, calculate_alignment_duration
+from .ascendant_utils import normalize_angle
+from .chart_utils import extract_reference_time
 
+logger = logging.getLogger(__name__)
 
-def calculate_jupiter_pof_last_conjunction(natal_data: Dict[str, Any], transit_data: Dict[str, Any]) -> Dict[str, Any]:
+# Venus aspects to the Yogi and Ava Yogi points, as angles from the point
+VENUS_ASPECTS = {
+    'conjunction': 0.0,
+    'trine1': 120.0,
+    'trine2': -120.0,
+    'sextile1': 60.0,
+    'sextile2': -60.0,
+    'square1': 90.0,
+    'square2': -90.0,
+    'opposition': 180.0
+}
+
+
+def calculate_jupiter_pof_last_conjunction(natal_data: Dict[str, Any], transit_data: Dict[str, Any],
+                                           reference_time: Optional[datetime] = None) -> Dict[str, Any]:
     """
     Calculate when Jupiter was last conjunct with the natal Part of Fortune.
     
     Args:
         natal_data: The natal chart data dictionary
         transit_data: The transit chart data dictionary
+        reference_time: Moment to calculate from (extracted from transit_data when not given)
         
     Returns:
         Dictionary containing Jupiter-POF conjunction data
     """
     try:
         # --- Determine the reference time for calculations ---
-        reference_time = None
-        try:
-            # Attempt 1: Get precise UTC time from transit data
-            if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                "date_utc" in transit_data["transit"]["subject"]):
-                date_utc_str = transit_data["transit"]["subject"]["date_utc"]
-                if date_utc_str:
-                    if date_utc_str.endswith('Z'): date_utc_str = date_utc_str[:-1] + '+00:00'
-                    if '.' in date_utc_str:
-                        parts = date_utc_str.split('.')
-                        date_utc_str = parts[0] + '.' + parts[1][:6]
-                        if '+' not in date_utc_str and '-' not in date_utc_str[10:]: date_utc_str += '+00:00'
-                    reference_time = datetime.fromisoformat(date_utc_str)
-                    print(f"[Jupiter-PoF] SUCCESS: Using reference time from transit.subject.date_utc: {reference_time}")
-
-            # Attempt 2: Reconstruct from transit subject birth_data
-            if reference_time is None:
-                 if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                     "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                     "birth_data" in transit_data["transit"]["subject"] and isinstance(transit_data['transit']['subject']['birth_data'], dict)):
-                     t_info = transit_data["transit"]["subject"]["birth_data"]
-                     required_keys = ["date", "time"]
-                     if all(k in t_info for k in required_keys) and t_info["date"] and t_info["time"]:
-                         datetime_str = f"{t_info['date']} {t_info['time']}"
-                         try:
-                             reference_time = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-                             print(f"[Jupiter-PoF] SUCCESS: Using reference time reconstructed from transit.subject.birth_data: {reference_time} (Assumed Local)")
-                         except ValueError as parse_error:
-                             print(f"[Jupiter-PoF] DEBUG: Attempt 2 Error parsing date/time string '{datetime_str}': {parse_error}")
-
-            # Attempt 3: Reconstruct from top-level transit info
-            if reference_time is None:
-                required_keys = ["transit_year", "transit_month", "transit_day", "transit_hour", "transit_minute"]
-                if all(k in transit_data for k in required_keys):
-                    reference_time = datetime(
-                        int(transit_data["transit_year"]), int(transit_data["transit_month"]), int(transit_data["transit_day"]),
-                        int(transit_data["transit_hour"]), int(transit_data["transit_minute"])
-                    )
-                    print(f"[Jupiter-PoF] SUCCESS: Using reference time reconstructed from top-level transit_data keys: {reference_time} (Assumed Local)")
-
-        except Exception as e:
-            print(f"[Jupiter-PoF] ERROR: Exception during reference time extraction: {e}")
-
-        # Fallback if no time could be extracted
         if reference_time is None:
-            reference_time = datetime.now() # Keep existing fallback but log warning
-            print(f"[Jupiter-PoF] WARNING: Could not extract reference time from transit_data. Falling back to datetime.now(). Results may drift.")
+            reference_time = extract_reference_time(transit_data, "Jupiter-PoF")
 
         # Calculate the natal Part of Fortune position
         natal_asc_pos = natal_data["subject"]["houses"]["ascendant"]["abs_pos"]
@@ -181,6 +154,62 @@ def calculate_jupiter_pof_last_conjunction(natal_data: Dict[str, Any], transit_d
         }
 
 
+def _exact_venus_aspects(transit_data: Dict[str, Any], current_venus_pos: float, points: Dict[str, float],
+                         orb: float) -> Tuple[Optional[datetime], Dict[Tuple[str, str], Dict[str, Any]]]:
+    """
+    Find the next exact time of each Venus aspect to each point from real positions
+
+    Args:
+        transit_data: Transit chart data; its time and location anchor the search
+        current_venus_pos: Venus longitude in the transit chart, used for calibration
+        points: Point name to longitude
+        orb: Orb used for the aspect windows
+
+    Returns:
+        Tuple: (transit time, {(point name, aspect name): aspect fields}); the mapping is
+        empty when the transit time or location is missing
+    """
+    from ..services.event_finder import get_event_finder
+    from .alignment_utils import transit_reference, transit_julian_day
+
+    today, lat, lng = transit_reference(transit_data)
+    if today is None or lat is None or lng is None:
+        return None, {}
+
+    finder = get_event_finder()
+    reference_jd = transit_julian_day(today, lat, lng)
+    offset = finder.calibrate("venus", current_venus_pos, reference_jd)
+
+    def local_date(julian_day):
+        return (today + timedelta(days=julian_day - reference_jd)).strftime("%Y-%m-%d")
+
+    found = {}
+    for point_name, point in points.items():
+        # Venus retrograde loops can delay an aspect past a year, so search a whole synodic period
+        for event in finder.find_aspects("venus", point, reference_jd, reference_jd + 600, VENUS_ASPECTS, offset):
+            key = (point_name, event["type"])
+            if key in found:
+                continue
+
+            start_jd, end_jd = finder.find_orb_window("venus", event["point"], event["julian_day"], orb, offset)
+            duration_days = int(end_jd - start_jd)
+            found[key] = {
+                'aspect_type': event["type"].rstrip('12'),
+                'estimated_date': local_date(event["julian_day"]),
+                'days_to_aspect': int(event["julian_day"] - reference_jd),
+                'aspect_point': event["point"],
+                'distance': round(abs(normalize_angle(event["point"] - current_venus_pos)), 2),
+                'duration': {
+                    'days': duration_days,
+                    'start_date': local_date(start_jd),
+                    'exact_date': local_date(event["julian_day"]),
+                    'end_date': local_date(end_jd),
+                    'description': f"This aspect is active for approximately {duration_days} days, from {local_date(start_jd)} to {local_date(end_jd)}"
+                }
+            }
+    return today, found
+
+
 def get_next_venus_aspects(natal_data: Dict[str, Any], transit_data: Dict[str, Any], orb: float = 3.0) -> Dict[str, Any]:
     """
     Find upcoming Venus aspects to the Yogi Point and Ava Yogi Point
@@ -236,6 +265,15 @@ def get_next_venus_aspects(natal_data: Dict[str, Any], transit_data: Dict[str, A
         # Use the provided orb parameter instead of a fixed value
         standard_orb = orb
         
+        # Exact aspect times when the transit chart has a time and location
+        try:
+            _, exact_aspects = _exact_venus_aspects(
+                transit_data, current_venus_pos, {"yogi": yogi_point, "ava_yogi": ava_yogi_point}, standard_orb
+            )
+        except Exception as e:
+            logger.error(f"Error finding Venus aspects from ephemeris, using estimates: {str(e)}")
+            exact_aspects = {}
+        
         # Define aspect points for Yogi Point
         aspect_points = {
             'conjunction': yogi_point,
@@ -250,6 +288,11 @@ def get_next_venus_aspects(natal_data: Dict[str, Any], transit_data: Dict[str, A
         
         # For each aspect point, calculate estimated date of aspect
         for aspect_name, aspect_point in aspect_points.items():
+            exact = exact_aspects.get(("yogi", aspect_name))
+            if exact:
+                venus_yogi_aspects.append({**exact, 'interpretation': interpret_venus_aspect(exact['aspect_type'], "yogi")})
+                continue
+            
             # Calculate shortest distance to aspect point
             direct_diff = (aspect_point - current_venus_pos) % 360
             retro_diff = (current_venus_pos - aspect_point) % 360
@@ -318,6 +361,11 @@ def get_next_venus_aspects(natal_data: Dict[str, Any], transit_data: Dict[str, A
         }
         
         for aspect_name, aspect_point in ava_aspect_points.items():
+            exact = exact_aspects.get(("ava_yogi", aspect_name))
+            if exact:
+                venus_ava_yogi_aspects.append({**exact, 'interpretation': interpret_venus_aspect(exact['aspect_type'], "ava_yogi")})
+                continue
+            
             direct_diff = (aspect_point - current_venus_pos) % 360
             retro_diff = (current_venus_pos - aspect_point) % 360
             
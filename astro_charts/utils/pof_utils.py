@@ -26,54 +26,7 @@ def calculate_part_of_fortune_rahu_conjunctions(self, natal_data: Dict[str, Any]
         
         try:
             # --- Determine the reference time for projections ---
-            reference_time = None
-            try:
-                # Attempt 1: Get precise UTC time from transit data
-                if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                    "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                    "date_utc" in transit_data["transit"]["subject"]):
-                    date_utc_str = transit_data["transit"]["subject"]["date_utc"]
-                    if date_utc_str:
-                        if date_utc_str.endswith('Z'): date_utc_str = date_utc_str[:-1] + '+00:00'
-                        if '.' in date_utc_str:
-                             parts = date_utc_str.split('.')
-                             date_utc_str = parts[0] + '.' + parts[1][:6]
-                             if '+' not in date_utc_str and '-' not in date_utc_str[10:]: date_utc_str += '+00:00'
-                        reference_time = datetime.fromisoformat(date_utc_str)
-                        print(f"[PoF-Rahu] SUCCESS: Using reference time from transit.subject.date_utc: {reference_time}")
-            
-                # Attempt 2: Reconstruct from transit subject birth_data
-                if reference_time is None:
-                     if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                         "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                         "birth_data" in transit_data["transit"]["subject"] and isinstance(transit_data['transit']['subject']['birth_data'], dict)):
-                         t_info = transit_data["transit"]["subject"]["birth_data"]
-                         required_keys = ["date", "time"]
-                         if all(k in t_info for k in required_keys) and t_info["date"] and t_info["time"]:
-                             datetime_str = f"{t_info['date']} {t_info['time']}"
-                             try:
-                                 reference_time = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-                                 print(f"[PoF-Rahu] SUCCESS: Using reference time reconstructed from transit.subject.birth_data: {reference_time} (Assumed Local)")
-                             except ValueError as parse_error:
-                                 print(f"[PoF-Rahu] DEBUG: Attempt 2 Error parsing date/time string '{datetime_str}': {parse_error}")
-
-                # Attempt 3: Reconstruct from top-level transit info
-                if reference_time is None:
-                    required_keys = ["transit_year", "transit_month", "transit_day", "transit_hour", "transit_minute"]
-                    if all(k in transit_data for k in required_keys):
-                        reference_time = datetime(
-                            int(transit_data["transit_year"]), int(transit_data["transit_month"]), int(transit_data["transit_day"]),
-                            int(transit_data["transit_hour"]), int(transit_data["transit_minute"])
-                        )
-                        print(f"[PoF-Rahu] SUCCESS: Using reference time reconstructed from top-level transit_data keys: {reference_time} (Assumed Local)")
-
-            except Exception as e:
-                print(f"[PoF-Rahu] ERROR: Exception during reference time extraction: {e}")
-
-            # Fallback if no time could be extracted
-            if reference_time is None:
-                reference_time = datetime.now() # Keep existing fallback but log warning
-                print(f"[PoF-Rahu] WARNING: Could not extract reference time from transit_data. Falling back to datetime.now(). Results may drift.")
+            reference_time = self.get_reference_time(transit_data, "PoF-Rahu")
 
             # Get current positions of Rahu (North Node)
             rahu_pos = None
@@ -289,54 +242,7 @@ def calculate_part_of_fortune_regulus_conjunctions(self, natal_data: Dict[str, A
         
         try:
             # --- Determine the reference time for projections ---
-            reference_time = None
-            try:
-                # Attempt 1: Get precise UTC time from transit data
-                if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                    "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                    "date_utc" in transit_data["transit"]["subject"]):
-                    date_utc_str = transit_data["transit"]["subject"]["date_utc"]
-                    if date_utc_str:
-                        if date_utc_str.endswith('Z'): date_utc_str = date_utc_str[:-1] + '+00:00'
-                        if '.' in date_utc_str:
-                             parts = date_utc_str.split('.')
-                             date_utc_str = parts[0] + '.' + parts[1][:6]
-                             if '+' not in date_utc_str and '-' not in date_utc_str[10:]: date_utc_str += '+00:00'
-                        reference_time = datetime.fromisoformat(date_utc_str)
-                        print(f"[PoF-Regulus] SUCCESS: Using reference time from transit.subject.date_utc: {reference_time}")
-            
-                # Attempt 2: Reconstruct from transit subject birth_data
-                if reference_time is None:
-                     if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                         "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                         "birth_data" in transit_data["transit"]["subject"] and isinstance(transit_data['transit']['subject']['birth_data'], dict)):
-                         t_info = transit_data["transit"]["subject"]["birth_data"]
-                         required_keys = ["date", "time"]
-                         if all(k in t_info for k in required_keys) and t_info["date"] and t_info["time"]:
-                             datetime_str = f"{t_info['date']} {t_info['time']}"
-                             try:
-                                 reference_time = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-                                 print(f"[PoF-Regulus] SUCCESS: Using reference time reconstructed from transit.subject.birth_data: {reference_time} (Assumed Local)")
-                             except ValueError as parse_error:
-                                 print(f"[PoF-Regulus] DEBUG: Attempt 2 Error parsing date/time string '{datetime_str}': {parse_error}")
-
-                # Attempt 3: Reconstruct from top-level transit info
-                if reference_time is None:
-                    required_keys = ["transit_year", "transit_month", "transit_day", "transit_hour", "transit_minute"]
-                    if all(k in transit_data for k in required_keys):
-                        reference_time = datetime(
-                            int(transit_data["transit_year"]), int(transit_data["transit_month"]), int(transit_data["transit_day"]),
-                            int(transit_data["transit_hour"]), int(transit_data["transit_minute"])
-                        )
-                        print(f"[PoF-Regulus] SUCCESS: Using reference time reconstructed from top-level transit_data keys: {reference_time} (Assumed Local)")
-
-            except Exception as e:
-                print(f"[PoF-Regulus] ERROR: Exception during reference time extraction: {e}")
-
-            # Fallback if no time could be extracted
-            if reference_time is None:
-                reference_time = datetime.now() # Keep existing fallback but log warning
-                print(f"[PoF-Regulus] WARNING: Could not extract reference time from transit_data. Falling back to datetime.now(). Results may drift.")
+            reference_time = self.get_reference_time(transit_data, "PoF-Regulus")
 
             # Calculate current Regulus position
             # Regulus entered 0° Virgo in 2012
@@ -963,88 +869,8 @@ def calculate_ascendant_part_of_fortune_conjunctions(self, natal_data: Dict[str,
                 else:
                      raise ValueError("Could not determine ascendant position using transit or natal data")
 
-            # --- Determine the reference time for the calculation ---
-            reference_time = None
-            try:
-                # --- Enhanced Logging for Debugging Reference Time Extraction ---
-                print(f"DEBUG: Attempting to extract reference time from transit_data.")
-                print(f"DEBUG: Top-level transit_data keys: {list(transit_data.keys())}")
-
-                # Attempt 1: Get precise UTC time from transit data if available
-                if "transit" in transit_data and isinstance(transit_data['transit'], dict):
-                    print(f"DEBUG: Found 'transit' key. Keys inside: {list(transit_data['transit'].keys())}")
-                    if "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict):
-                        print(f"DEBUG: Found 'subject' key inside 'transit'. Keys inside: {list(transit_data['transit']['subject'].keys())}")
-                        if "date_utc" in transit_data["transit"]["subject"]:
-                            date_utc_str = transit_data["transit"]["subject"]["date_utc"]
-                            print(f"DEBUG: Attempt 1: Found date_utc: {date_utc_str}")
-                            if date_utc_str:
-                                if date_utc_str.endswith('Z'):
-                                   date_utc_str = date_utc_str[:-1] + '+00:00'
-                                if '.' in date_utc_str:
-                                     parts = date_utc_str.split('.')
-                                     date_utc_str = parts[0] + '.' + parts[1][:6] # Truncate microseconds
-                                     if '+' not in date_utc_str and '-' not in date_utc_str[10:]:
-                                         date_utc_str += '+00:00'
-
-                                reference_time = datetime.fromisoformat(date_utc_str)
-                                print(f"SUCCESS: Using reference time from transit_data.transit.subject.date_utc: {reference_time}")
-                            else:
-                                print("DEBUG: Attempt 1: date_utc field was empty.")
-                        else:
-                             print("DEBUG: Attempt 1: 'date_utc' key not found in transit.subject.")
-                    else:
-                        print("DEBUG: 'subject' key not found or not a dict in transit.")
-                else:
-                    print("DEBUG: 'transit' key not found or not a dict at top level.")
-
-                # Attempt 2: Reconstruct from transit subject birth_data (often used for transit time/location)
-                if reference_time is None:
-                    if ("transit" in transit_data and isinstance(transit_data['transit'], dict) and
-                        "subject" in transit_data['transit'] and isinstance(transit_data['transit']['subject'], dict) and
-                        "birth_data" in transit_data["transit"]["subject"] and isinstance(transit_data['transit']['subject']['birth_data'], dict)):
-                        
-                        t_info = transit_data["transit"]["subject"]["birth_data"]
-                        print(f"DEBUG: Attempt 2: Found transit.subject.birth_data. Keys: {list(t_info.keys())}")
-                        # --- MODIFIED --- Look for 'date' and 'time' keys instead of year, month, etc.
-                        required_keys = ["date", "time"]
-                        if all(k in t_info for k in required_keys) and t_info["date"] and t_info["time"]:
-                             date_str = t_info["date"] # e.g., "2025-03-29"
-                             time_str = t_info["time"] # e.g., "12:00"
-                             datetime_str = f"{date_str} {time_str}"
-                             try:
-                                 # Combine and parse the date and time strings
-                                 reference_time = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-                                 print(f"SUCCESS: Using reference time reconstructed from transit.subject.birth_data (date='{date_str}', time='{time_str}'): {reference_time} (Assumed Local)")
-                             except ValueError as parse_error:
-                                 print(f"DEBUG: Attempt 2: Error parsing date/time string '{datetime_str}': {parse_error}")
-                        else:
-                            print(f"DEBUG: Attempt 2: Missing or empty 'date' or 'time' keys in birth_data.")
-                    else:
-                        print("DEBUG: Attempt 2: Path transit.subject.birth_data not found or is not a dictionary.")
-
-                # Attempt 3: Reconstruct from top-level transit info (another common pattern)
-                if reference_time is None:
-                     required_keys = ["transit_year", "transit_month", "transit_day", "transit_hour", "transit_minute"]
-                     if all(k in transit_data for k in required_keys):
-                         print(f"DEBUG: Attempt 3: Found top-level transit time keys.")
-                         reference_time = datetime(
-                             int(transit_data["transit_year"]), int(transit_data["transit_month"]), int(transit_data["transit_day"]),
-                             int(transit_data["transit_hour"]), int(transit_data["transit_minute"])
-                         )
-                         print(f"SUCCESS: Using reference time reconstructed from top-level transit_data keys: {reference_time} (Assumed Local)")
-                     else:
-                         print(f"DEBUG: Attempt 3: Missing one or more required top-level keys: {required_keys}")
-
-            except Exception as e:
-                print(f"ERROR: Exception during reference time extraction: {e}")
-                import traceback
-                traceback.print_exc() # Print full traceback for detailed debugging
-
-            # Fallback if no time could be extracted
-            if reference_time is None:
-                reference_time = datetime.now() # Keep existing fallback but log warning
-                print(f"WARNING: Could not extract reference time from transit_data. Falling back to datetime.now(): {reference_time}. Results may drift.")
+            # --- Determine the reference time for projections ---
+            reference_time = self.get_reference_time(transit_data, "Asc-PoF")
 
             # --- Calculation based on the determined reference_time ---
             
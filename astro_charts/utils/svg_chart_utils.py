@@ -0,0 +1,380 @@
+import logging
+import math
+import os
+from html import escape
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .artifact_utils import ChartArtifact, text_artifact
+
+logger = logging.getLogger(__name__)
+
+# Rendering backends of the visualization services
+RENDER_MODE_ALTAIR = 'altair'  # Altair/Vega specs saved through vl-convert
+RENDER_MODE_FAST = 'fast'      # SVG written directly from columnar data
+RENDER_MODES = (RENDER_MODE_ALTAIR, RENDER_MODE_FAST)
+
+# Backend used when a request does not choose one
+VISUALIZATION_RENDER_MODE = os.getenv('VISUALIZATION_RENDER_MODE', RENDER_MODE_ALTAIR).lower()
+
+FONT_FAMILY = 'sans-serif'
+WATERMARK = 'Magi Maps'
+
+# Space around the plot area of a panel (pixels)
+MARGIN_LEFT = 60
+MARGIN_RIGHT = 140   # legend
+MARGIN_TOP = 50      # title and subtitle
+MARGIN_BOTTOM = 60   # date labels
+PANEL_SPACING = 20
+
+BAR_SIZE = 20        # bar width, as mark_bar(size=20)
+AXIS_COLOR = '#888888'
+GRID_COLOR = '#dddddd'
+
+
+def resolve_render_mode(render_mode: Optional[str] = None) -> str:
+    """
+    Pick the rendering backend of a visualization
+
+    Args:
+        render_mode: "altair" or "fast"; None uses VISUALIZATION_RENDER_MODE
+
+    Returns:
+        str: One of RENDER_MODES
+    """
+    mode = (render_mode or VISUALIZATION_RENDER_MODE).lower()
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode {render_mode!r}; expected one of {', '.join(RENDER_MODES)}")
+    return mode
+
+
+def _fmt(value: float) -> str:
+    """Coordinate with at most two decimals"""
+    return f"{value:.2f}".rstrip('0').rstrip('.')
+
+
+def interpolate_color(value: float, domain: Sequence[float], colors: Sequence[str]) -> str:
+    """
+    Color of a value on a piecewise linear scale
+
+    Args:
+        value: Value to color
+        domain: Increasing stops, e.g. [0, 50, 100]
+        colors: Hex color of each stop
+
+    Returns:
+        str: Hex color
+    """
+    rgb = np.array([[int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in colors], dtype=float)
+    channels = [np.interp(value, domain, rgb[:, channel]) for channel in range(3)]
+    return '#' + ''.join(f"{int(round(channel)):02x}" for channel in channels)
+
+
+def tick_values(maximum: float, count: int = 5) -> np.ndarray:
+    """Integer axis ticks from 0 to maximum, about count of them"""
+    step = max(1, math.ceil(maximum / count))
+    return np.arange(0, maximum + 1e-9, step)
+
+
+class SvgCanvas:
+    """SVG document assembled from element strings
+
+    Elements are collected in a list and joined once; the canvas grows to fit
+    every panel drawn on it.
+    """
+
+    def __init__(self, width: float = 0, height: float = 0):
+        self.width = width
+        self.height = height
+        self.parts: List[str] = []
+
+    def fit(self, right: float, bottom: float) -> None:
+        """Grow the canvas to contain the point (right, bottom)"""
+        self.width = max(self.width, right)
+        self.height = max(self.height, bottom)
+
+    def rect(self, x: float, y: float, width: float, height: float, fill: str,
+             title: Optional[str] = None, rx: float = 0, opacity: Optional[float] = None) -> None:
+        attributes = f'x="{_fmt(x)}" y="{_fmt(y)}" width="{_fmt(width)}" height="{_fmt(height)}" fill="{fill}"'
+        if rx:
+            attributes += f' rx="{_fmt(rx)}"'
+        if opacity is not None:
+            attributes += f' fill-opacity="{opacity}"'
+        if title:
+            self.parts.append(f'<rect {attributes}><title>{escape(title)}</title></rect>')
+        else:
+            self.parts.append(f'<rect {attributes}/>')
+
+    def rects(self, x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray,
+              fill: str, titles: Optional[Sequence[str]] = None, rx: float = 0) -> None:
+        """Draw many rectangles of one color; zero-size ones are skipped"""
+        x, y, width, height = np.broadcast_arrays(x, y, width, height)
+        keep = np.flatnonzero((width > 0) & (height > 0))
+        rounded = ' rx="%s"' % _fmt(rx) if rx else ''
+        for i in keep:
+            element = (f'<rect x="{_fmt(x[i])}" y="{_fmt(y[i])}" width="{_fmt(width[i])}" '
+                       f'height="{_fmt(height[i])}" fill="{fill}"{rounded}')
+            if titles is not None and titles[i]:
+                self.parts.append(f'{element}><title>{escape(titles[i])}</title></rect>')
+            else:
+                self.parts.append(f'{element}/>')
+
+    def line(self, x1: float, y1: float, x2: float, y2: float, stroke: str = AXIS_COLOR,
+             width: float = 1) -> None:
+        self.parts.append(
+            f'<line x1="{_fmt(x1)}" y1="{_fmt(y1)}" x2="{_fmt(x2)}" y2="{_fmt(y2)}" '
+            f'stroke="{stroke}" stroke-width="{_fmt(width)}"/>'
+        )
+
+    def polyline(self, x: np.ndarray, y: np.ndarray, stroke: str, width: float = 2,
+                 titles: Optional[Sequence[str]] = None) -> None:
+        """Draw a line through points, with a hover target at every point when titles are given"""
+        points = ' '.join(f"{_fmt(px)},{_fmt(py)}" for px, py in zip(x, y))
+        self.parts.append(f'<polyline points="{points}" fill="none" stroke="{stroke}" stroke-width="{_fmt(width)}"/>')
+        if titles is not None:
+            for px, py, title in zip(x, y, titles):
+                self.parts.append(
+                    f'<circle cx="{_fmt(px)}" cy="{_fmt(py)}" r="4" fill="{stroke}">'
+                    f'<title>{escape(title)}</title></circle>'
+                )
+
+    def text(self, x: float, y: float, content: str, size: float = 11, anchor: str = 'start',
+             fill: str = '#000000', weight: str = 'normal', rotate: float = 0,
+             opacity: Optional[float] = None, baseline: Optional[str] = None) -> None:
+        attributes = f'x="{_fmt(x)}" y="{_fmt(y)}" font-size="{_fmt(size)}" text-anchor="{anchor}" fill="{fill}"'
+        if weight != 'normal':
+            attributes += f' font-weight="{weight}"'
+        if rotate:
+            attributes += f' transform="rotate({_fmt(rotate)} {_fmt(x)} {_fmt(y)})"'
+        if opacity is not None:
+            attributes += f' fill-opacity="{opacity}"'
+        if baseline:
+            attributes += f' dominant-baseline="{baseline}"'
+        self.parts.append(f'<text {attributes}>{escape(content)}</text>')
+
+    def title(self, x: float, y: float, text: str, subtitle: Optional[str] = None,
+              size: float = 16, anchor: str = 'start') -> None:
+        """Panel or document title, with an optional subtitle below it"""
+        self.text(x, y, text, size=size, anchor=anchor, weight='bold')
+        if subtitle:
+            self.text(x, y + size + 2, subtitle, size=12, anchor=anchor, fill='#555555')
+
+    def legend(self, x: float, y: float, colors: Dict[str, str], title: Optional[str] = None) -> None:
+        """Color legend at (x, y)"""
+        if title:
+            self.text(x, y, title, size=11, weight='bold')
+            y += 16
+        for i, (name, color) in enumerate(colors.items()):
+            self.rect(x, y + i * 18 - 10, 12, 12, color)
+            self.text(x + 18, y + i * 18, name, size=11)
+
+    def watermark(self, right: float, bottom: float) -> None:
+        self.text(right - 10, bottom - 10, WATERMARK, size=14, anchor='end', fill='gray', opacity=0.3)
+
+    def to_svg(self) -> str:
+        width, height = _fmt(self.width), _fmt(self.height)
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}" font-family="{FONT_FAMILY}">'
+            f'<rect width="100%" height="100%" fill="#ffffff"/>'
+            + ''.join(self.parts) +
+            '</svg>'
+        )
+
+
+def stacked_bar_panel(canvas: SvgCanvas, x: float, y: float, labels: Sequence[str],
+                      series: Dict[str, np.ndarray], colors: Dict[str, str], title: str,
+                      subtitle: Optional[str] = None, y_title: str = '', y_max: Optional[float] = None,
+                      tooltips: Optional[Dict[str, Sequence[str]]] = None, width: float = 600,
+                      height: float = 200, label_angle: float = 0, max_labels: int = 31,
+                      legend_title: Optional[str] = None,
+                      line: Optional[Tuple[str, np.ndarray, str, Sequence[str]]] = None) -> float:
+    """
+    Draw a bar chart with one stacked bar per label
+
+    Positions of every bar segment are computed with array operations before
+    anything is written.
+
+    Args:
+        canvas: Canvas to draw on
+        x: Left edge of the panel
+        y: Top edge of the panel
+        labels: X axis label of each bar
+        series: Series name -> value of every bar, stacked in this order
+        colors: Series name -> color
+        title: Panel title
+        subtitle: Line below the title
+        y_title: Y axis title
+        y_max: Top of the y axis (defaults to the tallest stack); taller stacks are clipped
+        tooltips: Series name -> hover text of every bar segment
+        width: Width of the plot area
+        height: Height of the plot area
+        label_angle: Rotation of the x labels in degrees
+        max_labels: Label at most this many bars (every n-th one beyond it)
+        legend_title: Title above the color legend
+        line: (name, values, color, hover texts) drawn over the bars on its own right-hand axis
+
+    Returns:
+        float: Bottom edge of the panel
+    """
+    names = list(series)
+    count = len(labels)
+    values = np.vstack([np.asarray(series[name], dtype=float) for name in names]) if names else np.zeros((0, count))
+    tops = np.cumsum(values, axis=0)
+    if y_max is None:
+        y_max = max(1.0, float(tops[-1].max()) if count and names else 1.0)
+
+    plot_x, plot_y = x + MARGIN_LEFT, y + MARGIN_TOP
+    plot_bottom = plot_y + height
+    canvas.title(x + MARGIN_LEFT, y + 18, title, subtitle, size=14)
+
+    # Grid and y axis
+    for tick in tick_values(y_max):
+        tick_y = plot_bottom - tick / y_max * height
+        canvas.line(plot_x, tick_y, plot_x + width, tick_y, stroke=GRID_COLOR)
+        canvas.text(plot_x - 6, tick_y + 4, f"{int(tick)}", size=10, anchor='end')
+    canvas.line(plot_x, plot_y, plot_x, plot_bottom)
+    canvas.line(plot_x, plot_bottom, plot_x + width, plot_bottom)
+    if y_title:
+        canvas.text(x + 14, plot_y + height / 2, y_title, size=11, anchor='middle', rotate=-90)
+
+    # Bars
+    if count:
+        band = width / count
+        bar_width = min(BAR_SIZE, band * 0.8)
+        centers = plot_x + (np.arange(count) + 0.5) * band
+        scale = height / y_max
+        clipped_tops = np.minimum(tops, y_max)
+        clipped_bottoms = np.minimum(tops - values, y_max)
+        for row, name in enumerate(names):
+            canvas.rects(
+                centers - bar_width / 2,
+                plot_bottom - clipped_tops[row] * scale,
+                bar_width,
+                (clipped_tops[row] - clipped_bottoms[row]) * scale,
+                colors[name],
+                tooltips.get(name) if tooltips else
+                [f"{label}\n{name}: {int(value)}" for label, value in zip(labels, values[row])]
+            )
+
+        # X labels, thinned so they do not overlap
+        step = max(1, math.ceil(count / max_labels))
+        for i in range(0, count, step):
+            if label_angle:
+                canvas.text(centers[i], plot_bottom + 14, labels[i], size=10, anchor='end', rotate=label_angle)
+            else:
+                canvas.text(centers[i], plot_bottom + 14, labels[i], size=10, anchor='middle')
+
+        if line is not None:
+            line_name, line_values, line_color, line_titles = line
+            line_values = np.asarray(line_values, dtype=float)
+            low, high = min(0.0, float(line_values.min())), max(1.0, float(line_values.max()))
+            line_y = plot_bottom - (line_values - low) / (high - low) * height
+            canvas.polyline(centers, line_y, line_color, titles=line_titles)
+            canvas.line(plot_x + width, plot_y, plot_x + width, plot_bottom, stroke=line_color)
+            for tick in np.linspace(low, high, 5):
+                tick_y = plot_bottom - (tick - low) / (high - low) * height
+                canvas.text(plot_x + width + 6, tick_y + 4, f"{tick:.0f}", size=10, fill=line_color)
+            canvas.text(plot_x + width + 40, plot_y + height / 2, line_name, size=11,
+                        anchor='middle', rotate=90, fill=line_color)
+
+    legend_x = plot_x + width + (60 if line is not None else 20)
+    canvas.legend(legend_x, plot_y + 10, {name: colors[name] for name in names}, legend_title)
+    canvas.watermark(plot_x + width, plot_bottom)
+
+    bottom = plot_bottom + MARGIN_BOTTOM
+    canvas.fit(legend_x + MARGIN_RIGHT, bottom)
+    return bottom
+
+
+def horizontal_bar_panel(canvas: SvgCanvas, x: float, y: float,
+                         rows: Sequence[Tuple[str, Sequence[Tuple[float, str, str]]]],
+                         title: str, x_max: float, x_title: str = '', width: float = 600,
+                         height: float = 200, track: Optional[str] = None,
+                         value_labels: bool = False) -> float:
+    """
+    Draw a bar chart with one horizontal bar per row
+
+    Args:
+        canvas: Canvas to draw on
+        x: Left edge of the panel
+        y: Top edge of the panel
+        rows: (row label, segments) where each segment is (value, color, hover text),
+            stacked left to right
+        title: Panel title
+        x_max: Right end of the x axis
+        x_title: X axis title
+        width: Width of the plot area
+        height: Height of the plot area
+        track: Color of a full-length background bar behind every row
+        value_labels: Write the total of each row at the end of its bar
+
+    Returns:
+        float: Bottom edge of the panel
+    """
+    label_width = 110
+    plot_x, plot_y = x + label_width, y + MARGIN_TOP
+    plot_bottom = plot_y + height
+    canvas.title(x + label_width, y + 18, title, size=14)
+
+    x_max = max(x_max, 1e-9)
+    scale = width / x_max
+    for tick in tick_values(x_max):
+        tick_x = plot_x + tick * scale
+        canvas.line(tick_x, plot_y, tick_x, plot_bottom, stroke=GRID_COLOR)
+        canvas.text(tick_x, plot_bottom + 14, f"{int(tick)}", size=10, anchor='middle')
+    canvas.line(plot_x, plot_bottom, plot_x + width, plot_bottom)
+    if x_title:
+        canvas.text(plot_x + width / 2, plot_bottom + 32, x_title, size=11, anchor='middle')
+
+    band = height / max(1, len(rows))
+    bar_height = min(30, band * 0.8)
+    for i, (label, segments) in enumerate(rows):
+        center = plot_y + (i + 0.5) * band
+        top = center - bar_height / 2
+        canvas.text(plot_x - 8, center + 4, label, size=12, anchor='end')
+        if track:
+            canvas.rect(plot_x, top, width, bar_height, track, rx=5)
+        left, total = 0.0, 0.0
+        for value, color, hover in segments:
+            segment = min(value, x_max - left)
+            if segment > 0:
+                canvas.rect(plot_x + left * scale, top, segment * scale, bar_height, color, title=hover, rx=5)
+            left += max(segment, 0)
+            total += value
+        if value_labels:
+            canvas.text(plot_x + left * scale + 5, center + 5, f"{total:.0f}", size=14)
+
+    canvas.watermark(plot_x + width, plot_bottom)
+    bottom = plot_bottom + MARGIN_BOTTOM
+    canvas.fit(plot_x + width + 40, bottom)
+    return bottom
+
+
+def html_document(svg: str, title: str) -> str:
+    """Standalone HTML page showing an SVG; hover texts come from its <title> elements"""
+    return (
+        '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+        f'<title>{escape(title)}</title>\n'
+        '<style>body { margin: 0; padding: 16px; font-family: sans-serif; }</style>\n'
+        f'</head>\n<body>\n{svg}\n</body>\n</html>\n'
+    )
+
+
+def render_svg_pair(canvas: SvgCanvas, title: str, svg_path: str,
+                    html_path: str) -> Tuple[ChartArtifact, ChartArtifact]:
+    """
+    Serialize a canvas as SVG and HTML artifacts
+
+    Args:
+        canvas: Finished canvas
+        title: Page title of the HTML version
+        svg_path: Name of the SVG artifact
+        html_path: Name of the HTML artifact
+
+    Returns:
+        Tuple[ChartArtifact, ChartArtifact]: SVG and HTML artifacts
+    """
+    svg = canvas.to_svg()
+    return text_artifact(svg_path, svg), text_artifact(html_path, html_document(svg, title))
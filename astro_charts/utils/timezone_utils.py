@@ -0,0 +1,86 @@
+import logging
+import os
+import threading
+from typing import Optional
+
+from timezonefinder import TimezoneFinder
+
+from .cache_utils import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Coordinates are rounded to this many decimals before lookup (4 decimals is about 11 m)
+TIMEZONE_CACHE_PRECISION = int(os.getenv('TIMEZONE_CACHE_PRECISION', '4'))
+TIMEZONE_CACHE_SIZE = int(os.getenv('TIMEZONE_CACHE_SIZE', '4096'))
+
+# Load the whole timezone polygon data set into memory instead of reading it from the
+# package files on demand. Faster per lookup, at the cost of startup time and memory.
+TIMEZONE_IN_MEMORY = os.getenv('TIMEZONE_IN_MEMORY', '').lower() in ('1', 'true', 'yes')
+
+
+class TimezoneResolver:
+    """Coordinate to IANA timezone lookups sharing one TimezoneFinder"""
+
+    def __init__(self, precision: int = TIMEZONE_CACHE_PRECISION,
+                 cache_size: int = TIMEZONE_CACHE_SIZE, in_memory: bool = TIMEZONE_IN_MEMORY):
+        """
+        Initialize the resolver
+
+        Args:
+            precision: Decimals kept when quantizing coordinates for the cache
+            cache_size: Number of quantized coordinates kept in the LRU cache
+            in_memory: Load the timezone data into memory rather than reading files on demand
+        """
+        self.precision = precision
+        self.in_memory = in_memory
+        self.cache = LRUCache(cache_size)
+        self._finder = None
+        self._lock = threading.Lock()
+
+    @property
+    def finder(self) -> TimezoneFinder:
+        """The TimezoneFinder, created on first use"""
+        if self._finder is None:
+            with self._lock:
+                if self._finder is None:
+                    self._finder = TimezoneFinder(in_memory=self.in_memory)
+                    logger.info(f"Initialized TimezoneFinder (in_memory={self.in_memory})")
+        return self._finder
+
+    def timezone_at(self, lat: float, lng: float) -> Optional[str]:
+        """
+        Get the timezone name for a coordinate
+
+        Args:
+            lat: Latitude in degrees
+            lng: Longitude in degrees
+
+        Returns:
+            Optional[str]: IANA timezone name, or None if none was found
+        """
+        key = (round(lat, self.precision), round(lng, self.precision))
+        timezone_str = self.cache.get(key)
+        if timezone_str is None:
+            finder = self.finder
+            # TimezoneFinder reads its data files with seeks, so lookups are serialized
+            with self._lock:
+                timezone_str = finder.timezone_at(lat=key[0], lng=key[1])
+            if timezone_str:
+                self.cache.set(key, timezone_str)
+        return timezone_str
+
+
+_resolver: Optional[TimezoneResolver] = None
+_resolver_lock = threading.Lock()
+
+def get_timezone_resolver() -> TimezoneResolver:
+    """Return the process-wide TimezoneResolver"""
+    global _resolver
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = TimezoneResolver()
+        return _resolver
+
+def get_timezone(lat: float, lng: float) -> Optional[str]:
+    """Get the timezone name for a coordinate using the process-wide resolver"""
+    return get_timezone_resolver().timezone_at(lat, lng)
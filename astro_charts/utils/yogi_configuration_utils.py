@@ -4,7 +4,7 @@ from typing import Dict, Any, List, Optional
 
 from .aspect_utils import PLANET_DAILY_MOTION
 from .yogi_point_utils import get_ascendant_ruler, ZODIAC_SIGNS
-from .alignment_utils import find_yearly_power_alignments
+from .alignment_utils import find_yearly_power_alignments, transit_reference
 from .lucky_times_utils import calculate_triple_alignments
 
 def calculate_yogi_configurations(self, natal_data: Dict[str, Any], transit_data: Dict[str, Any], orb: float = 3.0) -> Dict[str, Any]:
@@ -15,6 +15,7 @@ def calculate_yogi_configurations(self, natal_data: Dict[str, Any], transit_data
             print(f"Transit Data: {transit_data}")
             yogi_point = self.calculate_yogi_point(natal_data)
             yogi_point_transit = self.calculate_yogi_point_transit(transit_data)
+            transit_time, transit_lat, transit_lng = transit_reference(transit_data)
             print(f"Yogi Point: {yogi_point}")
             print(f"Yogi Point Transit: {yogi_point_transit}")
             
@@ -193,7 +194,10 @@ def calculate_yogi_configurations(self, natal_data: Dict[str, Any], transit_data
                 duplicate_yogi_pos=duplicate_yogi_pos,
                 is_retrograde=duplicate_yogi_retrograde,
                 ascendant_pos=ascendant_pos,
-                orb=orb
+                orb=orb,
+                reference_time=transit_time,
+                lat=transit_lat,
+                lng=transit_lng
             )
             
             result = {
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+import swisseph as swe
+
+from astro_charts.services import ephemeris_store
+from astro_charts.services.ephemeris_engine import EphemerisEngine
+from astro_charts.services.ephemeris_store import EphemerisStore
+
+# Interpolation error allowed against a direct calculation, in arcseconds
+LONGITUDE_TOLERANCE = 2.0
+LATITUDE_TOLERANCE = 1.0
+# Longitude speed error allowed, in degrees/day
+SPEED_TOLERANCE = 0.002
+
+
+@pytest.fixture(scope="module")
+def store(tmp_path_factory):
+    return EphemerisStore.build(str(tmp_path_factory.mktemp("ephemeris")), start_year=2023, end_year=2024)
+
+
+def direct(body, julian_days):
+    flags = swe.FLG_SWIEPH + swe.FLG_SPEED
+    return np.array([swe.calc_ut(jd, EphemerisEngine.BODY_IDS[body], flags)[0] for jd in julian_days])
+
+
+def assert_matches_direct(store, body, julian_days):
+    longitude, latitude, speed = store.interpolate(julian_days, [body])
+    expected = direct(body, julian_days)
+
+    longitude_error = np.abs((longitude[:, 0] - expected[:, 0] + 180) % 360 - 180) * 3600
+    assert longitude_error.max() < LONGITUDE_TOLERANCE
+    assert np.abs(latitude[:, 0] - expected[:, 1]).max() * 3600 < LATITUDE_TOLERANCE
+    assert np.abs(speed[:, 0] - expected[:, 3]).max() < SPEED_TOLERANCE
+
+
+def find_brackets(store, body, condition):
+    """Julian days around every stored sample pair where condition(before, after) holds"""
+    julian_days = store.start_jd + np.arange(len(store.data)) * store.step_days
+    values = direct(body, julian_days)
+    hits = np.nonzero(condition(values[:-1], values[1:]))[0]
+    assert len(hits) > 0
+    return np.concatenate([julian_days[i] + np.linspace(0, store.step_days, 25) for i in hits])
+
+
+@pytest.mark.parametrize("body", list(EphemerisEngine.BODY_IDS))
+def test_interpolation_matches_calc_ut_at_random_times(store, body):
+    julian_days = np.random.default_rng(13).uniform(store.start_jd, store.end_jd, 300)
+    assert_matches_direct(store, body, julian_days)
+
+
+@pytest.mark.parametrize("body", ["sun", "moon", "mercury"])
+def test_interpolation_across_360_to_0(store, body):
+    julian_days = find_brackets(store, body, lambda before, after: before[:, 0] - after[:, 0] > 180)
+    assert_matches_direct(store, body, julian_days)
+
+
+@pytest.mark.parametrize("body", ["mercury", "venus", "mars"])
+def test_interpolation_around_retrograde_stations(store, body):
+    julian_days = find_brackets(store, body, lambda before, after: np.sign(before[:, 3]) != np.sign(after[:, 3]))
+    assert_matches_direct(store, body, julian_days)
+
+
+def test_missing_store_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(ephemeris_store, "EPHEMERIS_STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(ephemeris_store, "EPHEMERIS_STORE_ENABLED", True)
+    monkeypatch.setattr(ephemeris_store, "EPHEMERIS_STORE_BUILD", False)
+    monkeypatch.setattr(ephemeris_store, "_stores", {})
+    assert ephemeris_store.get_ephemeris_store() is None
+
+    # A short store saved under the name of the default coverage stands in for a full build
+    EphemerisStore.build(str(tmp_path), start_year=2024, end_year=2024)
+    step_hours = ephemeris_store.EPHEMERIS_STORE_STEP_HOURS
+    built = EphemerisStore.file_stem(None, None, 2024, 2024, step_hours)
+    default = EphemerisStore.file_stem(None, None, ephemeris_store.EPHEMERIS_STORE_START_YEAR,
+                                       ephemeris_store.EPHEMERIS_STORE_END_YEAR, step_hours)
+    for suffix in (".npy", ".json"):
+        (tmp_path / f"{built}{suffix}").rename(tmp_path / f"{default}{suffix}")
+
+    assert ephemeris_store.get_ephemeris_store() is not None
@@ -0,0 +1,123 @@
+import json
+from datetime import datetime
+
+import numpy as np
+import pytest
+import swisseph as swe
+
+from astro_charts.services import ephemeris_store
+from astro_charts.services.event_finder import EventFinder
+from astro_charts.utils.aspect_utils import find_closest_aspect, find_last_aspect
+
+FLAGS = swe.FLG_SWIEPH + swe.FLG_SPEED
+# Allowed difference between the finder's event times and the reference ones, in days
+TIME_TOLERANCE = 2 / (24 * 60 * 60)
+
+START_JD = swe.julday(2023, 1, 1, 0.0)
+END_JD = swe.julday(2025, 1, 1, 0.0)
+
+
+@pytest.fixture
+def finder(monkeypatch):
+    # Compare the finder's own precision, not the interpolated store's
+    monkeypatch.setattr(ephemeris_store, "EPHEMERIS_STORE_ENABLED", False)
+    return EventFinder()
+
+
+def longitude(body_id, julian_day):
+    return swe.calc_ut(julian_day, body_id, FLAGS)[0][0]
+
+
+def speed(body_id, julian_day):
+    return swe.calc_ut(julian_day, body_id, FLAGS)[0][3]
+
+
+def wrapped(value):
+    return (value + 180) % 360 - 180
+
+
+def reference_roots(func, start_jd, end_jd, step=0.25):
+    """Roots of func found by scanning swe.calc_ut values on a fine grid and bisecting"""
+    julian_days = np.arange(start_jd, end_jd + step, step)
+    values = [func(jd) for jd in julian_days]
+    roots = []
+    for low, high, low_value, high_value in zip(julian_days[:-1], julian_days[1:], values[:-1], values[1:]):
+        if (low_value < 0) == (high_value < 0) or abs(high_value - low_value) > 180:
+            continue
+        while high - low > 1e-8:
+            middle = (low + high) / 2
+            if (func(middle) < 0) == (low_value < 0):
+                low = middle
+            else:
+                high = middle
+        roots.append((low + high) / 2)
+    return roots
+
+
+def assert_times_match(found, expected):
+    assert len(found) == len(expected)
+    assert np.abs(np.array(found) - np.array(expected)).max() < TIME_TOLERANCE
+
+
+def test_aspects_through_a_retrograde_loop(finder):
+    # Venus turned retrograde at about 28 Leo in July 2023 and direct at about 12 Leo
+    point = 140.0
+    events = finder.find_aspects("venus", point, START_JD, END_JD)
+
+    expected = sorted(
+        root for target in (point, point + 180)
+        for root in reference_roots(lambda jd: wrapped(longitude(swe.VENUS, jd) - target), START_JD, END_JD)
+    )
+    assert_times_match([event["julian_day"] for event in events], expected)
+    # Direct, retrograde and direct again through the loop, then the next year's pass
+    conjunctions = [event["is_retrograde"] for event in events if event["type"] == "conjunction"]
+    assert conjunctions == [False, True, False, False]
+
+
+def test_stations(finder):
+    events = finder.find_stations("mercury", START_JD, END_JD)
+
+    expected = reference_roots(lambda jd: speed(swe.MERCURY, jd), START_JD, END_JD)
+    assert_times_match([event["julian_day"] for event in events], expected)
+    assert len(events) == 13
+    assert {event["type"] for event in events} == {"retrograde", "direct"}
+
+
+def test_ingresses(finder):
+    events = finder.find_ingresses("mars", START_JD, END_JD)
+
+    expected = sorted(
+        root for boundary in range(0, 360, 30)
+        for root in reference_roots(lambda jd: wrapped(longitude(swe.MARS, jd) - boundary), START_JD, END_JD)
+    )
+    assert_times_match([event["julian_day"] for event in events], expected)
+    assert len(events) == 14
+    assert [event["sign"] for event in events[-2:]] == ["Can", "Leo"]
+
+
+@pytest.mark.parametrize("body, offset", [("rahu", 0.0), ("ketu", 180.0)])
+def test_lunar_node_aspects(finder, body, offset):
+    point = 10.0
+    start_jd, end_jd = START_JD, START_JD + 20 * 365.25
+    events = finder.find_aspects(body, point, start_jd, end_jd)
+
+    expected = sorted(
+        root for target in (point, point + 180)
+        for root in reference_roots(
+            lambda jd: wrapped(longitude(swe.MEAN_NODE, jd) + offset - target), start_jd, end_jd, step=2.0
+        )
+    )
+    assert_times_match([event["julian_day"] for event in events], expected)
+    assert len(events) == 2
+    assert all(event["is_retrograde"] for event in events)
+
+
+def test_aspect_results_are_json_serializable(finder):
+    reference_time = datetime(2024, 3, 1, 12, 0)
+    current_pos = longitude(swe.JUPITER, swe.julday(2024, 3, 1, 12.0))
+    for find in (find_closest_aspect, find_last_aspect):
+        result = find(current_pos, 0.083, 60.0, reference_time=reference_time, planet="jupiter")
+        json.dumps(result)
+
+    result = find_closest_aspect(current_pos, 0.083, 60.0, reference_time=reference_time, planet="jupiter")
+    assert type(result["is_applying"]) is bool
@@ -0,0 +1,74 @@
+import asyncio
+import socket
+import sqlite3
+import time
+
+from astro_charts.services.job_queue import JobQueue
+
+
+def make_queues(tmp_path, runs, count=2):
+    async def handler(payload, progress):
+        runs.append(payload["n"])
+        await asyncio.sleep(0.02)
+        return payload["n"]
+
+    queues = []
+    for _ in range(count):
+        queue = JobQueue(str(tmp_path / "jobs.sqlite"), workers=2)
+        queue.register("test", handler)
+        queues.append(queue)
+    return queues
+
+
+def test_each_job_runs_once_across_queues(tmp_path):
+    runs = []
+
+    async def scenario():
+        first, second = make_queues(tmp_path, runs)
+        await first.start()
+        await second.start()
+        for n in range(6):
+            first.submit("test", {"n": n}, job_id=f"job-{n}")
+            # The second queue sees the same jobs; only one claim may win
+            second._queue.put_nowait(f"job-{n}")
+        await asyncio.sleep(0.5)
+        statuses = [first.get(f"job-{n}")["status"] for n in range(6)]
+        await first.stop()
+        await second.stop()
+        return statuses
+
+    statuses = asyncio.run(scenario())
+    assert sorted(runs) == list(range(6))
+    assert statuses == [JobQueue.STATUS_COMPLETED] * 6
+
+
+def test_only_jobs_of_gone_owners_are_requeued(tmp_path):
+    runs = []
+
+    async def scenario():
+        first, second = make_queues(tmp_path, runs)
+        await first.start()
+        for n in range(3):
+            first.submit("test", {"n": n}, job_id=f"job-{n}")
+        await asyncio.sleep(0.3)
+
+        conn = sqlite3.connect(str(tmp_path / "jobs.sqlite"))
+        conn.execute("UPDATE jobs SET status = 'running', owner = ? WHERE job_id = 'job-0'", (first.owner,))
+        conn.execute("UPDATE jobs SET status = 'running', owner = 'elsewhere:1:a', updated_at = ? "
+                     "WHERE job_id = 'job-1'", (time.time() - 100000,))
+        conn.execute("UPDATE jobs SET status = 'running', owner = ? WHERE job_id = 'job-2'",
+                     (f"{socket.gethostname()}:999999999:a",))
+        conn.commit()
+        conn.close()
+
+        await second.start()
+        await asyncio.sleep(0.3)
+        statuses = [second.get(f"job-{n}")["status"] for n in range(3)]
+        await first.stop()
+        await second.stop()
+        return statuses
+
+    statuses = asyncio.run(scenario())
+    # job-0 belongs to a running queue; job-1 is stale and job-2's process is gone
+    assert statuses == [JobQueue.STATUS_RUNNING, JobQueue.STATUS_COMPLETED, JobQueue.STATUS_COMPLETED]
+    assert sorted(runs) == [0, 1, 1, 2, 2]
@@ -0,0 +1,56 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from astro_charts.magi_linkages import MagiLinkageCalculator
+from astro_charts.magi_synastry import MagiSynastryCalculator
+from astro_charts.marital_linkages import MaritalLinkageCalculator
+from astro_charts.romance_linkages import RomanceLinkageCalculator
+from astro_charts.sexual_linkages import SexualLinkageCalculator
+
+# Output of the per-family calculators before they moved onto the shared linkage engine
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "data", "linkages_golden.json")
+BODIES = ["sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto", "chiron"]
+DATES = ["1950-06-15", "1975-01-03", "1990-11-20", "2001-04-09", "2020-08-30"]
+
+
+def chart(rng, name, date):
+    # Positions near multiples of 30 degrees and a few declinations, so charts share many aspects
+    return {"subject": {"name": name, "birth_data": {"date": date}, "planets": {
+        body: {"name": body.capitalize(),
+               "abs_pos": float(round((rng.integers(12) * 30 + rng.normal(0, 2)) % 360, 4)),
+               "declination": float(round(rng.choice([-23.0, -12.0, 0.5, 11.5, 22.5]) + rng.normal(0, 1.5), 4))}
+        for body in BODIES
+    }}}
+
+
+def chart_pairs():
+    rng = np.random.default_rng(17)
+    return [(chart(rng, f"A{i}", DATES[i % 5]), chart(rng, f"B{i}", DATES[(i + 2) % 5])) for i in range(12)]
+
+
+@pytest.fixture(scope="module")
+def golden():
+    with open(GOLDEN_PATH) as f:
+        return json.load(f)
+
+
+def test_linkage_families_match_golden_output(golden):
+    results = [{
+        "saturn_clashes": MagiSynastryCalculator().check_saturn_clashes(person1, person2),
+        "cinderella_linkages": MagiLinkageCalculator().find_cinderella_linkages(person1, person2),
+        "golden_transits": MagiLinkageCalculator().find_golden_transits(person1, person2),
+        "sexual_linkages": SexualLinkageCalculator().find_sexual_linkages(person1, person2),
+        "romance_linkages": RomanceLinkageCalculator().find_romance_linkages(person1, person2),
+        "marital_linkages": MaritalLinkageCalculator().find_marital_linkages(person1, person2),
+    } for person1, person2 in chart_pairs()]
+
+    assert json.loads(json.dumps(results)) == golden
+
+
+def test_find_linkages_matches_golden_output(golden):
+    for (person1, person2), expected in zip(chart_pairs(), golden):
+        linkages = json.loads(json.dumps(MagiSynastryCalculator().find_linkages(person1, person2)))
+        assert linkages == {key: expected[key] for key in linkages}
@@ -0,0 +1,74 @@
+from dataclasses import astuple
+
+from astro_charts.magi_aspects import MagiAspectCalculator
+from astro_charts.models.chart_state import BODIES, ChartState
+
+# London, 13 July 1985 12:00 (declinations for 00:00 UT that day)
+CHART = {
+    "sun": {"abs_pos": 110.987, "declination": 21.8711},
+    "moon": {"abs_pos": 58.3048, "declination": 19.049},
+    "mercury": {"abs_pos": 137.5221, "declination": 15.4166},
+    "venus": {"abs_pos": 67.713, "declination": 18.946},
+    "mars": {"abs_pos": 112.4025, "declination": 22.6346},
+    "jupiter": {"abs_pos": 314.7307, "declination": -17.1629},
+    "saturn": {"abs_pos": 231.5911, "declination": -16.0337},
+    "uranus": {"abs_pos": 254.6164, "declination": -22.5913},
+    "neptune": {"abs_pos": 271.7221, "declination": -22.2733},
+    "pluto": {"abs_pos": 211.9247, "declination": 3.6515},
+    "chiron": {"abs_pos": 72.1063, "declination": 18.0104},
+}
+
+# Output of the pairwise calculate_all_aspects loop before it was vectorized:
+# p1, p2, aspect, aspect degrees, orbit, actual degrees, harmonious, cinderella, sexual, romance
+EXPECTED_ASPECTS = [
+    ('sun', 'mars', 'conjunction', 0, 1.4155, 1.4155, True, False, False, False),
+    ('sun', 'mars', 'parallel', 0, 0.7635, 0.7635, True, False, False, False),
+    ('sun', 'saturn', 'trine', 120, 0.6041, 120.6041, True, False, False, False),
+    ('moon', 'venus', 'parallel', 0, 0.103, 0.103, True, False, False, False),
+    ('mercury', 'jupiter', 'opposition', 180, 2.7914, 177.2086, False, False, False, False),
+    ('mercury', 'uranus', 'trine', 120, 2.9057, 117.0943, True, False, False, False),
+    ('venus', 'chiron', 'parallel', 0, 0.9356, 0.9356, True, True, False, True),
+    ('mars', 'saturn', 'trine', 120, 0.8114, 119.1886, True, False, False, False),
+    ('jupiter', 'chiron', 'trine', 120, 2.6244, 117.3756, True, True, False, False),
+    ('uranus', 'neptune', 'parallel', 0, 0.318, 0.318, True, False, False, False),
+    ('uranus', 'chiron', 'opposition', 180, 2.5101, 177.4899, False, False, False, False),
+]
+
+
+def rounded(aspect):
+    values = astuple(aspect)
+    return values[:3] + tuple(round(value, 4) for value in values[3:6]) + values[6:]
+
+
+def test_calculate_all_aspects_matches_fixed_chart():
+    aspects = MagiAspectCalculator().calculate_all_aspects(CHART)
+    assert [rounded(aspect) for aspect in aspects] == EXPECTED_ASPECTS
+
+
+def test_find_aspect_hits_on_fixed_chart():
+    calculator = MagiAspectCalculator()
+    hits = calculator.find_aspect_hits(ChartState.from_planets(CHART))
+
+    found = [
+        (BODIES[p1], BODIES[p2], calculator.aspect_names[aspect], round(float(orbit), 4))
+        for p1, p2, aspect, orbit in zip(hits['p1'], hits['p2'], hits['aspect'], hits['orbit'])
+    ]
+    assert found == [(p1, p2, name, orbit) for p1, p2, name, _, orbit, *_ in EXPECTED_ASPECTS]
+    assert set(hits['day']) == {0}
+
+
+def test_find_aspect_hits_stacked_matches_each_day():
+    calculator = MagiAspectCalculator()
+    state = ChartState.from_planets(CHART)
+    # Turning the whole chart keeps its longitude aspects; the second day loses the declinations
+    rotated = ChartState.from_planets({name: {"abs_pos": data["abs_pos"] + 40} for name, data in CHART.items()})
+    stacked = ChartState.stack([state, rotated])
+
+    hits = calculator.find_aspect_hits(stacked)
+    daily = calculator.calculate_daily_aspects(stacked)
+
+    assert list(hits['day']) == sorted(hits['day'])
+    assert [rounded(aspect) for aspect in daily[0]] == EXPECTED_ASPECTS
+    assert [rounded(aspect) for aspect in daily[1]] == [
+        expected for expected in EXPECTED_ASPECTS if expected[2] not in ('parallel', 'contraparallel')
+    ]
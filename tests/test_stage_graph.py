@@ -0,0 +1,141 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from astro_charts.services.stage_graph import StageGraph, StageTimeoutError
+
+
+def test_memo_computes_once_under_concurrent_get():
+    graph = StageGraph()
+    calls = []
+
+    def compute():
+        calls.append(threading.current_thread().name)
+        time.sleep(0.1)
+        return 42
+
+    with ThreadPoolExecutor(8) as executor:
+        futures = [executor.submit(graph.memo, "key", compute) for _ in range(8)]
+        results = [future.result() for future in futures]
+
+    assert results == [42] * 8
+    assert len(calls) == 1
+
+
+def test_shared_dependency_runs_once_when_stages_run_concurrently():
+    calls = []
+    lock = threading.Lock()
+
+    def base():
+        with lock:
+            calls.append("base")
+        time.sleep(0.05)
+        return 1
+
+    with ThreadPoolExecutor(4) as executor:
+        graph = StageGraph(executor)
+        graph.add("base", base)
+        for i in range(4):
+            graph.add(f"child{i}", lambda value, i=i: value + i, "base")
+        results = graph.run(*[f"child{i}" for i in range(4)])
+
+    assert results == {"child0": 1, "child1": 2, "child2": 3, "child3": 4}
+    assert calls == ["base"]
+
+
+def test_exception_is_stored_and_raised_to_every_waiter():
+    graph = StageGraph()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        raise RuntimeError("broken")
+
+    def call():
+        try:
+            graph.memo("key", compute)
+        except RuntimeError as e:
+            return e
+
+    with ThreadPoolExecutor(4) as executor:
+        errors = list(executor.map(lambda _: call(), range(4)))
+
+    assert len(calls) == 1
+    assert all(isinstance(error, RuntimeError) and str(error) == "broken" for error in errors)
+    with pytest.raises(RuntimeError, match="broken"):
+        graph.memo("key", compute)
+    assert len(calls) == 1
+
+
+def test_undefined_dependency_raises_value_error():
+    graph = StageGraph()
+    with pytest.raises(ValueError, match="undefined stages: missing"):
+        graph.add("stage", lambda value: value, "missing")
+
+
+def test_duplicate_stage_raises_value_error():
+    graph = StageGraph()
+    graph.add("stage", lambda: 1)
+    with pytest.raises(ValueError, match="already defined"):
+        graph.add("stage", lambda: 2)
+
+
+def test_failing_stage_uses_fallback_and_records_failure():
+    graph = StageGraph()
+
+    def broken():
+        raise ValueError("no data")
+
+    graph.add("broken", broken, fallback=lambda e: [])
+    graph.add("dependent", lambda values: len(values), "broken")
+    graph.add("independent", lambda: "ok")
+
+    assert graph.run("dependent", "independent") == {"dependent": 0, "independent": "ok"}
+    assert graph.failures == {"broken": "no data"}
+
+
+def test_failing_stage_without_fallback_propagates():
+    graph = StageGraph()
+
+    def broken():
+        raise ValueError("no data")
+
+    graph.add("broken", broken)
+    graph.add("dependent", lambda value: value, "broken")
+    with pytest.raises(ValueError, match="no data"):
+        graph.get("dependent")
+    assert graph.failures == {}
+
+
+def test_timed_out_stage_uses_fallback():
+    with ThreadPoolExecutor(2) as timeout_executor:
+        graph = StageGraph(timeout_executor=timeout_executor)
+        graph.add("slow", lambda: time.sleep(1) or "late", timeout=0.1, fallback=lambda e: type(e))
+        graph.add("fast", lambda: "ok", timeout=1, fallback=lambda e: None)
+
+        started = time.monotonic()
+        results = graph.run("slow", "fast")
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert results == {"slow": StageTimeoutError, "fast": "ok"}
+    assert list(graph.failures) == ["slow"]
+
+
+def test_graph_deadline_caps_chained_timeouts():
+    with ThreadPoolExecutor(2) as executor, ThreadPoolExecutor(2) as timeout_executor:
+        graph = StageGraph(executor, timeout_executor, deadline=0.5)
+        graph.add("first", lambda: time.sleep(0.4) or 1, timeout=0.5, fallback=lambda e: None)
+        graph.add("second", lambda value: time.sleep(1) or value, "first", timeout=0.5, fallback=lambda e: None)
+
+        started = time.monotonic()
+        results = graph.run("second", "first")
+        elapsed = time.monotonic() - started
+
+    # Per-stage timeouts alone would allow 0.4 + 0.5 seconds
+    assert elapsed < 0.75
+    assert results == {"second": None, "first": 1}
+    assert list(graph.failures) == ["second"]
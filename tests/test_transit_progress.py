@@ -0,0 +1,40 @@
+from astro_charts import chart_creator
+from astro_charts.chart_creator import ChartCreator
+from astro_charts.services.ephemeris_engine import EphemerisEngine
+
+CACHED = {"2024-01-03", "2024-01-04", "2024-01-08"}
+
+
+def dates(from_date, to_date):
+    return [time.strftime("%Y-%m-%d") for time in EphemerisEngine.daily_times(from_date, to_date)]
+
+
+class FakeDayCache:
+    def get_days(self, fingerprint, day_dates, transit_hour, transit_minute):
+        return {date_str: {"cached": True} for date_str in day_dates if date_str in CACHED}
+
+    def set_days(self, fingerprint, days, transit_hour, transit_minute):
+        pass
+
+
+def test_incremental_range_reports_progress_per_computed_run(monkeypatch):
+    monkeypatch.setattr(chart_creator, "get_transit_day_cache", lambda: FakeDayCache())
+    monkeypatch.setattr(chart_creator, "CHART_PROCESS_WORKERS", 1)
+    monkeypatch.setattr(ChartCreator, "transit_fingerprint", "natal")
+    computed = []
+
+    def get_transit_range_data(self, from_date, to_date, transit_hour, transit_minute):
+        computed.append((from_date, to_date))
+        return {date_str: {"cached": False} for date_str in dates(from_date, to_date)}
+
+    monkeypatch.setattr(ChartCreator, "get_transit_range_data", get_transit_range_data)
+    creator = ChartCreator.__new__(ChartCreator)
+    reports = []
+
+    days = creator.get_transit_range_data_incremental("2024-01-01", "2024-01-10",
+                                                      progress=lambda done, total: reports.append((done, total)))
+
+    assert list(days) == dates("2024-01-01", "2024-01-10")
+    assert computed == [("2024-01-01", "2024-01-02"), ("2024-01-05", "2024-01-07"), ("2024-01-09", "2024-01-10")]
+    # Cached days first, then each computed run of missing days
+    assert reports == [(3, 10), (5, 10), (8, 10), (10, 10)]
@@ -0,0 +1,72 @@
+import contextlib
+import io
+import json
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from astro_charts.services.vedic_lucky_times_service import VedicLuckyTimesService
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "data", "vedic_lucky_times_golden.json")
+FROZEN_NOW = datetime(2025, 3, 29, 12, 0)
+SIGNS = ["Ari", "Tau", "Gem", "Can", "Leo", "Vir", "Lib", "Sco", "Sag", "Cap", "Aqu", "Pis"]
+BODIES = ["sun", "moon", "mercury", "venus", "mars", "jupiter", "saturn", "rahu", "ketu"]
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW if tz is None else FROZEN_NOW.replace(tzinfo=tz)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin datetime.now() in every astro_charts module that imported the datetime class"""
+    for name, module in list(sys.modules.items()):
+        if name.startswith("astro_charts") and getattr(module, "datetime", None) is datetime:
+            monkeypatch.setattr(module, "datetime", FrozenDatetime)
+
+
+def point(abs_pos, retrograde=False, house="house_3"):
+    return {"abs_pos": abs_pos, "sign": SIGNS[int(abs_pos // 30)], "position": abs_pos % 30,
+            "retrograde": retrograde, "house": house}
+
+
+def chart_data():
+    natal = {"subject": {
+        "name": "Golden",
+        "date_utc": "1990-05-01T10:30:00Z",
+        "planets": {body: point((i * 37.3 + 11) % 360) for i, body in enumerate(BODIES)},
+        "houses": {"ascendant": point(123.4), "house_7": point(303.4),
+                   "first_house": point(123.4), "seventh_house": point(303.4)}
+    }}
+    transit = {
+        "transit": {"subject": {
+            "date_utc": "2025-03-29T12:00:00Z",
+            "birth_data": {"date": "2025-03-29", "time": "12:00"},
+            "planets": {body: point((i * 53.1 + 7) % 360, body in ("rahu", "ketu")) for i, body in enumerate(BODIES)},
+            "houses": {"ascendant": point(45.6), "first_house": point(45.6)}
+        }},
+        "transit_year": 2025, "transit_month": 3, "transit_day": 29, "transit_hour": 12, "transit_minute": 0
+    }
+    return natal, transit
+
+
+def process(service):
+    natal, transit = chart_data()
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = service.process_vedic_lucky_times(natal, transit, "1990-05-01", "2025-03-29", "Golden")
+    # Encode the way FastAPI does, so values the endpoint cannot serialize fail here too
+    return jsonable_encoder(service.sanitize_response_for_json(response))
+
+
+def test_process_vedic_lucky_times_matches_golden_response(frozen_now):
+    response = process(VedicLuckyTimesService())
+    assert "error" not in response
+
+    with open(GOLDEN_PATH) as f:
+        golden = json.load(f)
+    assert response == golden